@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Result memory — plain dataclasses vs. compact (slotted) variants.
+
+Holds `--count` results of a few result types in a list three ways and
+measures the bytes each adds (tracemalloc) and the construction time:
+
+  - plain:    the dataclass as primitives return it (per-instance
+              __dict__).
+  - compact:  compact_class(cls) — slots only.
+  - frozen:   compact_class(cls, frozen = True) — slots, immutable;
+              construction pays object.__setattr__ per field.
+
+Field values are shared float objects, so the numbers isolate the
+per-instance overhead — exactly what slots remove.
+
+Usage
+-----
+    python python/benchmarks/bench_compact_results.py
+    python python/benchmarks/bench_compact_results.py --count 1000000
+"""
+
+import argparse
+import dataclasses
+import gc
+import time
+import tracemalloc
+
+from defipy.utils.data import compact_class
+from defipy.twin import MockProvider, StateTwinBuilder
+from defipy.primitives.pool_health import CheckPoolHealth
+from defipy.primitives.position import SimulatePriceMove
+from defipy.primitives.optimization import EvaluateTickRanges
+from defipy.utils.data import TickRangeCandidate
+
+
+def sample_results():
+    """One real result per type, from the MockProvider twins."""
+    v2 = StateTwinBuilder().build(MockProvider().snapshot("eth_dai_v2"))
+    v3 = StateTwinBuilder().build(MockProvider().snapshot("eth_dai_v3"))
+    tick = v3.slot0.tick - v3.slot0.tick % v3.tickSpacing
+    ranges = EvaluateTickRanges().apply(v3, [
+        TickRangeCandidate(lwr_tick = tick - 600, upr_tick = tick + 600),
+        TickRangeCandidate(lwr_tick = tick - 6000, upr_tick = tick + 6000),
+    ])
+    return [
+        SimulatePriceMove().apply(v2, -0.25, 10.0),
+        CheckPoolHealth().apply(v2),
+        ranges,
+    ]
+
+
+def measure(cls, values, count):
+    """(bytes per held instance, construction seconds). Timed outside
+    tracemalloc, which slows allocation several-fold."""
+    gc.collect()
+    t0 = time.perf_counter()
+    held = [cls(**values) for _ in range(count)]
+    elapsed = time.perf_counter() - t0
+    del held
+    gc.collect()
+    tracemalloc.start()
+    held = [cls(**values) for _ in range(count)]
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size / count, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description = "Benchmark result memory: plain vs slotted dataclasses.",
+    )
+    parser.add_argument("--count", type = int, default = 200_000,
+                        help = "Instances held per measurement (default: 200000).")
+    args = parser.parse_args()
+
+    print(f"{'type':>22} {'variant':>8} {'bytes/obj':>10} {'saved':>7} "
+          f"{'build_ms':>9}")
+    for result in sample_results():
+        cls = type(result)
+        values = {f.name: getattr(result, f.name) for f in dataclasses.fields(result)}
+        base = None
+        for label, variant in (("plain", cls),
+                               ("compact", compact_class(cls)),
+                               ("frozen", compact_class(cls, frozen = True))):
+            per_obj, elapsed = measure(variant, values, args.count)
+            base = base or per_obj
+            print(f"{cls.__name__:>22} {label:>8} {per_obj:>10.1f} "
+                  f"{1.0 - per_obj / base:>6.0%} {elapsed * 1e3:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
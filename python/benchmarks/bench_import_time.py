@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Startup cost of each public entry point, checked against a budget.
+
+Every entry point in ENTRY_POINTS is imported in a fresh interpreter
+and measured three ways:
+
+  warm_ms   wall time of the import statement alone (interpreter
+            startup excluded), bytecode cache populated; best of
+            `--repeat`.
+  cold_ms   same, with PYTHONPYCACHEPREFIX pointed at an empty
+            directory so every module is compiled from source — the
+            first run after an install or upgrade. The OS file cache
+            stays warm, so this is a lower bound on a true cold start.
+  peak_mb   tracemalloc peak during the import (Python allocations
+            only), measured in its own run since tracing slows the
+            import down.
+
+`--check` compares the numbers against a budget file (default:
+import_budget.json next to this script, or $DEFIPY_IMPORT_BUDGET) and
+exits 1 if any entry point is over. python/test/test_import_budget.py
+runs the memory check as part of the default test suite; its warm-time
+check is marked `benchmark` and only runs with DEFIPY_BENCHMARK=1.
+
+`--eager` sets DEFIPY_EAGER_IMPORT=1 to compare against the
+pre-lazy top-level import; `--top N` re-runs each entry point under
+`-X importtime` and lists its N heaviest top-level packages.
+
+Usage
+-----
+    python python/benchmarks/bench_import_time.py
+    python python/benchmarks/bench_import_time.py --check
+    python python/benchmarks/bench_import_time.py --eager --top 5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MCP_SERVER = os.path.join(HERE, "..", "mcp", "defipy_mcp_server.py")
+DEFAULT_BUDGET = os.path.join(HERE, "import_budget.json")
+
+# name -> import statement. The MCP server directory is deliberately
+# not a package (it would shadow the `mcp` SDK), so it is loaded by
+# path the same way python/test/mcp/conftest.py does.
+ENTRY_POINTS = {
+    "defipy": "import defipy",
+    "defipy.twin": "from defipy.twin import LiveProvider",
+    "defipy.tools": "import defipy.tools",
+    "defipy.primitives": "import defipy.primitives",
+    "mcp_server": (
+        "import importlib.util; "
+        "spec = importlib.util.spec_from_file_location("
+        "'defipy_mcp_server', {!r}); "
+        "spec.loader.exec_module(importlib.util.module_from_spec(spec))"
+    ).format(os.path.abspath(MCP_SERVER)),
+}
+
+# Entry points that need an optional extra; skipped when it's missing.
+REQUIRES = {"mcp_server": "mcp"}
+
+_PROBE = """\
+import json, sys, time
+{trace}
+_modules = len(sys.modules)
+_t0 = time.perf_counter()
+{statement}
+_t1 = time.perf_counter()
+print(json.dumps({{
+    "ms": (_t1 - _t0) * 1e3,
+    "modules": len(sys.modules) - _modules,
+    "peak_bytes": {peak},
+}}))
+"""
+
+
+def _env(eager = False, pycache = None):
+    env = dict(os.environ)
+    env.pop("DEFIPY_EAGER_IMPORT", None)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    if eager:
+        env["DEFIPY_EAGER_IMPORT"] = "1"
+    if pycache is not None:
+        env["PYTHONPYCACHEPREFIX"] = pycache
+    return env
+
+
+def probe(statement, eager = False, pycache = None, trace = False):
+    """Run `statement` in a fresh interpreter; return its probe dict."""
+    code = _PROBE.format(
+        statement = statement,
+        trace = "import tracemalloc; tracemalloc.start()" if trace else "",
+        peak = "tracemalloc.get_traced_memory()[1]" if trace else "None",
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        env = _env(eager, pycache), capture_output = True, text = True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(
+            "bench_import_time: {!r} failed:\n{}".format(statement, proc.stderr)
+        )
+    return json.loads(proc.stdout.splitlines()[-1])
+
+
+def available(name):
+    """False if `name` needs an optional package that isn't installed."""
+    requirement = REQUIRES.get(name)
+    if requirement is None:
+        return True
+    import importlib.util
+    return importlib.util.find_spec(requirement) is not None
+
+
+def measure(name, repeat = 3, cold = True, eager = False):
+    """{warm_ms, cold_ms, peak_mb, modules} for one entry point."""
+    statement = ENTRY_POINTS[name]
+    probe(statement, eager)                 # populate the bytecode cache
+    warm = [probe(statement, eager) for _ in range(repeat)]
+    result = {
+        "warm_ms": min(r["ms"] for r in warm),
+        "modules": warm[0]["modules"],
+        "peak_mb": peak_mb(name, eager),
+    }
+    if cold:
+        with tempfile.TemporaryDirectory() as pycache:
+            result["cold_ms"] = probe(statement, eager, pycache = pycache)["ms"]
+    return result
+
+
+def peak_mb(name, eager = False):
+    """tracemalloc peak of importing one entry point, in MiB."""
+    return probe(ENTRY_POINTS[name], eager, trace = True)["peak_bytes"] / 2**20
+
+
+def load_budget(path = None):
+    """{entry point: {metric: limit}} from a JSON budget file.
+
+    Resolution order: `path`, $DEFIPY_IMPORT_BUDGET, import_budget.json
+    next to this script. Top-level keys starting with "_" are comments.
+    """
+    path = path or os.environ.get("DEFIPY_IMPORT_BUDGET") or DEFAULT_BUDGET
+    with open(path) as f:
+        budget = json.load(f)
+    return {k: v for k, v in budget.items() if not k.startswith("_")}
+
+
+def over_budget(name, result, budget):
+    """["metric: value > limit", ...] for every metric over its limit."""
+    failures = []
+    for metric, limit in sorted(budget.get(name, {}).items()):
+        value = result.get(metric)
+        if value is not None and value > limit:
+            failures.append("{}: {:.1f} > {:.1f}".format(metric, value, limit))
+    return failures
+
+
+def heaviest(statement, eager = False, top = 5):
+    """[(package, self_ms), ...] from one `-X importtime` run."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env = _env(eager), capture_output = True, text = True, check = True,
+    )
+    packages = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _cumulative_us, module = line[len("import time:"):].split("|")
+        root = module.strip().split(".")[0]
+        packages[root] = packages.get(root, 0) + int(self_us)
+    ranked = sorted(packages.items(), key = lambda kv: -kv[1])
+    return [(root, us / 1e3) for root, us in ranked[:top]]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description = "Measure import time / memory of defipy entry points.",
+    )
+    parser.add_argument("--repeat", type = int, default = 3,
+                        help = "Warm runs per entry point; best-of is reported (default: 3).")
+    parser.add_argument("--no-cold", action = "store_true",
+                        help = "Skip the cold (recompile) run.")
+    parser.add_argument("--eager", action = "store_true",
+                        help = "Set DEFIPY_EAGER_IMPORT=1 in the children.")
+    parser.add_argument("--top", type = int, default = 0,
+                        help = "Also list the N heaviest top-level packages per entry point.")
+    parser.add_argument("--check", action = "store_true",
+                        help = "Exit 1 if any entry point exceeds the budget.")
+    parser.add_argument("--budget", default = None,
+                        help = "Budget JSON (default: $DEFIPY_IMPORT_BUDGET or import_budget.json).")
+    parser.add_argument("--only", nargs = "+", choices = sorted(ENTRY_POINTS),
+                        help = "Measure only these entry points.")
+    args = parser.parse_args()
+
+    budget = load_budget(args.budget) if args.check else {}
+    failures = {}
+
+    print(f"{'entry point':<20} {'warm_ms':>9} {'cold_ms':>9} "
+          f"{'peak_mb':>9} {'modules':>8}")
+    for name in args.only or ENTRY_POINTS:
+        if not available(name):
+            print(f"{name:<20} skipped: {REQUIRES[name]} not installed")
+            continue
+        r = measure(name, args.repeat, cold = not args.no_cold, eager = args.eager)
+        cold = f"{r['cold_ms']:>9.1f}" if "cold_ms" in r else f"{'-':>9}"
+        print(f"{name:<20} {r['warm_ms']:>9.1f} {cold} "
+              f"{r['peak_mb']:>9.1f} {r['modules']:>8}")
+        if args.top:
+            for root, ms in heaviest(ENTRY_POINTS[name], args.eager, args.top):
+                print(f"{'':<20} {ms:>9.1f}   {root}")
+        if args.check:
+            over = over_budget(name, r, budget)
+            if over:
+                failures[name] = over
+
+    if failures:
+        print("\nover budget:")
+        for name, over in failures.items():
+            print(f"  {name}: " + "; ".join(over))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Load test — MCP tool latency over the streamable HTTP transport.
+
+`--clients` concurrent MCP client sessions each issue `--requests`
+tool calls, cycling through a fixed mix of the curated tools, and the
+round-trip latency of every call is recorded. Reports, overall and per
+tool: calls, errors, p50 / p90 / p99 / max latency, and throughput.
+
+By default the script starts its own server
+(`defipy_mcp_server.py --transport http --workers N`) on a free port
+and stops it afterwards; pass `--url` to load an already running one.
+
+Usage
+-----
+    python python/benchmarks/bench_mcp_load.py
+    python python/benchmarks/bench_mcp_load.py --workers 4 --clients 32
+    python python/benchmarks/bench_mcp_load.py --url http://127.0.0.1:8000/mcp
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+from mcp import ClientSession
+from mcp.client.streamable_http import streamable_http_client
+
+
+SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                      "..", "mcp", "defipy_mcp_server.py")
+
+# (tool, arguments) — one valid call per tool family.
+MIX = [
+    ("CheckPoolHealth", {"pool_id": "eth_dai_v2"}),
+    ("CalculateSlippage", {"pool_id": "eth_dai_v2",
+                           "token_in_name": "DAI", "amount_in": 1000.0}),
+    ("SimulatePriceMove", {"pool_id": "eth_dai_v2",
+                           "price_change_pct": -0.3, "position_size_lp": 1.0}),
+    ("DetectRugSignals", {"pool_id": "eth_dai_v3"}),
+    ("AnalyzeBalancerPosition", {"pool_id": "eth_dai_balancer_50_50",
+                                 "lp_init_amt": 1.0, "entry_base_amt": 1000,
+                                 "entry_opp_amt": 100000}),
+    ("AssessDepegRisk", {"pool_id": "usdc_dai_stableswap_A10",
+                         "lp_init_amt": 100.0, "depeg_token_name": "USDC"}),
+]
+
+
+def percentile(sorted_ms, q):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_ms:
+        return float("nan")
+    k = max(0, min(len(sorted_ms) - 1, int(round(q / 100 * len(sorted_ms))) - 1))
+    return sorted_ms[k]
+
+
+async def client(url, n_requests, offset, samples):
+    async with streamable_http_client(url) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            for i in range(n_requests):
+                tool, args = MIX[(offset + i) % len(MIX)]
+                t0 = time.perf_counter()
+                try:
+                    result = await session.call_tool(tool, args)
+                    text = result.content[0].text if result.content else ""
+                    ok = not result.isError and not text.startswith("Error")
+                except Exception:
+                    ok = False
+                samples.append((tool, (time.perf_counter() - t0) * 1e3, ok))
+
+
+async def load(url, clients, n_requests):
+    samples = []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client(url, n_requests, c, samples)
+                           for c in range(clients)))
+    return samples, time.perf_counter() - t0
+
+
+def start_server(workers, port):
+    proc = subprocess.Popen(
+        [sys.executable, SERVER, "--transport", "http",
+         "--port", str(port), "--workers", str(workers)],
+        stderr = subprocess.DEVNULL,
+    )
+    health = "http://127.0.0.1:{}/healthz".format(port)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("bench_mcp_load: server exited during startup")
+        try:
+            if httpx.get(health, timeout = 1).status_code == 200:
+                return proc
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("bench_mcp_load: server not healthy after 60s")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def report(samples, wall_s):
+    print(f"{'tool':<26} {'calls':>6} {'errors':>7} {'p50_ms':>8} "
+          f"{'p90_ms':>8} {'p99_ms':>8} {'max_ms':>8}")
+    groups = {}
+    for tool, ms, ok in samples:
+        groups.setdefault(tool, []).append((ms, ok))
+    rows = sorted(groups.items()) + [("ALL", [(ms, ok) for _, ms, ok in samples])]
+    for tool, calls in rows:
+        ms = sorted(m for m, _ in calls)
+        errors = sum(1 for _, ok in calls if not ok)
+        print(f"{tool:<26} {len(calls):>6} {errors:>7} "
+              f"{percentile(ms, 50):>8.1f} {percentile(ms, 90):>8.1f} "
+              f"{percentile(ms, 99):>8.1f} {ms[-1]:>8.1f}")
+    print(f"\n{len(samples)} calls in {wall_s:.2f}s "
+          f"({len(samples) / wall_s:,.0f} calls/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description = "Load-test the DeFiPy MCP server over streamable HTTP.",
+    )
+    parser.add_argument("--url", default = None,
+                        help = "MCP endpoint of a running server; default: start one.")
+    parser.add_argument("--workers", type = int, default = 2,
+                        help = "Workers for the server this script starts (default: 2).")
+    parser.add_argument("--clients", type = int, default = 8,
+                        help = "Concurrent client sessions (default: 8).")
+    parser.add_argument("--requests", type = int, default = 50,
+                        help = "Tool calls per client (default: 50).")
+    args = parser.parse_args()
+
+    proc = None
+    url = args.url
+    if url is None:
+        port = free_port()
+        proc = start_server(args.workers, port)
+        url = "http://127.0.0.1:{}/mcp".format(port)
+    try:
+        samples, wall_s = asyncio.run(load(url, args.clients, args.requests))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout = 30)
+    print(f"server: {url}  clients: {args.clients}  "
+          f"requests/client: {args.requests}"
+          + (f"  workers: {args.workers}" if proc is not None else ""))
+    report(samples, wall_s)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""ScenarioEngine — single-thread loop vs. process pool.
+
+Builds `--twins` V2 / V3 ETH/DAI snapshots with jittered reserves and
+runs three primitives over each: SimulatePriceMove across
+`--moves` price changes, CalculateSlippage for two tokens x five
+sizes, and CheckPoolHealth once. Compares:
+
+  - loop:    build each twin in-process and call every grid point —
+             what the nightly job does today.
+  - engine:  ScenarioEngine at each `--processes` count (0 = inline),
+             pool started before timing so worker startup isn't
+             counted (the engine reuses it across runs).
+
+Usage
+-----
+    python python/benchmarks/bench_scenario_engine.py
+    python python/benchmarks/bench_scenario_engine.py --twins 2000 --processes 4 8
+"""
+
+import argparse
+import os
+import time
+
+from defipy.twin import (
+    ScenarioEngine,
+    ScenarioJob,
+    StateTwinBuilder,
+    V2PoolSnapshot,
+    V3PoolSnapshot,
+)
+from defipy.primitives.position import SimulatePriceMove
+from defipy.primitives.execution import CalculateSlippage
+from defipy.primitives.pool_health import CheckPoolHealth
+
+
+def build_jobs(twins, moves):
+    jobs = []
+    for k in range(twins):
+        eth = 1_000.0 * (1.0 + 0.13 * (k % 11))
+        dai = eth * 100.0 * (1.0 + 0.01 * ((k % 7) - 3))
+        if k % 2 == 0:
+            snap = V2PoolSnapshot(
+                pool_id = "v2_{}".format(k), token0_name = "ETH",
+                token1_name = "DAI", reserve0 = eth, reserve1 = dai,
+            )
+        else:
+            snap = V3PoolSnapshot(
+                pool_id = "v3_{}".format(k), token0_name = "ETH",
+                token1_name = "DAI", reserve0 = eth, reserve1 = dai,
+                fee = 3000, tick_spacing = 60,
+                lwr_tick = -(887272 // 60 * 60), upr_tick = 887272 // 60 * 60,
+            )
+        ticks = {} if k % 2 == 0 else {"lwr_tick": snap.lwr_tick,
+                                       "upr_tick": snap.upr_tick}
+        jobs.append(ScenarioJob(snap, SimulatePriceMove, dict(
+            price_change_pct = [-0.9 + 1.8 * i / max(moves - 1, 1)
+                                for i in range(moves)],
+            position_size_lp = 1.0, **ticks,
+        )))
+        jobs.append(ScenarioJob(snap, CalculateSlippage, dict(
+            token_in = ["ETH", "DAI"],
+            amount_in = [0.1, 1.0, 5.0, 20.0, 80.0], **ticks,
+        )))
+        jobs.append(ScenarioJob(snap, CheckPoolHealth))
+    return jobs
+
+
+def run_loop(jobs):
+    builder = StateTwinBuilder()
+    out = []
+    for job in jobs:
+        lp = builder.build(job.snapshot)
+        tokens = lp.factory.token_from_exchange[lp.name]
+        primitive = job.primitive()
+        for params in job.points():
+            if "token_in" in params:
+                params["token_in"] = tokens[params["token_in"]]
+            out.append(primitive.apply(lp, **params))
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description = "Benchmark ScenarioEngine against a single-thread loop.",
+    )
+    parser.add_argument("--twins", type = int, default = 200,
+                        help = "Twins to build (default: 200).")
+    parser.add_argument("--moves", type = int, default = 25,
+                        help = "Price moves per SimulatePriceMove grid (default: 25).")
+    parser.add_argument("--processes", type = int, nargs = "+",
+                        default = [0, os.cpu_count() or 1],
+                        help = "Worker counts to run (default: 0 and cpu_count).")
+    args = parser.parse_args()
+
+    jobs = build_jobs(args.twins, args.moves)
+    points = sum(len(job.points()) for job in jobs)
+
+    t0 = time.perf_counter()
+    run_loop(jobs)
+    t_loop = time.perf_counter() - t0
+    print("{} jobs, {} points".format(len(jobs), points))
+    print(f"{'runner':>10} {'seconds':>9} {'points/s':>10} {'speedup':>8} {'errors':>7}")
+    print(f"{'loop':>10} {t_loop:>9.2f} {points / t_loop:>10.0f} {1.0:>7.1f}x {0:>7}")
+
+    for processes in args.processes:
+        with ScenarioEngine(processes = processes) as engine:
+            if processes:
+                engine._get_pool()
+            run = engine.run(jobs)
+            for _outcome in run:
+                pass
+        report = run.report
+        label = "engine/{}".format(processes)
+        print(f"{label:>10} {report.elapsed_s:>9.2f} {report.points_per_sec:>10.0f} "
+              f"{t_loop / report.elapsed_s:>7.1f}x {report.errors:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""SimulatePriceMove — scalar loop vs. apply_batch.
+
+Times a scenario grid of N price shocks against the MockProvider
+V2 and V3 recipes two ways: N calls to `.apply()` (one UniswapImpLoss
+helper per point) and one call to `.apply_batch()` (one helper, one
+vectorized pass). Also reports the max absolute difference between
+the two so a speedup never hides a numerical regression.
+
+Usage
+-----
+    python python/benchmarks/bench_simulate_price_move.py
+    python python/benchmarks/bench_simulate_price_move.py --n 10000 --repeat 5
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from defipy.twin import MockProvider, StateTwinBuilder
+from defipy.primitives.position import SimulatePriceMove
+
+
+RECIPES = ("eth_dai_v2", "eth_dai_v3")
+
+
+def bench_recipe(recipe, n, repeat):
+    snap = MockProvider().snapshot(recipe)
+    lp = StateTwinBuilder().build(snap)
+    ticks = {}
+    if snap.protocol == "uniswap_v3":
+        ticks = dict(lwr_tick = snap.lwr_tick, upr_tick = snap.upr_tick)
+
+    pcts = np.linspace(-0.9, 3.0, n)
+    size = 1.0
+    prim = SimulatePriceMove()
+
+    run_loop = lambda: [prim.apply(lp, float(p), size, **ticks) for p in pcts]
+    run_batch = lambda: prim.apply_batch(lp, pcts, size, **ticks)
+    t_loop = min(timeit.repeat(run_loop, number = 1, repeat = repeat))
+    t_batch = min(timeit.repeat(run_batch, number = 1, repeat = repeat))
+    loop, batch = run_loop(), run_batch()
+
+    loop_values = np.array([r.new_value for r in loop])
+    max_diff = float(np.max(np.abs(loop_values - batch.new_value)))
+    return t_loop, t_batch, max_diff
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description = "Benchmark SimulatePriceMove scalar loop vs apply_batch.",
+    )
+    parser.add_argument("--n", type = int, default = 2000,
+                        help = "Scenarios per grid (default: 2000).")
+    parser.add_argument("--repeat", type = int, default = 3,
+                        help = "Timing repeats; best-of is reported (default: 3).")
+    args = parser.parse_args()
+
+    print(f"{'recipe':<12} {'n':>7} {'loop_s':>10} {'batch_s':>10} "
+          f"{'speedup':>9} {'max|Δvalue|':>12}")
+    for recipe in RECIPES:
+        t_loop, t_batch, max_diff = bench_recipe(recipe, args.n, args.repeat)
+        print(f"{recipe:<12} {args.n:>7} {t_loop:>10.4f} {t_batch:>10.6f} "
+              f"{t_loop / t_batch:>8.0f}x {max_diff:>12.2e}")
+
+
+if __name__ == "__main__":
+    main()
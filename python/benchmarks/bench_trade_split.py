@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""OptimalTradeSplit — solve time vs. pool count.
+
+Builds `--pools` USDC/DAI twins cycling through Uniswap V2, Uniswap V3
+at the 0.05% / 0.3% / 1% fee tiers, Balancer 50/50 and Stableswap
+(A = 50), with reserves jittered per pool, then splits one order of
+`--order` USDC across all of them. Reports the solve time (best of
+`--repeat`) and the output gained over the best single pool and over
+an equal split.
+
+Usage
+-----
+    python python/benchmarks/bench_trade_split.py
+    python python/benchmarks/bench_trade_split.py --pools 12 48 96 --order 2e6
+"""
+
+import argparse
+import timeit
+
+from defipy.twin import (
+    BalancerPoolSnapshot,
+    StableswapPoolSnapshot,
+    StateTwinBuilder,
+    V2PoolSnapshot,
+    V3PoolSnapshot,
+)
+from defipy.primitives.execution import OptimalTradeSplit
+
+
+V3_TIERS = ((500, 10), (3000, 60), (10000, 200))
+KINDS = 6
+
+
+def build_pools(n):
+    """n USDC/DAI twins across all four protocol families."""
+    builder = StateTwinBuilder()
+    pools = []
+    for k in range(n):
+        pool_id = "pool_{}".format(k)
+        depth = 1e6 * (1.0 + 0.37 * (k % 7))
+        tilt = 1.0 + 0.002 * ((k % 5) - 2)
+        kind = k % KINDS
+        if kind == 0:
+            snap = V2PoolSnapshot(
+                pool_id = pool_id, token0_name = "USDC", token1_name = "DAI",
+                reserve0 = depth, reserve1 = depth * tilt,
+            )
+        elif kind <= 3:
+            fee, spacing = V3_TIERS[kind - 1]
+            snap = V3PoolSnapshot(
+                pool_id = pool_id, token0_name = "USDC", token1_name = "DAI",
+                reserve0 = depth, reserve1 = depth * tilt,
+                fee = fee, tick_spacing = spacing,
+                lwr_tick = -(887272 // spacing * spacing),
+                upr_tick = 887272 // spacing * spacing,
+            )
+        elif kind == 4:
+            snap = BalancerPoolSnapshot(
+                pool_id = pool_id, token0_name = "USDC", token1_name = "DAI",
+                reserve0 = depth, reserve1 = depth * tilt,
+                weight0 = 0.5, weight1 = 0.5, pool_shares_init = 100.0,
+            )
+        else:
+            snap = StableswapPoolSnapshot(
+                pool_id = pool_id, token_names = ["USDC", "DAI"],
+                reserves = [depth, depth * tilt], A = 50, decimals = 18,
+            )
+        pools.append(builder.build(snap))
+    return pools
+
+
+def bench(n, order, repeat):
+    pools = build_pools(n)
+    usdc = pools[0].factory.token_from_exchange[pools[0].name]["USDC"]
+    splitter = OptimalTradeSplit()
+    run = lambda: splitter.apply(pools, usdc, order)
+    t = min(timeit.repeat(run, number = 1, repeat = repeat))
+    result = run()
+
+    legs = [splitter._leg(lp, "USDC", None) for lp in pools]
+    equal = sum(leg.quote(order / n) for leg in legs)
+    used = sum(1 for x in result.amounts_in if x > 0)
+    return (t, used, result.total_out,
+            result.improvement_pct, (result.total_out - equal) / equal)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description = "Benchmark OptimalTradeSplit across pool counts.",
+    )
+    parser.add_argument("--pools", type = int, nargs = "+",
+                        default = [6, 12, 36, 72],
+                        help = "Pool counts to run (default: 6 12 36 72).")
+    parser.add_argument("--order", type = float, default = 5e5,
+                        help = "Order size in USDC (default: 5e5).")
+    parser.add_argument("--repeat", type = int, default = 3,
+                        help = "Timing repeats; best-of is reported (default: 3).")
+    args = parser.parse_args()
+
+    print(f"{'pools':>6} {'used':>5} {'solve_ms':>9} {'total_out':>14} "
+          f"{'vs_best':>9} {'vs_equal':>9}")
+    for n in args.pools:
+        t, used, total, vs_best, vs_equal = bench(n, args.order, args.repeat)
+        print(f"{n:>6} {used:>5} {t * 1e3:>9.2f} {total:>14.2f} "
+              f"{vs_best:>8.3%} {vs_equal:>8.3%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Twin forking — copy.deepcopy vs. StateTwinBuilder.fork.
+
+Forks each MockProvider recipe (V2, V3, Balancer, Stableswap) N times
+both ways and reports wall-clock per fork and the memory the N live
+forks hold (tracemalloc, so the number is Python-heap bytes retained by
+the forks rather than process RSS noise).
+
+Usage
+-----
+    python python/benchmarks/bench_twin_fork.py
+    python python/benchmarks/bench_twin_fork.py --n 500 --repeat 5
+"""
+
+import argparse
+import copy
+import gc
+import timeit
+import tracemalloc
+
+from defipy.twin import MockProvider, StateTwinBuilder
+
+
+RECIPES = (
+    "eth_dai_v2",
+    "eth_dai_v3",
+    "eth_dai_balancer_50_50",
+    "usdc_dai_stableswap_A10",
+)
+
+
+def _retained_bytes(fn):
+    """Python-heap bytes still held by fn()'s return value."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    out = fn()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del out
+    return after - before
+
+
+def bench_recipe(recipe, n, repeat):
+    lp = StateTwinBuilder().build(MockProvider().snapshot(recipe))
+    builder = StateTwinBuilder()
+
+    deep = lambda: [copy.deepcopy(lp) for _ in range(n)]
+    fork = lambda: builder.fork(lp, n)
+
+    t_deep = min(timeit.repeat(deep, number = 1, repeat = repeat)) / n
+    t_fork = min(timeit.repeat(fork, number = 1, repeat = repeat)) / n
+    m_deep = _retained_bytes(deep) / n
+    m_fork = _retained_bytes(fork) / n
+    return t_deep, t_fork, m_deep, m_fork
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description = "Benchmark copy.deepcopy vs StateTwinBuilder.fork.",
+    )
+    parser.add_argument("--n", type = int, default = 200,
+                        help = "Forks per recipe (default: 200).")
+    parser.add_argument("--repeat", type = int, default = 3,
+                        help = "Timing repeats; best-of is reported (default: 3).")
+    args = parser.parse_args()
+
+    print(f"{'recipe':<24} {'deep_us':>9} {'fork_us':>9} {'speedup':>8} "
+          f"{'deep_KiB':>9} {'fork_KiB':>9}")
+    for recipe in RECIPES:
+        t_deep, t_fork, m_deep, m_fork = bench_recipe(recipe, args.n, args.repeat)
+        print(f"{recipe:<24} {t_deep * 1e6:>9.1f} {t_fork * 1e6:>9.1f} "
+              f"{t_deep / t_fork:>7.1f}x {m_deep / 1024:>9.2f} {m_fork / 1024:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Large-swap V3 quoting — uniswappy swap on a fork vs. TickIndex.
+
+Builds a V3 twin with `--positions` stacked ranged positions around
+the price (2 initialized ticks each), then quotes an exact-input trade
+that crosses about half of them three ways:
+
+  - swap:   StateTwinBuilder.fork + uniswappy Swap — the only existing
+            multi-tick quote; every step re-sorts the tick dict.
+  - index:  TickIndex.from_lp(lp) + quote — what CalculateSlippage /
+            DetectMEV do per call on a multi-tick twin.
+  - reuse:  quote on a prebuilt TickIndex (the `tick_index=` path).
+
+Also reports the quotes' relative difference, which should be ~1e-12.
+
+Usage
+-----
+    python python/benchmarks/bench_v3_tick_quote.py
+    python python/benchmarks/bench_v3_tick_quote.py --positions 1000 --repeat 5
+"""
+
+import argparse
+import timeit
+
+from uniswappy.process.swap import Swap
+
+from defipy.twin import MockProvider, StateTwinBuilder
+from defipy.utils.tools.v3 import TickIndex
+
+
+def build_twin(positions):
+    """eth_dai_v3 plus `positions` nested ranges, each 2 spacings wider
+    than the last, so the tick table has 2 * positions + 2 entries."""
+    lp = StateTwinBuilder().build(MockProvider().snapshot("eth_dai_v3"))
+    spacing = lp.tickSpacing
+    center = lp.slot0.tick - lp.slot0.tick % spacing
+    liquidity = lp.get_liquidity() / positions
+    for i in range(1, positions + 1):
+        lp.mint("bench", center - i * 2 * spacing, center + i * 2 * spacing,
+                liquidity)
+    return lp
+
+
+def trade_size(lp, token, index, crossed):
+    """Input that walks through roughly `crossed` initialized ticks."""
+    spacing = lp.tickSpacing
+    target = (lp.slot0.sqrtPriceX96 / 2 ** 96) * 1.0001 ** (-crossed * spacing)
+    amount = 1.0
+    while index.quote(lp, token, amount)[1] > target:
+        amount *= 2.0
+    return amount
+
+
+def bench(positions, repeat):
+    lp = build_twin(positions)
+    builder = StateTwinBuilder()
+    token = lp.factory.token_from_exchange[lp.name][lp.token0]
+    index = TickIndex.from_lp(lp)
+    amount = trade_size(lp, token, index, positions)
+
+    def swap():
+        fork = builder.fork(lp)[0]
+        tkn = fork.factory.token_from_exchange[fork.name][fork.token0]
+        return Swap().apply(fork, tkn, "bench", amount)
+
+    def fresh_index():
+        return TickIndex.from_lp(lp).quote(lp, token, amount)[0]
+
+    def reuse():
+        return index.quote(lp, token, amount)[0]
+
+    diff = abs(fresh_index() - swap()) / swap()
+    best = lambda fn: min(timeit.repeat(fn, number = 1, repeat = repeat))
+    return (len(lp.ticks), best(swap), best(fresh_index), best(reuse), diff)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description = "Benchmark multi-tick V3 quoting: uniswappy swap vs TickIndex.",
+    )
+    parser.add_argument("--positions", type = int, nargs = "+",
+                        default = [10, 100, 500],
+                        help = "Stacked positions per run (default: 10 100 500).")
+    parser.add_argument("--repeat", type = int, default = 3,
+                        help = "Timing repeats; best-of is reported (default: 3).")
+    args = parser.parse_args()
+
+    print(f"{'ticks':>6} {'swap_ms':>9} {'index_ms':>9} {'reuse_us':>9} "
+          f"{'speedup':>8} {'rel_diff':>9}")
+    for positions in args.positions:
+        n, t_swap, t_index, t_reuse, diff = bench(positions, args.repeat)
+        print(f"{n:>6} {t_swap * 1e3:>9.2f} {t_index * 1e3:>9.3f} "
+              f"{t_reuse * 1e6:>9.1f} {t_swap / t_index:>7.1f}x {diff:>9.1e}")
+
+
+if __name__ == "__main__":
+    main()
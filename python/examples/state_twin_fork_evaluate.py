@@ -45,7 +45,6 @@ Usage
 """
 
 import argparse
-import copy
 import os
 import statistics
 import sys
@@ -120,14 +119,15 @@ def make_scenarios(n: int) -> list[float]:
 
 
 def fork_twin(lp, n: int) -> list:
-    """Produce N independent forks via copy.deepcopy per D15.
-
-    Comment from STATE_TWIN_PHASE_3.md / R14: if deepcopy proves slow
-    at large N or surfaces shared-reference issues, the documented
-    fallback is `PoolSnapshot.clone() → StateTwinBuilder.build()` per
-    fork. For full-range V3 twins at N≤50 deepcopy stays well under
-    the wall-clock budget; we don't preemptively build the helper."""
-    return [copy.deepcopy(lp) for _ in range(n)]
+    """Produce N independent forks via StateTwinBuilder.fork.
+
+    Originally copy.deepcopy per D15, with `PoolSnapshot.clone() →
+    StateTwinBuilder.build()` as the documented fallback per R14.
+    StateTwinBuilder.fork copies only the state the protocol packages
+    mutate and shares V3 position tables copy-on-write (tick tables
+    are copied), so it stays cheap well past N=50 (see
+    python/benchmarks/bench_twin_fork.py)."""
+    return StateTwinBuilder().fork(lp, n)
 
 
 def evaluate_scenarios(lp_forks, scenarios, snap):
@@ -21,24 +21,52 @@
 Run standalone (stdio transport):
     python python/mcp/defipy_mcp_server.py
 
+Or as a shared HTTP service (streamable HTTP at /mcp; --transport sse
+for the legacy SSE endpoints), optionally pre-forked:
+    python python/mcp/defipy_mcp_server.py --transport http --port 8000 --workers 4
+
 Claude Desktop / Claude Code wiring: see python/mcp/README.md.
 
 Architecture:
 - Day 1's 10 schemas come from defipy.tools unchanged.
 - Each schema is wrapped with a required `pool_id` field at exposure
   time so the LLM picks both a tool and a pool in one call.
-- Every call_tool invocation builds a fresh MockProvider twin — no
-  cross-call state. Matches DeFiPy's stateless primitive contract.
+- Built twins are cached per (pool_id, block) in _TwinCache. Tools whose
+  primitives only read the twin share the cached instance; any other
+  tool gets a copy-on-write fork, so no call can leak state into the
+  next. Matches DeFiPy's stateless primitive contract.
+- pool_id is a MockProvider recipe name or, when DEFIPY_MCP_RPC_URL is
+  set, a live "<protocol>:<address>" pool read through LiveProvider.
+  Each client session's live reads are pinned to the block of its
+  first live call (_BlockPins), so a multi-tool conversation sees one
+  consistent chain state.
 - Token-name strings in the LLM's args (for CalculateSlippage and
   AssessDepegRisk) are resolved to ERC20 objects at dispatch time.
-- One JSON receipt per invocation emitted to stderr.
+- Twin checkout and the primitive run on a _Dispatcher worker (thread
+  pool by default), off the event loop, with a per-tool timeout and a
+  bounded number of pending calls.
+- RunBatch runs any one of the tools over a list of argument sets:
+  one dispatcher job per pool checks its twin out once and runs all of
+  that pool's calls, and the results come back as one compact table
+  (defipy.tools.BatchResult) rather than a JSON block per call.
+- One JSON receipt per invocation emitted to stderr, with the time
+  spent queued, getting the twin and running the primitive.
 """
 
+import argparse
 import asyncio
+import concurrent.futures
 import copy
+import functools
 import json
+import multiprocessing
+import os
+import signal
 import sys
+import threading
 import time
+import weakref
+from collections import OrderedDict
 from dataclasses import asdict, is_dataclass
 from datetime import datetime, timezone
 
@@ -46,8 +74,14 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from defipy.tools import TOOL_REGISTRY, get_schemas
-from defipy.twin import MockProvider, StateTwinBuilder
+from defipy.tools import TOOL_REGISTRY, get_schemas, run_batch
+from defipy.twin import (
+    LiveProvider,
+    MockProvider,
+    SnapshotCache,
+    StateTwinBuilder,
+)
+from defipy.twin._dispatch import resolve_token
 
 
 # ─── Compatibility + dispatch config ─────────────────────────────────────────
@@ -73,12 +107,248 @@ _COMPATIBLE_RECIPES = {
 
 # Tools with an object-typed parameter (ERC20) the LLM specifies as a
 # token-name string. Maps tool name → schema-arg-name that carries the
-# token-name. Resolved to an ERC20 at dispatch time via _resolve_token.
+# token-name. Resolved to an ERC20 at dispatch time via
+# defipy.twin._dispatch.resolve_token.
 _TOKEN_ARG_RENAMES = {
     "CalculateSlippage":  ("token_in_name", "token_in"),
     "AssessDepegRisk":    ("depeg_token_name", "depeg_token"),
 }
 
+# Live pool ids ("<protocol>:<address>") are compatible with the same
+# tools as the MockProvider recipe of their protocol family.
+_LIVE_PROTOCOL_RECIPES = {
+    "uniswap_v2":  "eth_dai_v2",
+    "uniswap_v3":  "eth_dai_v3",
+    "balancer":    "eth_dai_balancer_50_50",
+    "stableswap":  "usdc_dai_stableswap_A10",
+}
+
+# Tools whose primitives never mutate the twin they are given, so they
+# can run on the shared cached instance. test_server.py checks each one
+# leaves its twin untouched; a tool added to the registry but not here
+# gets a fork per call.
+_READ_ONLY_TOOLS = frozenset(_COMPATIBLE_RECIPES)
+
+# RunBatch runs one of the tools above over many argument sets and
+# returns a single table. Not a registry tool: it has no primitive of
+# its own. DEFIPY_MCP_MAX_BATCH caps the calls in one batch.
+_BATCH_TOOL = "RunBatch"
+_MAX_BATCH_CALLS = int(os.environ.get("DEFIPY_MCP_MAX_BATCH", "256"))
+
+
+# ─── Twin cache ──────────────────────────────────────────────────────────────
+
+
+class _TwinCache:
+    """Built twins keyed by (pool_id, block_number), LRU-bounded.
+
+    Building a twin is full uniswappy / balancerpy / stableswappy pool
+    construction, so each key is built once and checkout() hands it
+    out as either:
+
+      - the cached twin itself (read_only = True), for primitives that
+        only read it; or
+      - a StateTwinBuilder.fork() of it (read_only = False) — a
+        copy-on-write copy, cheaper than a build — for anything that
+        may swap / join.
+
+    block_number is None for MockProvider recipes, whose state never
+    changes. max_size = 0 disables the cache: every checkout builds.
+    Thread-safe; a twin is never built while holding the lock.
+    """
+
+    def __init__(self, provider, builder, max_size = 64):
+        if max_size < 0:
+            raise ValueError(
+                "_TwinCache: max_size must be >= 0; got {}".format(max_size)
+            )
+        self.provider = provider
+        self.builder = builder
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def checkout(self, pool_id: str, block_number = None,
+                 read_only: bool = False):
+        """Return (lp, cache_status); cache_status is "hit", "miss", or
+        "off" when caching is disabled."""
+        key = (pool_id, block_number)
+        with self._lock:
+            lp = self._entries.get(key)
+            if lp is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if lp is None:
+            lp = self._build(pool_id, block_number)
+            if self.max_size == 0:
+                return lp, "off"
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = lp
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last = False)
+                    self.evictions += 1
+            status = "miss"
+        else:
+            status = "hit"
+        if not read_only:
+            lp = self.builder.fork(lp)[0]
+        return lp, status
+
+    def invalidate(self, pool_id = None) -> None:
+        """Drop every cached twin, or only those of `pool_id`."""
+        with self._lock:
+            if pool_id is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == pool_id]:
+                    del self._entries[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _build(self, pool_id, block_number):
+        kwargs = {} if block_number is None else {"block_number": block_number}
+        return self.builder.build(self.provider.snapshot(pool_id, **kwargs))
+
+
+# ─── Live pools ──────────────────────────────────────────────────────────────
+
+
+def _is_live(pool_id) -> bool:
+    return isinstance(pool_id, str) and ":" in pool_id
+
+
+def _normalize_pool_id(pool_id):
+    """Lower-case the address of a live pool id, so casing variants
+    share cache entries. Recipe names pass through."""
+    if not _is_live(pool_id):
+        return pool_id
+    protocol, _, address = pool_id.partition(":")
+    return "{}:{}".format(protocol.strip(), address.strip().lower())
+
+
+def _compatible(tool_name: str, pool_id: str) -> bool:
+    recipes = _COMPATIBLE_RECIPES[tool_name]
+    if _is_live(pool_id):
+        protocol = pool_id.partition(":")[0]
+        return _LIVE_PROTOCOL_RECIPES.get(protocol) in recipes
+    return pool_id in recipes
+
+
+class _PoolProvider:
+    """Routes pool ids to MockProvider (recipe names) or LiveProvider
+    ("<protocol>:<address>").
+
+    `live` is None when no RPC endpoint is configured; live pool ids
+    are then rejected. At most `max_rpc_reads` live reads (snapshots
+    and chain-head lookups) are outstanding at once across worker
+    threads, so a burst of tool calls can't flood the endpoint. In
+    process mode the limit applies per worker process.
+    """
+
+    def __init__(self, mock, live = None, max_rpc_reads: int = 4):
+        if max_rpc_reads < 1:
+            raise ValueError(
+                "_PoolProvider: max_rpc_reads must be >= 1; got {}".format(
+                    max_rpc_reads)
+            )
+        self.mock = mock
+        self.live = live
+        self.max_rpc_reads = max_rpc_reads
+        self._rpc_slots = threading.BoundedSemaphore(max_rpc_reads)
+
+    def snapshot(self, pool_id: str, **kwargs):
+        if not _is_live(pool_id):
+            return self.mock.snapshot(pool_id, **kwargs)
+        with self._rpc_slots:
+            return self._live().snapshot(pool_id, **kwargs)
+
+    def latest_block(self) -> int:
+        with self._rpc_slots:
+            return self._live().get_w3().eth.block_number
+
+    def list_recipes(self) -> list:
+        return self.mock.list_recipes()
+
+    def _live(self):
+        if self.live is None:
+            raise ValueError(
+                "Live pool ids need an RPC endpoint: set DEFIPY_MCP_RPC_URL"
+            )
+        return self.live
+
+
+class _BlockPins:
+    """The block each client session's live reads are pinned to.
+
+    The first live call in a session pins the chain head at that
+    moment; every later live call in the session — any tool, any pool
+    — reads at the same block. Sessions are held weakly, so a pin goes
+    away with its session. `unpin` lets a session move to the new head.
+    """
+
+    def __init__(self):
+        self._pins = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def block_for(self, session, latest_block) -> int:
+        """Return the session's pinned block, pinning `latest_block()`
+        on first use."""
+        with self._lock:
+            block = self._pins.get(session)
+            if block is None:
+                block = self._pins[session] = latest_block()
+            return block
+
+    def unpin(self, session) -> None:
+        with self._lock:
+            self._pins.pop(session, None)
+
+
+class _DefaultSession:
+    """Session key for calls made outside an MCP request (tests, scripts)."""
+
+
+_DEFAULT_SESSION = _DefaultSession()
+
+
+def _live_provider():
+    """LiveProvider over DEFIPY_MCP_RPC_URL (comma-separated for several
+    endpoints), with a SnapshotCache; None when no URL is set."""
+    urls = [u.strip() for u in
+            os.environ.get("DEFIPY_MCP_RPC_URL", "").split(",") if u.strip()]
+    if not urls:
+        return None
+    cache = SnapshotCache(
+        max_size = int(os.environ.get("DEFIPY_MCP_SNAPSHOT_CACHE_SIZE", "1024")),
+        path = os.environ.get("DEFIPY_MCP_SNAPSHOT_CACHE") or None,
+    )
+    return LiveProvider(urls[0] if len(urls) == 1 else urls, cache = cache)
+
+
+_POOLS = _PoolProvider(
+    _PROVIDER, _live_provider(),
+    max_rpc_reads = int(os.environ.get("DEFIPY_MCP_RPC_CONCURRENCY", "4")),
+)
+_PINS = _BlockPins()
+
+# DEFIPY_MCP_TWIN_CACHE sets the cache size; 0 rebuilds on every call.
+_TWINS = _TwinCache(
+    _POOLS, _BUILDER,
+    max_size = int(os.environ.get("DEFIPY_MCP_TWIN_CACHE", "64")),
+)
+
 
 # ─── Schema wrapping ─────────────────────────────────────────────────────────
 
@@ -94,6 +364,7 @@ def _wrap_schemas_with_pool_id() -> list[dict]:
         props = w["inputSchema"].setdefault("properties", {})
         required = w["inputSchema"].setdefault("required", [])
 
+        recipes = sorted(_COMPATIBLE_RECIPES.get(tool_name, _PROVIDER.list_recipes()))
         props["pool_id"] = {
             "type": "string",
             "description": (
@@ -101,8 +372,20 @@ def _wrap_schemas_with_pool_id() -> list[dict]:
                 "available MockProvider recipes; pick the one matching "
                 "the protocol the user's question implies."
             ),
-            "enum": sorted(_COMPATIBLE_RECIPES.get(tool_name, _PROVIDER.list_recipes())),
+            "enum": recipes,
         }
+        if _POOLS.live is not None:
+            protocols = sorted(p for p, r in _LIVE_PROTOCOL_RECIPES.items()
+                               if r in recipes)
+            del props["pool_id"]["enum"]
+            props["pool_id"]["description"] = (
+                "Which pool to analyze. Required. Either a synthetic "
+                "recipe ({}) or a live on-chain pool as "
+                "'<protocol>:<address>' with protocol one of {}. Live "
+                "reads in one conversation are pinned to one block."
+            ).format(", ".join(recipes), ", ".join(protocols))
+            props["pool_id"]["pattern"] = "^({}|({}):0x[0-9a-fA-F]{{40}})$".format(
+                "|".join(recipes), "|".join(protocols))
         if "pool_id" not in required:
             required.append("pool_id")
 
@@ -123,44 +406,47 @@ def _wrap_schemas_with_pool_id() -> list[dict]:
     return wrapped
 
 
-# ─── Token resolution ────────────────────────────────────────────────────────
-
-
-def _resolve_token(lp, token_name: str):
-    """Resolve a token-name string to the ERC20 object the primitive expects.
-
-    V2/V3 exchanges expose tokens via `lp.factory.token_from_exchange[lp.name]`.
-    Balancer and Stableswap expose them via `lp.vault.get_token(name)`.
-    """
-    # V2 / V3 path.
-    factory = getattr(lp, "factory", None)
-    if factory is not None and hasattr(factory, "token_from_exchange"):
-        tokens = factory.token_from_exchange.get(lp.name, {})
-        if token_name in tokens:
-            return tokens[token_name]
-
-    # Balancer / Stableswap path.
-    vault = getattr(lp, "vault", None)
-    if vault is not None and hasattr(vault, "get_token"):
-        if token_name in vault.get_names():
-            return vault.get_token(token_name)
-
-    raise ValueError(
-        "Token {!r} not found in pool. Available: {}".format(
-            token_name, _list_pool_tokens(lp)
-        )
-    )
-
-
-def _list_pool_tokens(lp) -> list[str]:
-    """Enumerate the token names in a pool for error messages."""
-    factory = getattr(lp, "factory", None)
-    if factory is not None and hasattr(factory, "token_from_exchange"):
-        return sorted(factory.token_from_exchange.get(lp.name, {}).keys())
-    vault = getattr(lp, "vault", None)
-    if vault is not None and hasattr(vault, "get_names"):
-        return list(vault.get_names())
-    return []
+def _batch_schema() -> dict:
+    """MCP schema of the RunBatch tool."""
+    return {
+        "name": _BATCH_TOOL,
+        "description": (
+            "Run one of the other DeFiPy tools over many argument sets in "
+            "a single call, e.g. SimulatePriceMove at ten price changes or "
+            "CheckPoolHealth across several pools. Each entry of `calls` "
+            "holds the same arguments the tool itself takes, including "
+            "pool_id. Calls are grouped by pool so each pool is loaded "
+            "once, and pools are processed in parallel. Returns a compact "
+            "table: `columns` (pool_id, the tool's result fields, error) "
+            "and one row per call, in call order. A failed call has an "
+            "error message in its row; the other rows are unaffected."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "tool": {
+                    "type": "string",
+                    "description": "Name of the tool to run for every call.",
+                    "enum": sorted(_COMPATIBLE_RECIPES),
+                },
+                "calls": {
+                    "type": "array",
+                    "minItems": 1,
+                    "maxItems": _MAX_BATCH_CALLS,
+                    "description": (
+                        "Argument objects, one per call, each with a "
+                        "pool_id compatible with the tool."
+                    ),
+                    "items": {
+                        "type": "object",
+                        "properties": {"pool_id": {"type": "string"}},
+                        "required": ["pool_id"],
+                    },
+                },
+            },
+            "required": ["tool", "calls"],
+        },
+    }
 
 
 # ─── Receipt logging ─────────────────────────────────────────────────────────
@@ -169,7 +455,9 @@ def _list_pool_tokens(lp) -> list[str]:
 def _log_receipt(tool_name: str, pool_id: str, args: dict,
                  status: str, duration_ms: float,
                  result_summary: str = "",
-                 error_type: str = "", error_message: str = "") -> None:
+                 error_type: str = "", error_message: str = "",
+                 timings: dict = None, twin_cache: str = "",
+                 block_number: int = None) -> None:
     event = {
         "ts": datetime.now(timezone.utc).isoformat(),
         "tool": tool_name,
@@ -178,6 +466,15 @@ def _log_receipt(tool_name: str, pool_id: str, args: dict,
         "status": status,
         "duration_ms": round(duration_ms, 2),
     }
+    if timings:
+        # Per-phase breakdown of duration_ms: "queue" (waiting for a
+        # worker), "twin" (cache checkout, including any build / fork)
+        # and "primitive" (apply()).
+        event["timings_ms"] = {k: round(v, 3) for k, v in timings.items()}
+    if twin_cache:
+        event["twin_cache"] = twin_cache
+    if block_number is not None:
+        event["block_number"] = block_number
     if status == "ok":
         event["result_summary"] = result_summary
     else:
@@ -278,16 +575,295 @@ def _serialize_result(result) -> str:
     return json.dumps(payload, indent=2, default=str)
 
 
+# ─── Execution ───────────────────────────────────────────────────────────────
+
+
+def _execute(name: str, pool_id: str, primitive_args: dict,
+             read_only: bool, submitted_at: float,
+             block_number: int = None) -> dict:
+    """Check out the twin, resolve token-name args and run the primitive.
+
+    Runs on a _Dispatcher worker (thread, process, or inline), so it
+    never raises and returns only picklable values: a dict with
+    `result`, `error` — None or (message prefix, exception type name,
+    message) — and the `timings` / `twin_cache` fields for the receipt.
+    """
+    t_start = time.monotonic()
+    timings = {"queue": max(0.0, (time.time() - submitted_at) * 1000)}
+    outcome = {"result": None, "error": None,
+               "timings": timings, "twin_cache": ""}
+
+    try:
+        lp, outcome["twin_cache"] = _TWINS.checkout(
+            pool_id, block_number, read_only=read_only)
+    except Exception as e:
+        outcome["error"] = ("Error building twin: ", type(e).__name__, str(e))
+        return outcome
+    finally:
+        timings["twin"] = (time.monotonic() - t_start) * 1000
+
+    t_primitive = time.monotonic()
+    outcome["result"], outcome["error"] = _apply(name, lp, primitive_args)
+    timings["primitive"] = (time.monotonic() - t_primitive) * 1000
+    return outcome
+
+
+# Twin-cache outcomes of the RunBatch checkouts made on this worker
+# thread, for the batch receipt.
+_BATCH_CHECKOUTS = threading.local()
+
+
+def _checkout_batch_twin(block_number: int, read_only: bool, pool_id: str):
+    """run_batch's twin source for RunBatch: a _TWINS checkout, live
+    pools at the batch's pinned block."""
+    lp, cache = _TWINS.checkout(
+        pool_id, block_number if _is_live(pool_id) else None,
+        read_only=read_only)
+    _BATCH_CHECKOUTS.caches.append(cache)
+    return lp
+
+
+def _execute_batch(job) -> tuple:
+    """Run one pool's run_batch job on a _Dispatcher worker.
+
+    Returns the job's (result, error) pairs and the twin-cache outcomes
+    of the checkouts it made.
+    """
+    _BATCH_CHECKOUTS.caches = []
+    return job(), _BATCH_CHECKOUTS.caches
+
+
+def _apply(name: str, lp, primitive_args: dict):
+    """Resolve token-name args against `lp` and run the primitive.
+
+    Returns (result, None), or (None, (message prefix, exception type
+    name, message)) if either step raised.
+    """
+    # Token-name fields become ERC20 objects of the checked-out twin.
+    primitive_args = dict(primitive_args)
+    if name in _TOKEN_ARG_RENAMES:
+        schema_name, primitive_name = _TOKEN_ARG_RENAMES[name]
+        token_name = primitive_args.pop(schema_name, None)
+        if token_name is not None:
+            try:
+                primitive_args[primitive_name] = resolve_token(lp, token_name)
+            except Exception as e:
+                return None, ("Error resolving token: ",
+                              type(e).__name__, str(e))
+    try:
+        spec = TOOL_REGISTRY[name]
+        return spec.primitive_cls().apply(lp, **primitive_args), None
+    except Exception as e:
+        return None, ("Error: ", type(e).__name__, str(e))
+
+
+class _ServerBusy(Exception):
+    """Raised by _Dispatcher.run when max_pending calls are in flight."""
+
+
+class IncompatiblePool(Exception):
+    """Fails the RunBatch rows of a pool the batch's tool can't run on.
+    No leading underscore: the class name starts those rows' errors."""
+
+
+class _Dispatcher:
+    """Runs _execute off the event loop, with timeouts and a bounded queue.
+
+    mode
+        "thread" (default) — a ThreadPoolExecutor. Workers share the
+        server's twin cache. The event loop stays free to serve other
+        requests, but primitives are pure Python, so CPU-bound calls
+        still share the GIL.
+        "process" — a multiprocessing.Pool (fork start method where
+        available). CPU-bound calls run in parallel; each worker keeps
+        its own twin cache.
+        "inline" — run on the event loop, as before. No timeout.
+    workers
+        Pool size.
+    timeout
+        Seconds a call may run before it is reported as timed out.
+        None disables. `timeouts` overrides it per tool name.
+    max_pending
+        Calls admitted at once, queued or running. Further calls are
+        rejected with _ServerBusy instead of piling up.
+
+    A timed-out call is cancelled if it hasn't started. A thread that
+    is already running can't be interrupted: the client gets its
+    timeout error immediately, and the thread keeps its pending slot
+    until it returns, so runaway calls can't push the server past
+    max_pending. In process mode the pool is terminated and recreated
+    on the next call, which kills the runaway; other calls running on
+    that pool fail with an error saying so.
+    """
+
+    MODES = ("thread", "process", "inline")
+
+    def __init__(self, mode: str = "thread", workers: int = 4,
+                 timeout=30.0, max_pending: int = 32, timeouts=None):
+        if mode not in self.MODES:
+            raise ValueError(
+                "_Dispatcher: mode must be one of {}; got {!r}".format(
+                    self.MODES, mode)
+            )
+        if workers < 1:
+            raise ValueError(
+                "_Dispatcher: workers must be >= 1; got {}".format(workers)
+            )
+        if max_pending < 1:
+            raise ValueError(
+                "_Dispatcher: max_pending must be >= 1; got {}".format(
+                    max_pending)
+            )
+        for t in [timeout] + list((timeouts or {}).values()):
+            if t is not None and t <= 0:
+                raise ValueError(
+                    "_Dispatcher: timeouts must be positive or None; "
+                    "got {}".format(t)
+                )
+        self.mode = mode
+        self.workers = workers
+        self.timeout = timeout
+        self.timeouts = dict(timeouts or {})
+        self.max_pending = max_pending
+        self.pending = 0
+        self._lock = threading.Lock()
+        self._executor = None
+        self._inflight = set()
+
+    def timeout_for(self, name: str):
+        return self.timeouts.get(name, self.timeout)
+
+    async def run(self, name: str, *args, target=None) -> dict:
+        """Run _execute(name, *args); raises _ServerBusy when full and
+        asyncio.TimeoutError past the tool's timeout. A `target` runs
+        target(*args) instead, with `name` only picking the timeout."""
+        call = (target, args) if target is not None else (_execute, (name,) + args)
+        if self.mode == "inline":
+            return call[0](*call[1])
+        with self._lock:
+            if self.pending >= self.max_pending:
+                raise _ServerBusy(
+                    "{} tool calls already pending (max_pending={})".format(
+                        self.pending, self.max_pending)
+                )
+            self.pending += 1
+        try:
+            if self.mode == "thread":
+                return await self._run_thread(name, call)
+            return await self._run_process(name, call)
+        except BaseException:
+            if self.mode == "process":
+                self._release_process_slots()
+            raise
+
+    def close(self) -> None:
+        if self._executor is None:
+            return
+        if self.mode == "thread":
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._executor.terminate()
+        self._executor = None
+
+    def _release(self, *_):
+        with self._lock:
+            self.pending -= 1
+
+    async def _run_thread(self, name, call):
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="defipy-mcp")
+        future = self._executor.submit(call[0], *call[1])
+        # The slot is freed when the work finishes, not when we stop
+        # waiting for it.
+        future.add_done_callback(self._release)
+        return await asyncio.wait_for(asyncio.wrap_future(future),
+                                      self.timeout_for(name))
+
+    async def _run_process(self, name, call):
+        if self._executor is None:
+            method = "fork" if "fork" in multiprocessing.get_all_start_methods() \
+                else None
+            self._executor = multiprocessing.get_context(method).Pool(
+                self.workers)
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._inflight.add(waiter)
+
+        def settle(setter, value):
+            if waiter in self._inflight:
+                self._inflight.discard(waiter)
+                self._release()
+                if not waiter.done():
+                    setter(value)
+
+        self._executor.apply_async(
+            call[0], call[1],
+            callback=lambda r: loop.call_soon_threadsafe(
+                settle, waiter.set_result, r),
+            error_callback=lambda e: loop.call_soon_threadsafe(
+                settle, waiter.set_exception, e),
+        )
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter),
+                                          self.timeout_for(name))
+        except asyncio.TimeoutError:
+            # Kill the runaway: terminate the pool (recreated on the
+            # next call) and fail everything else that was running on it.
+            self._executor.terminate()
+            self._executor = None
+            for other in list(self._inflight):
+                if other is not waiter and not other.done():
+                    other.set_exception(RuntimeError(
+                        "worker pool restarted: {} timed out".format(name)))
+            raise
+
+    def _release_process_slots(self):
+        # After a pool restart no callbacks will arrive for its calls.
+        if self._executor is None:
+            with self._lock:
+                self.pending -= len(self._inflight)
+            self._inflight.clear()
+
+
+def _env_timeouts(spec: str) -> dict:
+    """Parse "ToolA=60,ToolB=5" into {"ToolA": 60.0, "ToolB": 5.0}."""
+    timeouts = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        tool, _, seconds = item.partition("=")
+        timeouts[tool.strip()] = float(seconds)
+    return timeouts
+
+
+def _env_timeout(value: str):
+    seconds = float(value)
+    return seconds if seconds > 0 else None
+
+
+# Configured from the environment; see python/mcp/README.md.
+_DISPATCHER = _Dispatcher(
+    mode=os.environ.get("DEFIPY_MCP_EXECUTOR", "thread"),
+    workers=int(os.environ.get("DEFIPY_MCP_WORKERS", "4")),
+    timeout=_env_timeout(os.environ.get("DEFIPY_MCP_TIMEOUT", "30")),
+    max_pending=int(os.environ.get("DEFIPY_MCP_MAX_PENDING", "32")),
+    timeouts=_env_timeouts(os.environ.get("DEFIPY_MCP_TOOL_TIMEOUTS", "")),
+)
+
+
 # ─── Core dispatch ───────────────────────────────────────────────────────────
 
 
-async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+async def call_tool(name: str, arguments: dict,
+                    session=None) -> list[TextContent]:
     """Dispatch a single tool invocation. Separable from the stdio loop
-    so tests can exercise it directly."""
+    so tests can exercise it directly. `session` keys the live-pool
+    block pin; the MCP handler passes the client session."""
 
     t0 = time.monotonic()
     arguments = dict(arguments or {})
-    pool_id = arguments.get("pool_id", "")
+    if name == _BATCH_TOOL:
+        return await _call_batch(arguments, session)
+    pool_id = _normalize_pool_id(arguments.get("pool_id", ""))
 
     # Unknown tool.
     if name not in TOOL_REGISTRY or name not in _COMPATIBLE_RECIPES:
@@ -298,59 +874,176 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text="Error: {}".format(err))]
 
     # Incompatible pool.
-    if pool_id not in _COMPATIBLE_RECIPES[name]:
+    if not _compatible(name, pool_id):
         err = ("Tool {!r} is not compatible with pool {!r}. "
                "Compatible pools: {}".format(
                    name, pool_id, _COMPATIBLE_RECIPES[name]))
+        if _POOLS.live is not None:
+            err += " or live '<protocol>:<address>' pools of protocol {}".format(
+                [p for p, r in _LIVE_PROTOCOL_RECIPES.items()
+                 if r in _COMPATIBLE_RECIPES[name]])
         _log_receipt(name, pool_id, arguments, "error",
                      (time.monotonic() - t0) * 1000,
                      error_type="IncompatiblePool", error_message=err)
         return [TextContent(type="text", text="Error: {}".format(err))]
 
-    # Build fresh twin per call.
+    # Live pool: read at the session's pinned block.
+    block_number = None
+    if _is_live(pool_id):
+        try:
+            block_number = await asyncio.to_thread(
+                _PINS.block_for,
+                session if session is not None else _DEFAULT_SESSION,
+                _POOLS.latest_block)
+        except Exception as e:
+            _log_receipt(name, pool_id, arguments, "error",
+                         (time.monotonic() - t0) * 1000,
+                         error_type=type(e).__name__, error_message=str(e))
+            return [TextContent(type="text",
+                                text="Error reading chain head: {}".format(e))]
+
+    # Strip pool_id from LLM args; the worker checks out the twin
+    # (shared for read-only tools, forked otherwise), resolves token
+    # names against it and runs the primitive.
+    primitive_args = {k: v for k, v in arguments.items() if k != "pool_id"}
     try:
-        snapshot = _PROVIDER.snapshot(pool_id)
-        lp = _BUILDER.build(snapshot)
-    except Exception as e:
+        outcome = await _DISPATCHER.run(
+            name, pool_id, primitive_args, name in _READ_ONLY_TOOLS,
+            time.time(), block_number)
+    except _ServerBusy as e:
         _log_receipt(name, pool_id, arguments, "error",
                      (time.monotonic() - t0) * 1000,
-                     error_type=type(e).__name__, error_message=str(e))
+                     error_type="ServerBusy", error_message=str(e))
         return [TextContent(type="text",
-                            text="Error building twin: {}".format(e))]
-
-    # Strip pool_id (and token-name fields) from LLM args before calling
-    # the primitive; resolve ERC20 objects as needed.
-    primitive_args = {k: v for k, v in arguments.items() if k != "pool_id"}
-
-    if name in _TOKEN_ARG_RENAMES:
-        schema_name, primitive_name = _TOKEN_ARG_RENAMES[name]
-        token_name = primitive_args.pop(schema_name, None)
-        if token_name is not None:
-            try:
-                primitive_args[primitive_name] = _resolve_token(lp, token_name)
-            except Exception as e:
-                _log_receipt(name, pool_id, arguments, "error",
-                             (time.monotonic() - t0) * 1000,
-                             error_type=type(e).__name__, error_message=str(e))
-                return [TextContent(type="text",
-                                    text="Error resolving token: {}".format(e))]
-
-    # Invoke primitive.
-    try:
-        spec = TOOL_REGISTRY[name]
-        result = spec.primitive_cls().apply(lp, **primitive_args)
+                            text="Error: server busy: {}".format(e))]
+    except asyncio.TimeoutError:
+        err = "{} timed out after {}s".format(
+            name, _DISPATCHER.timeout_for(name))
+        _log_receipt(name, pool_id, arguments, "error",
+                     (time.monotonic() - t0) * 1000,
+                     error_type="Timeout", error_message=err)
+        return [TextContent(type="text", text="Error: {}".format(err))]
     except Exception as e:
         _log_receipt(name, pool_id, arguments, "error",
                      (time.monotonic() - t0) * 1000,
                      error_type=type(e).__name__, error_message=str(e))
         return [TextContent(type="text", text="Error: {}".format(e))]
 
+    if outcome["error"] is not None:
+        prefix, error_type, message = outcome["error"]
+        _log_receipt(name, pool_id, arguments, "error",
+                     (time.monotonic() - t0) * 1000,
+                     error_type=error_type, error_message=message,
+                     timings=outcome["timings"],
+                     twin_cache=outcome["twin_cache"],
+                     block_number=block_number)
+        return [TextContent(type="text", text=prefix + message)]
+
+    result = outcome["result"]
     duration_ms = (time.monotonic() - t0) * 1000
     _log_receipt(name, pool_id, arguments, "ok", duration_ms,
-                 result_summary=_summarize(name, result))
+                 result_summary=_summarize(name, result),
+                 timings=outcome["timings"],
+                 twin_cache=outcome["twin_cache"],
+                 block_number=block_number)
     return [TextContent(type="text", text=_serialize_result(result))]
 
 
+async def _call_batch(arguments: dict, session=None) -> list[TextContent]:
+    """Dispatch a RunBatch invocation through defipy.tools.run_batch,
+    each pool's share running as one _execute_batch job on the
+    dispatcher. One receipt for the batch."""
+
+    t0 = time.monotonic()
+    tool = arguments.get("tool")
+    calls = arguments.get("calls")
+    receipt_args = {"tool": tool,
+                    "calls": len(calls) if isinstance(calls, list) else calls}
+
+    def fail(error_type, err):
+        _log_receipt(_BATCH_TOOL, "", receipt_args, "error",
+                     (time.monotonic() - t0) * 1000,
+                     error_type=error_type, error_message=err)
+        return [TextContent(type="text", text="Error: {}".format(err))]
+
+    if tool not in TOOL_REGISTRY or tool not in _COMPATIBLE_RECIPES:
+        return fail("UnknownTool", "Unknown tool: {}".format(tool))
+    if not isinstance(calls, list) or not calls or \
+            not all(isinstance(c, dict) for c in calls):
+        return fail("InvalidArguments",
+                    "calls must be a non-empty list of argument objects")
+    if len(calls) > _MAX_BATCH_CALLS:
+        return fail("BatchTooLarge", "{} calls in batch (max {})".format(
+            len(calls), _MAX_BATCH_CALLS))
+
+    # Schema token-name fields go to run_batch under the primitive's
+    # parameter name; it resolves them against each twin.
+    batch_calls = []
+    for call in calls:
+        call = dict(call, pool_id=_normalize_pool_id(call.get("pool_id", "")))
+        if tool in _TOKEN_ARG_RENAMES:
+            schema_name, primitive_name = _TOKEN_ARG_RENAMES[tool]
+            if schema_name in call:
+                call[primitive_name] = call.pop(schema_name)
+        batch_calls.append(call)
+    pool_ids = {call["pool_id"] for call in batch_calls}
+
+    # Live pools in the batch are all read at the session's pinned block.
+    block_number = None
+    if any(_is_live(pool_id) and _compatible(tool, pool_id)
+           for pool_id in pool_ids):
+        try:
+            block_number = await asyncio.to_thread(
+                _PINS.block_for,
+                session if session is not None else _DEFAULT_SESSION,
+                _POOLS.latest_block)
+        except Exception as e:
+            return fail(type(e).__name__,
+                        "reading chain head: {}".format(e))
+
+    loop = asyncio.get_running_loop()
+    caches = []
+
+    def run_pool(pool_id, job):
+        # Incompatible pools fail their own rows only, without a job.
+        if not _compatible(tool, pool_id):
+            raise IncompatiblePool(
+                "tool {!r} is not compatible with pool {!r}".format(
+                    tool, pool_id))
+        future = asyncio.run_coroutine_threadsafe(
+            _DISPATCHER.run(_BATCH_TOOL, job, target=_execute_batch), loop)
+        try:
+            results, pool_caches = future.result()
+        except asyncio.TimeoutError:
+            raise TimeoutError("{} timed out after {}s".format(
+                _BATCH_TOOL, _DISPATCHER.timeout_for(_BATCH_TOOL)))
+        caches.extend(pool_caches)
+        return results
+
+    # At most `workers` pools in flight, so one wide batch can't take
+    # every max_pending slot by itself.
+    table = await asyncio.to_thread(
+        run_batch, tool, batch_calls,
+        functools.partial(_checkout_batch_twin, block_number,
+                          tool in _READ_ONLY_TOOLS),
+        max_workers=_DISPATCHER.workers,
+        read_only=tool in _READ_ONLY_TOOLS,
+        run_pool=run_pool)
+
+    _log_receipt(_BATCH_TOOL, ",".join(sorted(pool_ids)), receipt_args, "ok",
+                 (time.monotonic() - t0) * 1000,
+                 result_summary="tool={}, rows={}, errors={}, pools={}".format(
+                     tool, len(table), table.errors, len(pool_ids)),
+                 twin_cache=",".join(sorted(set(caches))),
+                 block_number=block_number)
+    payload = {"tool": table.tool, "errors": table.errors,
+               "columns": table.columns, "rows": table.rows}
+    if block_number is not None:
+        payload["block_number"] = block_number
+    return [TextContent(type="text", text=json.dumps(
+        payload, separators=(",", ":"), default=str))]
+
+
 # ─── Server init ─────────────────────────────────────────────────────────────
 
 
@@ -369,17 +1062,18 @@ def _build_server() -> Server:
                 description = s["description"],
                 inputSchema = s["inputSchema"],
             )
-            for s in _wrap_schemas_with_pool_id()
+            for s in _wrap_schemas_with_pool_id() + [_batch_schema()]
         ]
 
     @server.call_tool()
     async def handle_call(name: str, arguments: dict) -> list[TextContent]:
-        return await call_tool(name, arguments)
+        return await call_tool(name, arguments,
+                               session=server.request_context.session)
 
     return server
 
 
-async def main():
+async def _serve_stdio():
     server = _build_server()
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
@@ -388,5 +1082,201 @@ async def main():
         )
 
 
+# ─── HTTP transport ──────────────────────────────────────────────────────────
+
+
+class _ASGIApp:
+    """Wrap an (scope, receive, send) coroutine so Starlette's Route
+    treats it as a raw ASGI app rather than a request handler."""
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    async def __call__(self, scope, receive, send):
+        await self.handler(scope, receive, send)
+
+
+def _security_settings(host: str):
+    """DNS-rebinding protection for loopback binds, as the MCP SDK's
+    FastMCP does; None (off) for any other host."""
+    from mcp.server.transport_security import TransportSecuritySettings
+    if host not in ("127.0.0.1", "localhost", "::1"):
+        return None
+    return TransportSecuritySettings(
+        enable_dns_rebinding_protection=True,
+        allowed_hosts=["127.0.0.1:*", "localhost:*", "[::1]:*"],
+        allowed_origins=["http://127.0.0.1:*", "http://localhost:*",
+                         "http://[::1]:*"],
+    )
+
+
+def _build_http_app(transport: str = "http", host: str = "127.0.0.1",
+                    stateless: bool = False):
+    """Starlette app serving the MCP server over HTTP.
+
+    transport "http" is streamable HTTP: POST / GET /mcp, responses
+    streamed as SSE. With `stateless` every request is its own session
+    (no Mcp-Session-Id), which any worker can serve. transport "sse" is
+    the older SSE transport (GET /sse, POST /messages/), kept for
+    clients that predate streamable HTTP.
+
+    Both add GET /healthz: worker pid plus twin / snapshot cache stats.
+    """
+    from starlette.applications import Starlette
+    from starlette.responses import JSONResponse
+    from starlette.routing import Mount, Route
+
+    server = _build_server()
+    security = _security_settings(host)
+
+    async def healthz(request):
+        live_cache = getattr(_POOLS.live, "cache", None)
+        return JSONResponse({
+            "status": "ok",
+            "pid": os.getpid(),
+            "transport": transport,
+            "twin_cache": _TWINS.stats(),
+            "snapshot_cache": live_cache.stats() if live_cache else None,
+        })
+
+    routes = [Route("/healthz", endpoint=healthz)]
+
+    if transport == "http":
+        from mcp.server.streamable_http_manager import (
+            StreamableHTTPSessionManager,
+        )
+        manager = StreamableHTTPSessionManager(
+            app=server, stateless=stateless, security_settings=security)
+        routes.append(Route("/mcp", endpoint=_ASGIApp(manager.handle_request)))
+        return Starlette(routes=routes, lifespan=lambda app: manager.run())
+
+    if transport == "sse":
+        from mcp.server.sse import SseServerTransport
+        sse = SseServerTransport("/messages/", security_settings=security)
+
+        async def handle_sse(scope, receive, send):
+            async with sse.connect_sse(scope, receive, send) as streams:
+                await server.run(streams[0], streams[1],
+                                 server.create_initialization_options())
+
+        routes.append(Route("/sse", endpoint=_ASGIApp(handle_sse),
+                            methods=["GET"]))
+        routes.append(Mount("/messages/", app=sse.handle_post_message))
+        return Starlette(routes=routes)
+
+    raise ValueError(
+        "_build_http_app: transport must be 'http' or 'sse'; got {!r}".format(
+            transport)
+    )
+
+
+def _warm_twins() -> None:
+    """Build every MockProvider recipe's twin into _TWINS, so pre-forked
+    workers start with them (shared copy-on-write)."""
+    for recipe in _PROVIDER.list_recipes():
+        _TWINS.checkout(recipe, read_only=True)
+
+
+def _prefork(config, workers: int) -> None:
+    """Bind the listening socket once, warm the caches, fork `workers`
+    uvicorn servers sharing the socket, and supervise them: a worker
+    that dies is replaced; SIGINT / SIGTERM stop them all."""
+    import uvicorn
+
+    sock = config.bind_socket()
+    _warm_twins()
+    children = set()
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            code = 0
+            try:
+                uvicorn.Server(config).run(sockets=[sock])
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+        children.add(pid)
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    for _ in range(workers):
+        spawn()
+    print("defipy MCP server: {} workers on http://{}:{}".format(
+        workers, config.host, config.port), file=sys.stderr, flush=True)
+
+    while children:
+        try:
+            pid, _status = os.wait()
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        if not stopping:
+            print("defipy MCP server: worker {} exited; restarting".format(pid),
+                  file=sys.stderr, flush=True)
+            spawn()
+    sock.close()
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="DeFiPy MCP server (stdio, streamable HTTP or SSE).",
+    )
+    parser.add_argument("--transport", choices=["stdio", "http", "sse"],
+                        default="stdio",
+                        help="Default: stdio (one client per process).")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="HTTP bind address (default: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=8000,
+                        help="HTTP port (default: 8000).")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Pre-forked HTTP worker processes (default: 1). "
+                             "More than one implies --stateless.")
+    parser.add_argument("--stateless", action="store_true",
+                        help="Streamable HTTP without sessions: every "
+                             "request stands alone.")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.workers > 1 and args.transport != "http":
+        parser.error("--workers > 1 needs --transport http")
+    if args.workers > 1 and not hasattr(os, "fork"):
+        parser.error("--workers > 1 needs os.fork (POSIX)")
+    return args
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    if args.transport == "stdio":
+        asyncio.run(_serve_stdio())
+        return
+
+    import uvicorn
+    # A session lives in one worker's memory, and the shared socket
+    # doesn't route a client back to the same worker, so more than one
+    # worker runs stateless.
+    stateless = args.stateless or args.workers > 1
+    app = _build_http_app(args.transport, args.host, stateless)
+    config = uvicorn.Config(app, host=args.host, port=args.port,
+                            log_level="warning", lifespan="on")
+    if args.workers == 1:
+        uvicorn.Server(config).run()
+    else:
+        _prefork(config, args.workers)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
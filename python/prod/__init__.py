@@ -1,69 +1,33 @@
-from defipy.erc import *
-from defipy.math.basic import *
-from defipy.math.interest import *
-from defipy.math.interest.ips import *
-from defipy.math.interest.ips.aggregate import *
-from defipy.math.model import *
-from defipy.math.risk import *
-from defipy.process import *
-from defipy.process.burn import *
-from defipy.process.deposit import *
-from defipy.process.liquidity import *
-from defipy.process.mint import *
-from defipy.process.swap import *
-from defipy.process.join import *
-from defipy.analytics.simulate import *
-from defipy.analytics.risk import *
-from defipy.utils.interfaces import *
-from defipy.utils.data import *
-from defipy.utils.client import *
-from defipy.utils.client.contract import *
-from defipy.utils.tools import *
-
-# Agent modules require web3scout, available via the [book] extra.
-# If web3scout (or any of its transitive deps like a specific web3.py
-# surface) isn't satisfied, skip agent imports so core defipy
-# (primitives, math, analytics) remains usable.
-try:
-    from defipy.agents.config import *
-    from defipy.agents.data import *
-    from defipy.agents import *
-except ImportError as _agent_import_err:
-    import warnings as _warnings
-    _warnings.warn(
-        "defipy.agents could not be imported ({}). Agents require "
-        "web3scout + a compatible web3.py; install with: "
-        "pip install defipy[book]".format(_agent_import_err),
-        ImportWarning,
-        stacklevel=2,
-    )
-    del _warnings
-    del _agent_import_err
-
-from defipy.primitives import *
-from defipy.primitives.position import *
-
-from uniswappy.cpt.exchg import *
-from uniswappy.cpt.factory import *
-from uniswappy.cpt.index import *
-from uniswappy.cpt.quote import *
-from uniswappy.cpt.vault import *
-from uniswappy.cpt.wallet import *
-from uniswappy.utils.tools.v3 import *
-
-from stableswappy.quote import *
-from stableswappy.vault import *
-from stableswappy.cst.factory import *
-from stableswappy.cst.exchg import *
-from stableswappy.utils.data import StableswapExchangeData
-
-from balancerpy.quote import *
-from balancerpy.vault import *
-from balancerpy.cwpt.factory import *
-from balancerpy.cwpt.exchg import *
-from balancerpy.enums import *
-from balancerpy.utils.data import BalancerExchangeData
-
-
-
-  
\ No newline at end of file
+# Top-level names load on first use; see defipy/_lazy.py for the export
+# list and for DEFIPY_EAGER_IMPORT=1, which restores the eager import.
+import importlib as _importlib
+import os as _os
+
+if _os.environ.get("DEFIPY_EAGER_IMPORT", "") not in ("", "0"):
+    _importlib.import_module("defipy._lazy").load_all(globals())
+else:
+    from defipy._lazy_index import INDEX as _INDEX
+
+    def __getattr__(name):
+        if name == "__all__":
+            # `from defipy import *` wants everything: load it once.
+            _importlib.import_module("defipy._lazy").load_all(globals())
+            names = [n for n in globals() if not n.startswith("_")]
+            globals()["__all__"] = names
+            return names
+        if name in _INDEX:
+            lazy = _importlib.import_module("defipy._lazy")
+            value = lazy.resolve(name, _INDEX)
+            globals()[name] = value
+            return value
+        if not name.startswith("_"):
+            # Sub-packages (defipy.primitives, defipy.twin, ...).
+            try:
+                return _importlib.import_module("defipy." + name)
+            except ModuleNotFoundError as e:
+                if e.name != "defipy." + name:
+                    raise
+        raise AttributeError("module 'defipy' has no attribute {!r}".format(name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(_INDEX))
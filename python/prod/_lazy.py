@@ -0,0 +1,185 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Lazy top-level namespace for `import defipy` (PEP 562).
+
+The top-level package re-exports the defipy sub-packages plus the
+uniswappy / balancerpy / stableswappy exchange, factory, quote and
+vault packages, and the agents. Importing all of them eagerly costs
+seconds (agents pull in web3scout → web3), and because every
+`from defipy.<sub> import ...` runs the package __init__ first, even
+`from defipy.twin import MockProvider` used to pay it.
+
+Instead, `defipy/__init__.py` only loads `_lazy_index.INDEX` — a
+generated map of every exported name to the module it comes from —
+and resolves a name on first attribute access, caching it in the
+package namespace. `from defipy import *` still works: `__all__` is
+itself served lazily and loads the whole namespace.
+
+EXPORTS below is the single source of truth for what the package
+re-exports, in the eager import order (later entries win, as with the
+original star imports). After changing it, or the public names of a
+re-exported module, regenerate the index:
+
+    python -m defipy._lazy
+
+test_lazy_import checks that the index matches.
+
+Setting DEFIPY_EAGER_IMPORT=1 restores the old eager behaviour.
+"""
+
+import importlib
+import os
+import warnings
+
+
+# (module, names) — names None means `from module import *`.
+EXPORTS = (
+    ("defipy.erc", None),
+    ("defipy.math.basic", None),
+    ("defipy.math.interest", None),
+    ("defipy.math.interest.ips", None),
+    ("defipy.math.interest.ips.aggregate", None),
+    ("defipy.math.model", None),
+    ("defipy.math.risk", None),
+    ("defipy.process", None),
+    ("defipy.process.burn", None),
+    ("defipy.process.deposit", None),
+    ("defipy.process.liquidity", None),
+    ("defipy.process.mint", None),
+    ("defipy.process.swap", None),
+    ("defipy.process.join", None),
+    ("defipy.analytics.simulate", None),
+    ("defipy.analytics.risk", None),
+    ("defipy.utils.interfaces", None),
+    ("defipy.utils.data", None),
+    ("defipy.utils.client", None),
+    ("defipy.utils.client.contract", None),
+    ("defipy.utils.tools", None),
+    ("defipy.agents.config", None),
+    ("defipy.agents.data", None),
+    ("defipy.agents", None),
+    ("defipy.primitives", None),
+    ("defipy.primitives.position", None),
+    ("uniswappy.cpt.exchg", None),
+    ("uniswappy.cpt.factory", None),
+    ("uniswappy.cpt.index", None),
+    ("uniswappy.cpt.quote", None),
+    ("uniswappy.cpt.vault", None),
+    ("uniswappy.cpt.wallet", None),
+    ("uniswappy.utils.tools.v3", None),
+    ("stableswappy.quote", None),
+    ("stableswappy.vault", None),
+    ("stableswappy.cst.factory", None),
+    ("stableswappy.cst.exchg", None),
+    ("stableswappy.utils.data", ("StableswapExchangeData",)),
+    ("balancerpy.quote", None),
+    ("balancerpy.vault", None),
+    ("balancerpy.cwpt.factory", None),
+    ("balancerpy.cwpt.exchg", None),
+    ("balancerpy.enums", None),
+    ("balancerpy.utils.data", ("BalancerExchangeData",)),
+)
+
+# Agent modules require web3scout, available via the [book] extra. If
+# it (or a compatible web3.py) is missing, their names are left out
+# and the rest of defipy stays usable.
+OPTIONAL_PREFIX = "defipy.agents"
+
+_AGENTS_HINT = (
+    "defipy.agents could not be imported ({}). Agents require "
+    "web3scout + a compatible web3.py; install with: "
+    "pip install defipy[book]"
+)
+
+
+def star_names(module):
+    """Names `from module import *` binds, right now."""
+    names = getattr(module, "__all__", None)
+    if names is None:
+        names = [n for n in vars(module) if not n.startswith("_")]
+    return list(names)
+
+
+def load_all(namespace):
+    """Run every EXPORTS import into `namespace`, in order; return the
+    resulting {name: source module}. Agent import failures warn and
+    are skipped."""
+    sources = {}
+    for module_name, names in EXPORTS:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            if not module_name.startswith(OPTIONAL_PREFIX):
+                raise
+            warnings.warn(_AGENTS_HINT.format(e), ImportWarning, stacklevel = 3)
+            continue
+        for name in (names or star_names(module)):
+            namespace[name] = getattr(module, name)
+            sources[name] = module_name
+    return sources
+
+
+def resolve(name, index):
+    """Look one exported name up in its source module."""
+    module_name = index[name]
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        if not module_name.startswith(OPTIONAL_PREFIX):
+            raise
+        raise AttributeError(
+            "module 'defipy' has no attribute {!r}: {}".format(
+                name, _AGENTS_HINT.format(e)
+            )
+        ) from e
+    return getattr(module, name)
+
+
+def build_index():
+    """{name: source module} for every name the eager import exports.
+
+    Runs the eager import into a scratch namespace, so it must be
+    called in a process that can import everything (agents included).
+    Sub-packages of defipy that the imports bind as attributes of the
+    package itself (defipy.primitives, defipy.erc, ...) are not in the
+    index; the package's __getattr__ imports those on demand.
+    """
+    return dict(sorted(load_all({}).items()))
+
+
+def write_index(path = None):
+    """Regenerate _lazy_index.py next to this file."""
+    import pprint
+    path = path or os.path.join(os.path.dirname(__file__), "_lazy_index.py")
+    with open(os.path.join(os.path.dirname(__file__), "_lazy.py")) as f:
+        header = "".join(f.readlines()[:17])
+    with open(path, "w") as f:
+        f.write(header)
+        f.write(
+            "\n# Generated by `python -m defipy._lazy` — do not edit by hand.\n"
+            "# Maps every name `import defipy` exports to its source module.\n\n"
+        )
+        f.write("INDEX = ")
+        f.write(pprint.pformat(build_index(), width = 79, sort_dicts = False))
+        f.write("\n")
+    return path
+
+
+if __name__ == "__main__":
+    print("wrote {}".format(write_index()))
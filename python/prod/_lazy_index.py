@@ -0,0 +1,215 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+# Generated by `python -m defipy._lazy` — do not edit by hand.
+# Maps every name `import defipy` exports to its source module.
+
+INDEX = {'ABC': 'defipy.math.interest.ips',
+ 'ABCMeta': 'defipy.math.interest.ips',
+ 'API0x': 'defipy.utils.client',
+ 'AddLiquidity': 'defipy.process.liquidity',
+ 'AggregateIPS': 'defipy.math.interest.ips.aggregate',
+ 'AggregatePortfolio': 'defipy.primitives',
+ 'AnalyzeBalancerPosition': 'defipy.primitives.position',
+ 'AnalyzePosition': 'defipy.primitives.position',
+ 'AnalyzeStableswapPosition': 'defipy.primitives.position',
+ 'Arbitrage': 'defipy.analytics.simulate',
+ 'AssessDepegRisk': 'defipy.primitives',
+ 'BalancerExchange': 'balancerpy.cwpt.exchg',
+ 'BalancerExchangeData': 'balancerpy.utils.data',
+ 'BalancerFactory': 'balancerpy.cwpt.factory',
+ 'BalancerMath': 'balancerpy.cwpt.exchg',
+ 'BalancerPositionAnalysis': 'defipy.utils.data',
+ 'BalancerPriceMoveScenario': 'defipy.utils.data',
+ 'BalancerVault': 'balancerpy.vault',
+ 'BreakEvenAlphas': 'defipy.utils.data',
+ 'BreakEvenTime': 'defipy.utils.data',
+ 'BrownianModel': 'defipy.math.model',
+ 'CSQuote': 'stableswappy.quote',
+ 'CWPQuote': 'balancerpy.quote',
+ 'CalculateSlippage': 'defipy.primitives',
+ 'Chain0x': 'defipy.utils.data',
+ 'CheckPoolHealth': 'defipy.primitives',
+ 'CheckTickRangeStatus': 'defipy.primitives',
+ 'ChildLP': 'uniswappy.cpt.exchg',
+ 'ChildUniswapExchange': 'uniswappy.cpt.exchg',
+ 'CompactResult': 'defipy.utils.data',
+ 'CompareFeeTiers': 'defipy.primitives',
+ 'CompareProtocols': 'defipy.primitives',
+ 'CompoundReturn': 'defipy.math.interest',
+ 'ConstantIPS': 'defipy.math.interest.ips',
+ 'CorrectReserves': 'defipy.analytics.simulate',
+ 'DAYS_IN_YEAR': 'defipy.math.interest.ips',
+ 'DOAERC20': 'defipy.erc',
+ 'Decimal': 'defipy.math.basic',
+ 'DepegRiskAssessment': 'defipy.utils.data',
+ 'DepegScenario': 'defipy.utils.data',
+ 'DepositSplitBatch': 'defipy.utils.data',
+ 'DepositSplitResult': 'defipy.utils.data',
+ 'DetectFeeAnomaly': 'defipy.primitives',
+ 'DetectMEV': 'defipy.primitives',
+ 'DetectRugSignals': 'defipy.primitives',
+ 'ERC20': 'defipy.erc',
+ 'EvaluateRebalance': 'defipy.primitives',
+ 'EvaluateTickRanges': 'defipy.primitives',
+ 'EventSelectionModel': 'defipy.math.model',
+ 'ExchangeData': 'defipy.utils.data',
+ 'ExecuteScript': 'defipy.utils.client.contract',
+ 'FactoryData': 'defipy.utils.data',
+ 'FeeAnomalyResult': 'defipy.utils.data',
+ 'FeeTierCandidate': 'defipy.utils.data',
+ 'FeeTierComparison': 'defipy.utils.data',
+ 'FeeTierMetrics': 'defipy.utils.data',
+ 'FindBreakEvenPrice': 'defipy.primitives.position',
+ 'FindBreakEvenTime': 'defipy.primitives.position',
+ 'FullMath': 'uniswappy.utils.tools.v3',
+ 'HOURS_IN_DAY': 'defipy.math.interest.ips',
+ 'IDGenerator': 'defipy.math.basic',
+ 'IExchange': 'defipy.utils.interfaces',
+ 'IExchangeFactory': 'defipy.utils.interfaces',
+ 'IPS': 'defipy.math.interest.ips.aggregate',
+ 'ImpermanentLossAgent': 'defipy.agents',
+ 'ImpermanentLossConfig': 'defipy.agents.config',
+ 'IndexERC20': 'defipy.erc',
+ 'IndexTokenBurn': 'defipy.process.burn',
+ 'IndexTokenQuote': 'uniswappy.cpt.quote',
+ 'IndexVault': 'uniswappy.cpt.vault',
+ 'Join': 'defipy.process.join',
+ 'JoinTree': 'defipy.process.join',
+ 'LPERC20': 'defipy.erc',
+ 'LPQuote': 'uniswappy.cpt.quote',
+ 'LPTokenQuote': 'uniswappy.cpt.quote',
+ 'LPType': 'defipy.utils.data',
+ 'LiquidityMath': 'uniswappy.utils.tools.v3',
+ 'MAX_TRADE': 'defipy.math.model',
+ 'MEVDetectionResult': 'defipy.utils.data',
+ 'MarkovState': 'defipy.analytics.simulate',
+ 'MaxDrop': 'defipy.math.risk',
+ 'MockAddress': 'defipy.utils.tools',
+ 'ModelQueue': 'defipy.math.model',
+ 'OptimalDepositSplit': 'defipy.primitives',
+ 'OptimalTradeSplit': 'defipy.primitives',
+ 'PoolHealth': 'defipy.utils.data',
+ 'PortfolioAnalysis': 'defipy.utils.data',
+ 'PortfolioPosition': 'defipy.utils.data',
+ 'Position': 'uniswappy.utils.tools.v3',
+ 'PositionAnalysis': 'defipy.utils.data',
+ 'PositionSummary': 'defipy.utils.data',
+ 'PriceMoveScenario': 'defipy.utils.data',
+ 'PriceMoveScenarioBatch': 'defipy.utils.data',
+ 'PriceThresholdConfig': 'defipy.agents.config',
+ 'PriceThresholdSwapAgent': 'defipy.agents',
+ 'Proc': 'balancerpy.enums',
+ 'Process': 'defipy.process',
+ 'ProtocolComparison': 'defipy.utils.data',
+ 'ProtocolMetrics': 'defipy.utils.data',
+ 'QuantTerminal': 'defipy.analytics.simulate',
+ 'QuoteLiquidity': 'uniswappy.cpt.quote',
+ 'RangeMetrics': 'defipy.utils.data',
+ 'RebalanceCostReport': 'defipy.utils.data',
+ 'RebaseIndexToken': 'uniswappy.cpt.index',
+ 'RemoveLiquidity': 'defipy.process.liquidity',
+ 'ResultCollector': 'defipy.utils.data',
+ 'RoundFloat': 'defipy.math.interest',
+ 'RugSignalReport': 'defipy.utils.data',
+ 'SECONDS_IN_HOUR': 'defipy.math.interest.ips',
+ 'SafeMath': 'uniswappy.utils.tools.v3',
+ 'SaferMath': 'defipy.utils.tools',
+ 'SettlementLPToken': 'uniswappy.cpt.index',
+ 'Shared': 'uniswappy.utils.tools.v3',
+ 'SimpleLPSimulation': 'defipy.analytics.simulate',
+ 'SimulateBalancerPriceMove': 'defipy.primitives.position',
+ 'SimulatePriceMove': 'defipy.primitives.position',
+ 'SimulateStableswapPriceMove': 'defipy.primitives.position',
+ 'SlippageAnalysis': 'defipy.utils.data',
+ 'SlippageCurve': 'defipy.utils.data',
+ 'SolveDeltas': 'defipy.analytics.simulate',
+ 'SolveDeltasRobust': 'defipy.analytics.simulate',
+ 'SqrtPriceMath': 'uniswappy.utils.tools.v3',
+ 'StableswapExchange': 'stableswappy.cst.exchg',
+ 'StableswapExchangeData': 'stableswappy.utils.data',
+ 'StableswapFactory': 'stableswappy.cst.factory',
+ 'StableswapPoolMath': 'stableswappy.cst.exchg',
+ 'StableswapPositionAnalysis': 'defipy.utils.data',
+ 'StableswapPriceMoveScenario': 'defipy.utils.data',
+ 'StableswapVault': 'stableswappy.vault',
+ 'Swap': 'defipy.process.swap',
+ 'SwapDeposit': 'defipy.process.deposit',
+ 'SwapIndexMint': 'defipy.process.mint',
+ 'SwapMath': 'uniswappy.utils.tools.v3',
+ 'TVLBasedLiquidityExitAgent': 'defipy.agents',
+ 'TVLExitConfig': 'defipy.agents.config',
+ 'Tick': 'uniswappy.utils.tools.v3',
+ 'TickIndex': 'defipy.utils.tools',
+ 'TickMath': 'uniswappy.utils.tools.v3',
+ 'TickRangeCandidate': 'defipy.utils.data',
+ 'TickRangeEvaluation': 'defipy.utils.data',
+ 'TickRangeStatus': 'defipy.utils.data',
+ 'TimeDeltaModel': 'defipy.math.model',
+ 'TokenDeltaModel': 'defipy.math.model',
+ 'TokenSupplyState': 'defipy.analytics.simulate',
+ 'TradeSplitResult': 'defipy.utils.data',
+ 'TreeAmountQuote': 'uniswappy.cpt.quote',
+ 'UniV3Helper': 'uniswappy.utils.tools.v3',
+ 'UniV3Utils': 'uniswappy.utils.tools.v3',
+ 'UniswapExchange': 'uniswappy.cpt.exchg',
+ 'UniswapExchangeData': 'defipy.utils.data',
+ 'UniswapFactory': 'uniswappy.cpt.factory',
+ 'UniswapImpLoss': 'defipy.analytics.risk',
+ 'UniswapPoolData': 'defipy.agents.data',
+ 'UniswapScriptHelper': 'defipy.utils.tools',
+ 'UniswapV3Exchange': 'uniswappy.cpt.exchg',
+ 'Vault': 'uniswappy.cpt.vault',
+ 'VolumeSpikeConfig': 'defipy.agents.config',
+ 'VolumeSpikeNotifierAgent': 'defipy.agents',
+ 'Wallets': 'uniswappy.cpt.wallet',
+ 'WithdrawSwap': 'defipy.process.swap',
+ 'Yield': 'defipy.math.interest',
+ 'abstractclassmethod': 'defipy.math.interest.ips',
+ 'abstractmethod': 'defipy.math.interest.ips',
+ 'abstractproperty': 'defipy.math.interest.ips',
+ 'abstractstaticmethod': 'defipy.math.interest.ips',
+ 'aggregate': 'defipy.math.interest.ips',
+ 'balancer_constants': 'balancerpy.cwpt.exchg',
+ 'burn': 'defipy.process',
+ 'compact_class': 'defipy.utils.data',
+ 'comparison': 'defipy.primitives',
+ 'config': 'defipy.agents',
+ 'data': 'defipy.agents',
+ 'deposit': 'defipy.process',
+ 'execution': 'defipy.primitives',
+ 'from_compact': 'defipy.utils.data',
+ 'get_cache_token': 'defipy.math.interest.ips',
+ 'ips': 'defipy.math.interest',
+ 'join': 'defipy.process',
+ 'liquidity': 'defipy.process',
+ 'mint': 'defipy.process',
+ 'np': 'defipy.math.risk',
+ 'optimization': 'defipy.primitives',
+ 'pool_health': 'defipy.primitives',
+ 'portfolio': 'defipy.primitives',
+ 'position': 'defipy.primitives',
+ 'queue': 'defipy.math.model',
+ 'random': 'defipy.math.basic',
+ 'result': 'balancerpy.cwpt.exchg',
+ 'risk': 'defipy.primitives',
+ 'string': 'defipy.math.basic',
+ 'swap': 'defipy.process',
+ 'to_compact': 'defipy.utils.data',
+ 'update_abstractmethods': 'defipy.math.interest.ips',
+ 'v3': 'defipy.utils.tools'}
@@ -16,9 +16,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License
 
+import numpy as np
+
 from uniswappy.cpt.quote import LPQuote
 from uniswappy.utils.data import UniswapExchangeData
-from ...utils.data import SlippageAnalysis
+from ...utils.data import SlippageAnalysis, SlippageCurve
+from ...utils.tools.v3.TickIndex import TickIndex
 
 
 # V2 swap fee: Uniswap V2 hardcodes 0.3% (expressed as fee_bps = 3, so that
@@ -32,6 +35,13 @@ _V2_FEE_DENOM = 1000
 _DEFAULT_SLIPPAGE_TARGET = 0.01
 
 
+def _fee_fraction(lp):
+    # V3 fee tiers are hundredths of a bip (3000 = 0.3%).
+    if lp.version == UniswapExchangeData.VERSION_V3:
+        return lp.fee / 1_000_000
+    return _V2_FEE_BPS / _V2_FEE_DENOM
+
+
 class CalculateSlippage:
 
     """ Compute slippage and price-impact decomposition for a trade.
@@ -70,18 +80,31 @@ class CalculateSlippage:
         max_size_at_1pct is returned as None. A dedicated primitive
         (AssessLiquidityDepth) will handle V3 depth analysis.
 
-        V3 trades that cross tick boundaries will have a price_impact_pct
-        approximation error — the primitive reads virtual reserves at the
-        active tick and computes new_spot as if the trade stayed within
-        that tick. For large trades in narrow-range V3 pools, this
-        underestimates the true price impact. Small trades relative to
-        the active tick's depth are unaffected.
+        V3 twins carrying a tick table (more than one position's worth
+        of initialized ticks, e.g. built from a LiveProvider
+        `tick_words=N` snapshot) are quoted through a TickIndex: the
+        trade walks every tick it crosses, and new_spot is the price
+        the walk ends at. Single-position V3 twins keep LPQuote's
+        in-tick quote, which reads virtual reserves at the active tick
+        and computes new_spot as if the trade stayed within that tick —
+        for large trades in narrow-range pools that underestimates the
+        true price impact. Both V3 paths charge the pool's fee tier
+        (lp.fee), not LPQuote's fixed 0.3%. Pass `tick_index` to quote any V3 twin
+        through the index, or to reuse one index across many calls on
+        an unchanged pool.
+
+        Slippage curves: curve() evaluates a whole grid of trade sizes
+        in one vectorized pass — the closed form above for V2 (and for
+        single-position V3, on LPQuote's virtual reserves), a batched
+        TickIndex walk for tick-table V3 — and solves the max size for
+        any set of slippage targets, V3 included.
     """
 
     def __init__(self):
         pass
 
-    def apply(self, lp, token_in, amount_in, lwr_tick = None, upr_tick = None):
+    def apply(self, lp, token_in, amount_in, lwr_tick = None, upr_tick = None,
+              tick_index = None):
 
         """ apply
 
@@ -102,6 +125,10 @@ class CalculateSlippage:
                 LP methods that need it).
             upr_tick : int, optional
                 Upper tick of the position (V3 only).
+            tick_index : TickIndex, optional
+                V3 only — `TickIndex.from_lp(lp)` for lp's current tick
+                table. Built on demand when lp carries more than one
+                position's ticks.
 
             Returns
             -------
@@ -139,12 +166,21 @@ class CalculateSlippage:
         # both V2 and V3 directly.
         spot_price = lp.get_price(token_in)
 
-        # Execute the trade through LPQuote — dispatches to V2's
-        # get_amount_out0/_out1 (fee baked in at 0.3%) or V3's
-        # UniV3Helper.quote (fee per the pool's fee tier). Keeps the
-        # primitive protocol-agnostic.
-        lpq_trade = LPQuote(quote_opposing = True, include_fee = True)
-        amount_out = lpq_trade.get_amount(lp, token_in, amount_in, lwr_tick, upr_tick)
+        if tick_index is None and TickIndex.has_tick_table(lp):
+            tick_index = TickIndex.from_lp(lp)
+        if tick_index is not None:
+            return self._apply_tick_index(
+                lp, token_in, amount_in, spot_price, tick_index,
+            )
+
+        # Execute the trade: V2 through LPQuote's get_amount_out0/_out1
+        # (V2's fixed 0.3% fee), V3 through the in-tick quote at the
+        # pool's fee tier — LPQuote's V3 quote hard-codes 0.3%.
+        if lp.version == UniswapExchangeData.VERSION_V3:
+            amount_out, _ = TickIndex.in_tick_quote(lp, token_in, amount_in)
+        else:
+            lpq_trade = LPQuote(quote_opposing = True, include_fee = True)
+            amount_out = lpq_trade.get_amount(lp, token_in, amount_in, lwr_tick, upr_tick)
 
         # Execution price: effective rate received on this trade.
         execution_price = amount_out / amount_in
@@ -180,6 +216,136 @@ class CalculateSlippage:
             max_size_at_1pct = max_size_at_1pct,
         )
 
+    def curve(self, lp, token_in, amounts, slippage_targets = (_DEFAULT_SLIPPAGE_TARGET,),
+              lwr_tick = None, upr_tick = None, tick_index = None):
+
+        """ curve
+
+            Vectorized apply(): slippage metrics for a grid of trade
+            sizes, plus the max trade size at each slippage target.
+
+            Parameters
+            ----------
+            lp : Exchange
+                LP exchange at current pool state.
+            token_in : ERC20
+                The token being sold. Must be one of lp.token0 or
+                lp.token1.
+            amounts : array_like
+                Trade sizes in token_in human units. Every element must
+                be strictly greater than zero.
+            slippage_targets : array_like
+                Slippage fractions to solve max sizes for, each in
+                (0, 1). Defaults to the 1% apply() reports.
+            lwr_tick : int, optional
+                Lower tick of the position (V3 only).
+            upr_tick : int, optional
+                Upper tick of the position (V3 only).
+            tick_index : TickIndex, optional
+                V3 only — as in apply().
+
+            Returns
+            -------
+            SlippageCurve
+                Columnar result; element i of each array matches
+                apply(lp, token_in, amounts[i], ...), and max_size[j]
+                is the largest trade within slippage_targets[j].
+
+            Raises
+            ------
+            ValueError
+                If any amount is <= 0, any target is outside (0, 1), or
+                token_in is not a token in lp's pair.
+        """
+
+        amounts = np.asarray(amounts, dtype = float)
+        targets = np.asarray(slippage_targets, dtype = float)
+        if np.any(amounts <= 0):
+            raise ValueError(
+                "CalculateSlippage: amount_in must be > 0; "
+                "got min {}".format(amounts.min())
+            )
+        if np.any((targets <= 0) | (targets >= 1)):
+            raise ValueError(
+                "CalculateSlippage: slippage targets must be in (0, 1); "
+                "got {}".format(targets.tolist())
+            )
+        if token_in.token_name not in (lp.token0, lp.token1):
+            raise ValueError(
+                "CalculateSlippage: token_in {!r} is not in lp's pair "
+                "({!r}, {!r})".format(
+                    token_in.token_name, lp.token0, lp.token1
+                )
+            )
+
+        spot_price = lp.get_price(token_in)
+
+        if tick_index is None and TickIndex.has_tick_table(lp):
+            tick_index = TickIndex.from_lp(lp)
+        if tick_index is not None:
+            zero_for_one = token_in.token_name == lp.token0
+            sqrt_price = lp.slot0.sqrtPriceX96 / 2 ** 96
+            amount_out, sqrt_after = tick_index.swap_batch(
+                amounts, zero_for_one, sqrt_price, lp.fee,
+            )
+            new_spot_price = sqrt_after ** 2 if zero_for_one else 1.0 / sqrt_after ** 2
+            max_size = tick_index.max_amount_in(
+                targets, zero_for_one, sqrt_price, lp.fee,
+            )
+        else:
+            # Constant product on (virtual) reserves with the pool fee:
+            # what get_amount_out0/_out1 compute for V2 and
+            # TickIndex.in_tick_quote computes for V3.
+            tokens = lp.factory.token_from_exchange[lp.name]
+            token_out = tokens[lp.token1] if token_in.token_name == lp.token0 \
+                        else tokens[lp.token0]
+            lpq_reserves = LPQuote()
+            reserve_in = lpq_reserves.get_reserve(lp, token_in, lwr_tick, upr_tick)
+            reserve_out = lpq_reserves.get_reserve(lp, token_out, lwr_tick, upr_tick)
+            fee = _fee_fraction(lp)
+            amount_with_fee = amounts * (1.0 - fee)
+            amount_out = reserve_out * amount_with_fee / (reserve_in + amount_with_fee)
+            new_spot_price = (reserve_out - amount_out) / (reserve_in + amounts)
+            max_size = self._calc_max_sizes(reserve_in, targets, fee)
+
+        execution_price = amount_out / amounts
+
+        return SlippageCurve(
+            spot_price = spot_price,
+            amount_in = amounts,
+            execution_price = execution_price,
+            slippage_pct = (spot_price - execution_price) / spot_price,
+            slippage_cost = amounts * spot_price - amount_out,
+            price_impact_pct = (spot_price - new_spot_price) / spot_price,
+            slippage_targets = targets,
+            max_size = max_size,
+        )
+
+    def _apply_tick_index(self, lp, token_in, amount_in, spot_price, tick_index):
+
+        """ _apply_tick_index
+
+            V3 slippage metrics from a multi-tick quote. new_spot is
+            the price the quote ends at, so price_impact_pct holds
+            across tick crossings.
+        """
+
+        amount_out, sqrt_after = tick_index.quote(lp, token_in, amount_in)
+        execution_price = amount_out / amount_in
+        if token_in.token_name == lp.token0:
+            new_spot_price = sqrt_after ** 2
+        else:
+            new_spot_price = 1.0 / sqrt_after ** 2
+
+        return SlippageAnalysis(
+            spot_price = spot_price,
+            execution_price = execution_price,
+            slippage_pct = (spot_price - execution_price) / spot_price,
+            slippage_cost = amount_in * spot_price - amount_out,
+            price_impact_pct = (spot_price - new_spot_price) / spot_price,
+            max_size_at_1pct = None,
+        )
+
     def _calc_max_size(self, lp, reserve_in):
 
         """ _calc_max_size
@@ -222,3 +388,16 @@ class CalculateSlippage:
             return 0.0
 
         return reserve_in * numerator / (effective * (1.0 - s))
+
+    def _calc_max_sizes(self, reserve_in, targets, fee):
+
+        """ _calc_max_sizes
+
+            Vectorized _calc_max_size over arbitrary slippage targets,
+            for any constant-product reserves (V2 real, or V3 virtual)
+            and fee fraction. Targets at or below the fee rate clamp
+            to 0.
+        """
+
+        numerator = np.maximum(targets - fee, 0.0)
+        return reserve_in * numerator / ((1.0 - fee) * (1.0 - targets))
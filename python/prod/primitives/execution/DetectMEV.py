@@ -17,8 +17,10 @@
 # limitations under the License
 
 from uniswappy.cpt.quote import LPQuote
+from uniswappy.utils.data import UniswapExchangeData
 
 from ...utils.data import MEVDetectionResult
+from ...utils.tools.v3.TickIndex import TickIndex
 
 
 # Normal sandwich extraction is typically 50-500 bps depending on trade
@@ -62,15 +64,19 @@ class DetectMEV:
         primitive's scope — it's an on-chain indexing concern (web3scout
         territory), not an AMM-math concern.
 
-        V2 and V3 both supported. LPQuote dispatches to the correct
-        invariant: V2's constant-product-with-fee, or V3's in-range
-        virtual-reserves quote. Fees are included in theoretical_output
-        on both sides, matching what get_amount_out / UniV3Helper.quote
-        actually return on-chain — so the comparison is apples-to-apples.
-        For large V3 trades that cross tick boundaries, theoretical_output
-        inherits LPQuote's in-tick approximation; very large trades may
-        show an apparent "underdelivery" that's really just the quote's
-        single-tick assumption breaking down. Flagged in the scope notes.
+        V2 and V3 both supported: V2's constant-product-with-fee via
+        LPQuote, or V3's in-range virtual-reserves quote at the pool's
+        fee tier (TickIndex.in_tick_quote — LPQuote's own V3 quote
+        charges a fixed 0.3%). Fees are included in theoretical_output
+        on both sides, matching what the pool charges on-chain — so the
+        comparison is apples-to-apples. For large V3 trades that cross
+        tick boundaries, theoretical_output inherits the in-tick
+        approximation; very large trades may show an apparent
+        "underdelivery" that's really just the quote's single-tick
+        assumption breaking down. V3 twins carrying a tick
+        table (more than one position's ticks) avoid that: they're
+        quoted through a TickIndex that walks every crossed tick, as is
+        any V3 twin when `tick_index` is passed.
 
         Threshold convention. frontrun_threshold_bps defaults to 50 bps.
         Only underdelivery with magnitude above threshold fires
@@ -118,7 +124,7 @@ class DetectMEV:
         self.frontrun_threshold_bps = frontrun_threshold_bps
 
     def apply(self, lp, token_in, amount_in, actual_output,
-              lwr_tick = None, upr_tick = None):
+              lwr_tick = None, upr_tick = None, tick_index = None):
 
         """ apply
 
@@ -144,6 +150,10 @@ class DetectMEV:
                 LPQuote.
             upr_tick : int, optional
                 Upper tick (V3 positions only).
+            tick_index : TickIndex, optional
+                V3 only — `TickIndex.from_lp(lp)` for lp's current tick
+                table. Built on demand when lp carries more than one
+                position's ticks.
 
             Returns
             -------
@@ -179,11 +189,19 @@ class DetectMEV:
             )
 
         # Theoretical output: what the invariant math says this trade
-        # should have returned at the supplied pool state. LPQuote
-        # handles V2 vs V3 dispatch and fee integration.
-        theoretical_output = LPQuote(
-            quote_opposing = True, include_fee = True,
-        ).get_amount(lp, token_in, amount_in, lwr_tick, upr_tick)
+        # should have returned at the supplied pool state. Every V3
+        # path charges lp.fee; multi-tick V3 twins go through the tick
+        # index, single-position ones quote in-tick.
+        if tick_index is None and TickIndex.has_tick_table(lp):
+            tick_index = TickIndex.from_lp(lp)
+        if tick_index is not None:
+            theoretical_output, _ = tick_index.quote(lp, token_in, amount_in)
+        elif lp.version == UniswapExchangeData.VERSION_V3:
+            theoretical_output, _ = TickIndex.in_tick_quote(lp, token_in, amount_in)
+        else:
+            theoretical_output = LPQuote(
+                quote_opposing = True, include_fee = True,
+            ).get_amount(lp, token_in, amount_in, lwr_tick, upr_tick)
 
         extraction_amount = theoretical_output - actual_output
 
@@ -0,0 +1,429 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import math
+
+from uniswappy.cpt.quote import LPQuote
+from uniswappy.utils.data import UniswapExchangeData
+
+from balancerpy.cwpt.exchg import BalancerExchange
+from balancerpy.cwpt.exchg.BalancerExchange import SWAP_FEE as _BALANCER_SWAP_FEE
+
+from stableswappy.cst.exchg import StableswapExchange
+
+from ...utils.data import TradeSplitResult
+from ...utils.tools.v3.TickIndex import TickIndex
+
+
+# V2 fee multiplier (997 / 1000), as in get_amount_out0/_out1.
+_V2_FEE_MULT = 997 / 1000
+
+# Stableswap math constants: fees are fractions of 1e10, balances and
+# rates 1e18 fixed point.
+_SS_FEE_DENOM = 10 ** 10
+_SS_PRECISION = 10 ** 18
+
+# Bisection on the common marginal price stops once the bracket is this
+# tight relative to its upper end.
+_DEFAULT_TOL = 1e-12
+_MAX_ITER = 200
+
+
+class OptimalTradeSplit:
+
+    """ Split one exact-input order across several pools of the same
+        pair to maximize total output.
+
+        Answers "how much of this order should go to each pool?" for a
+        set of built twins — any mix of Uniswap V2, Uniswap V3 (any fee
+        tier), Balancer and Stableswap. Each pool's output is concave
+        in its input, so the optimal split leaves every pool that gets
+        flow at the same marginal rate λ (token_out per extra unit of
+        token_in, fee included), and pools whose best rate is below λ
+        get nothing. The primitive bisects on λ: each pool's input at a
+        given λ is the inverse of its marginal-rate curve, and λ is
+        narrowed until the inputs sum to amount_in.
+
+        Follows the DeFiPy primitive contract: stateless construction
+        (modulo the solver tolerance), computation at .apply(),
+        structured dataclass return. Non-mutating — no pool is swapped
+        against.
+
+        Per-protocol inverses
+        ---------------------
+        - Uniswap V2: closed form on reserves,
+          x = (√(R_in·R_out·γ / λ) - R_in) / γ with γ = 0.997.
+        - Uniswap V3: every pool is walked through a TickIndex, so the
+          pool's own fee tier applies and a trade that leaves a
+          position's range runs on into the next one (or drains the
+          pool). λ maps to a target price, and the input to reach it
+          is a prefix-sum lookup.
+        - Balancer: closed form on the weighted-product marginal,
+          B_in + γ·x = (B_out·γ·r·B_in^r / λ)^(1 / (r + 1)) with
+          r = w_in / w_out and γ = 1 - swap fee.
+        - Stableswap: no closed form; a float model of the invariant
+          (same quadratic as StableswapPoolMath.get_y, same dy/dx as
+          _dydx) is inverted by an inner regula falsi solve inside
+          the outer bracket.
+
+        The float models pick the split; amounts_out and
+        best_single_pool_out then come from each pool's own quote
+        (LPQuote, TickIndex, BalancerExchange.get_amount_out,
+        StableswapExchange.get_amount_out), so the reported numbers
+        are exactly what each pool would pay.
+
+        Pools are matched on token names: token_in may come from any
+        of the twins. Pools with more than two tokens need token_out.
+    """
+
+    def __init__(self, tol = _DEFAULT_TOL):
+        self.tol = tol
+
+    def apply(self, lps, token_in, amount_in, token_out = None):
+
+        """ apply
+
+            Compute the output-maximizing split of amount_in across lps.
+
+            Parameters
+            ----------
+            lps : list
+                Built pools of the same pair: UniswapExchange (V2/V3),
+                BalancerExchange or StableswapExchange, in any mix.
+            token_in : ERC20
+                Token sold, matched by token_name in every pool.
+            amount_in : float
+                Total input in human units. Must be > 0.
+            token_out : ERC20, optional
+                Token bought. Required when a pool holds more than two
+                tokens; otherwise each pool's other token.
+
+            Returns
+            -------
+            TradeSplitResult
+
+            Raises
+            ------
+            ValueError
+                If lps is empty, amount_in <= 0, a pool is not one of
+                the four supported types, or the pools do not share the
+                token_in / token_out pair.
+        """
+
+        if amount_in <= 0:
+            raise ValueError(
+                "OptimalTradeSplit: amount_in must be > 0; "
+                "got {}".format(amount_in)
+            )
+        if len(lps) == 0:
+            raise ValueError("OptimalTradeSplit: lps must not be empty")
+
+        name_in = token_in.token_name
+        name_out = token_out.token_name if token_out is not None else None
+        legs = []
+        for lp in lps:
+            leg = self._leg(lp, name_in, name_out)
+            name_out = leg.name_out
+            legs.append(leg)
+
+        lam, amounts_in = self._solve(legs, amount_in)
+        amounts_out = [leg.quote(x) if x > 0 else 0.0
+                       for leg, x in zip(legs, amounts_in)]
+        total_out = sum(amounts_out)
+        best_single = max(leg.quote(amount_in) for leg in legs)
+
+        return TradeSplitResult(
+            token_in_name = name_in,
+            token_out_name = name_out,
+            amount_in = amount_in,
+            amounts_in = amounts_in,
+            amounts_out = amounts_out,
+            total_out = total_out,
+            marginal_price = lam,
+            execution_price = total_out / amount_in,
+            best_single_pool_out = best_single,
+            improvement_pct = (total_out - best_single) / best_single
+                              if best_single > 0 else 0.0,
+        )
+
+    def _solve(self, legs, amount_in):
+
+        """ _solve
+
+            Bisect on the marginal rate λ. Returns λ and the per-pool
+            inputs, interpolated between the bracket ends so they sum
+            to amount_in exactly.
+        """
+
+        lam_hi = max(leg.marginal0 for leg in legs)
+        lam_lo = 0.0
+        x_hi = [0.0] * len(legs)
+        x_lo = [amount_in] * len(legs)
+
+        for _ in range(_MAX_ITER):
+            if lam_hi - lam_lo <= self.tol * lam_hi:
+                break
+            lam = 0.5 * (lam_lo + lam_hi)
+            xs = [leg.amount_at(lam, lo, hi)
+                  for leg, lo, hi in zip(legs, x_hi, x_lo)]
+            if sum(xs) > amount_in:
+                lam_lo, x_lo = lam, xs
+            else:
+                lam_hi, x_hi = lam, xs
+
+        s_lo, s_hi = sum(x_lo), sum(x_hi)
+        t = (amount_in - s_hi) / (s_lo - s_hi) if s_lo > s_hi else 0.0
+        amounts = [h + t * (l - h) for l, h in zip(x_lo, x_hi)]
+        return 0.5 * (lam_lo + lam_hi), amounts
+
+    def _leg(self, lp, name_in, name_out):
+
+        """ _leg
+
+            Wrap lp in its protocol's marginal-rate model. Dispatch
+            matches CompareProtocols: class identity for Balancer and
+            Stableswap, .version for Uniswap.
+        """
+
+        if isinstance(lp, BalancerExchange):
+            return _BalancerLeg(lp, name_in, name_out)
+        if isinstance(lp, StableswapExchange):
+            return _StableswapLeg(lp, name_in, name_out)
+        if hasattr(lp, 'version'):
+            if lp.version == UniswapExchangeData.VERSION_V3:
+                return _UniswapV3Leg(lp, name_in, name_out)
+            if lp.version == UniswapExchangeData.VERSION_V2:
+                return _UniswapV2Leg(lp, name_in, name_out)
+        raise ValueError(
+            "OptimalTradeSplit: unrecognized lp type {}. Supported: "
+            "UniswapExchange (V2/V3), BalancerExchange, StableswapExchange."
+            .format(type(lp).__name__)
+        )
+
+
+# ─── Per-protocol legs ──────────────────────────────────────────────────────
+#
+# Each leg exposes marginal0 (the rate for an infinitesimal trade),
+# amount_at(lam, lo, hi) — the input at which the marginal rate falls
+# to lam, clamped to [lo, hi] (the outer bracket's inputs) — and
+# quote(x), the pool's own exact-input quote.
+
+
+def _pair_names(lp_label, names, name_in, name_out):
+    if name_in not in names:
+        raise ValueError(
+            "OptimalTradeSplit: token_in {!r} is not in {} pool {}".format(
+                name_in, lp_label, names
+            )
+        )
+    if name_out is None:
+        others = [n for n in names if n != name_in]
+        if len(others) != 1:
+            raise ValueError(
+                "OptimalTradeSplit: {} pool {} has more than two tokens; "
+                "pass token_out".format(lp_label, names)
+            )
+        return others[0]
+    if name_out not in names or name_out == name_in:
+        raise ValueError(
+            "OptimalTradeSplit: token_out {!r} is not in {} pool {}".format(
+                name_out, lp_label, names
+            )
+        )
+    return name_out
+
+
+class _UniswapV2Leg:
+
+    def __init__(self, lp, name_in, name_out):
+        self.name_out = _pair_names("Uniswap V2", [lp.token0, lp.token1],
+                                    name_in, name_out)
+        tokens = lp.factory.token_from_exchange[lp.name]
+        self.lp = lp
+        self.token_in = tokens[name_in]
+        lpq = LPQuote()
+        self.r_in = lpq.get_reserve(lp, self.token_in)
+        self.r_out = lpq.get_reserve(lp, tokens[self.name_out])
+        self.marginal0 = _V2_FEE_MULT * self.r_out / self.r_in
+
+    def amount_at(self, lam, lo, hi):
+        x = (math.sqrt(self.r_in * self.r_out * _V2_FEE_MULT / lam) - self.r_in) \
+            / _V2_FEE_MULT
+        return min(max(x, lo), hi)
+
+    def quote(self, amount_in):
+        lpq = LPQuote(quote_opposing = True, include_fee = True)
+        return lpq.get_amount(self.lp, self.token_in, amount_in)
+
+
+class _UniswapV3Leg:
+
+    def __init__(self, lp, name_in, name_out):
+        self.name_out = _pair_names("Uniswap V3", [lp.token0, lp.token1],
+                                    name_in, name_out)
+        self.lp = lp
+        self.token_in = lp.factory.token_from_exchange[lp.name][name_in]
+        self.index = TickIndex.from_lp(lp)
+        self.zero_for_one = name_in == lp.token0
+        self.sqrt_price = lp.slot0.sqrtPriceX96 / 2 ** 96
+        self.gamma = 1.0 - lp.fee / 1_000_000
+        price = self.sqrt_price ** 2
+        self.marginal0 = self.gamma * (price if self.zero_for_one else 1.0 / price)
+
+    def amount_at(self, lam, lo, hi):
+        # Marginal rate at sqrt price p: γ·p² selling token0, γ/p²
+        # selling token1.
+        if self.zero_for_one:
+            target = math.sqrt(lam / self.gamma)
+        else:
+            target = math.sqrt(self.gamma / lam)
+        x = self.index.amount_in_to(target, self.zero_for_one,
+                                    self.sqrt_price, self.lp.fee)
+        return min(max(x, lo), hi)
+
+    def quote(self, amount_in):
+        return self.index.quote(self.lp, self.token_in, amount_in)[0]
+
+
+class _BalancerLeg:
+
+    def __init__(self, lp, name_in, name_out):
+        self.name_out = _pair_names("Balancer", lp.vault.get_names(),
+                                    name_in, name_out)
+        self.lp = lp
+        self.token_in = lp.vault.get_token(name_in)
+        self.token_out = lp.vault.get_token(self.name_out)
+        weights = lp.vault.get_denorm_weights()
+        self.b_in = self.token_in.token_total
+        self.b_out = self.token_out.token_total
+        self.ratio = weights[name_in] / weights[self.name_out]
+        self.gamma = 1.0 - _BALANCER_SWAP_FEE
+        self.marginal0 = self.gamma * self.ratio * self.b_out / self.b_in
+
+    def amount_at(self, lam, lo, hi):
+        # d(out)/dx = B_out·γ·r·B_in^r · (B_in + γ·x)^-(r + 1)
+        r = self.ratio
+        scaled = (self.b_out * self.gamma * r * self.b_in ** r / lam) ** (1.0 / (r + 1.0))
+        x = (scaled - self.b_in) / self.gamma
+        return min(max(x, lo), hi)
+
+    def quote(self, amount_in):
+        return self.lp.get_amount_out(amount_in, self.token_in,
+                                      self.token_out)['tkn_out_amt']
+
+
+class _StableswapLeg:
+
+    def __init__(self, lp, name_in, name_out):
+        self.name_out = _pair_names("Stableswap", lp.vault.get_names(),
+                                    name_in, name_out)
+        self.lp = lp
+        self.token_in = lp.vault.get_token(name_in)
+        self.token_out = lp.vault.get_token(self.name_out)
+        pool = lp.math_pool
+        self.i = lp.get_tkn_index(name_in)
+        self.j = lp.get_tkn_index(self.name_out)
+        self.n = pool.n
+        self.A = pool.A
+        self.fee = pool.fee
+        self.fee_mul = pool.fee_mul
+        # Normalized balances (pool "xp" units / 1e18) keep the
+        # invariant's D^(n+1) well inside float range.
+        self.xp = [x / _SS_PRECISION for x in pool._xp()]
+        self.D = pool.D() / _SS_PRECISION
+        # Human token_in → xp, and xp → human token_out.
+        self.to_xp = 10 ** lp.tkn_decimals[name_in] * pool.rates[self.i] \
+                     / _SS_PRECISION / _SS_PRECISION
+        self.from_xp = _SS_PRECISION * _SS_PRECISION \
+                       / (pool.rates[self.j] * 10 ** lp.tkn_decimals[self.name_out])
+        self.marginal0 = self._marginal(0.0)
+
+    def _y(self, x_i):
+        # StableswapPoolMath.get_y, solved in closed form:
+        # y^2 + b·y = c.
+        n, D = self.n, self.D
+        Ann = self.A * n
+        xx = [x_i if k == self.i else x for k, x in enumerate(self.xp)
+              if k != self.j]
+        c = D
+        for x in xx:
+            c = c * D / (x * n)
+        c = c * D / (n * Ann)
+        b = sum(xx) + D / Ann - D
+        root = math.sqrt(b * b + 4.0 * c)
+        return 2.0 * c / (b + root) if b > 0 else 0.5 * (root - b)
+
+    def _fee_frac(self, x_i, y):
+        if self.fee_mul is None:
+            return self.fee / _SS_FEE_DENOM
+        xpi = 0.5 * (self.xp[self.i] + x_i)
+        xpj = 0.5 * (self.xp[self.j] + y)
+        fm = self.fee_mul
+        dyn = fm * self.fee / (
+            (fm - _SS_FEE_DENOM) * 4.0 * xpi * xpj / (xpi + xpj) ** 2
+            + _SS_FEE_DENOM
+        )
+        return dyn / _SS_FEE_DENOM
+
+    def _marginal(self, amount_in):
+        # StableswapPoolMath._dydx at the post-trade balances.
+        x_i = self.xp[self.i] + amount_in * self.to_xp
+        y = self._y(x_i)
+        xp = list(self.xp)
+        xp[self.i], xp[self.j] = x_i, y
+        n = self.n
+        D_pow = self.D ** (n + 1)
+        A_pow = self.A * n ** (n + 1)
+        x_prod = math.prod(xp)
+        dydx = (y * (x_i * A_pow * x_prod + D_pow)) / (
+            x_i * (y * A_pow * x_prod + D_pow)
+        )
+        return dydx * (1.0 - self._fee_frac(x_i, y)) * self.to_xp * self.from_xp
+
+    def amount_at(self, lam, lo, hi):
+        # The marginal rate falls with size: solve marginal(x) = lam
+        # inside [lo, hi], which the outer bracket already narrowed,
+        # by regula falsi with the Illinois fix — a handful of
+        # evaluations rather than bisection's dozens.
+        f_hi = self._marginal(hi) - lam
+        if f_hi >= 0:
+            return hi
+        f_lo = self._marginal(lo) - lam
+        if f_lo <= 0:
+            return lo
+        side = 0
+        for _ in range(_MAX_ITER):
+            x = (lo * f_hi - hi * f_lo) / (f_hi - f_lo)
+            f = self._marginal(x) - lam
+            if abs(f) <= _DEFAULT_TOL * lam or hi - lo <= _DEFAULT_TOL * hi:
+                return x
+            if f > 0:
+                lo, f_lo = x, f
+                if side == 1:
+                    f_hi *= 0.5
+                side = 1
+            else:
+                hi, f_hi = x, f
+                if side == -1:
+                    f_lo *= 0.5
+                side = -1
+        return x
+
+    def quote(self, amount_in):
+        return self.lp.get_amount_out(amount_in, self.token_in,
+                                      self.token_out)['tkn_out_amt']
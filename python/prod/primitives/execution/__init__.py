@@ -1,2 +1,3 @@
 from .CalculateSlippage import CalculateSlippage
 from .DetectMEV import DetectMEV
+from .OptimalTradeSplit import OptimalTradeSplit
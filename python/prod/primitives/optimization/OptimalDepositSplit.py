@@ -16,19 +16,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License
 
+import numpy as np
+
 from uniswappy.utils.data import UniswapExchangeData
 from uniswappy.process.deposit import SwapDeposit
 
-from ...utils.data import DepositSplitResult
+from balancerpy.cwpt.exchg import BalancerExchange
+from balancerpy.cwpt.exchg.BalancerExchange import SWAP_FEE as _BALANCER_SWAP_FEE
+
+from ...utils.data import DepositSplitResult, DepositSplitBatch
+from ...utils.tools.v3.TickIndex import TickIndex
 
 
 # V2 protocol fee as a fraction (30 bps via 997/1000 in the swap math).
 _V2_FEE_FRAC = 0.003
 
+# Bisection on α stops once every bracket is this narrow.
+_ALPHA_TOL = 1e-13
+_MAX_ITER = 64
+
 
 class OptimalDepositSplit:
 
-    """ Compute the optimal swap fraction for a single-sided V2 deposit.
+    """ Compute the optimal swap fraction for a single-sided deposit
+        into a V2 pool, a V3 ranged position, or a 2-asset Balancer pool.
 
         Answers Q3.3 (and informs Q9.5) from DEFIMIND_TIER1_QUESTIONS.md.
         "I have X tokens of one side — what fraction should I swap to
@@ -56,17 +67,33 @@ class OptimalDepositSplit:
 
         Notes
         -----
-        V2-only in v1. V2 has a clean closed-form solution (the zap-in
-        quadratic) already derived and tested in
+        V2 has a clean closed-form solution (the zap-in quadratic)
+        already derived and tested in
         `uniswappy.process.deposit.SwapDeposit._calc_univ2_deposit_portion`.
-        V3 uses scipy.optimize.minimize internally and depends on
-        `UniV3Helper.quote` which is tracked in the cleanup backlog
-        for its hard-coded-997-fee issue. Rather than propagate that
-        latent bug into a projection primitive, v1 rejects V3 cleanly;
-        extension comes after the UniV3Helper fix lands. V2 raises
-        `ValueError` with a backlog-referencing message so the caller
-        understands the scope choice rather than assuming the
-        primitive is broken.
+
+        V3 and Balancer have no closed form; α is the root of the
+        post-swap deposit-ratio mismatch
+            h(α) = (1-α)·A·need_out(α) - out(α)·need_in(α)
+        which is positive at α = 0 (nothing swapped yet) and falls
+        monotonically — each extra unit swapped both shrinks the
+        token_in side and grows the token_out side — so bisection on
+        α always brackets it. need_in / need_out are the token
+        amounts one unit of the target position holds at the
+        post-swap price:
+          - V3: 1/√P - 1/√P_b of token0 and √P - √P_a of token1, with
+            √P clamped into the range. The swap leg is quoted through
+            a TickIndex, at the pool's own fee tier and across any
+            ticks it crosses (SwapDeposit's V3 path goes through
+            UniV3Helper.quote's hard-coded 0.3% fee instead). A range
+            entirely on the token_in side needs no swap: α = 0.
+          - Balancer: the post-swap balances themselves (a
+            proportional join), with the weighted-product quote
+            B_out·(1 - (B_in / (B_in + γ·x))^(w_in/w_out)).
+        Every quote is a pure read of twin state.
+
+        Batch mode: apply_batch evaluates many amount_in values at
+        once. V2 vectorizes the zap quadratic; V3 and Balancer run one
+        bisection over the whole grid (TickIndex.swap_batch per step).
 
         Scope for "deposit larger than reserves." The closed-form
         quadratic does not have an upper bound on amount_in vs.
@@ -78,7 +105,10 @@ class OptimalDepositSplit:
         Consistent with AggregatePortfolio's stance: the primitive
         surfaces the shape, the caller reads the signal.
 
-        Expected LP tokens formula. V2's add_liquidity mints:
+        Expected LP tokens formula. V3 reports the position
+        liquidity min(d0 / need0, d1 / need1); Balancer the pool
+        shares S · min(d_in / B_in', d_out / B_out'). V2's
+        add_liquidity mints:
           L_new = min(b_0 · L / res_0,  b_1 · L / res_1)
         after the swap, using post-swap reserves and post-swap
         total_supply. At the optimal split the two ratios match to
@@ -106,23 +136,28 @@ class OptimalDepositSplit:
     def __init__(self):
         pass
 
-    def apply(self, lp, token_in, amount_in):
+    def apply(self, lp, token_in, amount_in, lwr_tick = None, upr_tick = None):
 
         """ apply
 
-            Compute the optimal deposit split for a single-sided V2
+            Compute the optimal deposit split for a single-sided
             deposit of amount_in tokens of token_in.
 
             Parameters
             ----------
-            lp : UniswapExchange
-                V2 LP exchange at current state. V3 raises ValueError.
+            lp : UniswapExchange or BalancerExchange
+                V2 or V3 LP exchange, or a 2-asset Balancer pool, at
+                current state.
             token_in : ERC20
                 The token being provided (the "single side"). Must be
                 one of the pool's two tokens.
             amount_in : float
                 Total human-units amount of token_in available to
                 deposit via the zap. Must be > 0.
+            lwr_tick : int, optional
+                Lower tick of the target position (V3 only; required).
+            upr_tick : int, optional
+                Upper tick of the target position (V3 only; required).
 
             Returns
             -------
@@ -131,17 +166,27 @@ class OptimalDepositSplit:
             Raises
             ------
             ValueError
-                If lp is not V2, token_in is not in the pool,
-                amount_in <= 0, or the pool has zero reserves on
-                either side.
+                If token_in is not in the pool, amount_in <= 0, the
+                pool has zero reserves on either side, a V3 range is
+                missing or inverted, or a Balancer pool does not hold
+                exactly two tokens.
         """
 
-        if lp.version != UniswapExchangeData.VERSION_V2:
-            raise ValueError(
-                "OptimalDepositSplit v1: only V2 pools supported; "
-                "got version {!r}. V3 extension is tracked behind "
-                "the UniV3Helper.quote fee-passthrough fix in the "
-                "cleanup backlog.".format(lp.version)
+        if isinstance(lp, BalancerExchange) or \
+                lp.version == UniswapExchangeData.VERSION_V3:
+            batch = self.apply_batch(lp, token_in, [amount_in],
+                                     lwr_tick, upr_tick)
+            return DepositSplitResult(
+                token_in_name = batch.token_in_name,
+                amount_in = amount_in,
+                optimal_fraction = float(batch.optimal_fraction[0]),
+                swap_amount_in = float(batch.swap_amount_in[0]),
+                swap_amount_out = float(batch.swap_amount_out[0]),
+                deposit_amount_in = float(batch.deposit_amount_in[0]),
+                deposit_amount_out = float(batch.deposit_amount_out[0]),
+                expected_lp_tokens = float(batch.expected_lp_tokens[0]),
+                slippage_cost = float(batch.slippage_cost[0]),
+                slippage_pct = float(batch.slippage_pct[0]),
             )
 
         if token_in.token_name not in (lp.token0, lp.token1):
@@ -270,3 +315,230 @@ class OptimalDepositSplit:
             slippage_cost = slippage_cost,
             slippage_pct = slippage_pct,
         )
+
+    def apply_batch(self, lp, token_in, amounts_in, lwr_tick = None,
+                    upr_tick = None):
+
+        """ apply_batch
+
+            Vectorized apply(): the optimal split for every deposit
+            size in amounts_in against the same pool state.
+
+            Parameters
+            ----------
+            lp : UniswapExchange or BalancerExchange
+                Same as apply().
+            token_in : ERC20
+                Same as apply().
+            amounts_in : array_like
+                Deposit sizes in human units; every element must be > 0.
+            lwr_tick : int, optional
+                Lower tick of the target position (V3 only; required).
+            upr_tick : int, optional
+                Upper tick of the target position (V3 only; required).
+
+            Returns
+            -------
+            DepositSplitBatch
+
+            Raises
+            ------
+            ValueError
+                Same conditions as apply(), for any element.
+        """
+
+        amounts = np.asarray(amounts_in, dtype = np.float64).ravel()
+        if amounts.size == 0 or np.any(amounts <= 0):
+            raise ValueError(
+                "OptimalDepositSplit: amounts_in must be non-empty and "
+                "all > 0; got {}".format(amounts_in)
+            )
+
+        if isinstance(lp, BalancerExchange):
+            spot_price, alpha, out, lp_tokens = self._solve_balancer(
+                lp, token_in, amounts
+            )
+        elif lp.version == UniswapExchangeData.VERSION_V3:
+            spot_price, alpha, out, lp_tokens = self._solve_v3(
+                lp, token_in, amounts, lwr_tick, upr_tick
+            )
+        else:
+            spot_price, alpha, out, lp_tokens = self._solve_v2(
+                lp, token_in, amounts
+            )
+
+        swap_amount_in = alpha * amounts
+        spot_priced_swap_value = swap_amount_in * spot_price
+        slippage_cost = spot_priced_swap_value - out
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            slippage_pct = np.where(spot_priced_swap_value > 0,
+                                    slippage_cost / spot_priced_swap_value,
+                                    0.0)
+
+        return DepositSplitBatch(
+            token_in_name = token_in.token_name,
+            amount_in = amounts,
+            optimal_fraction = alpha,
+            swap_amount_in = swap_amount_in,
+            swap_amount_out = out,
+            deposit_amount_in = (1.0 - alpha) * amounts,
+            deposit_amount_out = out,
+            expected_lp_tokens = lp_tokens,
+            slippage_cost = slippage_cost,
+            slippage_pct = slippage_pct,
+        )
+
+    # ─── Per-protocol solvers ───────────────────────────────────────────────
+    #
+    # Each returns (spot_price, alpha, swap_amount_out, expected_lp_tokens)
+    # with one array element per amount.
+
+    def _solve_v2(self, lp, token_in, amounts):
+        self._check_pair(token_in.token_name, (lp.token0, lp.token1))
+        tokens = lp.factory.token_from_exchange[lp.name]
+        reserve_in = lp.get_reserve(tokens[token_in.token_name])
+        name_out = lp.token1 if token_in.token_name == lp.token0 else lp.token0
+        reserve_out = lp.get_reserve(tokens[name_out])
+        self._check_reserves(reserve_in, reserve_out)
+
+        # Zap quadratic 0.997·α²·A/R + 1.997·α - 1 = 0, positive root
+        # in the cancellation-free form SwapDeposit solves it in.
+        gamma = 1.0 - _V2_FEE_FRAC
+        b = 1.0 + gamma
+        alpha = 2.0 / (b + np.sqrt(b * b + 4.0 * gamma * amounts / reserve_in))
+
+        x = alpha * amounts
+        out = reserve_out * gamma * x / (reserve_in + gamma * x)
+        total_supply = lp.get_liquidity()
+        lp_tokens = np.minimum((1.0 - alpha) * amounts * total_supply
+                               / (reserve_in + x),
+                               out * total_supply / (reserve_out - out))
+        return reserve_out / reserve_in, alpha, out, lp_tokens
+
+    def _solve_v3(self, lp, token_in, amounts, lwr_tick, upr_tick):
+        self._check_pair(token_in.token_name, (lp.token0, lp.token1))
+        if lwr_tick is None or upr_tick is None:
+            raise ValueError(
+                "OptimalDepositSplit: V3 deposits need the target "
+                "position's lwr_tick and upr_tick"
+            )
+        if lwr_tick >= upr_tick:
+            raise ValueError(
+                "OptimalDepositSplit: lwr_tick must be < upr_tick; "
+                "got {} >= {}".format(lwr_tick, upr_tick)
+            )
+
+        index = TickIndex.from_lp(lp)
+        sqrt_price = lp.slot0.sqrtPriceX96 / 2 ** 96
+        sqrt_lwr = 1.0001 ** (lwr_tick / 2)
+        sqrt_upr = 1.0001 ** (upr_tick / 2)
+        zero_for_one = token_in.token_name == lp.token0
+
+        def quote(x):
+            # swap_batch rejects zero-size trades; α = 0 quotes nothing.
+            out = np.zeros_like(x)
+            after = np.full_like(x, sqrt_price)
+            live = x > 0
+            if np.any(live):
+                out[live], after[live] = index.swap_batch(
+                    x[live], zero_for_one, sqrt_price, lp.fee
+                )
+            return out, after
+
+        def needs(sqrt_after):
+            # Token amounts per unit of position liquidity, (in, out).
+            s = np.clip(sqrt_after, sqrt_lwr, sqrt_upr)
+            need0 = 1.0 / s - 1.0 / sqrt_upr
+            need1 = s - sqrt_lwr
+            return (need0, need1) if zero_for_one else (need1, need0)
+
+        def mismatch(alpha):
+            out, after = quote(alpha * amounts)
+            need_in, need_out = needs(after)
+            return (1.0 - alpha) * amounts * need_out - out * need_in
+
+        alpha = self._bisect(mismatch, amounts.size)
+        out, after = quote(alpha * amounts)
+        need_in, need_out = needs(after)
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            lp_tokens = np.minimum(
+                np.where(need_in > 0, (1.0 - alpha) * amounts / need_in, np.inf),
+                np.where(need_out > 0, out / need_out, np.inf),
+            )
+
+        spot_price = sqrt_price ** 2 if zero_for_one else sqrt_price ** -2
+        return spot_price, alpha, out, lp_tokens
+
+    def _solve_balancer(self, lp, token_in, amounts):
+        names = lp.vault.get_names()
+        if len(names) != 2:
+            raise ValueError(
+                "OptimalDepositSplit: Balancer pools must hold exactly "
+                "two tokens; got {}".format(names)
+            )
+        self._check_pair(token_in.token_name, tuple(names))
+        name_out = names[1] if token_in.token_name == names[0] else names[0]
+        reserve_in = lp.vault.get_token(token_in.token_name).token_total
+        reserve_out = lp.vault.get_token(name_out).token_total
+        self._check_reserves(reserve_in, reserve_out)
+
+        weights = lp.vault.get_denorm_weights()
+        w_in = weights[token_in.token_name]
+        w_out = weights[name_out]
+        gamma = 1.0 - _BALANCER_SWAP_FEE
+
+        def quote(x):
+            return reserve_out * (
+                1.0 - (reserve_in / (reserve_in + gamma * x)) ** (w_in / w_out)
+            )
+
+        def mismatch(alpha):
+            x = alpha * amounts
+            out = quote(x)
+            return ((1.0 - alpha) * amounts * (reserve_out - out)
+                    - out * (reserve_in + x))
+
+        alpha = self._bisect(mismatch, amounts.size)
+        x = alpha * amounts
+        out = quote(x)
+        lp_tokens = lp.pool_shares * np.minimum(
+            (1.0 - alpha) * amounts / (reserve_in + x),
+            out / (reserve_out - out),
+        )
+
+        spot_price = (reserve_out / w_out) / (reserve_in / w_in)
+        return spot_price, alpha, out, lp_tokens
+
+    # ─── Helpers ────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _bisect(mismatch, size):
+        # h(0) >= 0 and h falls in α, so keep lo on the h > 0 side.
+        lo = np.zeros(size)
+        hi = np.ones(size)
+        for _ in range(_MAX_ITER):
+            mid = 0.5 * (lo + hi)
+            positive = mismatch(mid) > 0
+            lo = np.where(positive, mid, lo)
+            hi = np.where(positive, hi, mid)
+            if np.all(hi - lo < _ALPHA_TOL):
+                break
+        return lo
+
+    @staticmethod
+    def _check_pair(name, pair):
+        if name not in pair:
+            raise ValueError(
+                "OptimalDepositSplit: token_in {!r} not in pool "
+                "(pool holds {}, {})".format(name, pair[0], pair[1])
+            )
+
+    @staticmethod
+    def _check_reserves(reserve_in, reserve_out):
+        if reserve_in <= 0 or reserve_out <= 0:
+            raise ValueError(
+                "OptimalDepositSplit: pool reserves must be > 0; "
+                "got reserve_in={}, reserve_out={}".format(
+                    reserve_in, reserve_out
+                )
+            )
@@ -16,9 +16,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License
 
+import numpy as np
+
 from uniswappy.analytics.risk import UniswapImpLoss
 from uniswappy.utils.data import UniswapExchangeData
-from ...utils.data import PriceMoveScenario
+from ...utils.data import PriceMoveScenario, PriceMoveScenarioBatch
 
 
 class SimulatePriceMove:
@@ -65,6 +67,12 @@ class SimulatePriceMove:
         is the correct interpretation for hypothetical-value analysis.
         AnalyzePosition uses the same paper-value convention; the two
         primitives agree on how a position is valued at any given state.
+
+        Scenario grids: apply_batch evaluates many price changes (and
+        optionally many position sizes) in one vectorized pass. Every
+        quantity above is either linear in position_size_lp or a pure
+        function of alpha, so the IL helper is built once per call
+        rather than once per scenario.
     """
 
     def __init__(self):
@@ -175,3 +183,92 @@ class SimulatePriceMove:
             fee_projection = None,
             value_change_pct = value_change_pct,
         )
+
+    def apply_batch(self, lp, price_change_pcts, position_size_lp,
+                    lwr_tick = None, upr_tick = None):
+
+        """ apply_batch
+
+            Vectorized apply(): simulate a grid of price moves from the
+            current LP state in one pass.
+
+            Parameters
+            ----------
+            lp : Exchange
+                LP exchange at current pool state.
+            price_change_pcts : array_like
+                Fractional price changes from current price. Every
+                element must be strictly greater than -1.0.
+            position_size_lp : float or array_like
+                LP tokens held by the position, in human units. A scalar
+                applies to every scenario; an array is broadcast against
+                price_change_pcts (NumPy rules). Every element must be
+                strictly greater than zero.
+            lwr_tick : int, optional
+                Lower tick of the position (V3 only).
+            upr_tick : int, optional
+                Upper tick of the position (V3 only).
+
+            Returns
+            -------
+            PriceMoveScenarioBatch
+                Columnar result; element i of each array matches
+                apply(lp, price_change_pcts[i], position_size_lp[i], ...).
+
+            Raises
+            ------
+            ValueError
+                If any price change is <= -1.0, any position size is
+                <= 0, or the two inputs cannot be broadcast together.
+        """
+
+        pcts = np.asarray(price_change_pcts, dtype = float)
+        sizes = np.asarray(position_size_lp, dtype = float)
+
+        if np.any(pcts <= -1.0):
+            raise ValueError(
+                "SimulatePriceMove: price_change_pct must be > -1.0 "
+                "(price cannot go below zero); got min {}".format(pcts.min())
+            )
+        if np.any(sizes <= 0):
+            raise ValueError(
+                "SimulatePriceMove: position_size_lp must be > 0; "
+                "got min {}".format(sizes.min())
+            )
+        pcts, sizes = np.broadcast_arrays(pcts, sizes)
+
+        tokens = lp.factory.token_from_exchange[lp.name]
+        y_tkn = tokens[lp.token1]
+
+        # Token amounts are linear in liquidity for both V2 (reserve
+        # share) and V3 (Δx = L·(1/√P - 1/√Pb), Δy = L·(√P - √Pa)), so
+        # one unit-size helper supplies per-LP-token amounts that scale
+        # to any position size without rebuilding the helper.
+        il_helper = UniswapImpLoss(lp, 1.0, lwr_tick, upr_tick)
+        current_x_amt = il_helper.x_tkn_init * sizes
+        current_y_amt = il_helper.y_tkn_init * sizes
+
+        price_y_in_x = lp.get_price(y_tkn)
+        current_value = current_x_amt + current_y_amt * price_y_in_x
+
+        alpha = 1.0 + pcts
+        hold_value_at_new = current_x_amt + current_y_amt * (price_y_in_x / alpha)
+
+        # Closed form of UniswapImpLoss.calc_iloss, in float64 rather
+        # than its per-point Decimal arithmetic. The V3 range factor r
+        # depends only on the ticks and the current price, so it is a
+        # single scalar for the whole grid.
+        il_at_new_price = 2.0 * np.sqrt(alpha) / (1.0 + alpha) - 1.0
+        if lp.version != UniswapExchangeData.VERSION_V2:
+            sqrt_r = np.sqrt(il_helper.calc_price_range(lwr_tick, upr_tick))
+            il_at_new_price = il_at_new_price * (sqrt_r / (sqrt_r - 1.0))
+
+        new_value = hold_value_at_new * (1.0 + il_at_new_price)
+        value_change_pct = (new_value - current_value) / current_value
+
+        return PriceMoveScenarioBatch(
+            new_price_ratio = alpha,
+            new_value = new_value,
+            il_at_new_price = il_at_new_price,
+            value_change_pct = value_change_pct,
+        )
@@ -1,4 +1,6 @@
 from defipy.tools.schemas import get_schemas
 from defipy.tools.registry import list_tool_names, TOOL_REGISTRY
+from defipy.tools.batch import BatchResult, run_batch
 
-__all__ = ["get_schemas", "list_tool_names", "TOOL_REGISTRY"]
+__all__ = ["get_schemas", "list_tool_names", "TOOL_REGISTRY",
+           "BatchResult", "run_batch"]
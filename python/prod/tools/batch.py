@@ -0,0 +1,253 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Batch invocation of a registered tool over many argument sets.
+
+run_batch groups the calls by pool_id, gets each pool's twin once,
+runs every call against it, and returns one BatchResult table (a row
+per call, a column per result field) instead of N result objects.
+Pools are worked on in parallel on a thread pool; calls on the same
+pool share its twin, which relies on the primitive contract that
+`apply` only reads the pool.
+
+Token arguments (`token_in`, `depeg_token`) may be given as token-name
+strings; they are resolved against each pool's twin, as ScenarioEngine
+and the MCP server resolve them (defipy.twin._dispatch).
+"""
+
+import concurrent.futures
+import dataclasses
+import functools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union
+
+from defipy.tools.registry import TOOL_REGISTRY
+
+
+@dataclass
+class BatchResult:
+    """Results of one tool over many calls, as a table.
+
+    Attributes
+    ----------
+    tool : str
+        The tool that was run.
+    columns : list[str]
+        "pool_id", then the fields of the tool's result dataclass, then
+        "error". Only "pool_id" and "error" if no call succeeded.
+    rows : list[list]
+        One row per call, in call order. Nested result dataclasses are
+        stored as dicts. A failed call has None in every result column
+        and "ExceptionType: message" under "error".
+    """
+    tool: str
+    columns: list = field(default_factory=list)
+    rows: list = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def errors(self) -> int:
+        """Number of calls that failed."""
+        return sum(1 for row in self.rows if row[-1] is not None)
+
+    def records(self) -> list[dict]:
+        """The table as one {column: value} dict per call."""
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+    def to_pandas(self):
+        """The table as a pandas DataFrame (pandas is imported lazily)."""
+        import pandas as pd
+        return pd.DataFrame(self.rows, columns=self.columns)
+
+    @classmethod
+    def from_outcomes(cls, tool: str, outcomes: list) -> "BatchResult":
+        """Tabulate (pool_id, result, error) triples, in order.
+
+        `error` is None for a successful call; `result` is then the
+        primitive's result dataclass.
+        """
+        fields = ()
+        for _pool_id, result, error in outcomes:
+            if error is None:
+                fields = tuple(f.name for f in dataclasses.fields(result))
+                break
+        rows = []
+        for pool_id, result, error in outcomes:
+            if error is None:
+                values = dataclasses.asdict(result)
+                rows.append([pool_id] + [values[f] for f in fields] + [None])
+            else:
+                rows.append([pool_id] + [None] * len(fields) + [error])
+        return cls(tool, ["pool_id", *fields, "error"], rows)
+
+
+def run_batch(
+    tool_name: str,
+    calls: list,
+    twins: Union[Callable, Any],
+    max_workers: Optional[int] = None,
+    read_only: bool = True,
+    run_pool: Optional[Callable] = None,
+) -> BatchResult:
+    """Run one registered tool over many argument sets.
+
+    Parameters
+    ----------
+    tool_name : str
+        A key of TOOL_REGISTRY, e.g. "SimulatePriceMove".
+    calls : list[dict]
+        One dict per call: a "pool_id" plus the keyword arguments of
+        the primitive's `apply` (everything but `lp`). `token_in` /
+        `depeg_token` may be token-name strings.
+    twins : provider | callable
+        Where twins come from. A provider (anything with a
+        `snapshot(pool_id)` method, e.g. MockProvider or LiveProvider)
+        is read once per distinct pool_id and built with
+        StateTwinBuilder. A callable is called as `twins(pool_id)` and
+        must return the built twin — a checkout from the caller's own
+        twin cache, say.
+    max_workers : int | None
+        Threads working on pools concurrently. None (default) uses one
+        per distinct pool, up to 8; 0 runs everything in the calling
+        thread.
+    read_only : bool
+        True (default): a pool's calls share one twin, which relies on
+        the primitive contract that `apply` only reads the pool. False:
+        every call gets a twin of its own from `twins`.
+    run_pool : callable | None
+        Runs one pool's share of the batch: called as
+        `run_pool(pool_id, job)` on a worker thread, it must return
+        `job()` — after running it elsewhere, e.g. on a process pool.
+        `job` takes no arguments and pickles whenever `twins` is a
+        picklable callable. If run_pool raises, every call on that
+        pool records the error. Default: run `job()` in place.
+
+    Returns
+    -------
+    BatchResult
+        One row per call, in call order. A call that fails — or whose
+        pool's twin can't be built — records its error in the row
+        instead of aborting the batch.
+
+    Raises
+    ------
+    ValueError
+        If tool_name isn't registered, a call has no pool_id, or
+        max_workers is negative.
+    TypeError
+        If a call isn't a dict.
+    """
+    if tool_name not in TOOL_REGISTRY:
+        raise ValueError(
+            "run_batch: unknown tool {!r}; expected one of {}".format(
+                tool_name, sorted(TOOL_REGISTRY)
+            )
+        )
+    if max_workers is not None and max_workers < 0:
+        raise ValueError(
+            "run_batch: max_workers must be >= 0 or None; got {}".format(
+                max_workers
+            )
+        )
+
+    groups = {}
+    for i, call in enumerate(calls):
+        if not isinstance(call, dict):
+            raise TypeError(
+                "run_batch: calls must be dicts; got {} at index {}".format(
+                    type(call).__name__, i
+                )
+            )
+        if "pool_id" not in call:
+            raise ValueError(
+                "run_batch: call {} has no pool_id".format(i)
+            )
+        groups.setdefault(call["pool_id"], []).append(i)
+
+    twin_for = _twin_factory(twins)
+
+    def run_group(pool_id):
+        indices = groups[pool_id]
+        job = functools.partial(
+            _run_pool, tool_name, twin_for, read_only, pool_id,
+            [{k: v for k, v in calls[i].items() if k != "pool_id"}
+             for i in indices],
+        )
+        try:
+            results = job() if run_pool is None else run_pool(pool_id, job)
+        except Exception as e:
+            from defipy.twin._dispatch import describe_error
+            results = [(None, describe_error(e))] * len(indices)
+        return [(i, result, error)
+                for i, (result, error) in zip(indices, results)]
+
+    workers = min(len(groups), 8) if max_workers is None else max_workers
+    if workers == 0 or len(groups) <= 1:
+        grouped = map(run_group, groups)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="defipy-batch",
+        ) as executor:
+            grouped = list(executor.map(run_group, groups))
+
+    outcomes = [None] * len(calls)
+    for group in grouped:
+        for i, result, error in group:
+            outcomes[i] = (calls[i]["pool_id"], result, error)
+    return BatchResult.from_outcomes(tool_name, outcomes)
+
+
+def _run_pool(tool_name, twin_for, read_only, pool_id, kwargs_list) -> list:
+    """One pool's calls, in order, as (result, error) pairs. Module-level
+    so a run_pool hook can ship it to another process."""
+    # Imported here so `import defipy.tools` doesn't pull in defipy.twin.
+    from defipy.twin._dispatch import describe_error, resolve_tokens
+    primitive = TOOL_REGISTRY[tool_name].primitive_cls()
+    outcomes = []
+    lp = None
+    for kwargs in kwargs_list:
+        if lp is None or not read_only:
+            try:
+                lp = twin_for(pool_id)
+            except Exception as e:
+                missing = len(kwargs_list) - len(outcomes)
+                return outcomes + [(None, describe_error(e))] * missing
+        try:
+            outcomes.append(
+                (primitive.apply(lp, **resolve_tokens(lp, kwargs)), None)
+            )
+        except Exception as e:
+            outcomes.append((None, describe_error(e)))
+    return outcomes
+
+
+def _twin_factory(twins) -> Callable:
+    if hasattr(twins, "snapshot"):
+        # Imported here so `import defipy.tools` doesn't pull in the
+        # twin builder and the protocol packages behind it.
+        from defipy.twin.builder import StateTwinBuilder
+        builder = StateTwinBuilder()
+        return lambda pool_id: builder.build(twins.snapshot(pool_id))
+    if callable(twins):
+        return twins
+    raise TypeError(
+        "run_batch: twins must be a provider with snapshot() or a "
+        "callable; got {}".format(type(twins).__name__)
+    )
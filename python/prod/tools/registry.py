@@ -36,8 +36,12 @@ from defipy.primitives.execution import CalculateSlippage
 # MCP server), not by the LLM. These are filtered out of drift-test
 # comparisons and never appear in a tool's input_schema. `lp` is the
 # pool/exchange object; `token_in` and `depeg_token` are ERC20 objects
-# resolved from context by the dispatch layer.
-DISPATCH_SUPPLIED_PARAMS = frozenset({"self", "lp", "token_in", "depeg_token"})
+# resolved from context by the dispatch layer. `tick_index` is an
+# optional prebuilt TickIndex for in-process callers; left unset, the
+# primitive builds its own.
+DISPATCH_SUPPLIED_PARAMS = frozenset(
+    {"self", "lp", "token_in", "depeg_token", "tick_index"}
+)
 
 
 @dataclass(frozen=True)
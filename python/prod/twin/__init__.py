@@ -9,6 +9,21 @@ from defipy.twin.snapshot import (
 from defipy.twin.builder import StateTwinBuilder
 from defipy.twin.mock_provider import MockProvider
 from defipy.twin.live_provider import LiveProvider
+from defipy.twin.async_live_provider import AsyncLiveProvider
+from defipy.twin.rpc_pool import RpcEndpointPool
+from defipy.twin.snapshot_series import (
+    write_snapshot_series,
+    read_snapshot_series,
+)
+from defipy.twin.snapshot_cache import SnapshotCache
+from defipy.twin.event_updater import TwinEventUpdater, LiveTwinFollower
+from defipy.twin.token_cache import TokenMetadataCache
+from defipy.twin.scenario import (
+    ScenarioEngine,
+    ScenarioJob,
+    ScenarioResult,
+    ScenarioReport,
+)
 
 __all__ = [
     "StateTwinProvider",
@@ -20,4 +35,16 @@ __all__ = [
     "StateTwinBuilder",
     "MockProvider",
     "LiveProvider",
+    "AsyncLiveProvider",
+    "RpcEndpointPool",
+    "write_snapshot_series",
+    "read_snapshot_series",
+    "SnapshotCache",
+    "TwinEventUpdater",
+    "LiveTwinFollower",
+    "TokenMetadataCache",
+    "ScenarioEngine",
+    "ScenarioJob",
+    "ScenarioResult",
+    "ScenarioReport",
 ]
@@ -0,0 +1,83 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Running primitives by name on built twins — helpers shared by
+ScenarioEngine, defipy.tools.run_batch and the MCP server.
+
+Callers pass primitive arguments as plain data, so ERC20 arguments
+arrive as token-name strings and are resolved against the twin they
+will run on. A failed call is reported as "ExceptionType: message".
+"""
+
+
+# Primitive parameters that take an ERC20; a str value names a token of
+# the twin.
+TOKEN_PARAMS = ("token_in", "token_out", "depeg_token")
+
+
+def resolve_tokens(lp, kwargs: dict) -> dict:
+    """A copy of `kwargs` with every str TOKEN_PARAMS value replaced by
+    lp's token of that name."""
+    kwargs = dict(kwargs)
+    for name in TOKEN_PARAMS:
+        if isinstance(kwargs.get(name), str):
+            kwargs[name] = resolve_token(lp, kwargs[name])
+    return kwargs
+
+
+def resolve_token(lp, token_name: str):
+    """The ERC20 named `token_name` in lp.
+
+    V2 / V3 exchanges keep their tokens on the factory
+    (`lp.factory.token_from_exchange[lp.name]`); Balancer and
+    Stableswap on the vault (`lp.vault.get_token(name)`).
+
+    Raises
+    ------
+    ValueError
+        If lp has no token of that name.
+    """
+    factory = getattr(lp, "factory", None)
+    if factory is not None and hasattr(factory, "token_from_exchange"):
+        tokens = factory.token_from_exchange.get(lp.name, {})
+        if token_name in tokens:
+            return tokens[token_name]
+    vault = getattr(lp, "vault", None)
+    if vault is not None and hasattr(vault, "get_token"):
+        if token_name in vault.get_names():
+            return vault.get_token(token_name)
+    raise ValueError(
+        "token {!r} not found in pool {!r}; available: {}".format(
+            token_name, lp.name, pool_token_names(lp)
+        )
+    )
+
+
+def pool_token_names(lp) -> list:
+    """lp's token names, for error messages."""
+    factory = getattr(lp, "factory", None)
+    if factory is not None and hasattr(factory, "token_from_exchange"):
+        return sorted(factory.token_from_exchange.get(lp.name, {}).keys())
+    vault = getattr(lp, "vault", None)
+    if vault is not None and hasattr(vault, "get_names"):
+        return list(vault.get_names())
+    return []
+
+
+def describe_error(e: Exception) -> str:
+    return "{}: {}".format(type(e).__name__, e)
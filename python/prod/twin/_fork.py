@@ -0,0 +1,246 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Structural forking for built twins — the engine behind
+StateTwinBuilder.fork().
+
+`copy.deepcopy(lp)` walks the whole exchange object graph through the
+generic memo machinery: factory, token registry, vault, every V3
+TickInfo / PositionInfo. This module instead knows which parts of each
+protocol's exchange the protocol packages mutate and copies exactly
+those:
+
+  - Scalars (ints, floats, strings) are immutable; a shallow copy of
+    the exchange already gives the fork its own bindings.
+  - Top-level containers (reserve / fee / provider ledgers) are copied
+    one level deep.
+  - ERC20 objects are NOT immutable — uniswappy, balancerpy and
+    stableswappy all track pool balances in `token.token_total` and
+    mutate it on every swap/join — so each fork gets its own token
+    objects, re-threaded through the factory registry (and vault).
+  - Factory metadata (name, address, parent_lp, other exchanges'
+    registry entries) and pool configuration (Balancer weights and
+    bounds, Stableswap rates) are shared.
+  - V3 position tables are shared copy-on-write: see
+    _CopyOnWriteTable. Forking a twin with thousands of positions
+    costs one dict copy; only positions a fork actually touches get
+    their own PositionInfo. The tick table can't be shared that way —
+    uniswappy's Tick helpers assert `type(ticks) == dict`, which no
+    subclass passes — so each fork gets a plain dict of its own
+    TickInfo copies.
+"""
+
+import copy
+
+from uniswappy.cpt.exchg import UniswapExchange, UniswapV3Exchange
+from balancerpy.cwpt.exchg import BalancerExchange
+from stableswappy.cst.exchg import StableswapExchange
+
+
+class _CopyOnWriteTable(dict):
+    """dict whose values are shared with other tables until accessed.
+
+    uniswappy's V3 code reads a TickInfo / PositionInfo with
+    `table[key]` and then mutates the returned object in place
+    (Tick.cross, Tick.update, Position.get). So the copy point is
+    `__getitem__`: the first keyed access on a table replaces the
+    shared entry with a private shallow copy (the entries are flat
+    dataclasses of ints). Later accesses hit the private copy.
+
+    Both sides of a fork are wrapped — the parent's tables too — so a
+    mutation through keyed access (`[]`, `get`, `setdefault`, `pop`,
+    `popitem`) never leaks into the other. Iteration (`values()` /
+    `items()`) and `copy()` hand out entries as they are; callers must
+    treat those as read-only.
+    """
+
+    __slots__ = ("_owned",)
+
+    def __init__(self, entries = ()):
+        super().__init__(entries)
+        self._owned = set()
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if key not in self._owned:
+            value = copy.copy(value)
+            dict.__setitem__(self, key, value)
+            self._owned.add(key)
+        return value
+
+    def get(self, key, default = None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self._owned.add(key)
+
+    def setdefault(self, key, default = None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def pop(self, key, *default):
+        if key not in self:
+            return dict.pop(self, key, *default)
+        value = self[key]
+        dict.__delitem__(self, key)
+        self._owned.discard(key)
+        return value
+
+    def popitem(self):
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        dict.clear(self)
+        self._owned.clear()
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._owned.discard(key)
+
+    def __reduce__(self):
+        # Default dict-subclass pickling replays __setitem__ before the
+        # _owned slot is restored; rebuild from a plain dict instead.
+        # Keeps deepcopy / pickle of a forked twin working.
+        return (self.__class__, (dict(self),))
+
+    def fork(self) -> "_CopyOnWriteTable":
+        """Return a new table sharing every entry, and drop this table's
+        ownership so its next access copies too."""
+        self._owned.clear()
+        return _CopyOnWriteTable(self)
+
+
+def fork_exchange(lp):
+    """Return an independent fork of a built exchange.
+
+    Dispatches on exchange type. Raises TypeError for anything that is
+    not a uniswappy / balancerpy / stableswappy exchange.
+    """
+    if isinstance(lp, UniswapV3Exchange):
+        return _fork_v3(lp)
+    if isinstance(lp, UniswapExchange):
+        return _fork_v2(lp)
+    if isinstance(lp, BalancerExchange):
+        return _fork_vault_pool(lp)
+    if isinstance(lp, StableswapExchange):
+        fork = _fork_vault_pool(lp)
+        fork.math_pool = _fork_stableswap_math(lp.math_pool)
+        return fork
+    raise TypeError(
+        "StateTwinBuilder.fork: unsupported exchange type {}"
+        .format(type(lp).__name__)
+    )
+
+
+# ─── Shared helpers ─────────────────────────────────────────────────────────
+
+
+def _shallow_with_containers(obj, skip = ()):
+    """copy.copy(obj), then give the copy its own top-level list / dict /
+    set attributes (one level deep). Nested mutable objects are handled
+    by the protocol-specific forks below; `skip` names attributes the
+    caller replaces itself, so they aren't copied twice."""
+    out = copy.copy(obj)
+    for name, value in vars(out).items():
+        if name in skip:
+            continue
+        if isinstance(value, (list, dict, set)):
+            setattr(out, name, copy.copy(value))
+    return out
+
+
+def _fork_factory(factory, exchange_name, tokens):
+    """Copy a FactoryData with this exchange's registry entry pointing at
+    the fork's own token objects. Other exchanges' entries are shared."""
+    out = copy.copy(factory)
+    registry = dict(factory.token_from_exchange)
+    registry[exchange_name] = tokens
+    out.token_from_exchange = registry
+    return out
+
+
+# ─── Uniswap V2 / V3 ────────────────────────────────────────────────────────
+
+
+def _fork_v2(lp, skip = ()):
+    fork = _shallow_with_containers(lp, skip)
+    tokens = {
+        name: copy.copy(tkn)
+        for name, tkn in lp.factory.token_from_exchange[lp.name].items()
+    }
+    fork.factory = _fork_factory(lp.factory, lp.name, tokens)
+    return fork
+
+
+def _fork_v3(lp):
+    fork = _fork_v2(lp, skip = ("ticks", "positions", "positions_for_owner"))
+    fork.slot0 = copy.copy(lp.slot0)
+    fork.protocolFees = copy.copy(lp.protocolFees)
+    fork.positions_for_owner = {
+        owner: set(ticks) for owner, ticks in lp.positions_for_owner.items()
+    }
+    # Tick.update / Tick.cross reject dict subclasses, so ticks are
+    # copied eagerly; TickInfo is a flat dataclass of ints.
+    fork.ticks = {tick: copy.copy(info) for tick, info in lp.ticks.items()}
+    if not isinstance(lp.positions, _CopyOnWriteTable):
+        lp.positions = _CopyOnWriteTable(lp.positions)
+    fork.positions = lp.positions.fork()
+    return fork
+
+
+# ─── Balancer / Stableswap ──────────────────────────────────────────────────
+
+
+def _fork_vault_pool(lp):
+    fork = _shallow_with_containers(lp)
+    token_map = {id(tkn): copy.copy(tkn) for tkn in lp.vault.tkns}
+
+    vault = copy.copy(lp.vault)
+    vault.tkns = [token_map[id(tkn)] for tkn in lp.vault.tkns]
+    vault.tkn_dic = {
+        name: token_map[id(tkn)] for name, tkn in lp.vault.tkn_dic.items()
+    }
+    fork.vault = vault
+
+    tokens = {
+        name: token_map.get(id(tkn), tkn)
+        for name, tkn in lp.factory.token_from_exchange[lp.name].items()
+    }
+    fork.factory = _fork_factory(lp.factory, lp.name, tokens)
+    return fork
+
+
+def _fork_stableswap_math(math_pool):
+    # StableswapPoolMath uses __slots__, so no vars(); balances and
+    # admin_balances are the only lists it mutates (rates is config).
+    if math_pool is None:
+        return None
+    out = copy.copy(math_pool)
+    out.balances = list(math_pool.balances)
+    out.admin_balances = list(math_pool.admin_balances)
+    return out
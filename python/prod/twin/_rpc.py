@@ -30,14 +30,28 @@ Phase 1 strategy (per STATE_TWIN_PHASE_1_EXPANDED.md D1):
     `chain_id()`) so a `FakeRpcClient` in tests can mimic it without
     network access.
 
-Phase 2 extends this module with Multicall3 batching for V3 reads
+Phase 2 extends this module with Multicall3 batching for pool reads
 (see MULTICALL3_ADDRESS, multicall_aggregate3, load_v3_pool_contract
-below). V2 LiveProvider stays sequential — one extra
-`eth_getBlockByNumber` for the timestamp retrofit, no multicall.
+below). Every LiveProvider path, V2 included, reads its pool state and
+block timestamp in one aggregate3 call.
+
+Token metadata (symbol/decimals) reads through the process-wide
+TokenMetadataCache (token_cache.py); the multicall paths batch any
+misses into one Multicall3 round trip via fetch_tokens.
+
+fetch_pool_logs decodes a pool's Sync / Swap / Mint / Burn events
+from one eth_getLogs, for TwinEventUpdater (event_updater.py).
+
+AsyncRpcClient / make_async_client and the async_* helpers at the
+bottom are the asyncio transport for AsyncLiveProvider; they share the
+call encoding, result decoding and token-cache logic with the sync
+helpers.
 """
 
 from typing import Optional
 
+from defipy.twin.token_cache import default_token_cache
+
 
 # RPC client interface (informal protocol):
 #
@@ -51,13 +65,21 @@ from typing import Optional
 # the same surface against canned responses.
 
 
-def make_client(rpc_url: str):
+def make_client(rpc_url):
     """Construct a production RpcClient backed by web3scout.ConnectW3.
 
     Imported lazily so `from defipy.twin import LiveProvider` works
     in the bare install. Only callers that actually want to hit the
     chain pay the [chain]-extras import cost.
+
+    `rpc_url` may also be a list of URLs or an RpcEndpointPool: the
+    client's web3 then sends every request through the pool (pooled
+    sessions, latency-weighted routing, retry and failover — see
+    rpc_pool.py) behind the same RpcClient surface.
     """
+    from defipy.twin.rpc_pool import RpcEndpointPool
+    if isinstance(rpc_url, (list, tuple, RpcEndpointPool)):
+        return _make_pooled_client(rpc_url)
     try:
         from web3scout.utils.connect import ConnectW3
     except ImportError as e:
@@ -75,12 +97,41 @@ def make_client(rpc_url: str):
     return RpcClient(connector)
 
 
+def _make_pooled_client(rpc_url):
+    from defipy.twin.rpc_pool import RpcEndpointPool, web3_provider
+    pool = rpc_url if isinstance(rpc_url, RpcEndpointPool) else RpcEndpointPool(rpc_url)
+    try:
+        from web3 import Web3
+    except ImportError as e:
+        raise ImportError(
+            "LiveProvider requires the [chain] extra. Install with "
+            "`pip install defipy[chain]` (or `defipy[book]` / "
+            "`defipy[anvil]`, which carry the same web3 dep)."
+        ) from e
+    return RpcClient(_PoolConnector(Web3(web3_provider(pool)), pool))
+
+
+class _PoolConnector:
+    """ConnectW3-shaped holder for a pool-backed Web3."""
+
+    def __init__(self, w3, pool):
+        self._w3 = w3
+        self.pool = pool
+
+    def get_w3(self):
+        return self._w3
+
+    def is_connect(self) -> bool:
+        return self._w3.is_connected()
+
+
 class RpcClient:
     """Thin wrapper around web3scout's ConnectW3.
 
-    Held by LiveProvider for the duration of a single .snapshot()
-    call. Stateless across calls — every .snapshot() makes a fresh
-    client via make_client().
+    Held by LiveProvider for its lifetime (see LiveProvider._get_client).
+    Built from a list of URLs or an RpcEndpointPool, the connector's
+    web3 routes every request through the pool — pooled sessions,
+    retry and failover happen below this surface; `pool` exposes it.
     """
 
     def __init__(self, connector):
@@ -116,13 +167,19 @@ class RpcClient:
     def block_timestamp(self, block_number: int) -> int:
         """Block header timestamp for the given block_number.
 
-        Used by V2 LiveProvider's enrichment retrofit (Phase 2). V3
-        reads timestamp inside the multicall via Multicall3's
-        `getCurrentBlockTimestamp()`, so this helper is V2-only in
-        Phase 2; one extra round trip per V2 snapshot.
+        LiveProvider no longer calls this — every snapshot path reads
+        the timestamp inside its multicall via Multicall3's
+        `getCurrentBlockTimestamp()`. Kept for callers that want a
+        header timestamp without a pool read; one round trip.
         """
         return int(self._w3.eth.get_block(block_number).timestamp)
 
+    @property
+    def pool(self):
+        """The RpcEndpointPool behind this client, or None for a
+        single-URL client."""
+        return getattr(self._connector, "pool", None)
+
     def is_connected(self) -> bool:
         """True if the underlying ConnectW3 reports a live connection.
 
@@ -275,36 +332,54 @@ def multicall_aggregate3_args(w3, calls, block_number, allow_failure = False):
             for a no-arg call.
           - args         : argument values, e.g. [0]; [] for no-arg.
           - decode_types : eth_abi return types, e.g. ["address"] or
-            ["address[]", "uint256[]", "uint256"].
+            ["address[]", "uint256[]", "uint256"]. None returns the
+            raw returnData bytes undecoded (for reads whose return
+            shape varies, e.g. string vs bytes32 symbol()).
     block_number : int
         Pin every sub-call to this block per R1 (block consistency).
     allow_failure : bool
         False (default): any sub-call revert raises RuntimeError (the
         whole batch is allowFailure=False, so it reverts upstream first).
-        True: failed sub-calls return None in their result slot, used
-        by the Curve coin-count probe.
+        True: failed sub-calls — reverted, or returning data that
+        doesn't decode (e.g. an address with no code) — return None in
+        their result slot. Used by the Curve coin-count probe and the
+        chunked batch helpers.
 
     Returns
     -------
     list
         One decoded value per call, in input order. Bare scalar for a
-        single-return call, tuple for multi-return. None for a failed
-        sub-call when allow_failure=True.
+        single-return call, tuple for multi-return, raw bytes when
+        decode_types is None. None for a failed sub-call when
+        allow_failure=True.
     """
-    from eth_abi import encode, decode
-    from eth_utils import function_signature_to_4byte_selector
     multicall = w3.eth.contract(
         address = w3.to_checksum_address(MULTICALL3_ADDRESS),
         abi = _MULTICALL3_ABI,
     )
+    results = multicall.functions.aggregate3(
+        _encode_calls(w3, calls, allow_failure),
+    ).call(block_identifier = block_number)
+    return _decode_results(results, calls, allow_failure)
+
+
+def _encode_calls(w3, calls, allow_failure):
+    """(target, fn_sig, arg_types, args, _) entries → aggregate3 Call3
+    tuples. Shared by the sync and async multicall helpers."""
+    from eth_abi import encode
+    from eth_utils import function_signature_to_4byte_selector
     encoded = []
     for target, fn_sig, arg_types, args, _decode_types in calls:
         selector = function_signature_to_4byte_selector(fn_sig)
         call_data = selector + (encode(arg_types, args) if arg_types else b"")
         encoded.append((w3.to_checksum_address(target), allow_failure, call_data))
-    results = multicall.functions.aggregate3(encoded).call(
-        block_identifier = block_number,
-    )
+    return encoded
+
+
+def _decode_results(results, calls, allow_failure):
+    """aggregate3 (success, returnData) pairs → decoded values, per
+    multicall_aggregate3_args' contract."""
+    from eth_abi import decode
     decoded_results = []
     for (success, return_data), (_t, fn_sig, _at, _a, decode_types) in zip(results, calls):
         if not success:
@@ -315,11 +390,65 @@ def multicall_aggregate3_args(w3, calls, block_number, allow_failure = False):
                 "multicall_aggregate3_args: sub-call {!r} reverted "
                 "(allowFailure was off)".format(fn_sig)
             )
-        out = decode(decode_types, return_data)
+        if decode_types is None:
+            decoded_results.append(bytes(return_data))
+            continue
+        try:
+            out = decode(decode_types, return_data)
+        except Exception:
+            # A call to an address with no code "succeeds" with empty
+            # returnData; under allow_failure that's a failed slot, not
+            # a reason to sink the whole batch.
+            if not allow_failure:
+                raise
+            decoded_results.append(None)
+            continue
         decoded_results.append(out[0] if len(decode_types) == 1 else out)
     return decoded_results
 
 
+# Default cap on sub-calls per aggregate3 for chunked batches. A Call3
+# is ~200 bytes of calldata and the pool getters batched here cost a
+# few thousand gas each, so 300 keeps one eth_call around 60 KB and
+# well under the common 50M eth_call gas cap and provider body limits.
+MULTICALL_BATCH_SIZE = 300
+
+
+def multicall_aggregate3_chunked(w3, calls, block_number,
+                                 batch_size = MULTICALL_BATCH_SIZE):
+    """multicall_aggregate3_args over an arbitrarily long call list.
+
+    Splits `calls` into aggregate3 batches of at most `batch_size`
+    sub-calls, every batch pinned to `block_number` and run with
+    allow_failure=True so one reverting sub-call can't sink the rest.
+
+    Returns one slot per call, in input order: the decoded value, None
+    for a reverted sub-call, or — when a whole batch's eth_call fails
+    (gas cap, body-size limit, transport error) — the exception
+    instance, repeated in every slot of that batch. Callers decide how
+    far a failure spreads.
+    """
+    out = []
+    for chunk in _chunks(calls, batch_size):
+        try:
+            out.extend(multicall_aggregate3_args(
+                w3, chunk, block_number, allow_failure = True,
+            ))
+        except Exception as e:
+            out.extend([e] * len(chunk))
+    return out
+
+
+def _chunks(calls, batch_size) -> list:
+    if batch_size < 1:
+        raise ValueError(
+            "multicall_aggregate3_chunked: batch_size must be >= 1; got {}"
+            .format(batch_size)
+        )
+    return [calls[start:start + batch_size]
+            for start in range(0, len(calls), batch_size)]
+
+
 # ─── V2 helpers ────────────────────────────────────────────────────────────
 
 
@@ -381,12 +510,15 @@ def load_curve_pool_contract(w3, address: str):
     return ABILoad(PlatformsEnum.CURVE, "StableSwap").apply(w3, address)
 
 
-def fetch_token(w3, address: str):
+def fetch_token(w3, address: str, chain_id: Optional[int] = None):
     """Fetch ERC20 metadata via web3scout's FetchToken.
 
     Returns a uniswappy.erc.ERC20 with .token_name (symbol),
     .token_addr, .token_decimal populated from on-chain reads.
 
+    With `chain_id`, reads through the process-wide TokenMetadataCache
+    (see token_cache.py): a hit costs no RPC, a miss is stored.
+
     Note on block-pinning: FetchToken does NOT accept a
     block_identifier — symbol() and decimals() are read at "latest".
     For Phase 1 this is acceptable: token metadata is effectively
@@ -395,8 +527,115 @@ def fetch_token(w3, address: str):
     practice. The v1 ImpermanentLossAgent's prime_mock_pool path uses
     this same pattern.
     """
+    if chain_id is not None:
+        cached = default_token_cache().get(chain_id, address)
+        if cached is not None:
+            return _make_token(address, *cached)
     from web3scout.token.fetch.fetch_token import FetchToken
-    return FetchToken(w3).apply(address)
+    tkn = FetchToken(w3).apply(address)
+    if chain_id is not None and tkn.token_name is not None \
+            and tkn.token_decimal is not None:
+        default_token_cache().put(
+            chain_id, address, tkn.token_name, tkn.token_decimal,
+        )
+    return tkn
+
+
+def fetch_tokens(w3, addresses, block_number: int, chain_id: int,
+                 batch_size: Optional[int] = None) -> list:
+    """Metadata for several tokens in at most one round trip.
+
+    Cached tokens (TokenMetadataCache, keyed by (chain_id, address))
+    cost nothing. The rest have symbol() and decimals() read together
+    in one Multicall3 batch pinned to `block_number` — instead of
+    FetchToken's two sequential reads per token — and are stored.
+    A token whose symbol() / decimals() reverts or doesn't decode falls
+    back to fetch_token for that address. With `batch_size`, the misses
+    are split across aggregate3 batches of at most that many sub-calls
+    (see multicall_aggregate3_chunked) — for sweeps over many pools.
+
+    Returns uniswappy.erc.ERC20 objects in `addresses` order.
+    """
+    tokens, missing, calls = _token_lookup(addresses, chain_id)
+    if not missing:
+        return tokens
+    if batch_size is None:
+        results = multicall_aggregate3_args(
+            w3, calls, block_number, allow_failure = True,
+        )
+    else:
+        # Even chunk size keeps each token's symbol/decimals pair in
+        # one batch.
+        results = multicall_aggregate3_chunked(
+            w3, calls, block_number, _token_batch_size(batch_size),
+        )
+    for i in _token_store(addresses, missing, results, chain_id, tokens):
+        tokens[i] = fetch_token(w3, addresses[i], chain_id)
+    return tokens
+
+
+def _token_lookup(addresses, chain_id) -> tuple:
+    """Serve `addresses` from the token cache. Returns (tokens,
+    missing, calls): ERC20s for the hits (None elsewhere), the miss
+    indices, and the symbol()/decimals() sub-calls that read them."""
+    cache = default_token_cache()
+    tokens = [None] * len(addresses)
+    missing = []
+    for i, address in enumerate(addresses):
+        cached = cache.get(chain_id, address)
+        if cached is None:
+            missing.append(i)
+        else:
+            tokens[i] = _make_token(address, *cached)
+    calls = []
+    for i in missing:
+        calls.append((addresses[i], "symbol()", [], [], None))
+        calls.append((addresses[i], "decimals()", [], [], ["uint8"]))
+    return tokens, missing, calls
+
+
+def _token_batch_size(batch_size: int) -> int:
+    return max(2, batch_size - batch_size % 2)
+
+
+def _token_store(addresses, missing, results, chain_id, tokens) -> list:
+    """Decode the metadata batch into `tokens` and the cache. A failed
+    batch (exception slot) is raised. Returns the indices whose
+    symbol() / decimals() didn't decode, for the caller's fallback."""
+    cache = default_token_cache()
+    unresolved = []
+    for j, i in enumerate(missing):
+        symbol_data, decimals = results[2 * j], results[2 * j + 1]
+        if isinstance(symbol_data, Exception):
+            raise symbol_data
+        symbol = _decode_symbol(symbol_data)
+        if symbol is None or decimals is None:
+            unresolved.append(i)
+            continue
+        cache.put(chain_id, addresses[i], symbol, int(decimals))
+        tokens[i] = _make_token(addresses[i], symbol, int(decimals))
+    return unresolved
+
+
+def _decode_symbol(return_data) -> Optional[str]:
+    """symbol() returnData → str. Most ERC20s return `string`; a few
+    early ones (MKR, SAI) return `bytes32`. None if neither decodes."""
+    if return_data is None:
+        return None
+    from eth_abi import decode
+    try:
+        return decode(["string"], return_data)[0]
+    except Exception:
+        pass
+    if len(return_data) == 32:
+        return return_data.rstrip(b"\x00").decode("utf-8", errors = "replace")
+    return None
+
+
+def _make_token(address: str, symbol: str, decimals: int):
+    """ERC20 shaped like FetchToken's return value."""
+    from uniswappy.erc import ERC20
+    return ERC20(symbol, address, decimals)
 
 
 def amt_to_decimal(token, amt_raw):
@@ -409,3 +648,230 @@ def amt_to_decimal(token, amt_raw):
     — keep native floats end-to-end into the snapshot.
     """
     return amt_raw / (10 ** token.token_decimal)
+
+
+# ─── Pool event logs ───────────────────────────────────────────────────────
+#
+# The state-changing events of a Uniswap pair / pool, fetched with one
+# eth_getLogs per range and decoded into the shape web3's
+# `contract.events.X().process_log()` produces ({"event", "args",
+# "address", "blockNumber", "logIndex", "transactionHash"}), so
+# TwinEventUpdater accepts logs decoded either way. Only the args the
+# updater reads are decoded. Each entry is (name, signature, indexed
+# args as (topic position, arg, type), data args as (arg, type)).
+POOL_EVENTS = {
+    "uniswap_v2": [
+        ("Sync", "Sync(uint112,uint112)",
+            [], [("reserve0", "uint112"), ("reserve1", "uint112")]),
+        ("Swap", "Swap(address,uint256,uint256,uint256,uint256,address)",
+            [], [("amount0In", "uint256"), ("amount1In", "uint256"),
+                 ("amount0Out", "uint256"), ("amount1Out", "uint256")]),
+        ("Mint", "Mint(address,uint256,uint256)",
+            [], [("amount0", "uint256"), ("amount1", "uint256")]),
+        ("Burn", "Burn(address,uint256,uint256,address)",
+            [], [("amount0", "uint256"), ("amount1", "uint256")]),
+    ],
+    "uniswap_v3": [
+        ("Swap", "Swap(address,address,int256,int256,uint160,uint128,int24)",
+            [], [("amount0", "int256"), ("amount1", "int256"),
+                 ("sqrtPriceX96", "uint160"), ("liquidity", "uint128"),
+                 ("tick", "int24")]),
+        ("Mint", "Mint(address,address,int24,int24,uint128,uint256,uint256)",
+            [(2, "tickLower", "int24"), (3, "tickUpper", "int24")],
+            [("sender", "address"), ("amount", "uint128"),
+             ("amount0", "uint256"), ("amount1", "uint256")]),
+        ("Burn", "Burn(address,int24,int24,uint128,uint256,uint256)",
+            [(2, "tickLower", "int24"), (3, "tickUpper", "int24")],
+            [("amount", "uint128"), ("amount0", "uint256"),
+             ("amount1", "uint256")]),
+    ],
+}
+
+
+# Default cap on blocks per eth_getLogs when following a pool. Hosted
+# nodes reject wide ranges (commonly 2k–10k blocks, or 10k results), so
+# a follower that fell behind reads its backlog in chunks of this size.
+LOG_BLOCK_RANGE = 2_000
+
+
+def event_topic(signature: str) -> bytes:
+    """topic0 (keccak-256 of the canonical signature) of an event."""
+    from eth_utils import keccak
+    return keccak(text = signature)
+
+
+def fetch_pool_logs(w3, protocol: str, address: str, from_block: int,
+                    to_block: int) -> list:
+    """One eth_getLogs for `address`'s POOL_EVENTS[protocol] over
+    [from_block, to_block], decoded and sorted by (blockNumber,
+    logIndex). Logs with an unknown topic0 are dropped."""
+    by_topic = {
+        event_topic(signature): (name, indexed, data)
+        for name, signature, indexed, data in POOL_EVENTS[protocol]
+    }
+    raw_logs = w3.eth.get_logs({
+        "address": address,
+        "fromBlock": from_block,
+        "toBlock": to_block,
+        "topics": [list(by_topic)],
+    })
+    events = []
+    for log in raw_logs:
+        topics = [_as_bytes(t) for t in log["topics"]]
+        if not topics or topics[0] not in by_topic:
+            continue
+        events.append(decode_pool_log(log, *by_topic[topics[0]], topics))
+    events.sort(key = lambda e: (e["blockNumber"], e["logIndex"]))
+    return events
+
+
+def decode_pool_log(log, name, indexed, data, topics) -> dict:
+    """Decode one raw log given its POOL_EVENTS entry."""
+    from eth_abi import decode
+    args = {}
+    for position, arg, abi_type in indexed:
+        args[arg] = decode([abi_type], topics[position])[0]
+    values = decode([t for _, t in data], _as_bytes(log["data"]))
+    args.update(zip((arg for arg, _ in data), values))
+    return {
+        "event": name,
+        "args": args,
+        "address": log.get("address"),
+        "blockNumber": int(log["blockNumber"]),
+        "logIndex": int(log["logIndex"]),
+        "transactionHash": log.get("transactionHash"),
+    }
+
+
+def _as_bytes(value) -> bytes:
+    """HexBytes / bytes / "0x…" str → bytes."""
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return bytes(value)
+
+
+# ─── Async client ──────────────────────────────────────────────────────────
+#
+# AsyncLiveProvider's transport. Same informal protocol as RpcClient,
+# with block_number() / chain_id() awaitable and get_w3() returning a
+# web3.AsyncWeb3. Call encoding and result decoding are shared with the
+# sync helpers above; only the eth_call itself is awaited.
+
+
+def make_async_client(rpc_url: str):
+    """Construct an AsyncRpcClient over web3's AsyncHTTPProvider.
+
+    web3scout's ConnectW3 is sync-only, so the async client talks to
+    web3 directly. Imported lazily, like make_client.
+    """
+    try:
+        from web3 import AsyncWeb3, AsyncHTTPProvider
+    except ImportError as e:
+        raise ImportError(
+            "AsyncLiveProvider requires the [chain] extra. Install with "
+            "`pip install defipy[chain]` (or `defipy[book]` / "
+            "`defipy[anvil]`, which carry the same web3 dep)."
+        ) from e
+    return AsyncRpcClient(AsyncWeb3(AsyncHTTPProvider(rpc_url)))
+
+
+class AsyncRpcClient:
+    """Thin wrapper around a web3.AsyncWeb3 instance.
+
+    Held by AsyncLiveProvider for its lifetime; one HTTP session serves
+    every concurrent snapshot. chain_id is cached on first read (C9).
+    """
+
+    def __init__(self, w3):
+        self._w3 = w3
+        self._chain_id: Optional[int] = None
+
+    def get_w3(self):
+        """Return the underlying web3.AsyncWeb3 instance."""
+        return self._w3
+
+    async def block_number(self) -> int:
+        """Current block_number from the endpoint."""
+        return int(await self._w3.eth.block_number)
+
+    async def chain_id(self) -> int:
+        """Chain id of the endpoint. Cached on first access per C9."""
+        if self._chain_id is None:
+            self._chain_id = int(await self._w3.eth.chain_id)
+        return self._chain_id
+
+    async def is_connected(self) -> bool:
+        return bool(await self._w3.is_connected())
+
+
+async def async_multicall_aggregate3_args(w3, calls, block_number,
+                                          allow_failure = False):
+    """Awaitable multicall_aggregate3_args for a web3.AsyncWeb3."""
+    multicall = w3.eth.contract(
+        address = w3.to_checksum_address(MULTICALL3_ADDRESS),
+        abi = _MULTICALL3_ABI,
+    )
+    results = await multicall.functions.aggregate3(
+        _encode_calls(w3, calls, allow_failure),
+    ).call(block_identifier = block_number)
+    return _decode_results(results, calls, allow_failure)
+
+
+async def async_multicall_aggregate3_chunked(w3, calls, block_number,
+                                             batch_size = MULTICALL_BATCH_SIZE,
+                                             limit = None):
+    """Awaitable multicall_aggregate3_chunked.
+
+    Same slot contract as the sync helper (decoded value, None for a
+    reverted sub-call, the exception for a failed batch). The batches
+    are issued concurrently; pass an asyncio.Semaphore as `limit` to
+    bound how many eth_calls are in flight at once.
+    """
+    import asyncio
+
+    async def run(chunk):
+        try:
+            if limit is None:
+                return await async_multicall_aggregate3_args(
+                    w3, chunk, block_number, allow_failure = True,
+                )
+            async with limit:
+                return await async_multicall_aggregate3_args(
+                    w3, chunk, block_number, allow_failure = True,
+                )
+        except Exception as e:
+            return [e] * len(chunk)
+
+    chunks = _chunks(calls, batch_size)
+    out = []
+    for values in await asyncio.gather(*(run(c) for c in chunks)):
+        out.extend(values)
+    return out
+
+
+async def async_fetch_tokens(w3, addresses, block_number: int, chain_id: int,
+                             batch_size: Optional[int] = None,
+                             limit = None) -> list:
+    """Awaitable fetch_tokens: cache first, then one pinned metadata
+    batch (chunked by `batch_size`, concurrency bounded by `limit`).
+
+    FetchToken is sync-only, so there is no per-token fallback here: a
+    token whose symbol() / decimals() reverts or doesn't decode raises
+    RuntimeError naming the address.
+    """
+    tokens, missing, calls = _token_lookup(addresses, chain_id)
+    if not missing:
+        return tokens
+    results = await async_multicall_aggregate3_chunked(
+        w3, calls, block_number,
+        _token_batch_size(MULTICALL_BATCH_SIZE if batch_size is None
+                          else batch_size),
+        limit,
+    )
+    unresolved = _token_store(addresses, missing, results, chain_id, tokens)
+    if unresolved:
+        raise RuntimeError(
+            "async_fetch_tokens: symbol()/decimals() unreadable for {}"
+            .format([addresses[i] for i in unresolved])
+        )
+    return tokens
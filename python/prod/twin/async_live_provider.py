@@ -0,0 +1,220 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""AsyncLiveProvider — asyncio counterpart of LiveProvider.
+
+Same pool_id format, block pinning, snapshot types and SnapshotCache
+support as LiveProvider, with `await snapshot(...)` and
+`await snapshot_many(...)` over web3's AsyncHTTPProvider (via
+`_rpc.AsyncRpcClient`). A slow endpoint suspends the calling task
+instead of blocking the event loop.
+
+The reads are LiveProvider's batch read plans (`_batch_plan`) driven
+by the shared `_PlanRunner`, so every call encoding, revert check and
+decode step is the code snapshot_many runs; only the eth_calls are
+awaited. A single `snapshot()` is a one-pool plan run — the same
+round trips as the sync path (eth_blockNumber when unpinned,
+eth_chainId once, one aggregate3 per read phase, one token batch on a
+cold token cache).
+
+Concurrency is bounded per provider: at most `max_concurrency`
+requests are in flight at once across every concurrent `snapshot()`
+and every chunk of a `snapshot_many()` phase.
+
+AsyncLiveProvider is not a StateTwinProvider — that ABC's `snapshot`
+is synchronous — but its snapshots feed StateTwinBuilder unchanged.
+"""
+
+import asyncio
+from typing import Optional
+
+from defipy.twin.live_provider import LiveProvider, _PlanRunner
+from defipy.twin.snapshot import PoolSnapshot
+from defipy.twin.snapshot_cache import SnapshotCache
+
+
+class AsyncLiveProvider:
+    """Chain-reading State Twin provider for asyncio code.
+
+    Parameters
+    ----------
+    rpc_url : str
+        HTTP(S) RPC endpoint. The client is constructed lazily on the
+        first read, so construction works without web3 installed.
+    cache : SnapshotCache | None
+        Optional memoization, as for LiveProvider.
+    max_concurrency : int
+        Maximum in-flight RPC requests for this provider. Must be >= 1.
+        Default 8.
+
+    Examples
+    --------
+        provider = AsyncLiveProvider(rpc_url, max_concurrency = 4)
+        snap = await provider.snapshot("uniswap_v3:0x88e6...5640")
+        snaps = await provider.snapshot_many(pool_ids, block_number = N)
+        lp = StateTwinBuilder().build(snap)
+    """
+
+    def __init__(
+        self,
+        rpc_url: str,
+        cache: Optional[SnapshotCache] = None,
+        max_concurrency: int = 8,
+    ):
+        if max_concurrency < 1:
+            raise ValueError(
+                "AsyncLiveProvider: max_concurrency must be >= 1; got {}"
+                .format(max_concurrency)
+            )
+        self.rpc_url = rpc_url
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self._cached_client = None
+        # asyncio.Semaphore binds to the loop it first waits on; one is
+        # made per running loop so a provider survives asyncio.run()
+        # being called more than once.
+        self._limit = None
+        self._limit_loop = None
+
+    # ─── Test-only constructor ─────────────────────────────────────────────
+
+    @classmethod
+    def _with_client(
+        cls, client, cache: Optional[SnapshotCache] = None,
+        max_concurrency: int = 8,
+    ) -> "AsyncLiveProvider":
+        """Inject a duck-typed AsyncRpcClient. Test-only.
+
+        See AsyncFakeRpcClient in python/test/twin/_fake_rpc.py.
+        """
+        provider = cls("<injected>", cache = cache,
+                       max_concurrency = max_concurrency)
+        provider._cached_client = client
+        return provider
+
+    # ─── Public API ────────────────────────────────────────────────────────
+
+    def get_w3(self):
+        """Return the underlying web3.AsyncWeb3 instance."""
+        return self._get_client().get_w3()
+
+    async def snapshot(self, pool_id: str, **kwargs) -> PoolSnapshot:
+        """Construct a PoolSnapshot from on-chain state.
+
+        Same arguments, return types and errors as
+        `LiveProvider.snapshot` (block_number, lwr_tick / upr_tick,
+        tick_words, n_coins).
+        """
+        LiveProvider._parse_pool_id(pool_id)
+        LiveProvider._check_tick_words(kwargs.get("tick_words", None))
+        snap, = await self._read(
+            [pool_id], [kwargs], kwargs.get("block_number", None), None,
+            "AsyncLiveProvider.snapshot",
+        )
+        if isinstance(snap, Exception):
+            raise snap
+        return snap
+
+    async def snapshot_many(
+        self,
+        pool_ids: list,
+        block_number: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> list:
+        """Snapshot many pools at one block.
+
+        Same phases, arguments and result contract as
+        `LiveProvider.snapshot_many` — snapshots (or the per-pool
+        exception) in input order. A phase's multicall chunks are
+        issued concurrently, at most `max_concurrency` at a time.
+        """
+        from defipy.twin import _rpc
+        if batch_size is None:
+            batch_size = _rpc.MULTICALL_BATCH_SIZE
+        if batch_size < 1:
+            raise ValueError(
+                "AsyncLiveProvider.snapshot_many: batch_size must be >= 1; "
+                "got {}".format(batch_size)
+            )
+        pool_ids = list(pool_ids)
+        return await self._read(
+            pool_ids, [{}] * len(pool_ids), block_number, batch_size,
+            "AsyncLiveProvider.snapshot_many",
+        )
+
+    # ─── Plan driver ───────────────────────────────────────────────────────
+
+    async def _read(self, pool_ids, kwargs_list, block_number, batch_size,
+                    caller):
+        from defipy.twin import _rpc
+
+        client = self._get_client()
+        w3 = client.get_w3()
+        limit = self._get_limit()
+
+        # R1 — resolve "latest" once; every read below pins to it.
+        if block_number is None:
+            async with limit:
+                block_number = await client.block_number()
+        async with limit:
+            chain_id = await client.chain_id()
+        ctx = {"w3": w3, "block_number": block_number,
+               "chain_id": chain_id, "timestamp": None, "caller": caller}
+
+        results, plans, keys = LiveProvider._start_plans(
+            pool_ids, kwargs_list, ctx, self.cache,
+        )
+        runner = _PlanRunner(plans, pool_ids, results, ctx)
+        while runner.pending:
+            calls, addresses = runner.next_phase()
+            call_out = tokens = None
+            if calls:
+                call_out = await _rpc.async_multicall_aggregate3_chunked(
+                    w3, calls, block_number,
+                    _rpc.MULTICALL_BATCH_SIZE if batch_size is None else batch_size,
+                    limit,
+                )
+            if addresses:
+                try:
+                    tokens = await _rpc.async_fetch_tokens(
+                        w3, addresses, block_number, chain_id, batch_size,
+                        limit,
+                    )
+                except Exception as e:
+                    tokens = e
+            runner.resolve(call_out, tokens)
+
+        LiveProvider._fill_cache(self.cache, keys, results)
+        return results
+
+    # ─── Client management ─────────────────────────────────────────────────
+
+    def _get_client(self):
+        """Return the cached client (constructing it on first call)."""
+        if self._cached_client is not None:
+            return self._cached_client
+        from defipy.twin import _rpc
+        self._cached_client = _rpc.make_async_client(self.rpc_url)
+        return self._cached_client
+
+    def _get_limit(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._limit is None or self._limit_loop is not loop:
+            self._limit = asyncio.Semaphore(self.max_concurrency)
+            self._limit_loop = loop
+        return self._limit
@@ -72,6 +72,52 @@ class StateTwinBuilder:
             .format(type(snapshot).__name__)
         )
 
+    # ─── Forking ────────────────────────────────────────────────────────────
+
+    def fork(self, lp, n: int = 1) -> list:
+        """Return `n` independent forks of a built twin.
+
+        Each fork can be swapped, joined, or otherwise mutated without
+        affecting `lp` or any other fork — the same guarantee as
+        `copy.deepcopy(lp)`, at a fraction of the cost. Only the state
+        the protocol packages mutate is copied (reserves, ledgers,
+        token balances, V3 slot0); factory metadata and pool config are
+        shared, and V3 position tables are shared copy-on-write (V3 tick
+        tables are copied). See defipy.twin._fork for the per-protocol
+        breakdown.
+
+        Forking wraps `lp`'s own V3 position table in the
+        copy-on-write table type as well, so later mutations of the
+        parent stay out of its forks. Provenance attributes
+        (`live_snapshot`, `snapshot_block_number`) carry over.
+
+        Parameters
+        ----------
+        lp : Exchange
+            A built twin (or any uniswappy / balancerpy / stableswappy
+            exchange).
+        n : int
+            Number of forks. Must be >= 1.
+
+        Returns
+        -------
+        list
+            `n` exchange objects of the same type as `lp`.
+
+        Raises
+        ------
+        ValueError
+            If n < 1.
+        TypeError
+            If `lp` is not a supported exchange type.
+        """
+        if n < 1:
+            raise ValueError(
+                "StateTwinBuilder.fork: n must be >= 1; got {}".format(n)
+            )
+        from defipy.twin._fork import fork_exchange
+        return [fork_exchange(lp) for _ in range(n)]
+
     # ─── Provenance tagging ─────────────────────────────────────────────────
 
     def _tag_provenance(self, lp, s: PoolSnapshot):
@@ -164,11 +210,53 @@ class StateTwinBuilder:
             fee = s.fee,
         )
         lp = factory.deploy(exch_data)
-        UniJoin().apply(
-            lp, _TWIN_USER, s.reserve0, s.reserve1, s.lwr_tick, s.upr_tick,
-        )
+        if s.tick_indices is not None:
+            self._mint_tick_table(lp, s)
+        else:
+            UniJoin().apply(
+                lp, _TWIN_USER, s.reserve0, s.reserve1, s.lwr_tick, s.upr_tick,
+            )
         return self._tag_provenance(lp, s)
 
+    def _mint_tick_table(self, lp, s: V3PoolSnapshot):
+        """Populate a V3 twin's tick table from a snapshot's walked
+        ticks: initialize at the snapshot's price, then mint one
+        `_TWIN_USER` position per interval between consecutive ticks
+        carrying that interval's liquidity. lwr_tick / upr_tick are not
+        used, and the twin's reserves become what the walked window
+        holds rather than s.reserve0 / s.reserve1.
+
+        uniswappy keeps the pool's active liquidity (Uniswap's
+        liquidity()) in total_supply — swaps start from it — but mint()
+        adds every position to it, in range or not. It is set last to
+        the sum of liquidityNet at or below the current tick, as the
+        pool itself would hold it."""
+        from uniswappy.utils.tools.v3 import UniV3Utils
+        if s.sqrt_price is not None:
+            lp.initialize(int(s.sqrt_price * 2 ** 96))
+        elif s.reserve0 > 0 and s.reserve1 > 0:
+            lp.initialize(UniV3Utils.encodePriceSqrt(s.reserve1, s.reserve0))
+        else:
+            raise ValueError(
+                "StateTwinBuilder: V3 tick-table snapshot {!r} needs "
+                "sqrt_price when a reserve is zero".format(s.pool_id)
+            )
+        levels = []
+        level = 0.0
+        for net in s.tick_liquidity_net:
+            level += net
+            levels.append(level)
+        # Float residue from summing nets is not liquidity.
+        floor = 1e-12 * max([abs(x) for x in levels] + [0.0])
+        for lwr, upr, liquidity in zip(s.tick_indices, s.tick_indices[1:], levels):
+            if liquidity <= floor:
+                continue
+            lp.mint(_TWIN_USER, lwr, upr, liquidity)
+        lp.total_supply = sum(
+            info.liquidityNet for tick, info in lp.ticks.items()
+            if tick <= lp.slot0.tick
+        )
+
     # ─── Balancer 2-asset ───────────────────────────────────────────────────
 
     def _build_balancer(self, s: BalancerPoolSnapshot):
@@ -0,0 +1,507 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Event-driven incremental updates for built Uniswap twins.
+
+Following a pool block by block with `StateTwinBuilder.build` means a
+full snapshot plus a rebuild per block. TwinEventUpdater instead
+applies the pool's own decoded event logs to an existing twin, in
+place — a live-following twin then costs one eth_getLogs per advance
+(per bounded block range, for a follower catching up on a backlog).
+
+Uniswap V2 — the pair emits Sync(reserve0, reserve1) on every reserve
+change, so Sync is authoritative: reserves (and the pool token
+balances uniswappy keeps in step with them) are set, not accumulated.
+Swap / Mint / Burn are paired with the Sync their transaction emitted
+just before them. A paired Swap changes nothing further. A paired
+Mint or Burn moves the LP totalSupply by the liquidity the amounts
+imply at the pre-event reserves, keeping the twin's single synthetic
+provider in lockstep (as StateTwinBuilder does for the real supply).
+An unpaired Swap / Mint / Burn (a log stream filtered without Sync)
+applies its reserve deltas directly.
+
+Uniswap V3 — a twin is the builder's single full-position Join of the
+reserves that active liquidity L holds over the snapshot's tick range.
+Swap carries the pool's new sqrtPriceX96, tick and L outright; Mint /
+Burn move L when their range covers the current tick. Each change
+re-derives the reserves exactly as LiveProvider does and re-joins them
+in place: slot0, the position, its two ticks, the LP ledger, reserves
+and token balances. Mint / Burn need the pool's raw (sqrtPriceX96, L)
+to start from — pass `sqrt_price_x96` / `liquidity` (LiveProvider's
+`follow` does), or the first Swap supplies them; until then they
+leave the updater `stale`.
+
+Drift (fee-on-mint, missed logs, reorgs) is caught by `verify()`
+against a fresh snapshot at the updater's block, which resyncs the
+twin when the reserves disagree. LiveTwinFollower drives the whole
+loop from a LiveProvider: `LiveProvider.follow(pool_id, ...)`.
+"""
+
+import copy
+from typing import Optional
+
+from uniswappy.cpt.exchg import UniswapExchange, UniswapV3Exchange
+
+from defipy.twin.builder import _TWIN_USER
+from defipy.twin.snapshot import PoolSnapshot
+
+
+class TwinEventUpdater:
+    """Apply decoded pool events to a built Uniswap V2 / V3 twin.
+
+    Parameters
+    ----------
+    lp : UniswapExchange | UniswapV3Exchange
+        A twin built by StateTwinBuilder. Updated in place.
+    token0_decimals, token1_decimals : int
+        On-chain decimals of the pool's tokens — event amounts are raw
+        uints; the twin holds decimal-adjusted amounts.
+    sqrt_price_x96, liquidity : int | None
+        V3 only: the pool's raw slot0 sqrtPriceX96 and active liquidity
+        at the twin's block, so Mint / Burn can apply before the first
+        Swap. Ignored for V2.
+
+    Events are dicts shaped like web3's decoded logs — {"event",
+    "args", "blockNumber", "logIndex", "transactionHash"} — as returned
+    by `LiveProvider.pool_events` (or `contract.events.X().process_log`).
+    Events at or before the twin's block, or at or before the last
+    applied (blockNumber, logIndex), are skipped, so overlapping log
+    ranges are safe. Unrecognized event names are ignored.
+
+    Examples
+    --------
+        lp = StateTwinBuilder().build(snap)
+        updater = TwinEventUpdater(lp, 6, 18)
+        updater.apply(provider.pool_events(pool_id, N + 1, M),
+                      through_block = M)
+        updater.verify(provider.snapshot(pool_id, block_number = M))
+    """
+
+    def __init__(
+        self,
+        lp,
+        token0_decimals: int = 18,
+        token1_decimals: int = 18,
+        sqrt_price_x96: Optional[int] = None,
+        liquidity: Optional[int] = None,
+    ):
+        if isinstance(lp, UniswapV3Exchange):
+            self.protocol = "uniswap_v3"
+            self._range = self._v3_range(lp)
+        elif isinstance(lp, UniswapExchange):
+            self.protocol = "uniswap_v2"
+        else:
+            raise TypeError(
+                "TwinEventUpdater: unsupported exchange type {}"
+                .format(type(lp).__name__)
+            )
+        self.lp = lp
+        self.decimals = (token0_decimals, token1_decimals)
+        self.block_number = getattr(lp, "snapshot_block_number", None)
+        # Last block the twin fully reflects (its snapshot block, or an
+        # apply() `through_block`); events at or before it are skipped.
+        self._complete_block = self.block_number
+        self.events_applied = 0
+        self.stale = False
+        self.last_drift = None
+        self._last_position = None
+        self._sync_tx = None
+        self._v3_raw = None
+        if self.protocol == "uniswap_v3" and sqrt_price_x96 is not None:
+            self._seed_v3(sqrt_price_x96, liquidity)
+
+    # ─── Applying events ───────────────────────────────────────────────────
+
+    def apply(self, events, through_block: Optional[int] = None) -> int:
+        """Apply `events` in order; return how many changed the twin.
+
+        `through_block`, if given, records that the twin now reflects
+        every event up to and including that block (the upper bound
+        of the log range), even if the range held no events.
+        """
+        handlers = (self._V2_HANDLERS if self.protocol == "uniswap_v2"
+                    else self._V3_HANDLERS)
+        applied = 0
+        for event in events:
+            handler = handlers.get(event.get("event"))
+            if handler is None or self._already_applied(event):
+                continue
+            handler(self, event["args"], event.get("transactionHash") or _NO_TX)
+            self._advance_to(event)
+            applied += 1
+        if through_block is not None:
+            self._set_block(through_block)
+            if self._complete_block is None or through_block > self._complete_block:
+                self._complete_block = through_block
+        self.events_applied += applied
+        return applied
+
+    def _already_applied(self, event) -> bool:
+        block = event.get("blockNumber")
+        if block is None:
+            return False
+        if self._complete_block is not None and block <= self._complete_block:
+            return True
+        position = (block, event.get("logIndex", 0))
+        return self._last_position is not None and position <= self._last_position
+
+    def _advance_to(self, event):
+        block = event.get("blockNumber")
+        if block is None:
+            return
+        self._last_position = (block, event.get("logIndex", 0))
+        self._set_block(block)
+
+    def _set_block(self, block: int):
+        if self.block_number is None or block > self.block_number:
+            self.block_number = block
+            self.lp.snapshot_block_number = block
+
+    # ─── Uniswap V2 ────────────────────────────────────────────────────────
+
+    def _v2_sync(self, args, tx):
+        self._set_v2_reserves(self._machine(args["reserve0"], 0),
+                              self._machine(args["reserve1"], 1))
+        self._sync_tx = tx
+
+    def _v2_swap(self, args, tx):
+        if self._paired(tx):
+            return
+        self._set_v2_reserves(
+            self.lp.reserve0 + self._machine(args["amount0In"], 0)
+                - self._machine(args["amount0Out"], 0),
+            self.lp.reserve1 + self._machine(args["amount1In"], 1)
+                - self._machine(args["amount1Out"], 1),
+        )
+
+    def _v2_mint(self, args, tx):
+        self._v2_liquidity(args, tx, +1)
+
+    def _v2_burn(self, args, tx):
+        self._v2_liquidity(args, tx, -1)
+
+    def _v2_liquidity(self, args, tx, sign):
+        lp = self.lp
+        amount0 = self._machine(args["amount0"], 0)
+        amount1 = self._machine(args["amount1"], 1)
+        if self._paired(tx):
+            # Sync already moved the reserves; recover the pre-event ones.
+            pre0 = lp.reserve0 - sign * amount0
+            pre1 = lp.reserve1 - sign * amount1
+        else:
+            pre0, pre1 = lp.reserve0, lp.reserve1
+            self._set_v2_reserves(pre0 + sign * amount0, pre1 + sign * amount1)
+        if pre0 <= 0 or pre1 <= 0:
+            return
+        # UniswapV2Pair.mint: min(a0·ts/r0, a1·ts/r1); burn returns
+        # amounts pro rata, so the same ratio recovers the burned supply.
+        supply = lp.total_supply
+        delta = int(min(amount0 * supply / pre0, amount1 * supply / pre1))
+        lp.total_supply = max(supply + sign * delta, 0)
+        lp.liquidity_providers[_TWIN_USER] = lp.total_supply
+
+    def _paired(self, tx) -> bool:
+        paired = self._sync_tx is not None and self._sync_tx == tx
+        self._sync_tx = None
+        return paired
+
+    def _set_v2_reserves(self, reserve0, reserve1):
+        lp = self.lp
+        lp.reserve0 = int(reserve0)
+        lp.reserve1 = int(reserve1)
+        tokens = lp.factory.token_from_exchange[lp.name]
+        tokens[lp.token0].token_total = lp.reserve0
+        tokens[lp.token1].token_total = lp.reserve1
+
+    def _machine(self, raw, i):
+        return self.lp.convert_to_machine(raw / 10 ** self.decimals[i])
+
+    # ─── Uniswap V3 ────────────────────────────────────────────────────────
+
+    def _v3_swap(self, args, tx):
+        self._v3_raw = [int(args["sqrtPriceX96"]), int(args["liquidity"]),
+                        int(args["tick"])]
+        self.stale = False
+        self._rejoin_v3()
+
+    def _v3_mint(self, args, tx):
+        self._v3_liquidity(args, +1)
+
+    def _v3_burn(self, args, tx):
+        self._v3_liquidity(args, -1)
+
+    def _v3_liquidity(self, args, sign):
+        if self._v3_raw is None:
+            # No raw pool state to add the liquidity to: only a Swap,
+            # a seed, or resync() can bring the twin back.
+            self.stale = True
+            return
+        _, _, tick = self._v3_raw
+        if int(args["tickLower"]) <= tick < int(args["tickUpper"]):
+            self._v3_raw[1] = max(self._v3_raw[1] + sign * int(args["amount"]), 0)
+            self._rejoin_v3()
+
+    def _seed_v3(self, sqrt_price_x96, liquidity):
+        from uniswappy.utils.tools.v3 import TickMath
+        self._v3_raw = [int(sqrt_price_x96), int(liquidity),
+                        TickMath.getTickAtSqrtRatio(int(sqrt_price_x96))]
+        self.stale = False
+
+    def _rejoin_v3(self):
+        from defipy.twin.live_provider import LiveProvider
+        sqrt_price_x96, liquidity, _ = self._v3_raw
+        lwr_tick, upr_tick = self._range
+        _, _, amount0_raw, amount1_raw = LiveProvider._v3_position_amounts(
+            sqrt_price_x96, liquidity, self.lp.tickSpacing, lwr_tick, upr_tick,
+        )
+        self._set_v3_reserves(amount0_raw / 10 ** self.decimals[0],
+                              amount1_raw / 10 ** self.decimals[1])
+
+    def _set_v3_reserves(self, amount0, amount1):
+        """Re-join human reserves (amount0, amount1) into the twin's
+        single position — the state UniJoin().apply would leave on a
+        fresh exchange, written over the existing one."""
+        from uniswappy.utils.tools.v3 import (
+            UniV3Utils, UniV3Helper, TickMath, SqrtPriceMath, Position,
+        )
+        lp = self.lp
+        lwr_tick, upr_tick = self._range
+        if amount0 <= 0 or amount1 <= 0:
+            self.stale = True
+            return
+
+        sqrt_price = UniV3Utils.encodePriceSqrt(amount1, amount0)
+        sqrtP = sqrt_price / 2**96
+        helper = UniV3Helper()
+        liquidity = lp.convert_to_machine(min(
+            helper.calc_Ly(sqrtP, amount1, lwr_tick, upr_tick),
+            helper.calc_Lx(sqrtP, amount0, lwr_tick, upr_tick),
+        ))
+        tick = TickMath.getTickAtSqrtRatio(sqrt_price)
+        slot0 = copy.copy(lp.slot0)
+        slot0.sqrtPriceX96 = sqrt_price
+        slot0.tick = tick
+        lp.slot0 = slot0
+
+        lower, upper = lp.ticks[lwr_tick], lp.ticks[upr_tick]
+        lower.liquidityGross = upper.liquidityGross = liquidity
+        lower.liquidityNet, upper.liquidityNet = liquidity, -liquidity
+        Position.get(lp.positions, _TWIN_USER, lwr_tick, upr_tick).liquidity = liquidity
+        lp.total_supply = liquidity
+        lp.liquidity_providers[_TWIN_USER] = liquidity
+
+        # Token amounts a mint of `liquidity` at the new price pays in —
+        # UniswapV3Exchange._modifyPosition's three cases.
+        sqrt_lwr = TickMath.getSqrtRatioAtTick(lwr_tick)
+        sqrt_upr = TickMath.getSqrtRatioAtTick(upr_tick)
+        reserve0 = reserve1 = 0
+        if tick < lwr_tick:
+            reserve0 = SqrtPriceMath.getAmount0DeltaHelper(sqrt_lwr, sqrt_upr, liquidity)
+        elif tick < upr_tick:
+            reserve0 = SqrtPriceMath.getAmount0DeltaHelper(sqrt_price, sqrt_upr, liquidity)
+            reserve1 = SqrtPriceMath.getAmount1DeltaHelper(sqrt_lwr, sqrt_price, liquidity)
+        else:
+            reserve1 = SqrtPriceMath.getAmount1DeltaHelper(sqrt_lwr, sqrt_upr, liquidity)
+        tokens = lp.factory.token_from_exchange[lp.name]
+        tokens[lp.token0].token_total = reserve0
+        tokens[lp.token1].token_total = reserve1
+        lp.reserve0, lp.reserve1 = reserve0, reserve1
+
+    @staticmethod
+    def _v3_range(lp) -> tuple:
+        ranges = lp.positions_for_owner.get(_TWIN_USER, ())
+        if len(ranges) != 1:
+            raise ValueError(
+                "TwinEventUpdater: expected the builder's single V3 twin "
+                "position; found {} ranges (tick-table twins are not "
+                "supported)".format(len(ranges))
+            )
+        return next(iter(ranges))
+
+    _V2_HANDLERS = {
+        "Sync": _v2_sync, "Swap": _v2_swap, "Mint": _v2_mint, "Burn": _v2_burn,
+    }
+    _V3_HANDLERS = {
+        "Swap": _v3_swap, "Mint": _v3_mint, "Burn": _v3_burn,
+    }
+
+    # ─── Verification ──────────────────────────────────────────────────────
+
+    def drift(self, snapshot: PoolSnapshot) -> float:
+        """Largest relative difference between the twin's reserves (and,
+        for V2 with a real supply, its LP supply) and `snapshot`'s."""
+        self._check_snapshot(snapshot)
+        lp = self.lp
+        pairs = [
+            (lp.convert_to_human(lp.reserve0), snapshot.reserve0),
+            (lp.convert_to_human(lp.reserve1), snapshot.reserve1),
+        ]
+        if self.protocol == "uniswap_v2" and snapshot.total_supply is not None:
+            pairs.append((lp.convert_to_human(lp.total_supply),
+                          snapshot.total_supply))
+        return max(
+            abs(twin - chain) / max(abs(chain), 1e-18) for twin, chain in pairs
+        )
+
+    def verify(
+        self,
+        snapshot: PoolSnapshot,
+        rel_tol: float = 1e-6,
+        resync: bool = True,
+        sqrt_price_x96: Optional[int] = None,
+        liquidity: Optional[int] = None,
+    ) -> bool:
+        """Check the twin against a fresh snapshot at the same block.
+
+        Returns True if every reserve is within `rel_tol` (and the
+        updater isn't stale). Otherwise, with `resync`, resets the twin
+        to the snapshot (see `resync`) before returning False. The
+        measured drift is kept on `last_drift`.
+
+        Raises
+        ------
+        ValueError
+            If the snapshot is for another protocol or another block.
+        """
+        self.last_drift = self.drift(snapshot)
+        ok = self.last_drift <= rel_tol and not self.stale
+        if not ok and resync:
+            self.resync(snapshot, sqrt_price_x96, liquidity)
+        return ok
+
+    def resync(
+        self,
+        snapshot: PoolSnapshot,
+        sqrt_price_x96: Optional[int] = None,
+        liquidity: Optional[int] = None,
+    ) -> None:
+        """Reset the twin's state to `snapshot`, in place. For V3, pass
+        the pool's raw sqrtPriceX96 / liquidity to re-seed Mint / Burn
+        handling; without them the updater waits for the next Swap."""
+        self._check_snapshot(snapshot)
+        lp = self.lp
+        if self.protocol == "uniswap_v2":
+            self._set_v2_reserves(lp.convert_to_machine(snapshot.reserve0),
+                                  lp.convert_to_machine(snapshot.reserve1))
+            if snapshot.total_supply is not None:
+                from defipy.twin.builder import StateTwinBuilder
+                StateTwinBuilder._set_v2_total_supply(lp, snapshot.total_supply)
+            self.stale = False
+        else:
+            self._v3_raw = None
+            self.stale = True
+            if sqrt_price_x96 is not None:
+                self._seed_v3(sqrt_price_x96, liquidity)
+            self._set_v3_reserves(snapshot.reserve0, snapshot.reserve1)
+        self._sync_tx = None
+        if snapshot.block_number is not None:
+            self.block_number = self._complete_block = snapshot.block_number
+            self._last_position = None
+            lp.snapshot_block_number = snapshot.block_number
+
+    def _check_snapshot(self, snapshot):
+        if snapshot.protocol != self.protocol:
+            raise ValueError(
+                "TwinEventUpdater: {} snapshot for a {} twin"
+                .format(snapshot.protocol, self.protocol)
+            )
+        if (snapshot.block_number is not None and self.block_number is not None
+                and snapshot.block_number != self.block_number):
+            raise ValueError(
+                "TwinEventUpdater: snapshot is at block {}; twin is at {}"
+                .format(snapshot.block_number, self.block_number)
+            )
+
+
+# Stand-in transaction hash for events that carry none: consecutive
+# hash-less Sync / Swap logs are then treated as one transaction's pair.
+_NO_TX = object()
+
+
+class LiveTwinFollower:
+    """A twin kept current from a LiveProvider's event logs.
+
+    Built by `LiveProvider.follow(pool_id, ...)`; not constructed
+    directly. Holds the twin (`lp`) and its TwinEventUpdater.
+
+    `advance(to_block)` costs one eth_getLogs per `log_block_range`
+    blocks (plus an eth_blockNumber when `to_block` is None). Every
+    `verify_every` blocks it also takes a fresh snapshot and verifies —
+    resyncing on drift.
+    """
+
+    def __init__(self, provider, pool_id: str, updater: TwinEventUpdater,
+                 verify_every: Optional[int] = None,
+                 snapshot_kwargs: Optional[dict] = None,
+                 log_block_range: Optional[int] = None):
+        from defipy.twin import _rpc
+        self.provider = provider
+        self.pool_id = pool_id
+        self.updater = updater
+        self.verify_every = verify_every
+        self.log_block_range = (_rpc.LOG_BLOCK_RANGE if log_block_range is None
+                                else log_block_range)
+        self._snapshot_kwargs = dict(snapshot_kwargs or {})
+        self._verified_at = updater.block_number
+
+    @property
+    def lp(self):
+        return self.updater.lp
+
+    @property
+    def block_number(self) -> int:
+        return self.updater.block_number
+
+    def advance(self, to_block: Optional[int] = None) -> int:
+        """Apply the pool's events through `to_block` (default: the
+        chain head). Returns the number of events applied.
+
+        The range is read in chunks of at most `log_block_range` blocks,
+        each applied before the next is fetched — if a chunk's read
+        fails, the twin stays at the last complete chunk and a later
+        advance() resumes from there.
+        """
+        if to_block is None:
+            to_block = self.provider._get_client().block_number()
+        if to_block <= self.block_number:
+            return 0
+        applied = 0
+        while self.block_number < to_block:
+            start = self.block_number + 1
+            end = min(to_block, start + self.log_block_range - 1)
+            events = self.provider.pool_events(self.pool_id, start, end)
+            applied += self.updater.apply(events, through_block = end)
+        if (self.verify_every is not None
+                and to_block - self._verified_at >= self.verify_every):
+            self.verify()
+        return applied
+
+    def verify(self, rel_tol: float = 1e-6) -> bool:
+        """Verify (and, on drift, resync) against a fresh snapshot at
+        the follower's block."""
+        block = self.block_number
+        snap = self.provider.snapshot(
+            self.pool_id, block_number = block, **self._snapshot_kwargs,
+        )
+        raw = self.provider._event_state(self.pool_id, block)
+        self._verified_at = block
+        return self.updater.verify(
+            snap, rel_tol = rel_tol,
+            sqrt_price_x96 = raw.get("sqrt_price_x96"),
+            liquidity = raw.get("liquidity"),
+        )
@@ -38,7 +38,10 @@ Per STATE_TWIN_PHASE_1_EXPANDED.md:
   - D1: web3scout's ConnectW3 + ABILoad + FetchToken under the hood,
     via the `_rpc` module.
   - D5: Token decimals + symbols read via FetchToken (which doesn't
-    block-pin metadata reads — see _rpc.fetch_token docstring).
+    block-pin metadata reads — see _rpc.fetch_token docstring). Every
+    snapshot path batches them through _rpc.fetch_tokens instead and
+    reads through the process-wide TokenMetadataCache, so a warm V2 or
+    V3 snapshot is one round trip.
   - C3: `_with_client(client)` test-only classmethod for injection.
   - R1: "latest" resolved to a concrete block once at the top of
     `.snapshot()`, then all subsequent reads pin to that block.
@@ -52,6 +55,7 @@ from defipy.twin.snapshot import (
     V2PoolSnapshot,
     V3PoolSnapshot,
 )
+from defipy.twin.snapshot_cache import SnapshotCache
 
 
 # Supported protocol identifiers for the pool_id string format.
@@ -62,6 +66,147 @@ _PROTO_STABLESWAP = "stableswap"
 
 _KNOWN_PROTOCOLS = (_PROTO_V2, _PROTO_V3, _PROTO_BALANCER, _PROTO_STABLESWAP)
 
+# Without an n_coins hint, the stableswap read plan probes this many
+# coins(i)/balances(i) per Curve pool.
+_MAX_CURVE_COINS = 8
+
+# UniswapV3Pool.ticks(int24) return layout; liquidityNet is index 1.
+_TICK_INFO_TYPES = [
+    "uint128", "int128", "uint256", "uint256",
+    "int56", "uint160", "uint32", "bool",
+]
+
+
+class _CallRequest:
+    """A batch read plan's request for one multicall phase."""
+    __slots__ = ("calls", "allow_failure")
+
+    def __init__(self, calls, allow_failure = False):
+        self.calls = calls
+        self.allow_failure = allow_failure
+
+
+class _TokenRequest:
+    """A batch read plan's request for token metadata."""
+    __slots__ = ("addresses",)
+
+    def __init__(self, addresses):
+        self.addresses = addresses
+
+
+class _PlanRunner:
+    """Drive a set of batch read plans phase by phase, without I/O.
+
+    `next_phase()` returns the phase's work — a flat multicall list or
+    a deduplicated token-address list (never both) — and `resolve()`
+    feeds the raw replies back to each plan. The caller does the I/O
+    in between, so the sync (`LiveProvider`) and async
+    (`AsyncLiveProvider`) drivers share every planning and decode
+    step. The first call phase carries getCurrentBlockTimestamp() for
+    `ctx["timestamp"]`. `ctx["caller"]` names the public method being
+    served ("LiveProvider.snapshot", ...) in revert errors.
+    """
+
+    def __init__(self, plans, pool_ids, results, ctx):
+        self.pool_ids = pool_ids
+        self.results = results
+        self.ctx = ctx
+        self.pending = {}
+        self._plans = plans
+        self._first_phase = True
+        self._call_reqs = {}
+        self._token_reqs = {}
+        self._spans = {}
+        self._addresses = []
+        self._has_timestamp = False
+        for i, gen in plans.items():
+            self._advance(gen, None, i)
+
+    def next_phase(self) -> tuple:
+        """Return (calls, token_addresses) for the next phase."""
+        from defipy.twin import _rpc
+        self._call_reqs = {i: r for i, r in self.pending.items()
+                           if isinstance(r, _CallRequest)}
+        # Token requests wait until no pool has calls left, so every
+        # pool's metadata goes out in one deduplicated batch.
+        self._token_reqs = {} if self._call_reqs else dict(self.pending)
+
+        calls = []
+        self._has_timestamp = bool(self._call_reqs) and self._first_phase
+        if self._has_timestamp:
+            calls.append((_rpc.MULTICALL3_ADDRESS,
+                          "getCurrentBlockTimestamp()", [], [], ["uint256"]))
+        self._spans = {}
+        for i, req in self._call_reqs.items():
+            self._spans[i] = (len(calls), len(calls) + len(req.calls))
+            calls.extend(req.calls)
+        if self._call_reqs:
+            self._first_phase = False
+
+        self._addresses = list(dict.fromkeys(
+            a for req in self._token_reqs.values() for a in req.addresses
+        ))
+        return calls, self._addresses
+
+    def resolve(self, call_out, tokens) -> None:
+        """Feed one phase's replies back: `call_out` is the chunked
+        multicall slot list for the phase's calls, `tokens` the ERC20s
+        for its addresses (or the exception fetching them raised)."""
+        replies = {}
+        if self._has_timestamp and isinstance(call_out[0], int):
+            self.ctx["timestamp"] = int(call_out[0])
+        for i, (lo, hi) in self._spans.items():
+            replies[i] = self._check_call_reply(
+                self._call_reqs[i], call_out[lo:hi], self.pool_ids[i],
+                self.ctx["caller"],
+            )
+        if self._token_reqs:
+            if isinstance(tokens, Exception):
+                for i in self._token_reqs:
+                    replies[i] = tokens
+            else:
+                by_addr = dict(zip(self._addresses, tokens))
+                for i, req in self._token_reqs.items():
+                    replies[i] = [by_addr[a] for a in req.addresses]
+
+        self.pending = {i: r for i, r in self.pending.items()
+                        if i not in replies}
+        for i, reply in replies.items():
+            self._advance(self._plans[i], reply, i)
+
+    def _advance(self, gen, reply, i) -> None:
+        """Step one read plan: feed it `reply` (an exception is thrown
+        in), then either record its next request in `pending` or its
+        finished snapshot / raised error in `results`."""
+        try:
+            if isinstance(reply, Exception):
+                request = gen.throw(reply)
+            else:
+                request = gen.send(reply)
+        except StopIteration as stop:
+            self.results[i] = stop.value
+        except Exception as e:
+            self.results[i] = e
+        else:
+            self.pending[i] = request
+
+    @staticmethod
+    def _check_call_reply(request, values, pool_id, caller):
+        """Turn a plan's raw chunked-multicall slots into its reply: a
+        failed batch becomes that exception; a reverted sub-call
+        becomes a RuntimeError unless the plan asked for
+        allow_failure (then it stays None)."""
+        for (target, fn_sig, _at, _a, _dt), value in zip(request.calls, values):
+            if isinstance(value, Exception):
+                return value
+            if value is None and not request.allow_failure:
+                return RuntimeError(
+                    "{}: {} reverted on {} for pool_id {!r}".format(
+                        caller, fn_sig, target, pool_id,
+                    )
+                )
+        return list(values)
+
 
 class LiveProvider(StateTwinProvider):
     """Chain-reading State Twin provider.
@@ -100,15 +245,51 @@ class LiveProvider(StateTwinProvider):
 
     Stateless snapshots, reused connection
     --------------------------------------
-    Each `.snapshot()` produces a fresh PoolSnapshot from a fresh chain
-    read — no caching of pool state, block data, or snapshot results.
-    The underlying web3 connection IS reused: the first `.snapshot()`
-    or `.get_w3()` call constructs an RpcClient via `make_client()`
-    and caches it on the instance for the rest of its lifetime. For
-    long-running processes that may see the connection go stale,
-    construct a fresh LiveProvider periodically. Snapshot caching,
-    connection pooling, and reorg-detection are consumer concerns
-    (see DeFiMind for an opinionated take).
+    By default each `.snapshot()` produces a fresh PoolSnapshot from a
+    fresh chain read — no caching of pool state, block data, or
+    snapshot results. The underlying web3 connection IS reused: the
+    first `.snapshot()` or `.get_w3()` call constructs an RpcClient via
+    `make_client()` and caches it on the instance for the rest of its
+    lifetime. For long-running processes, pass several endpoints —
+    `LiveProvider([url_a, url_b])` or `LiveProvider(RpcEndpointPool(...))`
+    — and the client pools sessions, routes by latency, retries
+    transient errors and fails over between them (see rpc_pool.py).
+    Reorg-detection is a consumer concern (see DeFiMind for an
+    opinionated take).
+
+    Batch reads
+    -----------
+    `snapshot_many(pool_ids, block_number=...)` reads many pools of
+    any mix of protocols at one block in a few chunked Multicall3
+    round trips, returning snapshots (or per-pool exceptions) in input
+    order. AsyncLiveProvider (async_live_provider.py) runs the same
+    read plans over an asyncio transport. `snapshot_range(pool_id,
+    start, end, step)` streams one pool across a block range;
+    `follow(pool_id)` keeps a built V2 / V3 twin current from the
+    pool's event logs (see event_updater.py).
+
+    V3 tick tables (opt-in)
+    -----------------------
+    A uniswap_v3 snapshot carries only the active liquidity by default,
+    so its twin prices every trade as if that liquidity spanned the
+    full range. Pass `tick_words=N` to also walk the pool's tick
+    bitmap N words (256 tick spacings each) either side of the current
+    price: one multicall for the bitmap words, one for the initialized
+    ticks' liquidityNet. The snapshot then carries `tick_indices` /
+    `tick_liquidity_net` and StateTwinBuilder populates the twin's
+    tick table from them, so large trades cross ticks the way they do
+    on chain — up to the edge of the walked window.
+
+    Snapshot cache (opt-in)
+    -----------------------
+    Pass `cache=SnapshotCache(...)` to memoize snapshots keyed by
+    `(chain_id, protocol, address, block_number)` (plus the tick
+    options for uniswap_v3). "latest" is resolved to a concrete
+    block before the lookup, so a cached read is always the state at
+    the block it reports. A hit costs no contract calls — only the
+    `eth_blockNumber` read when no block_number was passed. See
+    SnapshotCache for LRU / TTL / on-disk options and hit/miss
+    counters; one cache can be shared across providers.
 
     Examples
     --------
@@ -122,15 +303,19 @@ class LiveProvider(StateTwinProvider):
             "uniswap_v2:0xB4e16d0168e52d35CaCD2c6185b44281Ec28C9Dc",
             block_number=19_500_000,
         )
+
+        # Memoized historical reads
+        provider = LiveProvider(rpc_url, cache=SnapshotCache(max_size=4096))
     """
 
-    def __init__(self, rpc_url: str):
+    def __init__(self, rpc_url: str, cache: Optional[SnapshotCache] = None):
         self.rpc_url = rpc_url
+        self.cache = cache
         # Client is constructed lazily on the first .snapshot() or
         # .get_w3() call so the constructor works without web3 installed.
         # Cached for the life of the LiveProvider instance per D20 —
-        # snapshots are stateless (no caching of pool state, block data,
-        # or snapshot results) but the connection is reused across calls.
+        # snapshots are stateless unless a SnapshotCache is passed
+        # (see `cache`) but the connection is reused across calls.
         # Tests inject a client via _with_client(), which sets this
         # attribute directly to bypass the production make_client() path.
         self._cached_client = None
@@ -138,7 +323,9 @@ class LiveProvider(StateTwinProvider):
     # ─── Test-only constructor ─────────────────────────────────────────────
 
     @classmethod
-    def _with_client(cls, client) -> "LiveProvider":
+    def _with_client(
+        cls, client, cache: Optional[SnapshotCache] = None,
+    ) -> "LiveProvider":
         """Inject a duck-typed RpcClient. Test-only.
 
         The argument must duck-type defipy.twin._rpc.RpcClient:
@@ -151,6 +338,7 @@ class LiveProvider(StateTwinProvider):
         """
         provider = cls.__new__(cls)
         provider.rpc_url = "<injected>"
+        provider.cache = cache
         provider._cached_client = client
         return provider
 
@@ -168,10 +356,10 @@ class LiveProvider(StateTwinProvider):
         Lazy construction. The underlying RpcClient is constructed on
         first call to get_w3() or .snapshot() (whichever comes first)
         and cached for the life of the LiveProvider instance. Both
-        methods share one connection. For long-running processes that
-        may see the connection go stale, construct a fresh
-        LiveProvider periodically or build your own
-        connection-management layer around get_w3().
+        methods share one connection. For long-running processes,
+        construct the LiveProvider over several endpoints (a url list
+        or an RpcEndpointPool): the pool retries transient errors and
+        fails over between endpoints underneath this web3 instance.
 
         Returns
         -------
@@ -202,6 +390,11 @@ class LiveProvider(StateTwinProvider):
                 a concrete block once at the start of the snapshot.
             lwr_tick / upr_tick : int | None
                 uniswap_v3 only — override the full-range tick default.
+            tick_words : int | None
+                uniswap_v3 only — walk the tick bitmap this many words
+                either side of the current price and attach the
+                initialized ticks (`tick_indices` /
+                `tick_liquidity_net`). Default None: no walk.
             n_coins : int | None
                 stableswap only — coin count hint; skips the
                 coins(0..K) probe when supplied.
@@ -218,34 +411,456 @@ class LiveProvider(StateTwinProvider):
         Raises
         ------
         ValueError
-            If pool_id is malformed or names an unknown protocol.
+            If pool_id is malformed or names an unknown protocol, or
+            tick_words is negative.
         NotImplementedError
             If pool_id names a supported protocol but an unsupported
             pool shape (e.g. a 3-asset Balancer weighted pool).
         """
-        protocol, address = self._parse_pool_id(pool_id)
-        block_number = kwargs.get("block_number", None)
+        self._parse_pool_id(pool_id)
+        self._check_tick_words(kwargs.get("tick_words", None))
+        snap, = self._read(
+            [pool_id], [kwargs], kwargs.get("block_number", None), None,
+            "LiveProvider.snapshot",
+        )
+        if isinstance(snap, Exception):
+            raise snap
+        return snap
 
-        if protocol == _PROTO_V2:
-            return self._snapshot_v2(address, block_number)
-        if protocol == _PROTO_V3:
-            return self._snapshot_v3(
-                address,
-                block_number,
-                kwargs.get("lwr_tick", None),
-                kwargs.get("upr_tick", None),
+    # ─── Public API: batch snapshots ───────────────────────────────────────
+
+    def snapshot_many(
+        self,
+        pool_ids: list,
+        block_number: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> list:
+        """Snapshot many pools at one block in a handful of round trips.
+
+        Resolves the block once, then drives every pool's reads in
+        lock-step phases. Each phase packs all pools' calls into chunked
+        Multicall3 batches (`_rpc.multicall_aggregate3_chunked`); token
+        metadata for every pool is resolved together at the end
+        (`_rpc.fetch_tokens`, cache first). Phases per protocol:
+
+          - uniswap_v2 / uniswap_v3 — pool reads, then tokens.
+          - balancer — pool reads, vault getPoolTokens, then tokens.
+          - stableswap — A() + a coins(i)/balances(i) probe over up to
+            8 coins in one phase, then tokens.
+
+        So a sweep over hundreds of mixed pools costs roughly
+        (phases × ceil(calls / batch_size)) eth_calls rather than one
+        multicall (or more) per pool. Snapshots match `.snapshot()`'s
+        for the same pool and block; uniswap_v3 uses the full-range
+        tick default. An attached SnapshotCache is consulted and filled
+        per pool.
+
+        Parameters
+        ----------
+        pool_ids : list[str]
+            "<protocol>:<address>" strings, as for `.snapshot()`.
+        block_number : int | None
+            Block to read. Default: "latest", resolved once.
+        batch_size : int | None
+            Max sub-calls per aggregate3. Default
+            `_rpc.MULTICALL_BATCH_SIZE` (300) — sized to stay under
+            common eth_call gas caps and request-body limits.
+
+        Returns
+        -------
+        list
+            One entry per pool_id, in input order: the PoolSnapshot, or
+            the exception that pool's read raised (malformed pool_id,
+            reverted call, unsupported pool shape, failed batch).
+            Errors are isolated — one bad pool never fails the sweep.
+            Check with `isinstance(entry, Exception)`.
+        """
+        from defipy.twin import _rpc
+
+        if batch_size is None:
+            batch_size = _rpc.MULTICALL_BATCH_SIZE
+        if batch_size < 1:
+            raise ValueError(
+                "LiveProvider.snapshot_many: batch_size must be >= 1; "
+                "got {}".format(batch_size)
             )
-        if protocol == _PROTO_BALANCER:
-            return self._snapshot_balancer(address, block_number)
-        if protocol == _PROTO_STABLESWAP:
-            return self._snapshot_stableswap(
-                address, block_number, kwargs.get("n_coins", None),
+
+        pool_ids = list(pool_ids)
+        return self._read(
+            pool_ids, [{}] * len(pool_ids), block_number, batch_size,
+            "LiveProvider.snapshot_many",
+        )
+
+    def _read(self, pool_ids, kwargs_list, block_number, batch_size, caller):
+        """Run one read plan per pool through _PlanRunner; return the
+        snapshots (or per-pool exceptions) in input order. The driver
+        behind both snapshot() and snapshot_many()."""
+        from defipy.twin import _rpc
+
+        client = self._get_client()
+        w3 = client.get_w3()
+        # R1 — resolve "latest" once; every read below pins to it.
+        if block_number is None:
+            block_number = client.block_number()
+        chain_id = client.chain_id()
+        ctx = {"w3": w3, "block_number": block_number,
+               "chain_id": chain_id, "timestamp": None, "caller": caller}
+
+        results, plans, keys = self._start_plans(
+            pool_ids, kwargs_list, ctx, self.cache,
+        )
+        runner = _PlanRunner(plans, pool_ids, results, ctx)
+        while runner.pending:
+            calls, addresses = runner.next_phase()
+            call_out = tokens = None
+            if calls:
+                call_out = _rpc.multicall_aggregate3_chunked(
+                    w3, calls, block_number,
+                    _rpc.MULTICALL_BATCH_SIZE if batch_size is None else batch_size,
+                )
+            if addresses:
+                try:
+                    tokens = _rpc.fetch_tokens(
+                        w3, addresses, block_number, chain_id, batch_size,
+                    )
+                except Exception as e:
+                    tokens = e
+            runner.resolve(call_out, tokens)
+
+        self._fill_cache(self.cache, keys, results)
+        return results
+
+    # ─── Public API: block ranges ──────────────────────────────────────────
+
+    def snapshot_range(
+        self,
+        pool_id: str,
+        start: int,
+        end: int,
+        step: int = 1,
+        window: int = 8,
+        skip_unchanged: bool = False,
+        path: Optional[str] = None,
+        **kwargs,
+    ):
+        """Yield one pool's snapshots over a block range, in block order.
+
+        Reads blocks start, start + step, ... up to and including
+        `end`. The first block is read on its own — it warms the token
+        metadata cache and, for stableswap, fixes the coin count (passed
+        on as the n_coins hint) — so every later block is a single
+        aggregate3. Those reads run on a thread pool with at most
+        `window` blocks in flight, handed back in order as they
+        complete. An attached SnapshotCache is used per block.
+
+        Parameters
+        ----------
+        pool_id : str
+            "<protocol>:<address>", as for `.snapshot()`.
+        start, end : int
+            First and last block (inclusive).
+        step : int
+            Block stride. Default 1 (every block).
+        window : int
+            Maximum concurrent block reads. Default 8.
+        skip_unchanged : bool
+            If True, a snapshot whose state (everything but
+            block_number / timestamp) equals the last one yielded is
+            dropped — only blocks where the pool moved come through.
+            This is an output filter only: every block is still read in
+            full. A later block already costs one aggregate3, so a
+            cheaper "did it move?" probe could not save round trips.
+        path : str | None
+            If given, the yielded series is also written there in the
+            columnar format of snapshot_series.py once the range is
+            exhausted (not if the consumer stops early). Replay with
+            `read_snapshot_series(path)`.
+        **kwargs
+            Passed to every `.snapshot()` read (lwr_tick / upr_tick,
+            n_coins). block_number is not allowed here.
+
+        Yields
+        ------
+        PoolSnapshot
+            One per block read (fewer with skip_unchanged). A failed
+            block read raises out of the generator.
+
+        Raises
+        ------
+        ValueError
+            On a malformed pool_id, start < 0, end < start, step < 1,
+            window < 1, or a block_number kwarg.
+        """
+        self._parse_pool_id(pool_id)
+        if "block_number" in kwargs:
+            raise ValueError(
+                "LiveProvider.snapshot_range: pass start / end, not "
+                "block_number"
+            )
+        if start < 0 or end < start:
+            raise ValueError(
+                "LiveProvider.snapshot_range: need 0 <= start <= end; got "
+                "start={}, end={}".format(start, end)
+            )
+        if step < 1 or window < 1:
+            raise ValueError(
+                "LiveProvider.snapshot_range: step and window must be >= 1; "
+                "got step={}, window={}".format(step, window)
+            )
+        return self._snapshot_range(
+            pool_id, range(start, end + 1, step), window, skip_unchanged,
+            path, kwargs,
+        )
+
+    def _snapshot_range(self, pool_id, blocks, window, skip_unchanged, path,
+                        kwargs):
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        first = self.snapshot(pool_id, block_number = blocks[0], **kwargs)
+        if first.protocol == _PROTO_STABLESWAP and "n_coins" not in kwargs:
+            kwargs = dict(kwargs, n_coins = len(first.token_names))
+
+        series = [] if path is not None else None
+        last_state = None
+
+        # Filters output only — the block was already read in full.
+        def emit(snap):
+            nonlocal last_state
+            state = self._state_fields(snap)
+            if skip_unchanged and state == last_state:
+                return False
+            last_state = state
+            if series is not None:
+                series.append(snap)
+            return True
+
+        if emit(first):
+            yield first
+
+        rest = iter(blocks[1:])
+        executor = ThreadPoolExecutor(max_workers = window)
+        try:
+            in_flight = deque()
+            for block in rest:
+                in_flight.append(executor.submit(
+                    self.snapshot, pool_id, block_number = block, **kwargs,
+                ))
+                if len(in_flight) >= window:
+                    break
+            while in_flight:
+                snap = in_flight.popleft().result()
+                block = next(rest, None)
+                if block is not None:
+                    in_flight.append(executor.submit(
+                        self.snapshot, pool_id, block_number = block, **kwargs,
+                    ))
+                if emit(snap):
+                    yield snap
+        finally:
+            executor.shutdown(wait = True, cancel_futures = True)
+
+        if path is not None:
+            from defipy.twin.snapshot_series import write_snapshot_series
+            write_snapshot_series(path, series)
+
+    @staticmethod
+    def _state_fields(snap) -> dict:
+        """A snapshot's fields minus its block position, for change
+        detection."""
+        import dataclasses
+        fields = dataclasses.asdict(snap)
+        fields.pop("block_number", None)
+        fields.pop("timestamp", None)
+        return fields
+
+    # ─── Public API: event logs ────────────────────────────────────────────
+
+    def pool_events(self, pool_id: str, from_block: int, to_block: int) -> list:
+        """Decoded state-changing events of a Uniswap pool, in order.
+
+        One eth_getLogs over [from_block, to_block] (inclusive) for the
+        pool's Sync / Swap / Mint / Burn (V2) or Swap / Mint / Burn
+        (V3) logs, decoded into web3-style event dicts — the input
+        TwinEventUpdater.apply takes.
+
+        Raises
+        ------
+        ValueError
+            On a malformed pool_id, a protocol other than uniswap_v2 /
+            uniswap_v3, or from_block > to_block.
+        """
+        from defipy.twin import _rpc
+        protocol, address = self._event_pool(pool_id)
+        if from_block > to_block:
+            raise ValueError(
+                "LiveProvider.pool_events: from_block ({}) > to_block ({})"
+                .format(from_block, to_block)
             )
-        # _parse_pool_id guards above; unreachable if reached.
-        raise ValueError(
-            "LiveProvider: unhandled protocol {!r}".format(protocol)
+        w3 = self._get_client().get_w3()
+        return _rpc.fetch_pool_logs(
+            w3, protocol, w3.to_checksum_address(address), from_block, to_block,
         )
 
+    def follow(
+        self,
+        pool_id: str,
+        block_number: Optional[int] = None,
+        verify_every: Optional[int] = None,
+        log_block_range: Optional[int] = None,
+        **kwargs,
+    ):
+        """Build a twin and keep it current from the pool's event logs.
+
+        Snapshots the pool at `block_number` (default "latest"), builds
+        the twin, and returns a LiveTwinFollower (event_updater.py)
+        whose `advance(to_block)` applies each new range of logs in
+        place — one eth_getLogs instead of a snapshot and rebuild.
+        With `verify_every`, every that-many blocks a fresh snapshot
+        checks the twin and resyncs it on drift. An advance over more
+        than `log_block_range` blocks (default _rpc.LOG_BLOCK_RANGE,
+        2000) is read as several bounded eth_getLogs. Uniswap V2 / V3
+        only; **kwargs (lwr_tick / upr_tick) go to every snapshot.
+        tick_words is rejected: the event updater tracks the builder's
+        single V3 position, not a tick-table twin.
+
+        Examples
+        --------
+            follower = provider.follow(pool_id, verify_every = 100)
+            follower.advance()            # to the chain head
+            follower.lp                   # the up-to-date twin
+        """
+        from defipy.twin.builder import StateTwinBuilder
+        from defipy.twin.event_updater import TwinEventUpdater, LiveTwinFollower
+        self._event_pool(pool_id)
+        if verify_every is not None and verify_every < 1:
+            raise ValueError(
+                "LiveProvider.follow: verify_every must be >= 1; got {}"
+                .format(verify_every)
+            )
+        if kwargs.get("tick_words", None) is not None:
+            raise ValueError(
+                "LiveProvider.follow: tick_words is not supported; event "
+                "following tracks one position over [lwr_tick, upr_tick]"
+            )
+        if log_block_range is not None and log_block_range < 1:
+            raise ValueError(
+                "LiveProvider.follow: log_block_range must be >= 1; got {}"
+                .format(log_block_range)
+            )
+        snap = self.snapshot(pool_id, block_number = block_number, **kwargs)
+        state = self._event_state(pool_id, snap.block_number)
+        updater = TwinEventUpdater(
+            StateTwinBuilder().build(snap),
+            state["decimals"][0], state["decimals"][1],
+            sqrt_price_x96 = state.get("sqrt_price_x96"),
+            liquidity = state.get("liquidity"),
+        )
+        return LiveTwinFollower(
+            self, pool_id, updater, verify_every, kwargs, log_block_range,
+        )
+
+    def _event_pool(self, pool_id: str) -> tuple:
+        protocol, address = self._parse_pool_id(pool_id)
+        if protocol not in (_PROTO_V2, _PROTO_V3):
+            raise ValueError(
+                "LiveProvider: event following supports uniswap_v2 and "
+                "uniswap_v3 pools; got {!r}".format(protocol)
+            )
+        return protocol, address
+
+    def _event_state(self, pool_id: str, block_number: int) -> dict:
+        """Token decimals (and, for V3, raw sqrtPriceX96 / liquidity) at
+        `block_number` — what TwinEventUpdater needs beyond a snapshot.
+        One aggregate3; token metadata comes from the warm token cache."""
+        from defipy.twin import _rpc
+        protocol, address = self._event_pool(pool_id)
+        client = self._get_client()
+        w3 = client.get_w3()
+        addr = w3.to_checksum_address(address)
+        calls = [
+            (addr, "token0()", ["address"]),
+            (addr, "token1()", ["address"]),
+        ]
+        if protocol == _PROTO_V3:
+            calls += [
+                (addr, "slot0()",
+                    ["uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool"]),
+                (addr, "liquidity()", ["uint128"]),
+            ]
+        results = _rpc.multicall_aggregate3(w3, calls, block_number)
+        tkn0, tkn1 = _rpc.fetch_tokens(
+            w3,
+            [w3.to_checksum_address(results[0]),
+             w3.to_checksum_address(results[1])],
+            block_number, client.chain_id(),
+        )
+        state = {"decimals": (tkn0.token_decimal, tkn1.token_decimal)}
+        if protocol == _PROTO_V3:
+            state["sqrt_price_x96"] = int(results[2][0])
+            state["liquidity"] = int(results[3])
+        return state
+
+    @classmethod
+    def _start_plans(cls, pool_ids, kwargs_list, ctx, cache) -> tuple:
+        """Parse pool_ids, serve SnapshotCache hits, and start a read
+        plan for every remaining pool. Returns (results, plans, keys):
+        `results` pre-filled with hits and parse errors, `plans` and
+        `keys` mapping pool index → generator / cache key."""
+        w3 = ctx["w3"]
+        results = [None] * len(pool_ids)
+        plans = {}
+        keys = {}
+        for i, (pool_id, kwargs) in enumerate(zip(pool_ids, kwargs_list)):
+            try:
+                protocol, address = cls._parse_pool_id(pool_id)
+                addr = w3.to_checksum_address(address)
+            except Exception as e:
+                results[i] = e
+                continue
+            if cache is not None:
+                keys[i] = cls._cache_key(
+                    ctx["chain_id"], protocol, address, ctx["block_number"],
+                    kwargs,
+                )
+                hit = cache.get(keys[i])
+                if hit is not None:
+                    results[i] = hit
+                    del keys[i]
+                    continue
+            plans[i] = cls._batch_plan(protocol, address, addr, ctx, kwargs)
+        return results, plans, keys
+
+    @staticmethod
+    def _fill_cache(cache, keys, results) -> None:
+        """Store every freshly read snapshot under its cache key."""
+        if cache is None:
+            return
+        for i, key in keys.items():
+            if not isinstance(results[i], Exception):
+                cache.put(key, results[i])
+
+    @staticmethod
+    def _cache_key(chain_id, protocol, address, block_number, kwargs) -> tuple:
+        """SnapshotCache key. Addresses are case-normalized so checksum
+        and lowercase pool_ids share an entry. uniswap_v3 tick overrides
+        and tick_words change the snapshot's contents, so they're part
+        of the key; n_coins is only a probe hint and isn't."""
+        key = (chain_id, protocol, address.lower(), block_number)
+        if protocol == _PROTO_V3:
+            key += (kwargs.get("lwr_tick", None), kwargs.get("upr_tick", None))
+            if kwargs.get("tick_words", None) is not None:
+                key += (kwargs["tick_words"],)
+        return key
+
+    @staticmethod
+    def _check_tick_words(tick_words) -> None:
+        if tick_words is not None and tick_words < 0:
+            raise ValueError(
+                "LiveProvider: tick_words must be >= 0; got {}"
+                .format(tick_words)
+            )
+
     # ─── pool_id parsing ───────────────────────────────────────────────────
 
     @staticmethod
@@ -291,9 +906,9 @@ class LiveProvider(StateTwinProvider):
         """Return the cached client (constructing it on first call).
 
         Phase 3a — caching changed from "construct per snapshot" to
-        "construct once, reuse." Snapshots remain stateless (no caching
-        of pool state, block data, or snapshot results); only the
-        connection is reused. Test injection via _with_client() sets
+        "construct once, reuse." Snapshot results are only memoized when
+        an opt-in SnapshotCache is attached; the connection is always
+        reused. Test injection via _with_client() sets
         _cached_client directly so the production make_client() path
         is bypassed."""
         if self._cached_client is not None:
@@ -304,129 +919,102 @@ class LiveProvider(StateTwinProvider):
         self._cached_client = _rpc.make_client(self.rpc_url)
         return self._cached_client
 
-    # ─── V2 snapshot ───────────────────────────────────────────────────────
-
-    def _snapshot_v2(
-        self,
-        pool_address: str,
-        block_number: Optional[int],
-    ) -> V2PoolSnapshot:
-        from defipy.twin import _rpc
-
-        client = self._get_client()
-        w3 = client.get_w3()
-
-        # R1 — block consistency. Resolve "latest" once at the top so
-        # every subsequent eth_call pins to the same concrete block.
-        # If a new block lands mid-snapshot, reserves and total_supply
-        # could otherwise come from different blocks.
-        if block_number is None:
-            block_number = client.block_number()
-
-        # Address normalization: web3 rejects addresses with mixed
-        # casing that don't match EIP-55 checksum. Normalize via the
-        # underlying w3 to accept lowercase / uppercase / checksum
-        # input uniformly.
-        addr = w3.to_checksum_address(pool_address)
-
-        pair = _rpc.load_v2_pair_contract(w3, addr)
-
-        # All three reserve-side reads pin to the same block. Token
-        # address reads also pin (token0/token1 don't change, but
-        # pinning is cheap and keeps the consistency story simple).
-        token0_addr = pair.functions.token0().call(block_identifier=block_number)
-        token1_addr = pair.functions.token1().call(block_identifier=block_number)
-        reserves = pair.functions.getReserves().call(block_identifier=block_number)
-        # Real LP-token totalSupply (v2.2.2). A UniswapV2 LP token is
-        # always 18 decimals, so adjust by 1e18 directly — NOT by a pool
-        # token's decimals (amt_to_decimal would be wrong here, e.g. USDC
-        # is 6). This is the real accumulated mint-minus-burn supply,
-        # which drifts above √(r0·r1) as fees grow reserves without
-        # minting LP. Stored on the snapshot so the builder can stamp the
-        # true supply onto the twin.
-        total_supply_raw = pair.functions.totalSupply().call(
-            block_identifier=block_number)
-        total_supply = int(total_supply_raw) / 1e18
-
-        # FetchToken returns a uniswappy.erc.ERC20 with .token_name
-        # (symbol), .token_addr, .token_decimal. metadata reads happen
-        # at "latest" — see _rpc.fetch_token docstring for why that's
-        # OK in practice.
-        tkn0 = _rpc.fetch_token(w3, token0_addr)
-        tkn1 = _rpc.fetch_token(w3, token1_addr)
-
-        # C2 — decimal adjustment. raw_reserve / 10**decimals produces
-        # a Python float in whole-token units, matching MockProvider's
-        # contract. StateTwinBuilder._build_v2 expects this format and
-        # passes the values directly to lp.add_liquidity().
-        reserve0 = _rpc.amt_to_decimal(tkn0, int(reserves[0]))
-        reserve1 = _rpc.amt_to_decimal(tkn1, int(reserves[1]))
-
-        # Phase 2 C5 enrichment: populate chain context. V2 keeps
-        # sequential reads — one extra eth_getBlockByNumber for
-        # timestamp. Multicall optimization is V3-only.
-        timestamp = client.block_timestamp(block_number)
-        chain_id = client.chain_id()
-
-        return V2PoolSnapshot(
-            pool_id = pool_address,
-            token0_name = tkn0.token_name,
-            token1_name = tkn1.token_name,
-            reserve0 = reserve0,
-            reserve1 = reserve1,
-            total_supply = total_supply,
-            block_number = block_number,
-            timestamp = timestamp,
-            chain_id = chain_id,
-        )
-
-    # ─── V3 snapshot ───────────────────────────────────────────────────────
+    # ─── V3 helpers ────────────────────────────────────────────────────────
 
-    def _snapshot_v3(
-        self,
-        pool_address: str,
-        block_number: Optional[int],
-        lwr_tick: Optional[int],
-        upr_tick: Optional[int],
-    ) -> V3PoolSnapshot:
-        from defipy.twin import _rpc
-
-        client = self._get_client()
-        w3 = client.get_w3()
-
-        # R1 — block consistency. Same discipline as V2.
-        if block_number is None:
-            block_number = client.block_number()
-
-        addr = w3.to_checksum_address(pool_address)
-        chain_id = client.chain_id()
+    @staticmethod
+    def _walk_ticks(addr, current_tick, tick_spacing, tick_words):
+        """Read plan fragment for the V3 tick bitmap walk; drive it with
+        `yield from`. Reads bitmap words `tick_words` either side of the
+        current tick's word in one phase, then liquidityNet for every
+        initialized tick found in a second (skipped when there are
+        none). Returns (ticks, nets, lo, hi): the initialized ticks in
+        ascending order, their raw liquidityNet, and the tick bounds of
+        the walked window."""
+        from uniswappy.utils.tools.v3 import UniV3Utils
+        min_tick = UniV3Utils.getMinTick(tick_spacing)
+        max_tick = UniV3Utils.getMaxTick(tick_spacing)
+        # TickBitmap.position: word = compressed >> 8, where compressed
+        # rounds toward negative infinity — Python's // already does.
+        word = (current_tick // tick_spacing) >> 8
+        first = max(word - tick_words, (min_tick // tick_spacing) >> 8)
+        last = min(word + tick_words, (max_tick // tick_spacing) >> 8)
+        words = list(range(first, last + 1))
+
+        bitmaps = yield _CallRequest([
+            (addr, "tickBitmap(int16)", ["int16"], [w], ["uint256"])
+            for w in words
+        ])
+        ticks = []
+        for w, bitmap in zip(words, bitmaps):
+            bitmap = int(bitmap)
+            while bitmap:
+                low = bitmap & -bitmap
+                ticks.append(((w << 8) + low.bit_length() - 1) * tick_spacing)
+                bitmap ^= low
+
+        nets = []
+        if ticks:
+            infos = yield _CallRequest([
+                (addr, "ticks(int24)", ["int24"], [t], _TICK_INFO_TYPES)
+                for t in ticks
+            ])
+            nets = [int(info[1]) for info in infos]
+        lo = max(first * 256 * tick_spacing, min_tick)
+        hi = min((last * 256 + 255) * tick_spacing, max_tick)
+        return ticks, nets, lo, hi
 
-        # All V3-specific reads + getCurrentBlockTimestamp folded into
-        # one Multicall3.aggregate3 round trip per D6/C8. Token
-        # metadata (symbol/decimals) is read separately via FetchToken
-        # — its API doesn't accept block_identifier or fold cleanly into
-        # the multicall format.
-        calls = [
-            (addr, "token0()", ["address"]),
-            (addr, "token1()", ["address"]),
-            (addr, "slot0()",
-                ["uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool"]),
-            (addr, "liquidity()", ["uint128"]),
-            (addr, "fee()", ["uint24"]),
-            (addr, "tickSpacing()", ["int24"]),
-            (_rpc.MULTICALL3_ADDRESS, "getCurrentBlockTimestamp()", ["uint256"]),
-        ]
-        results = _rpc.multicall_aggregate3(w3, calls, block_number)
-        token0_addr = results[0]
-        token1_addr = results[1]
-        slot0_tuple = results[2]
-        sqrt_price_x96 = int(slot0_tuple[0])
-        current_tick = int(slot0_tuple[1])
-        liquidity = int(results[3])
-        fee = int(results[4])
-        tick_spacing = int(results[5])
-        timestamp = int(results[6])
+    @staticmethod
+    def _v3_tick_table(walk, current_tick, liquidity, tick_spacing,
+                       decimals0, decimals1) -> tuple:
+        """Turn a tick walk into the snapshot's decimal-adjusted tick
+        table. Returns (tick_indices, tick_liquidity_net).
+
+        Liquidity per interval is anchored at the pool's active
+        liquidity, so the table is right even if a net outside the
+        window would have changed the running sum; the table opens at
+        the window's lower bound and closes at its upper one. Ticks
+        move into the decimal-adjusted price space the twin trades in
+        (price scales by 10**(decimals0 - decimals1)) and snap to
+        tick_spacing; liquidity scales by 10**-((decimals0 +
+        decimals1) / 2), the same as sqrt(reserve0 * reserve1).
+        """
+        import math
+        from uniswappy.utils.tools.v3 import UniV3Utils
+        ticks, nets, lo, hi = walk
+
+        # Raw liquidity over [bounds[i], bounds[i + 1]).
+        net_at = dict(zip(ticks, nets))
+        bounds = sorted(set(ticks) | {lo, hi})
+        below = sum(n for t, n in net_at.items() if t <= current_tick)
+        running = 0
+        levels = []
+        for b in bounds[:-1]:
+            running += net_at.get(b, 0)
+            levels.append(max(liquidity + running - below, 0))
+
+        raw_net = {bounds[0]: levels[0]}
+        for b, prev, level in zip(bounds[1:], levels, levels[1:]):
+            raw_net[b] = level - prev
+        raw_net[bounds[-1]] = -levels[-1]
+
+        shift = (decimals0 - decimals1) * math.log(10) / math.log(1.0001)
+        scale = 10 ** (-(decimals0 + decimals1) / 2)
+        min_tick = UniV3Utils.getMinTick(tick_spacing)
+        max_tick = UniV3Utils.getMaxTick(tick_spacing)
+        table = {}
+        for t, n in raw_net.items():
+            h = round((t + shift) / tick_spacing) * tick_spacing
+            h = min(max(h, min_tick), max_tick)
+            table[h] = table.get(h, 0) + n
+        tick_indices = sorted(t for t, n in table.items() if n != 0)
+        return tick_indices, [table[t] * scale for t in tick_indices]
 
+    @staticmethod
+    def _v3_position_amounts(sqrt_price_x96, liquidity, tick_spacing,
+                             lwr_tick, upr_tick) -> tuple:
+        """Resolve the tick range and the raw (amount0, amount1) held by
+        active liquidity L over it. Used by the V3 read plan. Returns
+        (lwr_tick, upr_tick, amount0_raw, amount1_raw)."""
         # Tick range default per D13 — full range from getMinTick /
         # getMaxTick at the pool's tick_spacing. Caller can override
         # either bound via kwargs.
@@ -466,200 +1054,197 @@ class LiveProvider(StateTwinProvider):
             amount1_raw = int(SqrtPriceMath.getAmount1Delta(
                 sqrt_lower, sqrt_price_x96, liquidity, False,
             ))
+        return lwr_tick, upr_tick, amount0_raw, amount1_raw
 
-        # Token metadata reads happen at "latest" — same caveat as V2
-        # path, FetchToken doesn't accept block_identifier.
-        # eth_abi decodes addresses as lowercase; normalize to checksum
-        # form before handing to FetchToken since real web3 rejects
-        # non-checksummed mixed-case input.
-        tkn0 = _rpc.fetch_token(w3, w3.to_checksum_address(token0_addr))
-        tkn1 = _rpc.fetch_token(w3, w3.to_checksum_address(token1_addr))
+    # ─── Read plans ────────────────────────────────────────────────────────
+    #
+    # Each plan is a generator that yields _CallRequest / _TokenRequest
+    # phases and returns the finished snapshot; _PlanRunner runs all
+    # plans' phases together. Every read goes through them: snapshot(),
+    # snapshot_many() and AsyncLiveProvider alike. `kwargs` carries the
+    # .snapshot() options the plans honor: lwr_tick / upr_tick /
+    # tick_words (uniswap_v3) and n_coins (stableswap).
 
-        # D15 — decimal-adjusted floats matching V2 contract.
-        reserve0 = amount0_raw / (10 ** tkn0.token_decimal)
-        reserve1 = amount1_raw / (10 ** tkn1.token_decimal)
+    @classmethod
+    def _batch_plan(cls, protocol, pool_address, addr, ctx, kwargs = None):
+        kwargs = kwargs or {}
+        if protocol == _PROTO_V2:
+            return cls._plan_v2(pool_address, addr, ctx)
+        if protocol == _PROTO_V3:
+            return cls._plan_v3(
+                pool_address, addr, ctx,
+                kwargs.get("lwr_tick", None), kwargs.get("upr_tick", None),
+                kwargs.get("tick_words", None),
+            )
+        if protocol == _PROTO_BALANCER:
+            return cls._plan_balancer(pool_address, addr, ctx)
+        return cls._plan_stableswap(
+            pool_address, addr, ctx, kwargs.get("n_coins", None),
+        )
+
+    @staticmethod
+    def _plan_v2(pool_address, addr, ctx):
+        from defipy.twin import _rpc
+        cs = ctx["w3"].to_checksum_address
+        token0, token1, reserves, supply = yield _CallRequest([
+            (addr, "token0()", [], [], ["address"]),
+            (addr, "token1()", [], [], ["address"]),
+            (addr, "getReserves()", [], [], ["uint112", "uint112", "uint32"]),
+            (addr, "totalSupply()", [], [], ["uint256"]),
+        ])
+        tkn0, tkn1 = yield _TokenRequest(
+            [cs(token0), cs(token1)],
+        )
+        return V2PoolSnapshot(
+            pool_id = pool_address,
+            token0_name = tkn0.token_name,
+            token1_name = tkn1.token_name,
+            reserve0 = _rpc.amt_to_decimal(tkn0, int(reserves[0])),
+            reserve1 = _rpc.amt_to_decimal(tkn1, int(reserves[1])),
+            total_supply = int(supply) / 1e18,
+            block_number = ctx["block_number"],
+            timestamp = ctx["timestamp"],
+            chain_id = ctx["chain_id"],
+        )
 
+    @classmethod
+    def _plan_v3(cls, pool_address, addr, ctx, lwr_tick = None, upr_tick = None,
+                 tick_words = None):
+        cs = ctx["w3"].to_checksum_address
+        token0, token1, slot0, liquidity, fee, tick_spacing = yield _CallRequest([
+            (addr, "token0()", [], [], ["address"]),
+            (addr, "token1()", [], [], ["address"]),
+            (addr, "slot0()", [], [],
+                ["uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool"]),
+            (addr, "liquidity()", [], [], ["uint128"]),
+            (addr, "fee()", [], [], ["uint24"]),
+            (addr, "tickSpacing()", [], [], ["int24"]),
+        ])
+        lwr_tick, upr_tick, amount0_raw, amount1_raw = cls._v3_position_amounts(
+            int(slot0[0]), int(liquidity), int(tick_spacing), lwr_tick, upr_tick,
+        )
+        walk = None
+        if tick_words is not None:
+            walk = yield from cls._walk_ticks(
+                addr, int(slot0[1]), int(tick_spacing), tick_words,
+            )
+        tkn0, tkn1 = yield _TokenRequest(
+            [cs(token0), cs(token1)],
+        )
+        tick_indices = tick_liquidity_net = sqrt_price = None
+        if walk is not None:
+            tick_indices, tick_liquidity_net = cls._v3_tick_table(
+                walk, int(slot0[1]), int(liquidity), int(tick_spacing),
+                tkn0.token_decimal, tkn1.token_decimal,
+            )
+            sqrt_price = int(slot0[0]) / 2 ** 96 * 10 ** (
+                (tkn0.token_decimal - tkn1.token_decimal) / 2
+            )
         return V3PoolSnapshot(
             pool_id = pool_address,
             token0_name = tkn0.token_name,
             token1_name = tkn1.token_name,
-            reserve0 = reserve0,
-            reserve1 = reserve1,
-            fee = fee,
-            tick_spacing = tick_spacing,
+            reserve0 = amount0_raw / (10 ** tkn0.token_decimal),
+            reserve1 = amount1_raw / (10 ** tkn1.token_decimal),
+            fee = int(fee),
+            tick_spacing = int(tick_spacing),
             lwr_tick = lwr_tick,
             upr_tick = upr_tick,
-            block_number = block_number,
-            timestamp = timestamp,
-            chain_id = chain_id,
+            tick_indices = tick_indices,
+            tick_liquidity_net = tick_liquidity_net,
+            sqrt_price = sqrt_price,
+            block_number = ctx["block_number"],
+            timestamp = ctx["timestamp"],
+            chain_id = ctx["chain_id"],
         )
 
-    # ─── Balancer snapshot ───────────────────────────────────────────────────
-
-    def _snapshot_balancer(self, pool_address, block_number):
+    @staticmethod
+    def _plan_balancer(pool_address, addr, ctx):
         from defipy.twin import _rpc
         from defipy.twin.snapshot import BalancerPoolSnapshot
-
-        client = self._get_client()
-        w3 = client.get_w3()
-
-        # R1 — block consistency. Same discipline as V2/V3. Both round
-        # trips below pin to this block.
-        if block_number is None:
-            block_number = client.block_number()
-
-        addr = w3.to_checksum_address(pool_address)
-        chain_id = client.chain_id()
-
-        # RT1 — no-arg pool reads + block timestamp, one pinned batch.
-        # Balancer token balances live on the Vault keyed by poolId, so
-        # they need a second round trip (poolId isn't known until RT1
-        # returns — can't fold into one batch).
-        rt1_calls = [
+        cs = ctx["w3"].to_checksum_address
+        pool_id, vault_addr, norm_weights = yield _CallRequest([
             (addr, "getPoolId()", [], [], ["bytes32"]),
             (addr, "getVault()", [], [], ["address"]),
             (addr, "getNormalizedWeights()", [], [], ["uint256[]"]),
-            (_rpc.MULTICALL3_ADDRESS, "getCurrentBlockTimestamp()", [], [], ["uint256"]),
-        ]
-        pool_id, vault_addr, norm_weights, timestamp = _rpc.multicall_aggregate3_args(
-            w3, rt1_calls, block_number,
-        )
-        timestamp = int(timestamp)
-
-        # RT2 — balances live on the Vault, keyed by poolId. Single
-        # arg-bearing call; the one-element list unpacks via trailing
-        # comma to the (tokens, balances, lastChangeBlock) 3-tuple.
-        (tokens, balances, _last_change), = _rpc.multicall_aggregate3_args(
-            w3,
-            [(w3.to_checksum_address(vault_addr), "getPoolTokens(bytes32)",
-              ["bytes32"], [pool_id],
-              ["address[]", "uint256[]", "uint256"])],
-            block_number,
-        )
-
-        # v2.2 scope: 2-asset weighted pools only (matches the snapshot
-        # and balancerpy's BalancerImpLoss scope).
+        ])
+        (tokens, balances, _last_change), = yield _CallRequest([
+            (cs(vault_addr), "getPoolTokens(bytes32)",
+             ["bytes32"], [pool_id], ["address[]", "uint256[]", "uint256"]),
+        ])
         if len(tokens) != 2:
             raise NotImplementedError(
                 "LiveProvider Balancer: v2.2 supports 2-asset weighted "
                 "pools only; pool {} has {} tokens."
                 .format(pool_address, len(tokens))
             )
-
-        # On-chain normalized weights are 1e18-scaled and sum to exactly
-        # 1e18. Read both honestly (don't derive weight1 = 1 - weight0);
-        # the float sum lands within BalancerPoolSnapshot's 1e-9 tol.
-        weight0 = int(norm_weights[0]) / 1e18
-        weight1 = int(norm_weights[1]) / 1e18
-
-        # Token metadata at "latest" — same caveat as V2/V3. eth_abi
-        # decodes addresses lowercased; re-checksum before FetchToken.
-        tkn0 = _rpc.fetch_token(w3, w3.to_checksum_address(tokens[0]))
-        tkn1 = _rpc.fetch_token(w3, w3.to_checksum_address(tokens[1]))
-
-        # C2 — decimal-adjusted floats in whole-token units.
-        reserve0 = _rpc.amt_to_decimal(tkn0, int(balances[0]))
-        reserve1 = _rpc.amt_to_decimal(tkn1, int(balances[1]))
-
+        tkn0, tkn1 = yield _TokenRequest(
+            [cs(tokens[0]), cs(tokens[1])],
+        )
         return BalancerPoolSnapshot(
             pool_id = pool_address,
             token0_name = tkn0.token_name,
             token1_name = tkn1.token_name,
-            reserve0 = reserve0,
-            reserve1 = reserve1,
-            weight0 = weight0,
-            weight1 = weight1,
-            block_number = block_number,
-            timestamp = timestamp,
-            chain_id = chain_id,
+            reserve0 = _rpc.amt_to_decimal(tkn0, int(balances[0])),
+            reserve1 = _rpc.amt_to_decimal(tkn1, int(balances[1])),
+            weight0 = int(norm_weights[0]) / 1e18,
+            weight1 = int(norm_weights[1]) / 1e18,
+            block_number = ctx["block_number"],
+            timestamp = ctx["timestamp"],
+            chain_id = ctx["chain_id"],
         )
 
-    # ─── Stableswap snapshot ─────────────────────────────────────────────────
-
-    def _snapshot_stableswap(self, pool_address, block_number, n_coins):
+    @staticmethod
+    def _plan_stableswap(pool_address, addr, ctx, n_coins = None):
         from defipy.twin import _rpc
         from defipy.twin.snapshot import StableswapPoolSnapshot
-
-        client = self._get_client()
-        w3 = client.get_w3()
-
-        # R1 — block consistency. The probe (if used) and the main read
-        # both pin to this block.
-        if block_number is None:
-            block_number = client.block_number()
-
-        addr = w3.to_checksum_address(pool_address)
-        chain_id = client.chain_id()
-
-        # Curve plain pools bake N_COINS in with no universal getter:
-        # take the caller's hint, else probe coins(0..K) and count the
-        # leading non-reverting run.
-        if n_coins is None:
-            n_coins = self._probe_curve_coin_count(w3, addr, block_number)
-
-        # Main read — A(), coins(i)/balances(i) per coin, block
-        # timestamp, one pinned batch. A() is the human amplification
-        # coefficient (matches stableswappy's A); do not read A_precise().
+        cs = ctx["w3"].to_checksum_address
+        # A() plus the coin-count probe and balances in one phase:
+        # coins(i) reverts past N, so the leading run of successes is N.
+        # An n_coins hint bounds the probe to exactly that many coins.
+        max_coins = _MAX_CURVE_COINS if n_coins is None else n_coins
         calls = [(addr, "A()", [], [], ["uint256"])]
-        for i in range(n_coins):
+        for i in range(max_coins):
             calls.append((addr, "coins(uint256)", ["uint256"], [i], ["address"]))
             calls.append((addr, "balances(uint256)", ["uint256"], [i], ["uint256"]))
-        calls.append(
-            (_rpc.MULTICALL3_ADDRESS, "getCurrentBlockTimestamp()", [], [], ["uint256"])
-        )
-        results = _rpc.multicall_aggregate3_args(w3, calls, block_number)
-
-        A_human = int(results[0])
-        coin_addrs = [results[1 + 2 * i] for i in range(n_coins)]
-        balances_raw = [int(results[2 + 2 * i]) for i in range(n_coins)]
-        timestamp = int(results[-1])
-
-        # Per-token metadata at "latest" (same caveat as V2/V3/Balancer).
-        # reserves decimal-adjusted to human floats; decimals stays the
-        # scalar 18 on the snapshot — decimals-invariant for plain pools
-        # (rate normalization), so a real USDC(6)/USDT(6)/DAI(18) pool
-        # reproduces on-chain economics built uniformly at 18.
-        token_names = []
-        reserves = []
-        for coin_addr, bal_raw in zip(coin_addrs, balances_raw):
-            tkn = _rpc.fetch_token(w3, w3.to_checksum_address(coin_addr))
-            token_names.append(tkn.token_name)
-            reserves.append(_rpc.amt_to_decimal(tkn, bal_raw))
-
-        return StableswapPoolSnapshot(
-            pool_id = pool_address,
-            token_names = token_names,
-            reserves = reserves,
-            A = A_human,
-            decimals = 18,
-            block_number = block_number,
-            timestamp = timestamp,
-            chain_id = chain_id,
-        )
-
-    def _probe_curve_coin_count(self, w3, addr, block_number, max_coins = 8):
-        """Probe coins(0..K) via an allow_failure multicall and count the
-        leading non-reverting run. Plain Curve pools have no universal
-        N_COINS() getter, so this is the fallback when the caller doesn't
-        pass an n_coins hint. The one place Phase 1's None-slot path is
-        exercised."""
-        from defipy.twin import _rpc
-        calls = [
-            (addr, "coins(uint256)", ["uint256"], [i], ["address"])
-            for i in range(max_coins)
-        ]
-        results = _rpc.multicall_aggregate3_args(
-            w3, calls, block_number, allow_failure = True,
-        )
+        out = yield _CallRequest(calls, allow_failure = True)
+        if out[0] is None:
+            raise RuntimeError(
+                "{}: A() reverted on {}".format(ctx["caller"], addr)
+            )
         n = 0
-        for r in results:
-            if r is None:
-                break
+        while n < max_coins and out[1 + 2 * n] is not None:
             n += 1
+        if n_coins is not None and n != n_coins:
+            raise RuntimeError(
+                "{}: coins({}) reverted on {} (n_coins={})".format(
+                    ctx["caller"], n, addr, n_coins,
+                )
+            )
         if n < 2:
             raise ValueError(
                 "LiveProvider Stableswap: probed {} coins at {}; expected "
                 ">= 2. Pass n_coins= explicitly if this pool's coins() "
                 "reverts unusually.".format(n, addr)
             )
-        return n
+        balances_raw = [out[2 + 2 * i] for i in range(n)]
+        if any(b is None for b in balances_raw):
+            raise RuntimeError(
+                "{}: balances(i) reverted on {}".format(ctx["caller"], addr)
+            )
+        coin_tokens = yield _TokenRequest(
+            [cs(out[1 + 2 * i]) for i in range(n)],
+        )
+        return StableswapPoolSnapshot(
+            pool_id = pool_address,
+            token_names = [t.token_name for t in coin_tokens],
+            reserves = [
+                _rpc.amt_to_decimal(t, int(b))
+                for t, b in zip(coin_tokens, balances_raw)
+            ],
+            A = int(out[0]),
+            decimals = 18,
+            block_number = ctx["block_number"],
+            timestamp = ctx["timestamp"],
+            chain_id = ctx["chain_id"],
+        )
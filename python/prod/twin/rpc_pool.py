@@ -0,0 +1,408 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""RpcEndpointPool — pooled HTTP sessions over several RPC endpoints.
+
+Give LiveProvider a list of URLs (or a configured pool) instead of one
+URL and its RpcClient routes every JSON-RPC request through this pool:
+
+    provider = LiveProvider(["https://a.example", "https://b.example"])
+    provider = LiveProvider(RpcEndpointPool(urls, max_retries = 5))
+
+Per request the pool
+
+  - picks a healthy endpoint, weighted by inverse EWMA latency (an
+    endpoint with no samples yet is weighted like the fastest, so it
+    gets tried);
+  - retries transient failures — transport errors, timeouts, HTTP 429
+    / 5xx, rate-limit and "header not found" JSON-RPC errors — on the
+    other endpoints first, then with exponential backoff;
+  - takes an endpoint out of rotation after `failure_threshold`
+    consecutive failures, and health-checks it (`eth_blockNumber`)
+    before letting it back in once `cooldown` seconds have passed.
+
+JSON-RPC error answers that aren't transient (a revert, a bad
+argument) are returned as-is — they're the chain's answer, not an
+endpoint fault.
+
+Each endpoint keeps one `requests.Session` with a connection pool of
+`pool_size`, shared by every thread using the provider. The pool is
+web3-free; `_rpc.make_client` wraps it in a web3 provider so
+RpcClient's get_w3() / block_number() / chain_id() surface, and
+LiveProvider, are unchanged.
+"""
+
+import json
+import random
+import threading
+import time
+from typing import Optional
+
+
+# JSON-RPC error codes / messages worth retrying on another endpoint.
+# -32005 is the de-facto "limit exceeded" code; "header not found"
+# means a lagging node hasn't seen the pinned block yet.
+_RETRY_CODES = (-32005,)
+_RETRY_MESSAGES = ("header not found", "rate limit", "too many requests")
+
+# Weight of the newest sample in the latency EWMA.
+_EWMA_ALPHA = 0.3
+
+
+class _RetryableResponse(Exception):
+    """A JSON-RPC error body the pool should retry elsewhere."""
+
+    def __init__(self, raw: bytes):
+        super().__init__(raw[:200])
+        self.raw = raw
+
+
+class _Endpoint:
+    __slots__ = ("url", "latency", "requests", "failures",
+                 "consecutive_failures", "down_until", "session")
+
+    def __init__(self, url: str):
+        self.url = url
+        self.latency = None         # EWMA seconds; None until sampled
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.down_until = None      # monotonic time; None while healthy
+        self.session = None
+
+
+class RpcEndpointPool:
+    """Latency-weighted, failover-aware pool of RPC endpoints.
+
+    Parameters
+    ----------
+    urls : list[str]
+        HTTP(S) endpoints serving the same chain. At least one.
+    max_retries : int
+        Extra attempts per request after the first. Default 3.
+    backoff : float
+        Seconds before the first repeat attempt on an already-tried
+        endpoint; doubles per round, capped at `max_backoff`. Failing
+        over to an untried endpoint doesn't wait.
+    max_backoff : float
+        Backoff cap in seconds. Default 5.
+    timeout : float
+        Per-request HTTP timeout in seconds. Default 10.
+    failure_threshold : int
+        Consecutive failures before an endpoint leaves rotation.
+        Default 2.
+    cooldown : float
+        Seconds an endpoint stays out before its health check.
+        Default 30.
+    pool_size : int
+        HTTP connections kept per endpoint session. Default 10.
+    transport : callable | None
+        `transport(url, body, timeout) -> bytes`, raising on failure.
+        Default: POST through a pooled requests.Session. Tests inject
+        a fake here.
+    seed : int | None
+        Seed for the routing RNG (reproducible endpoint choice).
+
+    Raises
+    ------
+    ValueError
+        If `urls` is empty or a numeric option is out of range.
+    """
+
+    def __init__(
+        self,
+        urls,
+        max_retries: int = 3,
+        backoff: float = 0.2,
+        max_backoff: float = 5.0,
+        timeout: float = 10.0,
+        failure_threshold: int = 2,
+        cooldown: float = 30.0,
+        pool_size: int = 10,
+        transport = None,
+        seed: Optional[int] = None,
+    ):
+        if isinstance(urls, str):
+            urls = [urls]
+        urls = list(urls)
+        if not urls:
+            raise ValueError("RpcEndpointPool: at least one url is required")
+        if max_retries < 0:
+            raise ValueError(
+                "RpcEndpointPool: max_retries must be >= 0; got {}"
+                .format(max_retries)
+            )
+        if failure_threshold < 1:
+            raise ValueError(
+                "RpcEndpointPool: failure_threshold must be >= 1; got {}"
+                .format(failure_threshold)
+            )
+        if backoff < 0 or max_backoff < 0 or cooldown < 0:
+            raise ValueError(
+                "RpcEndpointPool: backoff, max_backoff and cooldown must "
+                "be >= 0"
+            )
+        if timeout <= 0 or pool_size < 1:
+            raise ValueError(
+                "RpcEndpointPool: timeout must be positive and pool_size "
+                ">= 1"
+            )
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.pool_size = pool_size
+        self._endpoints = [_Endpoint(url) for url in urls]
+        self._transport = transport if transport is not None else self._http_post
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._request_id = 0
+        # Overridable in tests.
+        self._clock = time.monotonic
+        self._sleep = time.sleep
+
+    @property
+    def urls(self) -> list:
+        return [ep.url for ep in self._endpoints]
+
+    # ─── Public API ────────────────────────────────────────────────────────
+
+    def request(self, body: bytes) -> bytes:
+        """Send one encoded JSON-RPC request; return the raw response.
+
+        Raises the last transport error once every attempt has failed.
+        A retryable JSON-RPC error body that persists through every
+        attempt is returned, so the caller sees the node's message.
+        """
+        tried = set()
+        rounds = 0
+        last_error = None
+        for _attempt in range(self.max_retries + 1):
+            ep = self._pick(tried)
+            if ep is None:
+                # Every healthy endpoint failed this request — back off,
+                # then go round again.
+                self._sleep(self._backoff_delay(rounds))
+                rounds += 1
+                tried.clear()
+                ep = self._pick(tried)
+            tried.add(ep.url)
+            try:
+                raw = self._send(ep, body)
+            except _RetryableResponse as e:
+                last_error = e
+            except Exception as e:
+                if not _is_transient(e):
+                    raise
+                last_error = e
+            else:
+                return raw
+        if isinstance(last_error, _RetryableResponse):
+            return last_error.raw
+        raise last_error
+
+    def check_health(self) -> list:
+        """Probe every endpoint with eth_blockNumber now, updating its
+        rotation status. Returns one bool per url."""
+        return [self._probe(ep) for ep in self._endpoints]
+
+    def stats(self) -> list:
+        """Per-endpoint routing state, in url order."""
+        now = self._clock()
+        with self._lock:
+            return [
+                {
+                    "url": ep.url,
+                    "healthy": ep.down_until is None,
+                    "latency_ms": (None if ep.latency is None
+                                   else ep.latency * 1000.0),
+                    "requests": ep.requests,
+                    "failures": ep.failures,
+                    "retry_in": (None if ep.down_until is None
+                                 else max(0.0, ep.down_until - now)),
+                }
+                for ep in self._endpoints
+            ]
+
+    # ─── Routing ───────────────────────────────────────────────────────────
+
+    def _pick(self, tried) -> Optional[_Endpoint]:
+        """A healthy endpoint not in `tried`, latency-weighted. Endpoints
+        past their cooldown are health-checked first. None if every
+        healthy endpoint has been tried; if none is healthy at all, the
+        one due back soonest is used as a last resort."""
+        now = self._clock()
+        for ep in self._endpoints:
+            if ep.down_until is not None and ep.down_until <= now:
+                self._probe(ep)
+        with self._lock:
+            healthy = [ep for ep in self._endpoints if ep.down_until is None]
+            if not healthy:
+                if tried:
+                    return None
+                return min(self._endpoints, key = lambda e: e.down_until)
+            candidates = [ep for ep in healthy if ep.url not in tried]
+            if not candidates:
+                return None
+            known = [ep.latency for ep in candidates if ep.latency is not None]
+            best = min(known) if known else 1.0
+            weights = [
+                1.0 / max(ep.latency if ep.latency is not None else best, 1e-4)
+                for ep in candidates
+            ]
+            return self._rng.choices(candidates, weights = weights)[0]
+
+    def _backoff_delay(self, rounds: int) -> float:
+        return min(self.max_backoff, self.backoff * (2 ** rounds))
+
+    # ─── Transport + bookkeeping ───────────────────────────────────────────
+
+    def _send(self, ep: _Endpoint, body: bytes) -> bytes:
+        start = self._clock()
+        try:
+            raw = self._transport(ep.url, body, self.timeout)
+            if _is_retryable_body(raw):
+                raise _RetryableResponse(raw)
+        except Exception as e:
+            # Only the endpoint's own failures count against its health.
+            if isinstance(e, _RetryableResponse) or _is_transient(e):
+                self._record_failure(ep)
+            raise
+        self._record_success(ep, self._clock() - start)
+        return raw
+
+    def _probe(self, ep: _Endpoint) -> bool:
+        body = json.dumps({
+            "jsonrpc": "2.0", "method": "eth_blockNumber",
+            "params": [], "id": self._next_id(),
+        }).encode()
+        try:
+            self._send(ep, body)
+        except Exception:
+            return False
+        return True
+
+    def _record_success(self, ep: _Endpoint, elapsed: float) -> None:
+        with self._lock:
+            ep.requests += 1
+            ep.consecutive_failures = 0
+            ep.down_until = None
+            ep.latency = (elapsed if ep.latency is None
+                          else _EWMA_ALPHA * elapsed
+                          + (1 - _EWMA_ALPHA) * ep.latency)
+
+    def _record_failure(self, ep: _Endpoint) -> None:
+        with self._lock:
+            ep.requests += 1
+            ep.failures += 1
+            ep.consecutive_failures += 1
+            if ep.consecutive_failures >= self.failure_threshold:
+                ep.down_until = self._clock() + self.cooldown
+
+    def _next_id(self) -> int:
+        with self._lock:
+            self._request_id += 1
+            return self._request_id
+
+    def _session(self, ep: _Endpoint):
+        """The endpoint's pooled requests.Session, created on first use.
+        Built under the lock so concurrent first requests share one."""
+        with self._lock:
+            if ep.session is None:
+                import requests
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections = 1, pool_maxsize = self.pool_size,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                ep.session = session
+            return ep.session
+
+    def _http_post(self, url: str, body: bytes, timeout: float) -> bytes:
+        ep = next(e for e in self._endpoints if e.url == url)
+        response = self._session(ep).post(
+            url, data = body, timeout = timeout,
+            headers = {"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        return response.content
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Transport-level failures — connection errors, timeouts, HTTP 429
+    and 5xx — are worth another endpoint. Anything else (an HTTP 4xx,
+    a malformed request, a bug in the transport) is not: it would fail
+    the same way everywhere, so it is raised at once."""
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    try:
+        from requests import exceptions as http
+    except ImportError:
+        pass
+    else:
+        # Every requests exception is an OSError; only these two are
+        # transport failures.
+        if isinstance(exc, (http.ConnectionError, http.Timeout)):
+            return True
+        if isinstance(exc, http.RequestException):
+            return False
+    return isinstance(exc, OSError)
+
+
+def _is_retryable_body(raw: bytes) -> bool:
+    try:
+        payload = json.loads(raw)
+    except (ValueError, TypeError):
+        return False
+    error = payload.get("error") if isinstance(payload, dict) else None
+    if not isinstance(error, dict):
+        return False
+    if error.get("code") in _RETRY_CODES:
+        return True
+    message = str(error.get("message", "")).lower()
+    return any(m in message for m in _RETRY_MESSAGES)
+
+
+_PROVIDER_CLASS = None
+
+
+def web3_provider(pool: RpcEndpointPool):
+    """Wrap `pool` in a web3 JSON-RPC provider. Imports web3 lazily."""
+    global _PROVIDER_CLASS
+    if _PROVIDER_CLASS is None:
+        from web3.providers.base import JSONBaseProvider
+
+        class PooledProvider(JSONBaseProvider):
+            """web3 provider that sends every request through an
+            RpcEndpointPool."""
+
+            def __init__(self, pool):
+                super().__init__()
+                self.pool = pool
+
+            def make_request(self, method, params):
+                raw = self.pool.request(self.encode_rpc_request(method, params))
+                return self.decode_rpc_response(raw)
+
+        _PROVIDER_CLASS = PooledProvider
+    return _PROVIDER_CLASS(pool)
@@ -0,0 +1,356 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""ScenarioEngine — run primitives over many twins in a process pool.
+
+A job is (PoolSnapshot, primitive class, argument grid). The engine
+expands every grid into points, cuts each job's points into chunks and
+ships (snapshot, primitive, chunk) tasks to a multiprocessing pool.
+Only snapshots cross the process boundary: each worker builds its own
+twin with StateTwinBuilder, so nothing heavier than a dataclass of
+floats is ever pickled on the way in, and result dataclasses on the
+way out.
+
+Results stream back in job/point order as ScenarioResult objects while
+later chunks are still running. One twin is built per chunk and shared
+by its points, which relies on the primitive contract that `apply`
+only reads the pool. A failing point records its exception in
+`ScenarioResult.error` instead of aborting the run.
+
+Token arguments (`token_in`, `token_out`, `depeg_token`) may be given
+as token-name strings; they are resolved against the worker's twin,
+the way the MCP server resolves them per call.
+
+The pool is created on first use and reused by later runs until
+`close()` (or the end of a `with` block). `processes = 0` runs every
+chunk inline in the calling process — same results, no pool — which is
+handy for debugging and for callers already inside a worker.
+"""
+
+import itertools
+import math
+import multiprocessing
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union
+
+from defipy.twin._dispatch import describe_error, resolve_tokens
+from defipy.twin.builder import StateTwinBuilder
+from defipy.twin.snapshot import PoolSnapshot
+
+
+# Auto chunking aims for this many chunks per worker, so a slow chunk
+# near the end doesn't leave the rest of the pool idle.
+_CHUNKS_PER_WORKER = 4
+
+
+@dataclass
+class ScenarioJob:
+    """One twin, one primitive, a grid of argument sets.
+
+    Parameters
+    ----------
+    snapshot : PoolSnapshot
+        Pool state to build the twin from, worker-side.
+    primitive : type
+        Primitive class, e.g. SimulatePriceMove. Instantiated with no
+        arguments in the worker; must be importable there (any class
+        defined at module level is).
+    grid : dict | list[dict]
+        Keyword arguments for `method`, excluding `lp`. A dict is
+        expanded as a cartesian product: list/tuple values are swept,
+        anything else is held fixed (wrap a list-valued argument in
+        another list to pass it whole). A list of dicts is taken as
+        the points themselves. Default: a single call with no extra
+        arguments.
+    method : str
+        Primitive method to call. Default "apply".
+    """
+    snapshot: PoolSnapshot
+    primitive: type
+    grid: Union[dict, list] = field(default_factory = dict)
+    method: str = "apply"
+
+    def points(self) -> list:
+        """Expand `grid` into the list of keyword-argument dicts."""
+        if isinstance(self.grid, dict):
+            names = list(self.grid)
+            axes = [
+                value if isinstance(value, (list, tuple)) else [value]
+                for value in self.grid.values()
+            ]
+            return [dict(zip(names, combo)) for combo in itertools.product(*axes)]
+        return [dict(point) for point in self.grid]
+
+
+@dataclass
+class ScenarioResult:
+    """Outcome of one grid point.
+
+    Attributes
+    ----------
+    job_index : int
+        Position of the job in the list passed to `run`.
+    pool_id : str
+        The job snapshot's pool_id.
+    params : dict
+        The point's keyword arguments, as given (token names unresolved).
+    result : Any
+        The primitive's return value; None if the call failed.
+    error : str | None
+        "ExceptionType: message" if the call (or the twin build)
+        raised; None on success.
+    """
+    job_index: int
+    pool_id: str
+    params: dict
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class ScenarioReport:
+    """Progress and throughput of a run; updated as chunks complete.
+
+    Attributes
+    ----------
+    jobs : int
+        Jobs in the run.
+    points : int
+        Grid points across all jobs.
+    done : int
+        Points whose results have been received.
+    errors : int
+        Received points that failed.
+    chunks : int
+        Tasks the points were cut into.
+    processes : int
+        Worker processes (0 when running inline).
+    elapsed_s : float
+        Wall-clock seconds since the run started.
+    """
+    jobs: int
+    points: int
+    done: int = 0
+    errors: int = 0
+    chunks: int = 0
+    processes: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def points_per_sec(self) -> float:
+        return self.done / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def __str__(self) -> str:
+        return "{}/{} points ({} errors) in {:.2f}s — {:.1f} points/s".format(
+            self.done, self.points, self.errors, self.elapsed_s,
+            self.points_per_sec,
+        )
+
+
+class ScenarioRun:
+    """Iterator over a run's ScenarioResults, in job/point order.
+
+    Returned by ScenarioEngine.run. `report` reflects everything
+    received so far and is final once iteration finishes.
+    """
+
+    def __init__(self, chunks, report, progress):
+        self._chunks = chunks
+        self._progress = progress
+        self._t0 = time.perf_counter()
+        self.report = report
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            self.report.done += len(chunk)
+            self.report.errors += sum(1 for r in chunk if r.error is not None)
+            self.report.elapsed_s = time.perf_counter() - self._t0
+            if self._progress is not None:
+                self._progress(self.report)
+            yield from chunk
+
+    def collect(self) -> list:
+        """Drain the run into a list."""
+        return list(self)
+
+
+class ScenarioEngine:
+    """Process-pool runner for primitives over many twins.
+
+    Parameters
+    ----------
+    processes : int | None
+        Worker count. None (default) uses os.cpu_count(); 0 runs
+        inline without a pool.
+    chunksize : int | None
+        Grid points per task. None (default) picks about four chunks
+        per worker for each run, never mixing two jobs in one chunk.
+    maxtasksperchild : int | None
+        Recycle a worker after this many tasks (passed through to
+        multiprocessing.Pool). None (default) keeps workers for the
+        life of the engine.
+    mp_context : str | None
+        multiprocessing start method ("fork", "spawn", "forkserver").
+        None (default) uses the platform default.
+
+    Examples
+    --------
+        jobs = [
+            ScenarioJob(snap, SimulatePriceMove,
+                        {"price_change_pct": [-0.5, -0.2, 0.2],
+                         "position_size_lp": 10.0})
+            for snap in snapshots
+        ]
+        with ScenarioEngine(processes = 8) as engine:
+            run = engine.run(jobs, progress = print)
+            for outcome in run:
+                ...
+            print(run.report)
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        maxtasksperchild: Optional[int] = None,
+        mp_context: Optional[str] = None,
+    ):
+        if processes is not None and processes < 0:
+            raise ValueError(
+                "ScenarioEngine: processes must be >= 0 or None; got {}"
+                .format(processes)
+            )
+        if chunksize is not None and chunksize < 1:
+            raise ValueError(
+                "ScenarioEngine: chunksize must be >= 1 or None; got {}"
+                .format(chunksize)
+            )
+        self.processes = (multiprocessing.cpu_count()
+                          if processes is None else processes)
+        self.chunksize = chunksize
+        self.maxtasksperchild = maxtasksperchild
+        self.mp_context = mp_context
+        self._pool = None
+
+    # ─── Lifecycle ──────────────────────────────────────────────────────────
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Shut the worker pool down. A later run starts a new one."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            ctx = multiprocessing.get_context(self.mp_context)
+            self._pool = ctx.Pool(
+                self.processes, maxtasksperchild = self.maxtasksperchild,
+            )
+        return self._pool
+
+    # ─── Running ────────────────────────────────────────────────────────────
+
+    def run(
+        self,
+        jobs: list,
+        progress: Optional[Callable[[ScenarioReport], None]] = None,
+    ) -> ScenarioRun:
+        """Start a run and return its ScenarioRun iterator.
+
+        Parameters
+        ----------
+        jobs : list[ScenarioJob]
+            Jobs to run; results come back in this order, each job's
+            points in grid order.
+        progress : callable, optional
+            Called with the ScenarioReport after each chunk arrives.
+
+        Returns
+        -------
+        ScenarioRun
+            Work is dispatched immediately; iterate to receive results.
+        """
+        tasks = []
+        total = 0
+        points_per_job = []
+        for job in jobs:
+            if not isinstance(job, ScenarioJob):
+                raise TypeError(
+                    "ScenarioEngine: jobs must be ScenarioJob; got {}"
+                    .format(type(job).__name__)
+                )
+            points = job.points()
+            points_per_job.append(points)
+            total += len(points)
+
+        size = self.chunksize or max(1, math.ceil(
+            total / (max(self.processes, 1) * _CHUNKS_PER_WORKER)
+        ))
+        for i, (job, points) in enumerate(zip(jobs, points_per_job)):
+            for start in range(0, len(points), size):
+                tasks.append((i, job.snapshot, job.primitive, job.method,
+                              points[start:start + size]))
+
+        report = ScenarioReport(jobs = len(jobs), points = total,
+                                chunks = len(tasks),
+                                processes = self.processes)
+        if self.processes == 0:
+            chunks = map(_run_chunk, tasks)
+        else:
+            chunks = self._get_pool().imap(_run_chunk, tasks)
+        return ScenarioRun(chunks, report, progress)
+
+
+# ─── Worker side ─────────────────────────────────────────────────────────────
+
+_BUILDER = StateTwinBuilder()
+
+
+def _run_chunk(task) -> list:
+    job_index, snapshot, primitive, method, points = task
+    pool_id = snapshot.pool_id
+    try:
+        lp = _BUILDER.build(snapshot)
+        call = getattr(primitive(), method)
+    except Exception as e:
+        error = describe_error(e)
+        return [ScenarioResult(job_index, pool_id, params, error = error)
+                for params in points]
+
+    results = []
+    for params in points:
+        try:
+            kwargs = resolve_tokens(lp, params)
+            results.append(ScenarioResult(job_index, pool_id, params,
+                                          result = call(lp, **kwargs)))
+        except Exception as e:
+            results.append(ScenarioResult(job_index, pool_id, params,
+                                          error = describe_error(e)))
+    return results
@@ -92,6 +92,29 @@ class V2PoolSnapshot(PoolSnapshot):
 
 @dataclass(kw_only=True)
 class V3PoolSnapshot(PoolSnapshot):
+    """Uniswap V3 pool state.
+
+    `reserve0` / `reserve1` are the decimal-adjusted amounts the pool's
+    active liquidity holds over [lwr_tick, upr_tick].
+
+    `tick_indices` / `tick_liquidity_net` optionally carry the pool's
+    liquidity profile as parallel lists sorted by tick: the initialized
+    ticks LiveProvider found walking the tick bitmap around the current
+    price (`snapshot(..., tick_words=N)`), with liquidityNet at each.
+    Like the reserves they are decimal-adjusted — ticks shifted into
+    the decimal-adjusted price space the twin trades in and snapped to
+    tick_spacing, liquidity scaled by 10**-((decimals0 + decimals1) / 2)
+    — and anchored at the active liquidity. Liquidity beyond the walked
+    window is truncated, so the list opens and closes it: the nets sum
+    to zero. When present, StateTwinBuilder populates the twin's tick
+    table from them instead of joining one position over
+    [lwr_tick, upr_tick]. None (the default) for active-liquidity-only
+    snapshots.
+
+    `sqrt_price` is the pool's slot0 sqrtPriceX96 / 2**96 in the same
+    decimal-adjusted price space; LiveProvider sets it alongside the
+    tick table, and the builder initializes a tick-table twin at it.
+    """
     token0_name: str
     token1_name: str
     reserve0: float
@@ -102,9 +125,28 @@ class V3PoolSnapshot(PoolSnapshot):
     # tick_spacing via UniV3Utils. Callers can override either.
     lwr_tick: Optional[int] = None
     upr_tick: Optional[int] = None
+    tick_indices: Optional[list] = None
+    tick_liquidity_net: Optional[list] = None
+    sqrt_price: Optional[float] = None
 
     def __post_init__(self):
         self.protocol = "uniswap_v3"
+        if (self.tick_indices is None) != (self.tick_liquidity_net is None):
+            raise ValueError(
+                "V3PoolSnapshot: tick_indices and tick_liquidity_net must "
+                "be given together"
+            )
+        if self.tick_indices is not None:
+            if len(self.tick_indices) != len(self.tick_liquidity_net):
+                raise ValueError(
+                    "V3PoolSnapshot: tick_indices and tick_liquidity_net "
+                    "must have same length; got {} and {}"
+                    .format(len(self.tick_indices), len(self.tick_liquidity_net))
+                )
+            if any(a >= b for a, b in zip(self.tick_indices, self.tick_indices[1:])):
+                raise ValueError(
+                    "V3PoolSnapshot: tick_indices must be strictly ascending"
+                )
         if self.lwr_tick is None or self.upr_tick is None:
             # Local import: avoid pulling uniswappy at module load time,
             # keep snapshot.py cheap for pure-data inspection.
@@ -0,0 +1,246 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""SnapshotCache — opt-in memoization for LiveProvider reads.
+
+A PoolSnapshot read at a concrete block is a pure function of
+(chain_id, protocol, address, block_number): historical chain state
+doesn't change, so the result is safe to keep. LiveProvider resolves
+"latest" to a concrete block *before* consulting the cache, so a
+repeated "latest" read only hits while the chain head hasn't moved.
+
+Two tiers:
+
+  - In-memory LRU bounded by `max_size` entries, with optional `ttl`
+    seconds. Eviction is least-recently-used.
+  - Optional on-disk tier (`path`), a single sqlite3 file. Snapshots
+    are stored as JSON (dataclass fields + type name), never pickled,
+    so a cache file is safe to share. A memory miss falls through to
+    disk; a disk hit is promoted back into memory.
+
+`ttl` is the knob for reorg exposure: snapshots near the chain head
+can be orphaned, and ttl bounds how long such a read can be served.
+Leave it None when reading finalized history.
+
+Entries are handed out as copies — mutating a returned snapshot never
+poisons the cache. All methods are thread-safe.
+"""
+
+import copy
+import dataclasses
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from defipy.twin.snapshot import (
+    PoolSnapshot,
+    V2PoolSnapshot,
+    V3PoolSnapshot,
+    BalancerPoolSnapshot,
+    StableswapPoolSnapshot,
+)
+
+
+_SNAPSHOT_TYPES = {
+    cls.__name__: cls
+    for cls in (
+        V2PoolSnapshot,
+        V3PoolSnapshot,
+        BalancerPoolSnapshot,
+        StableswapPoolSnapshot,
+    )
+}
+
+
+class SnapshotCache:
+    """Bounded LRU / TTL cache of PoolSnapshots with an optional disk tier.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum in-memory entries. Must be >= 1. Default 1024.
+    ttl : float | None
+        Seconds an entry stays valid, in memory and on disk. None
+        (default) keeps entries until evicted by size.
+    path : str | None
+        sqlite3 file for the persistent tier. None (default) keeps the
+        cache in memory only.
+
+    Counters
+    --------
+    `hits`, `misses` and `evictions` count lookups over the cache's
+    lifetime; `stats()` returns them with the current size. A disk hit
+    counts as a hit.
+
+    Examples
+    --------
+        cache = SnapshotCache(max_size = 4096, path = "snapshots.db")
+        provider = LiveProvider(rpc_url, cache = cache)
+        provider.snapshot(pool_id, block_number = 19_500_000)  # miss
+        provider.snapshot(pool_id, block_number = 19_500_000)  # hit
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: Optional[float] = None,
+        path: Optional[str] = None,
+    ):
+        if max_size < 1:
+            raise ValueError(
+                "SnapshotCache: max_size must be >= 1; got {}".format(max_size)
+            )
+        if ttl is not None and ttl <= 0:
+            raise ValueError(
+                "SnapshotCache: ttl must be positive or None; got {}".format(ttl)
+            )
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> (stored_at, snapshot). stored_at is wall-clock time so
+        # memory and disk entries age against the same clock.
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread = False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                "key TEXT PRIMARY KEY, stored_at REAL, payload TEXT)"
+            )
+            self._db.commit()
+
+    # ─── Public API ────────────────────────────────────────────────────────
+
+    def get(self, key: tuple) -> Optional[PoolSnapshot]:
+        """Return a copy of the cached snapshot for `key`, or None."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[0], now):
+                del self._entries[key]
+                entry = None
+            if entry is None and self._db is not None:
+                entry = self._disk_get(key, now)
+                if entry is not None:
+                    self._memory_put(key, entry)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def put(self, key: tuple, snapshot: PoolSnapshot) -> None:
+        """Store a copy of `snapshot` under `key` (both tiers)."""
+        entry = (time.time(), copy.deepcopy(snapshot))
+        with self._lock:
+            self._memory_put(key, entry)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?)",
+                    (_encode_key(key), entry[0], _encode_snapshot(snapshot)),
+                )
+                self._db.commit()
+
+    def clear(self) -> None:
+        """Drop every entry (both tiers). Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM snapshots")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the disk tier, if any. The memory tier stays usable."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def stats(self) -> dict:
+        """Counters plus current in-memory size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    # ─── Internals ─────────────────────────────────────────────────────────
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl is not None and now - stored_at > self.ttl
+
+    def _memory_put(self, key, entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last = False)
+            self.evictions += 1
+
+    def _disk_get(self, key, now):
+        row = self._db.execute(
+            "SELECT stored_at, payload FROM snapshots WHERE key = ?",
+            (_encode_key(key),),
+        ).fetchone()
+        if row is None:
+            return None
+        stored_at, payload = row
+        if self._expired(stored_at, now):
+            self._db.execute(
+                "DELETE FROM snapshots WHERE key = ?", (_encode_key(key),),
+            )
+            self._db.commit()
+            return None
+        return (stored_at, _decode_snapshot(payload))
+
+
+def _encode_key(key: tuple) -> str:
+    return json.dumps(list(key))
+
+
+def _encode_snapshot(snapshot: PoolSnapshot) -> str:
+    return json.dumps({
+        "type": type(snapshot).__name__,
+        "fields": dataclasses.asdict(snapshot),
+    })
+
+
+def _decode_snapshot(payload: str) -> PoolSnapshot:
+    data = json.loads(payload)
+    cls = _SNAPSHOT_TYPES[data["type"]]
+    fields = data["fields"]
+    # `protocol` is set by __post_init__ and isn't a constructor input
+    # callers are meant to forge; let the subclass stamp it.
+    fields.pop("protocol", None)
+    return cls(**fields)
@@ -0,0 +1,123 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Columnar on-disk format for a series of PoolSnapshots.
+
+`LiveProvider.snapshot_range(..., path=...)` writes one; replay it with
+`read_snapshot_series(path)`. The file is a NumPy `.npz` archive with
+one array per snapshot field (reserves as float64, block numbers as
+int64, token names as unicode, Stableswap per-coin lists as 2-D
+arrays) plus a small JSON header naming the snapshot type. List fields
+whose length varies along the series (a V3 tick table) are stored
+ragged: the flat concatenation plus a `<field>__lengths` array. Fields
+that are None throughout the series are recorded in the header rather
+than stored. Nothing is pickled, so a series file is safe to share.
+
+All snapshots in a series must be the same type — one pool over a
+block range — and, for Stableswap, have the same coin count.
+"""
+
+import dataclasses
+import json
+
+import numpy as np
+
+from defipy.twin.snapshot_cache import _SNAPSHOT_TYPES
+
+
+_HEADER = "__series__"
+_LENGTHS = "{}__lengths"
+_FORMAT_VERSION = 1
+
+
+def write_snapshot_series(path: str, snapshots: list) -> None:
+    """Write `snapshots` (same type, in order) to a columnar .npz file.
+
+    Raises
+    ------
+    ValueError
+        If `snapshots` is empty or mixes snapshot types.
+    """
+    snapshots = list(snapshots)
+    if not snapshots:
+        raise ValueError("write_snapshot_series: no snapshots to write")
+    cls = type(snapshots[0])
+    if any(type(s) is not cls for s in snapshots):
+        raise ValueError(
+            "write_snapshot_series: all snapshots must be {}; got {}"
+            .format(cls.__name__, sorted({type(s).__name__ for s in snapshots}))
+        )
+
+    columns = {}
+    none_fields = []
+    ragged_fields = []
+    for f in dataclasses.fields(cls):
+        if f.name == "protocol":
+            continue   # stamped by __post_init__
+        values = [getattr(s, f.name) for s in snapshots]
+        if all(v is None for v in values):
+            none_fields.append(f.name)
+            continue
+        if any(v is None for v in values):
+            raise ValueError(
+                "write_snapshot_series: field {!r} is None for only part "
+                "of the series".format(f.name)
+            )
+        if (isinstance(values[0], list)
+                and len({len(v) for v in values}) > 1):
+            ragged_fields.append(f.name)
+            columns[f.name] = np.asarray([x for v in values for x in v])
+            columns[_LENGTHS.format(f.name)] = np.asarray(
+                [len(v) for v in values], dtype = np.int64,
+            )
+            continue
+        columns[f.name] = np.asarray(values)
+
+    header = {
+        "version": _FORMAT_VERSION,
+        "type": cls.__name__,
+        "length": len(snapshots),
+        "none_fields": none_fields,
+        "ragged_fields": ragged_fields,
+    }
+    with open(path, "wb") as fh:
+        np.savez_compressed(fh, **{_HEADER: np.array(json.dumps(header))}, **columns)
+
+
+def read_snapshot_series(path: str) -> list:
+    """Load a series written by write_snapshot_series, in order."""
+    with np.load(path, allow_pickle = False) as data:
+        header = json.loads(str(data[_HEADER]))
+        cls = _SNAPSHOT_TYPES[header["type"]]
+        columns = {name: data[name] for name in data.files if name != _HEADER}
+
+    ragged = {}
+    for name in header.get("ragged_fields", []):
+        flat = columns.pop(name).tolist()
+        ends = np.cumsum(columns.pop(_LENGTHS.format(name))).tolist()
+        ragged[name] = [flat[a:b] for a, b in zip([0] + ends, ends)]
+
+    out = []
+    for i in range(header["length"]):
+        fields = {name: col[i].tolist() for name, col in columns.items()}
+        for name, rows in ragged.items():
+            fields[name] = rows[i]
+        for name in header["none_fields"]:
+            fields[name] = None
+        out.append(cls(**fields))
+    return out
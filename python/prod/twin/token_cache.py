@@ -0,0 +1,139 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""TokenMetadataCache — process-wide ERC20 (symbol, decimals) cache.
+
+Every LiveProvider snapshot needs symbol() and decimals() for each
+pool token: two reads per token, two to six tokens per pool. Both are
+effectively immutable for production ERC20s, so LiveProvider looks
+them up here first, keyed by `(chain_id, address)`, and only reads the
+chain on a miss (see `_rpc.fetch_tokens`).
+
+One cache is shared by every LiveProvider in the process
+(`default_token_cache()`). Swap in a persistent one with
+
+    set_default_token_cache(TokenMetadataCache(path = "tokens.db"))
+
+The cache is unbounded — an entry is a symbol string and an int, and
+the set of tokens a process touches is small.
+"""
+
+import sqlite3
+import threading
+from typing import Optional
+
+
+class TokenMetadataCache:
+    """Thread-safe (chain_id, address) → (symbol, decimals) map.
+
+    Parameters
+    ----------
+    path : str | None
+        sqlite3 file backing the cache. Entries found there are loaded
+        on construction; new entries are written through. None (default)
+        keeps the cache in memory only.
+
+    Addresses are case-normalized, so checksum and lowercase forms
+    share an entry. `hits` / `misses` count `get` calls.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread = False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS tokens ("
+                "chain_id INTEGER, address TEXT, symbol TEXT, decimals INTEGER, "
+                "PRIMARY KEY (chain_id, address))"
+            )
+            self._db.commit()
+            for chain_id, address, symbol, decimals in self._db.execute(
+                "SELECT chain_id, address, symbol, decimals FROM tokens"
+            ):
+                self._entries[(chain_id, address)] = (symbol, decimals)
+
+    def get(self, chain_id: int, address: str) -> Optional[tuple]:
+        """Return (symbol, decimals) or None."""
+        with self._lock:
+            entry = self._entries.get((chain_id, address.lower()))
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return entry
+
+    def put(self, chain_id: int, address: str, symbol: str, decimals: int) -> None:
+        key = (chain_id, address.lower())
+        with self._lock:
+            self._entries[key] = (symbol, decimals)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO tokens VALUES (?, ?, ?, ?)",
+                    key + (symbol, decimals),
+                )
+                self._db.commit()
+
+    def clear(self) -> None:
+        """Drop every entry (memory and disk). Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM tokens")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the disk backing, if any. The memory tier stays usable."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_DEFAULT_CACHE = TokenMetadataCache()
+
+
+def default_token_cache() -> TokenMetadataCache:
+    """The process-wide cache LiveProvider reads through."""
+    return _DEFAULT_CACHE
+
+
+def set_default_token_cache(cache: TokenMetadataCache) -> None:
+    """Replace the process-wide cache (e.g. with a persistent one)."""
+    global _DEFAULT_CACHE
+    if not isinstance(cache, TokenMetadataCache):
+        raise TypeError(
+            "set_default_token_cache: expected TokenMetadataCache; got {}"
+            .format(type(cache).__name__)
+        )
+    _DEFAULT_CACHE = cache
@@ -0,0 +1,164 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Slotted (optionally frozen) variants of the result dataclasses.
+
+The result classes in this package are plain dataclasses, so every
+instance carries a `__dict__`. compact_class(cls) derives a
+`@dataclass(slots = True)` twin with the same field names, types,
+defaults and order. dataclasses.asdict / fields / replace, field
+access and equality behave exactly as on the original, so consumers
+that only read fields (the MCP server's _serialize_result, the
+summarizers, ResultCollector) take either form.
+
+A variant is a separate class, not a subclass: a slotted subclass
+would still inherit the parent's `__dict__`. Each variant records its
+source in `__compact_of__`; from_compact() converts back.
+
+Nested results (a list of DepegScenario inside DepegRiskAssessment,
+say) are converted along with their parent by to_compact().
+"""
+
+import dataclasses
+import functools
+
+
+def compact_class(result_cls, frozen = False):
+
+    """ compact_class
+
+        Slotted variant of a result dataclass, built once per
+        (result_cls, frozen) and cached.
+
+        Parameters
+        ----------
+        result_cls : type
+            A dataclass type, e.g. PoolHealth.
+        frozen : bool
+            Make instances immutable (hashable if every field is).
+            Costs a slower constructor. Default False.
+
+        Returns
+        -------
+        type
+            Dataclass named "Compact" + result_cls.__name__.
+
+        Raises
+        ------
+        TypeError
+            If result_cls is not a dataclass type.
+    """
+
+    if not (isinstance(result_cls, type) and dataclasses.is_dataclass(result_cls)):
+        raise TypeError(
+            "compact_class: expected a dataclass type; got {!r}".format(result_cls)
+        )
+    if getattr(result_cls, "__compact_of__", None) is not None:
+        result_cls = result_cls.__compact_of__
+    return _build(result_cls, bool(frozen))
+
+
+def to_compact(result, frozen = False):
+
+    """ to_compact
+
+        Copy a result into its compact variant. Dataclass values, and
+        lists / tuples of them, are converted too.
+    """
+
+    if not dataclasses.is_dataclass(result) or isinstance(result, type):
+        raise TypeError(
+            "to_compact: expected a dataclass instance; got {!r}".format(result)
+        )
+    cls = compact_class(type(result), frozen)
+    if type(result) is cls:
+        return result
+    return cls(**{
+        f.name: _convert(getattr(result, f.name), to_compact, frozen)
+        for f in dataclasses.fields(result)
+    })
+
+
+def from_compact(result):
+
+    """ from_compact
+
+        Copy a compact variant back into its original result class
+        (nested compact values included). Originals pass through.
+    """
+
+    original = getattr(type(result), "__compact_of__", None)
+    if original is None:
+        return result
+    return original(**{
+        f.name: _convert(getattr(result, f.name), _from_compact_nested, None)
+        for f in dataclasses.fields(result)
+    })
+
+
+@functools.lru_cache(maxsize = None)
+def _build(result_cls, frozen):
+    specs = []
+    for f in dataclasses.fields(result_cls):
+        spec = dataclasses.field(
+            default = f.default,
+            default_factory = f.default_factory,
+            init = f.init, repr = f.repr, compare = f.compare,
+            metadata = f.metadata,
+        )
+        specs.append((f.name, f.type, spec))
+
+    cls = dataclasses.make_dataclass(
+        "Compact" + result_cls.__name__,
+        specs,
+        namespace = {
+            "__compact_of__": result_cls,
+            "__reduce__": _reduce,
+            "__doc__": result_cls.__doc__,
+        },
+        slots = True,
+        frozen = frozen,
+    )
+    cls.__module__ = __name__
+    return cls
+
+
+def _reduce(self):
+    # Generated classes can't be found by name, so pickle through the
+    # original (importable) class and rebuild the variant on load.
+    values = {f.name: getattr(self, f.name) for f in dataclasses.fields(self)}
+    frozen = type(self).__dataclass_params__.frozen
+    return (_restore, (type(self).__compact_of__, frozen, values))
+
+
+def _restore(result_cls, frozen, values):
+    return _build(result_cls, frozen)(**values)
+
+
+def _convert(value, fn, frozen):
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return fn(value, frozen)
+    if isinstance(value, (list, tuple)) and any(
+        dataclasses.is_dataclass(v) and not isinstance(v, type) for v in value
+    ):
+        return type(value)(_convert(v, fn, frozen) for v in value)
+    return value
+
+
+def _from_compact_nested(value, _frozen):
+    return from_compact(value)
@@ -0,0 +1,65 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class DepositSplitBatch:
+    """ Columnar deposit splits for a grid of deposit sizes.
+
+        Produced by OptimalDepositSplit.apply_batch. Same semantics as
+        DepositSplitResult, one array element per amount_in — element
+        i of every column describes the same deposit.
+
+        Attributes
+        ----------
+        token_in_name : str
+            Symbol of the input token.
+        amount_in : np.ndarray
+            Deposit sizes, in human units, as passed in.
+        optimal_fraction : np.ndarray
+            α per deposit — the fraction of amount_in to swap first.
+        swap_amount_in : np.ndarray
+            α · amount_in.
+        swap_amount_out : np.ndarray
+            Token_out received from the swap leg.
+        deposit_amount_in : np.ndarray
+            (1-α) · amount_in of token_in deposited.
+        deposit_amount_out : np.ndarray
+            Token_out deposited (the whole swap output).
+        expected_lp_tokens : np.ndarray
+            LP tokens (V2), position liquidity (V3) or pool shares
+            (Balancer) the deposit would receive.
+        slippage_cost : np.ndarray
+            Swap-leg slippage in token_out units.
+        slippage_pct : np.ndarray
+            slippage_cost over the swap leg's spot-priced value.
+    """
+    token_in_name: str
+    amount_in: np.ndarray
+    optimal_fraction: np.ndarray
+    swap_amount_in: np.ndarray
+    swap_amount_out: np.ndarray
+    deposit_amount_in: np.ndarray
+    deposit_amount_out: np.ndarray
+    expected_lp_tokens: np.ndarray
+    slippage_cost: np.ndarray
+    slippage_pct: np.ndarray
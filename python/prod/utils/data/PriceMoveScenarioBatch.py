@@ -0,0 +1,52 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class PriceMoveScenarioBatch:
+    """Columnar price-move projections for a grid of hypothetical prices.
+
+    Produced by SimulatePriceMove.apply_batch. Same semantics as
+    PriceMoveScenario, one array element per scenario — element i of
+    every column describes the same (price_change_pct, position_size_lp)
+    pair. Arrays share the broadcast shape of the inputs.
+
+    Attributes
+    ----------
+    new_price_ratio : np.ndarray
+        Alpha = new_price / current_price per scenario.
+    new_value : np.ndarray
+        Position value at each new price, in token0 numeraire.
+    il_at_new_price : np.ndarray
+        Impermanent loss at each simulated price, as a fraction.
+    value_change_pct : np.ndarray
+        Fractional change in position value from current to simulated.
+
+    Notes
+    -----
+    No fee_projection column: SimulatePriceMove never models fees, so
+    the scalar result's always-None field carries no information here.
+    """
+    new_price_ratio: np.ndarray
+    new_value: np.ndarray
+    il_at_new_price: np.ndarray
+    value_change_pct: np.ndarray
@@ -0,0 +1,348 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import dataclasses
+import types
+import typing
+
+import numpy as np
+
+
+# Scalar annotation → column dtype. Anything else (str, lists, nested
+# dataclasses, arrays) is stored as-is in an object column.
+_NUMERIC_DTYPES = {
+    float: np.float64,
+    int: np.int64,
+    bool: np.bool_,
+}
+
+# Placeholder written under a masked (None) slot.
+_FILL = {
+    np.float64: np.nan,
+    np.int64: 0,
+    np.bool_: False,
+}
+
+
+class ResultCollector:
+
+    """ Columnar accumulator for results of one dataclass type.
+
+        Every field of the result class gets a preallocated NumPy
+        column, and append() writes one row across them — no per-row
+        dict as with dataclasses.asdict. Columns double in capacity
+        when full, so n appends cost O(n) amortized.
+
+        Column dtypes follow the field annotations: float → float64,
+        int → int64, bool → bool, Optional[...] of those → the same
+        dtype plus a boolean mask (True where the value was None).
+        Every other field (str, lists, nested dataclasses) gets an
+        object column.
+
+        Exports are views over the filled rows, not copies: column()
+        and columns() return NumPy views, to_pandas() wraps masked
+        columns as nullable extension arrays over the same buffers,
+        and to_arrow() hands the numeric buffers to pyarrow (an
+        optional dependency). A view is invalidated by the next
+        append that grows the columns; copy it if it must outlive
+        further appends.
+
+        Parameters
+        ----------
+        result_cls : type
+            The dataclass type to collect, e.g. PoolHealth. Its
+            compact (slotted) variant is accepted by append() too.
+        capacity : int
+            Initial rows allocated. Must be >= 1. Default 1024.
+
+        Examples
+        --------
+            collector = ResultCollector(PriceMoveScenario)
+            for pct in price_changes:
+                collector.append(SimulatePriceMove().apply(lp, pct, 10.0))
+            df = collector.to_pandas()
+    """
+
+    def __init__(self, result_cls, capacity = 1024):
+        if not (isinstance(result_cls, type) and dataclasses.is_dataclass(result_cls)):
+            raise TypeError(
+                "ResultCollector: result_cls must be a dataclass type; "
+                "got {!r}".format(result_cls)
+            )
+        if capacity < 1:
+            raise ValueError(
+                "ResultCollector: capacity must be >= 1; got {}".format(capacity)
+            )
+
+        hints = typing.get_type_hints(result_cls)
+        self.result_cls = result_cls
+        self.fields = tuple(f.name for f in dataclasses.fields(result_cls))
+        self._dtypes = {}
+        self._optional = set()
+        for name in self.fields:
+            dtype, optional = _column_type(hints.get(name, object))
+            self._dtypes[name] = dtype
+            if optional:
+                self._optional.add(name)
+
+        self._size = 0
+        self._capacity = capacity
+        self._columns = {
+            name: np.empty(capacity, dtype = self._dtypes[name])
+            for name in self.fields
+        }
+        self._masks = {
+            name: np.zeros(capacity, dtype = np.bool_)
+            for name in self._optional
+        }
+        # (name, column, mask or None, fill) per field, in order.
+        self._writers = self._make_writers()
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    # ─── Accumulation ───────────────────────────────────────────────────────
+
+    def append(self, result):
+
+        """ append
+
+            Add one result as a new row.
+
+            Raises
+            ------
+            TypeError
+                If result is neither a result_cls nor its compact
+                variant.
+        """
+
+        if not isinstance(result, self.result_cls) and \
+                getattr(type(result), "__compact_of__", None) is not self.result_cls:
+            raise TypeError(
+                "ResultCollector: expected {}; got {}".format(
+                    self.result_cls.__name__, type(result).__name__
+                )
+            )
+        if self._size == self._capacity:
+            self._grow(2 * self._capacity)
+        i = self._size
+        for name, column, mask, fill in self._writers:
+            value = getattr(result, name)
+            if mask is not None:
+                if value is None:
+                    mask[i] = True
+                    column[i] = fill
+                    continue
+                mask[i] = False
+            column[i] = value
+        self._size = i + 1
+
+    def extend(self, results):
+
+        """ extend
+
+            Append every result in an iterable.
+        """
+
+        for result in results:
+            self.append(result)
+
+    def clear(self):
+
+        """ clear
+
+            Drop all rows; capacity is kept.
+        """
+
+        self._size = 0
+
+    def _grow(self, capacity):
+        # Geometric growth: one copy per doubling.
+        for name in self.fields:
+            column = np.empty(capacity, dtype = self._dtypes[name])
+            column[:self._size] = self._columns[name][:self._size]
+            self._columns[name] = column
+        for name in self._optional:
+            mask = np.zeros(capacity, dtype = np.bool_)
+            mask[:self._size] = self._masks[name][:self._size]
+            self._masks[name] = mask
+        self._capacity = capacity
+        self._writers = self._make_writers()
+
+    def _make_writers(self):
+        writers = []
+        for name in self.fields:
+            mask = self._masks.get(name)
+            fill = _FILL.get(self._dtypes[name]) if mask is not None else None
+            writers.append((name, self._columns[name], mask, fill))
+        return tuple(writers)
+
+    # ─── Access ─────────────────────────────────────────────────────────────
+
+    def column(self, name):
+
+        """ column
+
+            View of one field's filled rows. Masked slots of Optional
+            numeric fields hold a placeholder (NaN / 0 / False); see
+            mask().
+        """
+
+        self._check_field(name)
+        return self._columns[name][:self._size]
+
+    def mask(self, name):
+
+        """ mask
+
+            View of an Optional field's None mask (True = None), or
+            None for a field that can't be None.
+        """
+
+        self._check_field(name)
+        mask = self._masks.get(name)
+        return None if mask is None else mask[:self._size]
+
+    def columns(self):
+
+        """ columns
+
+            Dict of field name → column view, in field order.
+        """
+
+        return {name: self._columns[name][:self._size] for name in self.fields}
+
+    def __getitem__(self, i):
+
+        """ Rebuild row i as a result_cls instance. """
+
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError(
+                "ResultCollector: row {} out of range for {} rows".format(
+                    i, self._size
+                )
+            )
+        values = {}
+        for name in self.fields:
+            mask = self._masks.get(name)
+            if mask is not None and mask[i]:
+                values[name] = None
+            else:
+                value = self._columns[name][i]
+                values[name] = value.item() if isinstance(value, np.generic) else value
+        return self.result_cls(**values)
+
+    # ─── Export ─────────────────────────────────────────────────────────────
+
+    def to_pandas(self):
+
+        """ to_pandas
+
+            DataFrame with one column per field. Optional numeric
+            fields become pandas nullable arrays (Float64 / Int64 /
+            boolean) over the collector's own value and mask buffers.
+
+            Returns
+            -------
+            pandas.DataFrame
+        """
+
+        import pandas as pd
+
+        data = {}
+        for name in self.fields:
+            values = self._columns[name][:self._size]
+            mask = self._masks.get(name)
+            if mask is not None:
+                values = _nullable_array(pd, values, mask[:self._size])
+            data[name] = values
+        return pd.DataFrame(data, copy = False)
+
+    def to_arrow(self):
+
+        """ to_arrow
+
+            pyarrow Table with one column per field; Optional fields
+            carry nulls where the value was None. Numeric columns
+            without a mask are handed over without copying.
+
+            Returns
+            -------
+            pyarrow.Table
+
+            Raises
+            ------
+            ImportError
+                If pyarrow is not installed.
+        """
+
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(
+                "ResultCollector.to_arrow requires pyarrow: "
+                "pip install pyarrow"
+            ) from e
+
+        arrays = []
+        for name in self.fields:
+            values = self._columns[name][:self._size]
+            mask = self._masks.get(name)
+            if mask is not None:
+                arrays.append(pa.array(values, mask = mask[:self._size]))
+            elif values.dtype == object:
+                arrays.append(pa.array(values.tolist()))
+            else:
+                arrays.append(pa.array(values))
+        return pa.Table.from_arrays(arrays, names = list(self.fields))
+
+    def _check_field(self, name):
+        if name not in self._columns:
+            raise KeyError(
+                "ResultCollector: {} has no field {!r}".format(
+                    self.result_cls.__name__, name
+                )
+            )
+
+
+def _column_type(annotation):
+    """(dtype, optional) for a field annotation."""
+    optional = False
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        optional = len(args) < len(typing.get_args(annotation))
+        annotation = args[0] if len(args) == 1 else object
+    dtype = _NUMERIC_DTYPES.get(annotation)
+    if dtype is None:
+        # Object columns hold None as-is; no mask needed.
+        return object, False
+    return dtype, optional
+
+
+def _nullable_array(pd, values, mask):
+    if values.dtype == np.float64:
+        return pd.arrays.FloatingArray(values, mask)
+    if values.dtype == np.int64:
+        return pd.arrays.IntegerArray(values, mask)
+    return pd.arrays.BooleanArray(values, mask)
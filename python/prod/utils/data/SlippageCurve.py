@@ -0,0 +1,60 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class SlippageCurve:
+    """Slippage and price impact across a grid of trade sizes.
+
+    Produced by CalculateSlippage.curve. Same semantics as
+    SlippageAnalysis, one array element per trade size — element i of
+    every column describes amount_in[i] — plus the largest trade that
+    stays within each of a set of slippage targets.
+
+    Attributes
+    ----------
+    spot_price : float
+        Pre-trade price of token_in in token_out units.
+    amount_in : np.ndarray
+        Trade sizes, in token_in human units, as passed in.
+    execution_price : np.ndarray
+        amount_out / amount_in per trade size.
+    slippage_pct : np.ndarray
+        (spot_price - execution_price) / spot_price per trade size.
+    slippage_cost : np.ndarray
+        amount_in * spot_price - amount_out, in token_out units.
+    price_impact_pct : np.ndarray
+        Fractional move of the pool's spot price per trade size.
+    slippage_targets : np.ndarray
+        Slippage fractions the max sizes were solved for.
+    max_size : np.ndarray
+        Largest amount_in keeping slippage_pct at or below each target;
+        0.0 where the target is at or below the fee rate.
+    """
+    spot_price: float
+    amount_in: np.ndarray
+    execution_price: np.ndarray
+    slippage_pct: np.ndarray
+    slippage_cost: np.ndarray
+    price_impact_pct: np.ndarray
+    slippage_targets: np.ndarray
+    max_size: np.ndarray
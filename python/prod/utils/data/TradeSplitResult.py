@@ -0,0 +1,67 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class TradeSplitResult:
+    """ Structured result of OptimalTradeSplit primitive.
+
+        Non-mutating projection of splitting one exact-input order
+        across several pools of the same pair. Per-pool lists follow
+        the order the pools were passed in.
+
+        Attributes
+        ----------
+        token_in_name : str
+            Symbol of the token sold.
+        token_out_name : str
+            Symbol of the token bought.
+        amount_in : float
+            Total input, in human units.
+        amounts_in : List[float]
+            Input routed to each pool; sums to amount_in. 0.0 for pools
+            whose best price is below the common marginal price.
+        amounts_out : List[float]
+            Output each pool returns for its share, from the pool's
+            own quote. In human units.
+        total_out : float
+            Sum of amounts_out.
+        marginal_price : float
+            The common marginal rate (token_out per unit token_in, fee
+            included) every used pool is left at.
+        execution_price : float
+            total_out / amount_in.
+        best_single_pool_out : float
+            Output of routing the whole order to the best single pool.
+        improvement_pct : float
+            (total_out - best_single_pool_out) / best_single_pool_out.
+            >= 0 up to solver tolerance.
+    """
+    token_in_name: str
+    token_out_name: str
+    amount_in: float
+    amounts_in: List[float]
+    amounts_out: List[float]
+    total_out: float
+    marginal_price: float
+    execution_price: float
+    best_single_pool_out: float
+    improvement_pct: float
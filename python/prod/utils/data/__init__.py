@@ -3,7 +3,9 @@ from uniswappy.utils.data import *
 # Primitive result types (Tier 2)
 from .PositionAnalysis import PositionAnalysis
 from .PriceMoveScenario import PriceMoveScenario
+from .PriceMoveScenarioBatch import PriceMoveScenarioBatch
 from .SlippageAnalysis import SlippageAnalysis
+from .SlippageCurve import SlippageCurve
 from .TickRangeStatus import TickRangeStatus
 from .BreakEvenAlphas import BreakEvenAlphas
 from .BreakEvenTime import BreakEvenTime
@@ -17,6 +19,8 @@ from .FeeAnomalyResult import FeeAnomalyResult
 from .FeeTierCandidate import FeeTierCandidate
 from .FeeTierComparison import FeeTierMetrics, FeeTierComparison
 from .DepositSplitResult import DepositSplitResult
+from .DepositSplitBatch import DepositSplitBatch
+from .TradeSplitResult import TradeSplitResult
 from .RebalanceCostReport import RebalanceCostReport
 from .TickRangeCandidate import TickRangeCandidate
 from .TickRangeEvaluation import TickRangeEvaluation, RangeMetrics
@@ -25,3 +29,9 @@ from .BalancerPositionAnalysis import BalancerPositionAnalysis
 from .StableswapPositionAnalysis import StableswapPositionAnalysis
 from .BalancerPriceMoveScenario import BalancerPriceMoveScenario
 from .StableswapPriceMoveScenario import StableswapPriceMoveScenario
+
+# Columnar collection of any of the above
+from .ResultCollector import ResultCollector
+
+# Slotted variants of the result types
+from .CompactResult import compact_class, to_compact, from_compact
@@ -1,2 +1,3 @@
 from uniswappy.utils.tools import *
-from .UniswapScriptHelper import UniswapScriptHelper
\ No newline at end of file
+from .UniswapScriptHelper import UniswapScriptHelper
+from .v3.TickIndex import TickIndex
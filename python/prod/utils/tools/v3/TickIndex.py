@@ -0,0 +1,637 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import numpy as np
+
+from uniswappy.utils.data import UniswapExchangeData
+
+
+_Q96 = 2 ** 96
+
+# V3 fees are quoted in hundredths of a bip (3000 = 0.3%).
+_FEE_DENOM = 1_000_000
+
+# uniswappy's V3 exchanges store liquidity as 18-decimal fixed point
+# unless built with TYPE_GWEI precision (see convert_to_human).
+_GWEI_SCALE = 1e-18
+
+
+class TickIndex:
+
+    """ Sorted, array-backed index of a V3 pool's initialized ticks.
+
+        Parallel NumPy arrays — `ticks`, `liquidity_net`, `sqrt_price`
+        (human sqrt price at each tick) and `liquidity` (active
+        liquidity from each tick up to the next) — plus prefix sums of
+        the token amounts each tick interval holds. Next-initialized-tick
+        lookup is a binary search, and an exact-input swap quote across
+        any number of ticks is two binary searches and a handful of
+        float ops, against uniswappy's swap loop which re-sorts the tick
+        dict on every step.
+
+        Quotes are in the twin's human units, with the fee charged on
+        the input the way SwapMath.computeSwapStep charges it. The index
+        is a snapshot of the tick table: rebuild it after the pool's
+        liquidity changes. Price moves don't invalidate it — quotes take
+        the current sqrt price as an argument.
+
+        Parameters
+        ----------
+        ticks : array-like of int
+            Initialized ticks, any order, no duplicates.
+        liquidity_net : array-like of float
+            liquidityNet at each tick, in human units.
+
+        Raises
+        ------
+        ValueError
+            If the arrays are empty, differ in length, or `ticks` has
+            duplicates.
+    """
+
+    def __init__(self, ticks, liquidity_net):
+        ticks = np.asarray(ticks, dtype = np.int64).ravel()
+        liquidity_net = np.asarray(liquidity_net, dtype = np.float64).ravel()
+        if len(ticks) == 0 or len(ticks) != len(liquidity_net):
+            raise ValueError(
+                "TickIndex: need matching, non-empty ticks and "
+                "liquidity_net; got {} and {}".format(
+                    len(ticks), len(liquidity_net)
+                )
+            )
+        order = np.argsort(ticks, kind = "stable")
+        ticks = ticks[order]
+        if np.any(ticks[1:] == ticks[:-1]):
+            raise ValueError("TickIndex: duplicate ticks")
+
+        self.ticks = ticks
+        self.liquidity_net = liquidity_net[order]
+        self.sqrt_price = np.power(1.0001, ticks / 2.0)
+        # liquidity[i] is active over [ticks[i], ticks[i + 1]); the last
+        # entry is what's left above the top tick (zero for a complete
+        # table). Clamped at zero against float residue.
+        self.liquidity = np.maximum(np.cumsum(self.liquidity_net), 0.0)
+
+        # Token amounts held by the intervals, end to end. Crossing
+        # intervals j..k-1 moves _sfx0[j] - _sfx0[k] of token0 and
+        # _cum1[k] - _cum1[j] of token1. token0 sums run down from the
+        # top tick and token1 sums up from the bottom one, so each is
+        # anchored where its amounts are small: an interval near the
+        # minimum tick holds ~1e19x more token0 than one near the price,
+        # and would swamp a bottom-anchored sum.
+        lo, hi = self.sqrt_price[:-1], self.sqrt_price[1:]
+        held = self.liquidity[:-1]
+        amount0 = held * (1.0 / lo - 1.0 / hi)
+        self._sfx0 = np.concatenate((np.cumsum(amount0[::-1])[::-1], [0.0]))
+        self._cum1 = np.concatenate(([0.0], np.cumsum(held * (hi - lo))))
+        # Ascending copy for binary search.
+        self._neg_sfx0 = -self._sfx0
+
+    def __len__(self):
+        return len(self.ticks)
+
+    @classmethod
+    def from_lp(cls, lp):
+
+        """ from_lp
+
+            Index a uniswappy V3 exchange's tick table.
+
+            Parameters
+            ----------
+            lp : UniswapV3Exchange
+                V3 exchange (a built twin or any uniswappy V3 pool).
+
+            Returns
+            -------
+            TickIndex
+
+            Raises
+            ------
+            ValueError
+                If lp is not V3 or has no initialized ticks.
+        """
+
+        if lp.version != UniswapExchangeData.VERSION_V3:
+            raise ValueError(
+                "TickIndex: lp must be a V3 exchange; got version {!r}"
+                .format(lp.version)
+            )
+        n = len(lp.ticks)
+        ticks = np.fromiter(lp.ticks.keys(), dtype = np.int64, count = n)
+        nets = np.fromiter(
+            (info.liquidityNet for info in lp.ticks.values()),
+            dtype = np.float64, count = n,
+        )
+        if lp.precision != UniswapExchangeData.TYPE_GWEI:
+            nets *= _GWEI_SCALE
+        return cls(ticks, nets)
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+
+        """ from_snapshot
+
+            Index a V3PoolSnapshot's tick table (LiveProvider
+            `tick_words=N` reads).
+
+            Raises
+            ------
+            ValueError
+                If the snapshot carries no tick table.
+        """
+
+        if getattr(snapshot, "tick_indices", None) is None:
+            raise ValueError(
+                "TickIndex: snapshot has no tick table; read it with "
+                "LiveProvider.snapshot(..., tick_words=N)"
+            )
+        return cls(snapshot.tick_indices, snapshot.tick_liquidity_net)
+
+    @staticmethod
+    def has_tick_table(lp):
+
+        """ has_tick_table
+
+            True when lp is a V3 exchange whose liquidity changes inside
+            the range a trade can cross — more initialized ticks than
+            the two a single position makes. Primitives quote such
+            pools through a TickIndex instead of the in-tick LPQuote.
+        """
+
+        return (lp.version == UniswapExchangeData.VERSION_V3
+                and len(lp.ticks) > 2)
+
+    # ─── Lookups ────────────────────────────────────────────────────────────
+
+    def next_initialized_tick(self, tick, lte):
+
+        """ next_initialized_tick
+
+            Nearest initialized tick at or below `tick` (lte=True) or
+            strictly above it (lte=False) — the search uniswappy's
+            nextTick does — or None when there is none.
+        """
+
+        if lte:
+            i = np.searchsorted(self.ticks, tick, side = "right") - 1
+            return int(self.ticks[i]) if i >= 0 else None
+        i = np.searchsorted(self.ticks, tick, side = "right")
+        return int(self.ticks[i]) if i < len(self.ticks) else None
+
+    def liquidity_at(self, sqrt_price):
+
+        """ liquidity_at
+
+            Active liquidity at a human sqrt price.
+        """
+
+        k = self._interval(sqrt_price)
+        return float(self.liquidity[k]) if k >= 0 else 0.0
+
+    def _interval(self, sqrt_price):
+        # Index i with sqrt_price[i] <= s < sqrt_price[i + 1]; -1 below
+        # the first tick.
+        return int(np.searchsorted(self.sqrt_price, sqrt_price, side = "right")) - 1
+
+    # ─── Quotes ─────────────────────────────────────────────────────────────
+
+    def quote(self, lp, token_in, amount_in):
+
+        """ quote
+
+            Exact-input quote against lp's current price and fee tier.
+
+            Parameters
+            ----------
+            lp : UniswapV3Exchange
+                The exchange this index was built from.
+            token_in : ERC20
+                Token sold; must be lp.token0 or lp.token1.
+            amount_in : float
+                Amount of token_in, in human units.
+
+            Returns
+            -------
+            tuple
+                (amount_out, sqrt_price_after) — token_out received and
+                the human sqrt price (token1 per token0) after the
+                trade.
+        """
+
+        if token_in.token_name not in (lp.token0, lp.token1):
+            raise ValueError(
+                "TickIndex: token_in {!r} is not in lp's pair ({!r}, {!r})"
+                .format(token_in.token_name, lp.token0, lp.token1)
+            )
+        return self.swap(
+            amount_in,
+            token_in.token_name == lp.token0,
+            lp.slot0.sqrtPriceX96 / _Q96,
+            lp.fee,
+        )
+
+    def swap(self, amount_in, zero_for_one, sqrt_price, fee = 3000):
+
+        """ swap
+
+            Exact-input swap across the indexed ticks, without mutating
+            anything.
+
+            Parameters
+            ----------
+            amount_in : float
+                Input amount in human units, fee included. Must be > 0.
+            zero_for_one : bool
+                True to sell token0 (price falls), False to sell token1.
+            sqrt_price : float
+                Starting human sqrt price (token1 per token0).
+            fee : int
+                Pool fee in hundredths of a bip (3000 = 0.3%).
+
+            Returns
+            -------
+            tuple
+                (amount_out, sqrt_price_after). A trade larger than the
+                indexed liquidity on its side returns everything that
+                side holds, with the price stopped at the outermost
+                tick.
+        """
+
+        if amount_in <= 0:
+            raise ValueError(
+                "TickIndex: amount_in must be > 0; got {}".format(amount_in)
+            )
+        x = amount_in * (_FEE_DENOM - fee) / _FEE_DENOM
+        k = self._interval(sqrt_price)
+        if zero_for_one:
+            return self._swap_down(x, k, sqrt_price)
+        return self._swap_up(x, k, sqrt_price)
+
+    def _swap_down(self, x, k, s):
+        # token0 in, token1 out; walk intervals k, k-1, ... 0.
+        if k < 0:
+            return 0.0, s
+        sp, sfx0, cum1 = self.sqrt_price, self._sfx0, self._cum1
+        L = self.liquidity[k]
+        first_in = L * (1.0 / sp[k] - 1.0 / s)
+        first_out = L * (s - sp[k])
+        if x <= first_in:
+            b = 1.0 / (1.0 / s + x / L)
+            return float(L * (s - b)), float(b)
+
+        # Exhausted inside interval j:
+        # sfx0[j + 1] < sfx0[k] + rest <= sfx0[j].
+        rest = x - first_in
+        j = int(np.searchsorted(
+            self._neg_sfx0, -(sfx0[k] + rest), side = "right",
+        )) - 1
+        if j < 0:
+            return float(first_out + cum1[k]), float(sp[0])
+        r = rest - (sfx0[j + 1] - sfx0[k])
+        L = self.liquidity[j]
+        a = sp[j + 1]
+        b = 1.0 / (1.0 / a + r / L)
+        out = first_out + (cum1[k] - cum1[j + 1]) + L * (a - b)
+        return float(out), float(b)
+
+    def _swap_up(self, x, k, s):
+        # token1 in, token0 out; walk intervals k, k+1, ...
+        sp, sfx0, cum1 = self.sqrt_price, self._sfx0, self._cum1
+        n = len(sp)
+        if k < 0:
+            # No liquidity below the first tick: the price reaches it
+            # for free.
+            k, s = 0, sp[0]
+        L = self.liquidity[k]
+        if k == n - 1:
+            if L <= 0:
+                return 0.0, float(s)
+            b = s + x / L
+            return float(L * (1.0 / s - 1.0 / b)), float(b)
+        first_in = L * (sp[k + 1] - s)
+        first_out = L * (1.0 / s - 1.0 / sp[k + 1])
+        if x <= first_in:
+            b = s + x / L
+            return float(L * (1.0 / s - 1.0 / b)), float(b)
+
+        # Exhausted inside interval j: cum1[j] <= cum1[k + 1] + rest < cum1[j + 1].
+        rest = x - first_in
+        j = int(np.searchsorted(cum1, cum1[k + 1] + rest, side = "right")) - 1
+        out = first_out + (sfx0[k + 1] - sfx0[j])
+        r = rest - (cum1[j] - cum1[k + 1])
+        L = self.liquidity[j]
+        if L <= 0:
+            # Past the top tick of a complete table.
+            return float(out), float(sp[j])
+        a = sp[j]
+        b = a + r / L
+        return float(out + L * (1.0 / a - 1.0 / b)), float(b)
+
+    @staticmethod
+    def in_tick_quote(lp, token_in, amount_in):
+
+        """ in_tick_quote
+
+            Exact-input quote inside lp's active interval at lp's fee
+            tier: LPQuote's in-tick V3 quote (which always charges
+            0.3%) at the pool's own fee. Tick crossings are ignored, so
+            it needs no index; amount_in may be an array.
+
+            Returns
+            -------
+            tuple
+                (amount_out, sqrt_price_after), as quote().
+        """
+
+        if token_in.token_name not in (lp.token0, lp.token1):
+            raise ValueError(
+                "TickIndex: token_in {!r} is not in lp's pair ({!r}, {!r})"
+                .format(token_in.token_name, lp.token0, lp.token1)
+            )
+        L = lp.get_liquidity()
+        s = lp.slot0.sqrtPriceX96 / _Q96
+        x = amount_in * (_FEE_DENOM - lp.fee) / _FEE_DENOM
+        if token_in.token_name == lp.token0:
+            b = L * s / (L + x * s)
+            return L * (s - b), b
+        b = s + x / L
+        return L * (1.0 / s - 1.0 / b), b
+
+    # ─── Batch quotes ───────────────────────────────────────────────────────
+
+    def quote_batch(self, lp, token_in, amounts_in):
+
+        """ quote_batch
+
+            Vectorized quote(): one exact-input quote per element of
+            amounts_in, all from lp's current price.
+
+            Returns
+            -------
+            tuple
+                (amounts_out, sqrt_prices_after) — arrays shaped like
+                amounts_in.
+        """
+
+        if token_in.token_name not in (lp.token0, lp.token1):
+            raise ValueError(
+                "TickIndex: token_in {!r} is not in lp's pair ({!r}, {!r})"
+                .format(token_in.token_name, lp.token0, lp.token1)
+            )
+        return self.swap_batch(
+            amounts_in,
+            token_in.token_name == lp.token0,
+            lp.slot0.sqrtPriceX96 / _Q96,
+            lp.fee,
+        )
+
+    def swap_batch(self, amounts_in, zero_for_one, sqrt_price, fee = 3000):
+
+        """ swap_batch
+
+            Vectorized swap(): every element of amounts_in is an
+            independent trade from sqrt_price. Each is located in the
+            tick table by one searchsorted over the whole batch, so a
+            curve of many sizes costs about as much as a single quote.
+
+            Returns
+            -------
+            tuple
+                (amounts_out, sqrt_prices_after) — arrays shaped like
+                amounts_in.
+        """
+
+        amounts = np.asarray(amounts_in, dtype = np.float64)
+        if np.any(amounts <= 0):
+            raise ValueError(
+                "TickIndex: amount_in must be > 0; got min {}".format(
+                    amounts.min()
+                )
+            )
+        x = amounts.ravel() * (_FEE_DENOM - fee) / _FEE_DENOM
+        k = self._interval(sqrt_price)
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            if zero_for_one:
+                out, after = self._swap_down_batch(x, k, sqrt_price)
+            else:
+                out, after = self._swap_up_batch(x, k, sqrt_price)
+        return out.reshape(amounts.shape), after.reshape(amounts.shape)
+
+    def _swap_down_batch(self, x, k, s):
+        # Array form of _swap_down; np.where picks each trade's branch.
+        if k < 0:
+            return np.zeros_like(x), np.full_like(x, s)
+        sp, sfx0, cum1 = self.sqrt_price, self._sfx0, self._cum1
+        L = self.liquidity[k]
+        first_in = L * (1.0 / sp[k] - 1.0 / s)
+        first_out = L * (s - sp[k])
+
+        b_first = 1.0 / (1.0 / s + x / L)
+        out_first = L * (s - b_first)
+
+        rest = x - first_in
+        j = np.searchsorted(self._neg_sfx0, -(sfx0[k] + rest), side = "right") - 1
+        drained = j < 0
+        # Trades that stay inside interval k (rest < 0) search above it;
+        # their lanes are discarded below, so just keep them in bounds.
+        j = np.clip(j, 0, max(k - 1, 0))
+        r = rest - (sfx0[j + 1] - sfx0[k])
+        Lj = self.liquidity[j]
+        a = sp[j + 1]
+        b = 1.0 / (1.0 / a + r / Lj)
+        out = first_out + (cum1[k] - cum1[j + 1]) + Lj * (a - b)
+        out = np.where(drained, first_out + cum1[k], out)
+        b = np.where(drained, sp[0], b)
+
+        inside = x <= first_in
+        return np.where(inside, out_first, out), np.where(inside, b_first, b)
+
+    def _swap_up_batch(self, x, k, s):
+        # Array form of _swap_up.
+        sp, sfx0, cum1 = self.sqrt_price, self._sfx0, self._cum1
+        n = len(sp)
+        if k < 0:
+            k, s = 0, sp[0]
+        L = self.liquidity[k]
+        b_first = s + x / L
+        out_first = L * (1.0 / s - 1.0 / b_first)
+        if k == n - 1:
+            if L <= 0:
+                return np.zeros_like(x), np.full_like(x, s)
+            return out_first, b_first
+        first_in = L * (sp[k + 1] - s)
+        first_out = L * (1.0 / s - 1.0 / sp[k + 1])
+
+        rest = x - first_in
+        j = np.searchsorted(cum1, cum1[k + 1] + rest, side = "right") - 1
+        j = np.minimum(j, n - 1)
+        out = first_out + (sfx0[k + 1] - sfx0[j])
+        r = rest - (cum1[j] - cum1[k + 1])
+        Lj = self.liquidity[j]
+        a = sp[j]
+        b = a + r / Lj
+        drained = Lj <= 0
+        out = np.where(drained, out, out + Lj * (1.0 / a - 1.0 / b))
+        b = np.where(drained, a, b)
+
+        inside = x <= first_in
+        return np.where(inside, out_first, out), np.where(inside, b_first, b)
+
+    # ─── Depth ──────────────────────────────────────────────────────────────
+
+    def amount_in_to(self, sqrt_target, zero_for_one, sqrt_price, fee = 3000):
+
+        """ amount_in_to
+
+            Exact input, fee included, that moves the price from
+            sqrt_price to sqrt_target — the inverse of swap() for a
+            target price. 0.0 when sqrt_target lies on the other side
+            of sqrt_price. Past the outermost tick the remaining side
+            is drained, so further moves cost nothing more.
+        """
+
+        g = (_FEE_DENOM - fee) / _FEE_DENOM
+        if zero_for_one:
+            if sqrt_target >= sqrt_price:
+                return 0.0
+            return (self._token0_above(sqrt_target) - self._token0_above(sqrt_price)) / g
+        if sqrt_target <= sqrt_price:
+            return 0.0
+        return (self._token1_below(sqrt_target) - self._token1_below(sqrt_price)) / g
+
+    def _token0_above(self, q):
+        # token0 held from sqrt price q up to the top tick (negative
+        # above it, where only liquidity[-1] remains).
+        i = self._interval(q)
+        if i < 0:
+            return float(self._sfx0[0])
+        top = min(i + 1, len(self.ticks) - 1)
+        return float(self._sfx0[top] + self.liquidity[i] * (1.0 / q - 1.0 / self.sqrt_price[top]))
+
+    def _token1_below(self, q):
+        # token1 held from the bottom tick up to sqrt price q.
+        i = self._interval(q)
+        if i < 0:
+            return 0.0
+        return float(self._cum1[i] + self.liquidity[i] * (q - self.sqrt_price[i]))
+
+    def max_amount_in(self, slippage_targets, zero_for_one, sqrt_price,
+                      fee = 3000):
+
+        """ max_amount_in
+
+            Largest exact-input trade whose execution price stays within
+            each slippage target of spot, solved segment by segment.
+
+            Slippage — 1 - amount_out / (amount_in * spot) — only grows
+            with trade size, so the boundary ticks are scanned once to
+            find the interval where each target is crossed; inside it
+            the pool is a constant-product curve on virtual reserves
+            (L / √P, L·√P) and the crossing point is a quadratic root.
+
+            Parameters
+            ----------
+            slippage_targets : array_like
+                Target slippage fractions, each in (0, 1).
+            zero_for_one : bool
+                True to sell token0, False to sell token1.
+            sqrt_price : float
+                Starting human sqrt price (token1 per token0).
+            fee : int
+                Pool fee in hundredths of a bip (3000 = 0.3%).
+
+            Returns
+            -------
+            np.ndarray
+                Maximum amount_in per target, fee included, in human
+                units; 0.0 for targets at or below the fee rate.
+        """
+
+        targets = np.asarray(slippage_targets, dtype = np.float64)
+        g = (_FEE_DENOM - fee) / _FEE_DENOM
+        spot, I, O, Rin, Rout = self._segments(zero_for_one, sqrt_price)
+
+        # Slippage at each segment's start; the first is the fee alone.
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            slip = np.where(I > 0, 1.0 - g * O / (I * spot), 1.0 - g)
+        slip = np.maximum.accumulate(slip)
+        seg = np.searchsorted(slip, targets.ravel(), side = "right") - 1
+        seg = np.maximum(seg, 0)
+
+        # Post-fee input r into segment `seg` where
+        # O + Rout·r / (Rin + r) = c·(I + r), c = spot·(1 - s) / g:
+        #   c·r² + (c·(I + Rin) - O - Rout)·r + Rin·(c·I - O) = 0.
+        c = spot * (1.0 - targets.ravel()) / g
+        Ip, Op, Ri, Ro = I[seg], O[seg], Rin[seg], Rout[seg]
+        a1 = c * (Ip + Ri) - Op - Ro
+        a0 = Ri * (c * Ip - Op)
+        root = np.sqrt(np.maximum(a1 * a1 - 4.0 * c * a0, 0.0))
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            r = np.where(a1 > 0, -2.0 * a0 / (a1 + root), (root - a1) / (2.0 * c))
+        sizes = np.maximum(Ip + np.nan_to_num(r), 0.0) / g
+        sizes = np.where(targets.ravel() <= 1.0 - g, 0.0, sizes)
+        return sizes.reshape(targets.shape)
+
+    def _segments(self, zero_for_one, s):
+
+        """ _segments
+
+            Constant-liquidity segments a trade from sqrt price s walks
+            through, in order: (spot, I, O, Rin, Rout), where I and O
+            are the post-fee input and the output accumulated before
+            each segment, and Rin / Rout its virtual reserves on entry.
+            The last segment is what lies past the outermost tick.
+        """
+
+        sp, sfx0, cum1, liq = self.sqrt_price, self._sfx0, self._cum1, self.liquidity
+        k = self._interval(s)
+        if zero_for_one:
+            spot = s * s
+            if k < 0:
+                entry = np.array([s])
+                L = np.zeros(1)
+                I = O = np.zeros(1)
+            else:
+                # Start, then boundaries sp[k], sp[k - 1], ... sp[0].
+                first_in = liq[k] * (1.0 / sp[k] - 1.0 / s)
+                first_out = liq[k] * (s - sp[k])
+                idx = np.arange(k, -1, -1)
+                entry = np.concatenate(([s], sp[idx]))
+                L = np.concatenate(([liq[k]], np.where(idx > 0, liq[idx - 1], 0.0)))
+                I = np.concatenate(([0.0], first_in + sfx0[idx] - sfx0[k]))
+                O = np.concatenate(([0.0], first_out + cum1[k] - cum1[idx]))
+            return spot, I, O, L / entry, L * entry
+
+        spot = 1.0 / (s * s)
+        if k < 0:
+            k, s = 0, sp[0]
+        if k == len(sp) - 1:
+            entry = np.array([s])
+            L = liq[k:]
+            I = O = np.zeros(1)
+        else:
+            # Start, then boundaries sp[k + 1], ... sp[n - 1].
+            first_in = liq[k] * (sp[k + 1] - s)
+            first_out = liq[k] * (1.0 / s - 1.0 / sp[k + 1])
+            idx = np.arange(k + 1, len(sp))
+            entry = np.concatenate(([s], sp[idx]))
+            L = np.concatenate(([liq[k]], liq[idx]))
+            I = np.concatenate(([0.0], first_in + cum1[idx] - cum1[k + 1]))
+            O = np.concatenate(([0.0], first_out + sfx0[k + 1] - sfx0[idx]))
+        return spot, I, O, L * entry, L / entry
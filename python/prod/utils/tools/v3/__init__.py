@@ -1 +1,2 @@
-from uniswappy.utils.tools.v3 import *
\ No newline at end of file
+from uniswappy.utils.tools.v3 import *
+from .TickIndex import TickIndex
@@ -0,0 +1,111 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""HTTP / SSE transports and the pre-forked multi-worker launcher."""
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+import defipy_mcp_server as srv  # noqa: E402 — resolved via local conftest
+
+
+def test_parse_args_defaults_to_stdio():
+    args = srv._parse_args([])
+    assert (args.transport, args.workers, args.stateless) == ("stdio", 1, False)
+
+
+@pytest.mark.parametrize("argv", [
+    ["--workers", "0"],
+    ["--workers", "2"],                          # stdio can't fan out
+    ["--transport", "sse", "--workers", "2"],    # sessions pinned to a worker
+])
+def test_parse_args_rejects_bad_combinations(argv):
+    with pytest.raises(SystemExit):
+        srv._parse_args(argv)
+
+
+@pytest.mark.parametrize("transport", ["http", "sse"])
+def test_healthz_reports_worker_and_cache_stats(transport):
+    from starlette.testclient import TestClient
+    with TestClient(srv._build_http_app(transport)) as client:
+        body = client.get("/healthz").json()
+    assert body["status"] == "ok"
+    assert body["transport"] == transport
+    assert body["pid"] == os.getpid()
+    assert "hits" in body["twin_cache"]
+
+
+def test_build_http_app_rejects_unknown_transport():
+    with pytest.raises(ValueError):
+        srv._build_http_app("websocket")
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_preforked_workers_serve_tool_calls():
+    import httpx
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamable_http_client
+
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, srv.__file__, "--transport", "http",
+         "--port", str(port), "--workers", "2"],
+        stderr = subprocess.DEVNULL,
+    )
+    base = "http://127.0.0.1:{}".format(port)
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                if httpx.get(base + "/healthz", timeout = 1).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            assert proc.poll() is None and time.monotonic() < deadline
+            time.sleep(0.2)
+
+        async def call():
+            async with streamable_http_client(base + "/mcp") as (r, w, _):
+                async with ClientSession(r, w) as session:
+                    await session.initialize()
+                    tools = await session.list_tools()
+                    result = await session.call_tool(
+                        "CheckPoolHealth", {"pool_id": "eth_dai_v2"})
+                    return len(tools.tools), json.loads(result.content[0].text)
+
+        n_tools, payload = asyncio.run(call())
+        assert n_tools == 11                # 10 registry tools + RunBatch
+        assert payload["version"] == "V2"
+        # Workers are pre-warmed: the recipe twins were built before fork.
+        assert httpx.get(base + "/healthz").json()["twin_cache"]["size"] == 4
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        assert proc.wait(timeout = 30) == 0
@@ -0,0 +1,185 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Live "<protocol>:<address>" pools in the MCP server, against the
+FakeRpcClient from python/test/twin/_fake_rpc.py."""
+
+import asyncio
+import json
+import re
+import threading
+import time
+
+import pytest
+
+import defipy_mcp_server as srv  # noqa: E402 — resolved via local conftest
+from defipy.twin import LiveProvider, MockProvider, SnapshotCache, StateTwinBuilder
+
+from twin._fake_rpc import (
+    build_fake_client,
+    canonical_weth_usdc_v2_spec,
+    canonical_weth_usdc_token_specs,
+    WETH_USDC_V2_POOL,
+)
+
+
+V2_POOL_ID = "uniswap_v2:{}".format(WETH_USDC_V2_POOL)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class _Session:
+    """Stand-in for an MCP ServerSession (only identity matters)."""
+
+
+@pytest.fixture
+def live(monkeypatch):
+    client = build_fake_client(
+        pool = canonical_weth_usdc_v2_spec(),
+        tokens = canonical_weth_usdc_token_specs(),
+        latest_block = 19_500_000,
+    )
+    provider = LiveProvider._with_client(client, cache = SnapshotCache())
+    pools = srv._PoolProvider(MockProvider(), provider)
+    monkeypatch.setattr(srv, "_POOLS", pools)
+    monkeypatch.setattr(srv, "_TWINS", srv._TwinCache(pools, StateTwinBuilder()))
+    monkeypatch.setattr(srv, "_PINS", srv._BlockPins())
+    return client
+
+
+def _receipts(capsys):
+    return [json.loads(ln) for ln in capsys.readouterr().err.splitlines() if ln]
+
+
+def test_live_pool_call_reads_through_live_provider(live, capsys):
+    result = _run(srv.call_tool("CheckPoolHealth", {"pool_id": V2_POOL_ID}))
+    payload = json.loads(result[0].text)
+    assert payload["version"] == "V2"
+    event = _receipts(capsys)[-1]
+    assert event["status"] == "ok"
+    assert event["block_number"] == 19_500_000
+
+
+def test_live_pool_resolves_token_names(live):
+    result = _run(srv.call_tool("CalculateSlippage", {
+        "pool_id": V2_POOL_ID, "token_in_name": "USDC", "amount_in": 1000.0,
+    }))
+    assert json.loads(result[0].text)["slippage_pct"] > 0
+
+
+def test_session_stays_pinned_while_chain_head_moves(live, capsys):
+    first, second = _Session(), _Session()
+    _run(srv.call_tool("CheckPoolHealth", {"pool_id": V2_POOL_ID},
+                       session = first))
+    live.get_w3()._latest_block = 19_500_007
+    _run(srv.call_tool("DetectRugSignals", {"pool_id": V2_POOL_ID},
+                       session = first))
+    _run(srv.call_tool("CheckPoolHealth", {"pool_id": V2_POOL_ID},
+                       session = second))
+    blocks = [e["block_number"] for e in _receipts(capsys)[-3:]]
+    assert blocks == [19_500_000, 19_500_000, 19_500_007]
+
+    srv._PINS.unpin(first)
+    _run(srv.call_tool("CheckPoolHealth", {"pool_id": V2_POOL_ID},
+                       session = first))
+    assert _receipts(capsys)[-1]["block_number"] == 19_500_007
+
+
+def test_batch_reads_live_pools_at_the_pinned_block(live, capsys):
+    session = _Session()
+    _run(srv.call_tool("CheckPoolHealth", {"pool_id": V2_POOL_ID},
+                       session = session))
+    live.get_w3()._latest_block = 19_500_007
+    result = _run(srv.call_tool("RunBatch", {
+        "tool": "CalculateSlippage",
+        "calls": [{"pool_id": V2_POOL_ID, "token_in_name": "USDC",
+                   "amount_in": a} for a in (100.0, 1000.0)],
+    }, session = session))
+    table = json.loads(result[0].text)
+    assert table["errors"] == 0
+    assert table["block_number"] == 19_500_000
+    assert _receipts(capsys)[-1]["block_number"] == 19_500_000
+
+
+def test_address_casing_shares_the_cached_twin(live, capsys):
+    _run(srv.call_tool("CheckPoolHealth", {"pool_id": V2_POOL_ID}))
+    shouted = "uniswap_v2:0x" + WETH_USDC_V2_POOL[2:].upper()
+    _run(srv.call_tool("CheckPoolHealth", {"pool_id": shouted}))
+    events = _receipts(capsys)[-2:]
+    assert [e["twin_cache"] for e in events] == ["miss", "hit"]
+    assert events[0]["pool_id"] == events[1]["pool_id"]
+
+
+def test_live_pool_compatibility_follows_protocol(live):
+    result = _run(srv.call_tool("AnalyzeBalancerPosition", {
+        "pool_id": V2_POOL_ID, "lp_init_amt": 1.0,
+        "entry_base_amt": 1, "entry_opp_amt": 1,
+    }))
+    assert "not compatible" in result[0].text
+    assert "balancer" in result[0].text
+    result = _run(srv.call_tool("CheckPoolHealth",
+                                {"pool_id": "sushiswap:0xabc"}))
+    assert "not compatible" in result[0].text
+
+
+def test_live_pool_without_rpc_url_is_an_error(monkeypatch):
+    pools = srv._PoolProvider(MockProvider())
+    monkeypatch.setattr(srv, "_POOLS", pools)
+    monkeypatch.setattr(srv, "_TWINS", srv._TwinCache(pools, StateTwinBuilder()))
+    result = _run(srv.call_tool("CheckPoolHealth", {"pool_id": V2_POOL_ID}))
+    assert "DEFIPY_MCP_RPC_URL" in result[0].text
+
+
+def test_schema_accepts_live_pool_ids_when_enabled(live):
+    wrapped = {w["name"]: w for w in srv._wrap_schemas_with_pool_id()}
+    prop = wrapped["CheckPoolHealth"]["inputSchema"]["properties"]["pool_id"]
+    assert "enum" not in prop
+    pattern = re.compile(prop["pattern"])
+    assert pattern.match(V2_POOL_ID)
+    assert pattern.match("eth_dai_v3")
+    assert not pattern.match("balancer:" + WETH_USDC_V2_POOL)
+    balancer = wrapped["AnalyzeBalancerPosition"]["inputSchema"][
+        "properties"]["pool_id"]
+    assert re.match(balancer["pattern"], "balancer:" + WETH_USDC_V2_POOL)
+
+
+def test_rpc_reads_are_limited(monkeypatch):
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    class SlowLive:
+        def snapshot(self, pool_id, **kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+    pools = srv._PoolProvider(MockProvider(), SlowLive(), max_rpc_reads = 2)
+    threads = [threading.Thread(target = pools.snapshot, args = (V2_POOL_ID,))
+               for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak[0] == 2
+    with pytest.raises(ValueError):
+        srv._PoolProvider(MockProvider(), max_rpc_reads = 0)
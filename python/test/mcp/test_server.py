@@ -174,7 +174,7 @@ def test_call_tool_strips_pool_id_from_primitive_args():
 def test_resolve_token_v2_path():
     from defipy.twin import MockProvider, StateTwinBuilder
     lp = StateTwinBuilder().build(MockProvider().snapshot("eth_dai_v2"))
-    tkn = srv._resolve_token(lp, "DAI")
+    tkn = srv.resolve_token(lp, "DAI")
     assert tkn is not None
     assert tkn.token_name == "DAI"
 
@@ -182,7 +182,7 @@ def test_resolve_token_v2_path():
 def test_resolve_token_v3_path():
     from defipy.twin import MockProvider, StateTwinBuilder
     lp = StateTwinBuilder().build(MockProvider().snapshot("eth_dai_v3"))
-    tkn = srv._resolve_token(lp, "ETH")
+    tkn = srv.resolve_token(lp, "ETH")
     assert tkn.token_name == "ETH"
 
 
@@ -190,7 +190,7 @@ def test_resolve_token_balancer_path():
     from defipy.twin import MockProvider, StateTwinBuilder
     lp = StateTwinBuilder().build(
         MockProvider().snapshot("eth_dai_balancer_50_50"))
-    tkn = srv._resolve_token(lp, "ETH")
+    tkn = srv.resolve_token(lp, "ETH")
     assert tkn.token_name == "ETH"
 
 
@@ -198,7 +198,7 @@ def test_resolve_token_stableswap_path():
     from defipy.twin import MockProvider, StateTwinBuilder
     lp = StateTwinBuilder().build(
         MockProvider().snapshot("usdc_dai_stableswap_A10"))
-    tkn = srv._resolve_token(lp, "USDC")
+    tkn = srv.resolve_token(lp, "USDC")
     assert tkn.token_name == "USDC"
 
 
@@ -206,7 +206,7 @@ def test_resolve_token_unknown_raises():
     from defipy.twin import MockProvider, StateTwinBuilder
     lp = StateTwinBuilder().build(MockProvider().snapshot("eth_dai_v2"))
     with pytest.raises(ValueError) as excinfo:
-        srv._resolve_token(lp, "NOPE")
+        srv.resolve_token(lp, "NOPE")
     assert "NOPE" in str(excinfo.value)
 
 
@@ -220,6 +220,18 @@ def test_summarizer_exists_for_every_registered_tool():
     assert not missing, "Missing summarizers for: {}".format(missing)
 
 
+def test_compact_results_serialize_and_summarize_identically():
+    from defipy.twin import MockProvider, StateTwinBuilder
+    from defipy.primitives.pool_health import CheckPoolHealth
+    from defipy.utils.data import to_compact
+    lp = StateTwinBuilder().build(MockProvider().snapshot("eth_dai_v3"))
+    result = CheckPoolHealth().apply(lp)
+    compact = to_compact(result)
+    assert srv._serialize_result(compact) == srv._serialize_result(result)
+    assert srv._summarize("CheckPoolHealth", compact) == \
+        srv._summarize("CheckPoolHealth", result)
+
+
 # ─── Receipt logging ──────────────────────────────────────────────────────
 
 
@@ -251,22 +263,287 @@ def test_receipt_emitted_on_error(capsys):
     assert "eth_dai_balancer_50_50" in event["error_message"]
 
 
-# ─── Fresh twin per call ──────────────────────────────────────────────────
-
-
-def test_call_tool_builds_fresh_twin_per_call():
-    # Invoke twice; the two internal lp objects must be distinct.
-    # We spy via MockProvider.snapshot returning distinct snapshot
-    # instances per call (Day 2 guarantee); separate build calls then
-    # yield separate lp instances.
-    from defipy.twin import MockProvider
-    p = MockProvider()
-    s1 = p.snapshot("eth_dai_v2")
-    s2 = p.snapshot("eth_dai_v2")
-    assert s1 is not s2
-    # Dispatch once to verify end-to-end freshness with builder
+# ─── Twin cache ───────────────────────────────────────────────────────────
+
+
+# One valid argument set per tool, on a pool the tool accepts.
+_TOOL_CALLS = {
+    "AnalyzePosition": ("eth_dai_v2", {
+        "lp_init_amt": 1.0, "entry_x_amt": 1000, "entry_y_amt": 100000}),
+    "AnalyzeBalancerPosition": ("eth_dai_balancer_50_50", {
+        "lp_init_amt": 1.0, "entry_base_amt": 1000, "entry_opp_amt": 100000}),
+    "AnalyzeStableswapPosition": ("usdc_dai_stableswap_A10", {
+        "lp_init_amt": 100.0, "entry_amounts": [50, 50]}),
+    "SimulatePriceMove": ("eth_dai_v2", {
+        "price_change_pct": -0.3, "position_size_lp": 1.0}),
+    "SimulateBalancerPriceMove": ("eth_dai_balancer_50_50", {
+        "price_change_pct": -0.3, "lp_init_amt": 1.0}),
+    "SimulateStableswapPriceMove": ("usdc_dai_stableswap_A10", {
+        "price_change_pct": -0.02, "lp_init_amt": 100.0}),
+    "CheckPoolHealth": ("eth_dai_v3", {}),
+    "DetectRugSignals": ("eth_dai_v3", {}),
+    "CalculateSlippage": ("eth_dai_v2", {
+        "token_in_name": "DAI", "amount_in": 1000.0}),
+    "AssessDepegRisk": ("usdc_dai_stableswap_A10", {
+        "lp_init_amt": 100.0, "depeg_token_name": "USDC"}),
+}
+
+
+def _twin_cache(max_size = 8):
+    from defipy.twin import MockProvider, StateTwinBuilder
+    return srv._TwinCache(MockProvider(), StateTwinBuilder(), max_size)
+
+
+@pytest.mark.parametrize("name", sorted(srv._READ_ONLY_TOOLS))
+def test_read_only_tools_leave_the_shared_twin_untouched(name, monkeypatch):
+    import pickle
+    cache = _twin_cache()
+    monkeypatch.setattr(srv, "_TWINS", cache)
+    pool_id, args = _TOOL_CALLS[name]
+    lp, _ = cache.checkout(pool_id, read_only = True)
+    before = pickle.dumps(lp)
+    result = _run(srv.call_tool(name, dict(args, pool_id = pool_id)))
+    assert not result[0].text.startswith("Error"), result[0].text
+    assert pickle.dumps(lp) == before
+
+
+def test_twin_cache_builds_once_and_shares_read_only_checkouts():
+    cache = _twin_cache()
+    lp1, status1 = cache.checkout("eth_dai_v2", read_only = True)
+    lp2, status2 = cache.checkout("eth_dai_v2", read_only = True)
+    assert (status1, status2) == ("miss", "hit")
+    assert lp1 is lp2
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_twin_cache_forks_writable_checkouts():
+    cache = _twin_cache()
+    shared, _ = cache.checkout("eth_dai_v2", read_only = True)
+    reserve = shared.reserve0
+    fork, status = cache.checkout("eth_dai_v2")
+    assert status == "hit" and fork is not shared
+    fork.reserve0 = reserve * 2
+    assert cache.checkout("eth_dai_v2", read_only = True)[0].reserve0 == reserve
+
+
+def test_twin_cache_evicts_least_recently_used():
+    cache = _twin_cache(max_size = 2)
+    cache.checkout("eth_dai_v2")
+    cache.checkout("eth_dai_v3")
+    cache.checkout("eth_dai_v2")
+    cache.checkout("eth_dai_balancer_50_50")     # evicts eth_dai_v3
+    assert cache.checkout("eth_dai_v2")[1] == "hit"
+    assert cache.checkout("eth_dai_v3")[1] == "miss"
+    assert cache.stats()["evictions"] == 2
+
+
+def test_twin_cache_disabled_and_invalidate():
+    off = _twin_cache(max_size = 0)
+    lp1, status = off.checkout("eth_dai_v2", read_only = True)
+    lp2, _ = off.checkout("eth_dai_v2", read_only = True)
+    assert status == "off" and lp1 is not lp2
+
+    cache = _twin_cache()
+    cache.checkout("eth_dai_v2")
+    cache.checkout("eth_dai_v3")
+    cache.invalidate("eth_dai_v2")
+    assert cache.stats()["size"] == 1
+    cache.invalidate()
+    assert cache.stats()["size"] == 0
+    with pytest.raises(ValueError):
+        _twin_cache(max_size = -1)
+
+
+def test_receipt_reports_twin_and_primitive_timings(capsys, monkeypatch):
+    monkeypatch.setattr(srv, "_TWINS", _twin_cache())
     _run(srv.call_tool("CheckPoolHealth", {"pool_id": "eth_dai_v2"}))
     _run(srv.call_tool("CheckPoolHealth", {"pool_id": "eth_dai_v2"}))
+    lines = [ln for ln in capsys.readouterr().err.splitlines() if ln]
+    first, second = json.loads(lines[-2]), json.loads(lines[-1])
+    assert (first["twin_cache"], second["twin_cache"]) == ("miss", "hit")
+    for event in (first, second):
+        assert set(event["timings_ms"]) == {"queue", "twin", "primitive"}
+        assert sum(event["timings_ms"].values()) <= event["duration_ms"] + 0.01
+
+
+# ─── Dispatcher ───────────────────────────────────────────────────────────
+
+
+def _slow_execute(name, pool_id, primitive_args, read_only, submitted_at,
+                  block_number = None):
+    import time
+    time.sleep(primitive_args.get("sleep", 0.3))
+    return {"result": name, "error": None, "timings": {}, "twin_cache": ""}
+
+
+async def _gather(*coros):
+    return await asyncio.gather(*coros, return_exceptions = True)
+
+
+def test_dispatcher_runs_calls_concurrently(monkeypatch):
+    import time
+    monkeypatch.setattr(srv, "_execute", _slow_execute)
+    d = srv._Dispatcher("thread", workers = 2)
+    t0 = time.monotonic()
+    a, b = _run(_gather(d.run("A", "p", {}, True, 0.0),
+                        d.run("B", "p", {}, True, 0.0)))
+    assert (a["result"], b["result"]) == ("A", "B")
+    assert time.monotonic() - t0 < 0.55
+    assert d.pending == 0
+    d.close()
+
+
+def test_dispatcher_thread_timeout_holds_slot_until_done(monkeypatch):
+    import time
+    monkeypatch.setattr(srv, "_execute", _slow_execute)
+    d = srv._Dispatcher("thread", timeout = 0.05, max_pending = 1)
+    with pytest.raises(asyncio.TimeoutError):
+        _run(d.run("A", "p", {}, True, 0.0))
+    # The runaway thread is still busy, so the queue is full.
+    assert d.pending == 1
+    with pytest.raises(srv._ServerBusy):
+        _run(d.run("B", "p", {}, True, 0.0))
+    time.sleep(0.4)
+    assert d.pending == 0
+    d.close()
+
+
+def test_dispatcher_per_tool_timeout(monkeypatch):
+    monkeypatch.setattr(srv, "_execute", _slow_execute)
+    d = srv._Dispatcher("thread", timeout = 0.05, timeouts = {"Slow": 5})
+    assert _run(d.run("Slow", "p", {}, True, 0.0))["result"] == "Slow"
+    assert d.timeout_for("Other") == 0.05
+    d.close()
+
+
+def test_dispatcher_process_timeout_kills_runaway(monkeypatch):
+    import time
+    monkeypatch.setattr(srv, "_execute", _slow_execute)
+    d = srv._Dispatcher("process", workers = 1, timeout = 0.5)
+    t0 = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        _run(d.run("A", "p", {"sleep": 30}, True, 0.0))
+    assert time.monotonic() - t0 < 5
+    assert d.pending == 0
+    # A fresh pool serves the next call.
+    assert _run(d.run("B", "p", {"sleep": 0}, True, 0.0))["result"] == "B"
+    d.close()
+
+
+def test_dispatcher_rejects_bad_config():
+    for kwargs in ({"mode": "fiber"}, {"workers": 0}, {"max_pending": 0},
+                   {"timeout": 0}, {"timeouts": {"A": -1}}):
+        with pytest.raises(ValueError):
+            srv._Dispatcher(**kwargs)
+    assert srv._env_timeouts("A=60, B=0.5") == {"A": 60.0, "B": 0.5}
+    assert srv._env_timeout("0") is None
+
+
+def test_call_tool_process_mode_end_to_end(monkeypatch):
+    d = srv._Dispatcher("process", workers = 1)
+    monkeypatch.setattr(srv, "_DISPATCHER", d)
+    result = _run(srv.call_tool("CalculateSlippage", {
+        "pool_id": "eth_dai_v2", "token_in_name": "DAI", "amount_in": 100.0}))
+    assert json.loads(result[0].text)["slippage_pct"] > 0
+    d.close()
+
+
+def test_call_tool_timeout_and_busy_receipts(capsys, monkeypatch):
+    monkeypatch.setattr(srv, "_execute", _slow_execute)
+    monkeypatch.setattr(srv, "_DISPATCHER",
+                        srv._Dispatcher("thread", timeout = 0.05,
+                                        max_pending = 1))
+    result = _run(srv.call_tool("CheckPoolHealth", {"pool_id": "eth_dai_v2"}))
+    assert "timed out" in result[0].text
+    result = _run(srv.call_tool("CheckPoolHealth", {"pool_id": "eth_dai_v2"}))
+    assert "server busy" in result[0].text
+    lines = [ln for ln in capsys.readouterr().err.splitlines() if ln]
+    assert [json.loads(ln)["error_type"] for ln in lines[-2:]] == \
+        ["Timeout", "ServerBusy"]
+    srv._DISPATCHER.close()
+
+
+# ─── RunBatch ─────────────────────────────────────────────────────────────
+
+
+def _batch(tool, calls):
+    result = _run(srv.call_tool("RunBatch", {"tool": tool, "calls": calls}))
+    return json.loads(result[0].text)
+
+
+def test_batch_schema_offers_every_tool():
+    schema = srv._batch_schema()
+    props = schema["inputSchema"]["properties"]
+    assert schema["name"] == "RunBatch"
+    assert props["tool"]["enum"] == sorted(srv._COMPATIBLE_RECIPES)
+    assert props["calls"]["items"]["required"] == ["pool_id"]
+
+
+def test_batch_rows_match_single_calls(monkeypatch):
+    monkeypatch.setattr(srv, "_TWINS", _twin_cache())
+    calls = [{"pool_id": p, "recent_window": w}
+             for p in ("eth_dai_v2", "eth_dai_v3") for w in (5, 20)]
+    table = _batch("CheckPoolHealth", calls)
+    assert table["errors"] == 0
+    for call, row in zip(calls, table["rows"]):
+        single = _run(srv.call_tool("CheckPoolHealth", dict(call)))
+        expected = json.loads(single[0].text)
+        record = dict(zip(table["columns"], row))
+        assert record.pop("error") is None
+        assert record.pop("pool_id") == call["pool_id"]
+        assert record == json.loads(json.dumps(expected))
+
+
+def test_batch_builds_each_twin_once(capsys, monkeypatch):
+    cache = _twin_cache()
+    monkeypatch.setattr(srv, "_TWINS", cache)
+    calls = [{"pool_id": "eth_dai_v2", "token_in_name": "DAI",
+              "amount_in": a} for a in (1.0, 10.0, 100.0, 1000.0)]
+    table = _batch("CalculateSlippage", calls)
+    assert table["errors"] == 0 and len(table["rows"]) == 4
+    assert cache.stats()["misses"] == 1 and cache.stats()["hits"] == 0
+    event = json.loads(capsys.readouterr().err.splitlines()[-1])
+    assert event["tool"] == "RunBatch" and event["status"] == "ok"
+    assert event["args"] == {"tool": "CalculateSlippage", "calls": 4}
+
+
+def test_batch_failures_stay_in_their_rows():
+    table = _batch("CalculateSlippage", [
+        {"pool_id": "eth_dai_v2", "token_in_name": "DAI", "amount_in": 10.0},
+        {"pool_id": "eth_dai_balancer_50_50", "amount_in": 10.0},
+        {"pool_id": "eth_dai_v2", "token_in_name": "XYZ", "amount_in": 10.0},
+    ])
+    errors = [row[-1] for row in table["rows"]]
+    assert errors[0] is None
+    assert errors[1].startswith("IncompatiblePool")
+    assert "'XYZ' not found" in errors[2]
+    assert table["errors"] == 2
+
+
+@pytest.mark.parametrize("arguments, message", [
+    ({"tool": "NoSuchTool", "calls": [{"pool_id": "eth_dai_v2"}]},
+     "Unknown tool"),
+    ({"tool": "CheckPoolHealth", "calls": []}, "non-empty list"),
+    ({"tool": "CheckPoolHealth", "calls": ["eth_dai_v2"]}, "non-empty list"),
+    ({"tool": "CheckPoolHealth", "calls": [{"pool_id": "eth_dai_v2"}] * 3},
+     "max 2"),
+])
+def test_batch_rejects_bad_requests(arguments, message, monkeypatch):
+    monkeypatch.setattr(srv, "_MAX_BATCH_CALLS", 2)
+    result = _run(srv.call_tool("RunBatch", arguments))
+    assert result[0].text.startswith("Error") and message in result[0].text
+
+
+def test_batch_process_mode_end_to_end(monkeypatch):
+    d = srv._Dispatcher("process", workers = 2)
+    monkeypatch.setattr(srv, "_DISPATCHER", d)
+    table = _batch("SimulatePriceMove", [
+        {"pool_id": p, "price_change_pct": pct, "position_size_lp": 1.0}
+        for p in ("eth_dai_v2", "eth_dai_v3") for pct in (-0.3, 0.3)])
+    assert [row[0] for row in table["rows"]] == ["eth_dai_v2"] * 2 + \
+        ["eth_dai_v3"] * 2
+    assert table["rows"][0][-1] is None
+    d.close()
 
 
 # ─── Server wiring ────────────────────────────────────────────────────────
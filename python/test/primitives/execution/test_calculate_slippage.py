@@ -16,15 +16,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License
 
-import sys, os, unittest
+import sys, os, copy, unittest
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)).split('/python/')[0])
 
+import numpy as np
 import pytest
 
 from uniswappy.erc import ERC20
+from uniswappy.process.swap import Swap
 
-from python.prod.utils.data import SlippageAnalysis
+from python.prod.utils.data import SlippageAnalysis, SlippageCurve
 from python.prod.primitives.execution import CalculateSlippage
+from python.prod.utils.tools.v3.TickIndex import TickIndex
 
 
 # ─── V2 test suite ───────────────────────────────────────────────────────────
@@ -181,6 +184,108 @@ class TestCalculateSlippageV3(unittest.TestCase):
         result = self.slip(10.0)
         self.assertGreaterEqual(result.slippage_pct, 0.0)
 
+    def test_v3_charges_pool_fee_tier_on_both_paths(self):
+        # A 0.05% pool: the in-tick and TickIndex paths both charge
+        # lp.fee, and both match a real swap.
+        lp = self.setup.lp
+        lp.fee = 500
+        in_tick = self.slip(10.0)
+        indexed = CalculateSlippage().apply(
+            lp, self.setup.eth, 10.0, tick_index = TickIndex.from_lp(lp),
+        )
+        curve = CalculateSlippage().curve(lp, self.setup.eth, [10.0])
+        fork = copy.deepcopy(lp)
+        eth = fork.factory.token_from_exchange[fork.name][self.setup.eth.token_name]
+        out = Swap().apply(fork, eth, "trader", 10.0)
+        self.assertAlmostEqual(in_tick.execution_price * 10.0, out, places = 6)
+        self.assertAlmostEqual(indexed.execution_price, in_tick.execution_price, places = 10)
+        self.assertAlmostEqual(curve.execution_price[0], in_tick.execution_price, places = 10)
+
+
+# ─── Slippage curves ─────────────────────────────────────────────────────────
+
+AMOUNT_GRID = np.geomspace(0.01, 500.0, 40)
+TARGETS = [0.005, 0.01, 0.05, 0.25]
+
+
+class TestCalculateSlippageCurveV2(unittest.TestCase):
+
+    @pytest.fixture(autouse = True)
+    def _bind_setup(self, v2_setup):
+        self.setup = v2_setup
+
+    def test_returns_slippage_curve(self):
+        curve = CalculateSlippage().curve(self.setup.lp, self.setup.eth, AMOUNT_GRID)
+        self.assertIsInstance(curve, SlippageCurve)
+        for col in (curve.execution_price, curve.slippage_pct,
+                    curve.slippage_cost, curve.price_impact_pct):
+            self.assertEqual(col.shape, AMOUNT_GRID.shape)
+
+    def test_matches_scalar_apply(self):
+        prim = CalculateSlippage()
+        for token in (self.setup.eth, self.setup.dai):
+            curve = prim.curve(self.setup.lp, token, AMOUNT_GRID)
+            for i, amount in enumerate(AMOUNT_GRID):
+                r = prim.apply(self.setup.lp, token, amount)
+                self.assertAlmostEqual(curve.execution_price[i], r.execution_price, places = 8)
+                self.assertAlmostEqual(curve.slippage_pct[i], r.slippage_pct, places = 10)
+                self.assertAlmostEqual(curve.price_impact_pct[i], r.price_impact_pct, places = 10)
+
+    def test_default_target_matches_max_size_at_1pct(self):
+        prim = CalculateSlippage()
+        curve = prim.curve(self.setup.lp, self.setup.eth, [1.0])
+        r = prim.apply(self.setup.lp, self.setup.eth, 1.0)
+        self.assertAlmostEqual(curve.max_size[0], r.max_size_at_1pct, places = 8)
+
+    def test_max_size_hits_each_target(self):
+        prim = CalculateSlippage()
+        curve = prim.curve(self.setup.lp, self.setup.eth, [1.0], TARGETS)
+        for target, size in zip(TARGETS, curve.max_size):
+            r = prim.apply(self.setup.lp, self.setup.eth, size)
+            self.assertAlmostEqual(r.slippage_pct, target, places = 8)
+
+    def test_target_below_fee_rate_clamps_to_zero(self):
+        curve = CalculateSlippage().curve(self.setup.lp, self.setup.eth, [1.0], [0.001])
+        self.assertEqual(curve.max_size[0], 0.0)
+
+    def test_raises_if_any_amount_nonpositive(self):
+        with self.assertRaises(ValueError):
+            CalculateSlippage().curve(self.setup.lp, self.setup.eth, [1.0, 0.0])
+
+    def test_raises_if_target_out_of_range(self):
+        with self.assertRaises(ValueError):
+            CalculateSlippage().curve(self.setup.lp, self.setup.eth, [1.0], [0.01, 1.0])
+
+
+class TestCalculateSlippageCurveV3(unittest.TestCase):
+
+    @pytest.fixture(autouse = True)
+    def _bind_setup(self, v3_setup):
+        # Stack a ±600-tick position on the full-range one so large
+        # trades cross initialized ticks.
+        lp = v3_setup.lp
+        center = lp.slot0.tick - lp.slot0.tick % lp.tickSpacing
+        lp.mint("user1", center - 600, center + 600, 4 * lp.get_liquidity())
+        self.setup = v3_setup
+
+    def test_matches_scalar_apply(self):
+        prim = CalculateSlippage()
+        curve = prim.curve(self.setup.lp, self.setup.eth, AMOUNT_GRID)
+        for i, amount in enumerate(AMOUNT_GRID):
+            r = prim.apply(self.setup.lp, self.setup.eth, amount)
+            self.assertAlmostEqual(curve.slippage_pct[i], r.slippage_pct, places = 10)
+            self.assertAlmostEqual(curve.price_impact_pct[i], r.price_impact_pct, places = 10)
+
+    def test_max_size_matches_real_swap(self):
+        lp = self.setup.lp
+        curve = CalculateSlippage().curve(lp, self.setup.dai, [1.0], TARGETS)
+        spot = lp.get_price(self.setup.dai)
+        for target, size in zip(TARGETS, curve.max_size):
+            fork = copy.deepcopy(lp)
+            dai = fork.factory.token_from_exchange[fork.name][self.setup.dai.token_name]
+            out = Swap().apply(fork, dai, "trader", size)
+            self.assertAlmostEqual(1.0 - out / (size * spot), target, places = 8)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -343,6 +343,25 @@ class TestDetectMEVV3(unittest.TestCase):
         self.assertEqual(result.direction, "underdelivered")
         self.assertTrue(result.likely_frontrun)
 
+    def test_v3_theoretical_output_charges_pool_fee_tier(self):
+        # A 0.05% pool: single-position (in-tick) and TickIndex quotes
+        # agree, and both match a real swap.
+        import copy
+        from uniswappy.process.swap import Swap
+        from python.prod.utils.tools.v3.TickIndex import TickIndex
+        lp = self.setup.lp
+        lp.fee = 500
+        fork = copy.deepcopy(lp)
+        eth = fork.factory.token_from_exchange[fork.name][self.setup.eth.token_name]
+        out = Swap().apply(fork, eth, "trader", 10.0)
+        in_tick = DetectMEV().apply(lp, self.setup.eth, 10.0, out)
+        indexed = DetectMEV().apply(
+            lp, self.setup.eth, 10.0, out, tick_index = TickIndex.from_lp(lp),
+        )
+        self.assertAlmostEqual(in_tick.theoretical_output, out, places = 6)
+        self.assertAlmostEqual(indexed.theoretical_output,
+                               in_tick.theoretical_output, places = 8)
+
 
 if __name__ == '__main__':
     unittest.main()
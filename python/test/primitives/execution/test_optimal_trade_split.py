@@ -0,0 +1,141 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)).split('/python/')[0])
+
+import pytest
+
+from python.prod.utils.data import TradeSplitResult
+from python.prod.primitives.execution import OptimalTradeSplit
+
+
+def _outputs(lps, token_name, amounts):
+    """Each pool's own quote for a candidate split."""
+    legs = [OptimalTradeSplit()._leg(lp, token_name, None) for lp in lps]
+    return sum(leg.quote(x) for leg, x in zip(legs, amounts) if x > 0)
+
+
+def _assert_locally_optimal(lps, token_name, result, step = 1e-3):
+    """Shifting a slice of flow between any two pools can't help."""
+    amounts = result.amounts_in
+    for a in range(len(lps)):
+        for b in range(len(lps)):
+            if a == b or amounts[b] <= 0:
+                continue
+            moved = list(amounts)
+            shift = min(step * result.amount_in, moved[b])
+            moved[a] += shift
+            moved[b] -= shift
+            assert _outputs(lps, token_name, moved) <= result.total_out * (1 + 1e-12)
+
+
+# ─── Shape ──────────────────────────────────────────────────────────────────
+
+
+def test_returns_trade_split_result(v2_setup, balancer_setup):
+    lps = [v2_setup.lp, balancer_setup.lp]
+    result = OptimalTradeSplit().apply(lps, v2_setup.eth, 10.0)
+    assert isinstance(result, TradeSplitResult)
+    assert result.token_in_name == "ETH"
+    assert result.token_out_name == "DAI"
+    assert len(result.amounts_in) == len(result.amounts_out) == 2
+    assert sum(result.amounts_in) == pytest.approx(10.0, rel = 1e-12)
+    assert result.total_out == pytest.approx(sum(result.amounts_out))
+
+
+def test_single_pool_takes_everything(v2_setup):
+    result = OptimalTradeSplit().apply([v2_setup.lp], v2_setup.eth, 25.0)
+    assert result.amounts_in == [pytest.approx(25.0)]
+    assert result.total_out == pytest.approx(result.best_single_pool_out)
+    assert result.improvement_pct == pytest.approx(0.0, abs = 1e-12)
+
+
+# ─── Optimality ─────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("amount_in", [1.0, 50.0, 400.0])
+def test_mixed_uniswap_balancer_split_is_optimal(v2_setup, v3_setup,
+                                                 balancer_setup, amount_in):
+    lps = [v2_setup.lp, v3_setup.lp, balancer_setup.lp]
+    result = OptimalTradeSplit().apply(lps, v2_setup.eth, amount_in)
+    assert result.total_out >= result.best_single_pool_out
+    _assert_locally_optimal(lps, "ETH", result)
+
+
+def test_identical_pools_split_evenly(v2_setup, v3_setup):
+    # Same reserves, same 0.3% fee, V3 full range: one curve, twice.
+    result = OptimalTradeSplit().apply(
+        [v2_setup.lp, v3_setup.lp], v2_setup.eth, 100.0,
+    )
+    assert result.amounts_in[0] == pytest.approx(50.0, rel = 1e-6)
+    assert result.amounts_in[1] == pytest.approx(50.0, rel = 1e-6)
+
+
+def test_small_trade_goes_to_best_priced_pool(v2_setup, weighted_balancer_setup):
+    # An 80/20 ETH/DAI Balancer pool with 50/50 balances prices ETH at
+    # 4x the V2 pool: a small sell clears there alone.
+    rich = weighted_balancer_setup(0.8, suffix = 'rich')
+    result = OptimalTradeSplit().apply(
+        [v2_setup.lp, rich.lp], v2_setup.eth, 1.0,
+    )
+    assert result.amounts_in[0] == 0.0
+    assert result.amounts_in[1] == pytest.approx(1.0)
+
+
+def test_stableswap_pools_split_is_optimal(amplified_stableswap_setup):
+    lps = [amplified_stableswap_setup(10, 'lo').lp,
+           amplified_stableswap_setup(200, 'hi').lp]
+    token = amplified_stableswap_setup(10, 'x').token0
+    result = OptimalTradeSplit().apply(lps, token, 20_000.0)
+    # Deeper curvature at high A keeps more flow.
+    assert result.amounts_in[1] > result.amounts_in[0] > 0
+    _assert_locally_optimal(lps, "USDC", result)
+
+
+def test_does_not_mutate_pools(v2_setup, balancer_setup):
+    before = (v2_setup.lp.get_reserve(v2_setup.eth),
+              balancer_setup.base_tkn.token_total)
+    OptimalTradeSplit().apply([v2_setup.lp, balancer_setup.lp],
+                              v2_setup.eth, 100.0)
+    assert (v2_setup.lp.get_reserve(v2_setup.eth),
+            balancer_setup.base_tkn.token_total) == before
+
+
+# ─── Errors ─────────────────────────────────────────────────────────────────
+
+
+def test_raises_on_non_positive_amount(v2_setup):
+    with pytest.raises(ValueError):
+        OptimalTradeSplit().apply([v2_setup.lp], v2_setup.eth, 0.0)
+
+
+def test_raises_on_empty_pool_list(v2_setup):
+    with pytest.raises(ValueError):
+        OptimalTradeSplit().apply([], v2_setup.eth, 1.0)
+
+
+def test_raises_when_pools_do_not_share_the_pair(v2_setup, stableswap_setup):
+    with pytest.raises(ValueError):
+        OptimalTradeSplit().apply([v2_setup.lp, stableswap_setup.lp],
+                                  v2_setup.eth, 1.0)
+
+
+def test_raises_on_unsupported_pool(v2_setup):
+    with pytest.raises(ValueError):
+        OptimalTradeSplit().apply([v2_setup.lp, object()], v2_setup.eth, 1.0)
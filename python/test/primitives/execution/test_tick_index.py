@@ -0,0 +1,209 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import sys, os, copy
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)).split('/python/')[0])
+
+import pytest
+
+from uniswappy.process.swap import Swap
+
+from python.prod.utils.tools.v3 import TickIndex
+from python.prod.primitives.execution import CalculateSlippage, DetectMEV
+
+
+# A narrow position stacked on the v3_setup full-range one: 4x the
+# liquidity over ±600 ticks around the entry price.
+NARROW_HALF_WIDTH = 600
+
+
+@pytest.fixture
+def multi_tick_setup(v3_setup):
+    lp = v3_setup.lp
+    spacing = lp.tickSpacing
+    center = lp.slot0.tick - lp.slot0.tick % spacing
+    lwr, upr = center - NARROW_HALF_WIDTH, center + NARROW_HALF_WIDTH
+    lp.mint("user1", lwr, upr, 4 * lp.get_liquidity())
+    v3_setup.narrow = (lwr, upr)
+    return v3_setup
+
+
+def _swapped(lp, token, amount_in):
+    """Run a real uniswappy swap on a copy; return (amount_out, copy)."""
+    lp = copy.deepcopy(lp)
+    tkn = lp.factory.token_from_exchange[lp.name][token.token_name]
+    return Swap().apply(lp, tkn, "trader", amount_in), lp
+
+
+# ─── Construction ───────────────────────────────────────────────────────────
+
+
+def test_rejects_empty_or_mismatched_arrays():
+    with pytest.raises(ValueError):
+        TickIndex([], [])
+    with pytest.raises(ValueError):
+        TickIndex([0, 60], [1.0])
+
+
+def test_rejects_duplicate_ticks():
+    with pytest.raises(ValueError):
+        TickIndex([0, 60, 0], [1.0, -1.0, 0.0])
+
+
+def test_sorts_ticks_and_accumulates_liquidity():
+    index = TickIndex([120, -60, 60], [-3.0, 2.0, 1.0])
+    assert index.ticks.tolist() == [-60, 60, 120]
+    assert index.liquidity.tolist() == [2.0, 3.0, 0.0]
+
+
+def test_from_lp_rejects_v2(v2_setup):
+    with pytest.raises(ValueError):
+        TickIndex.from_lp(v2_setup.lp)
+
+
+def test_from_snapshot_requires_tick_table():
+    class _Snap:
+        tick_indices = None
+    with pytest.raises(ValueError):
+        TickIndex.from_snapshot(_Snap())
+
+
+def test_from_lp_reads_the_tick_table(multi_tick_setup):
+    lp = multi_tick_setup.lp
+    index = TickIndex.from_lp(lp)
+    assert len(index) == 4
+    assert index.liquidity_at(lp.slot0.sqrtPriceX96 / 2 ** 96) == \
+        pytest.approx(5 * multi_tick_setup.lp_init_amt)
+
+
+def test_has_tick_table(v2_setup, multi_tick_setup):
+    assert TickIndex.has_tick_table(multi_tick_setup.lp)
+    assert not TickIndex.has_tick_table(v2_setup.lp)
+
+
+# ─── Lookups ────────────────────────────────────────────────────────────────
+
+
+def test_next_initialized_tick_matches_uniswappy(multi_tick_setup):
+    lp = multi_tick_setup.lp
+    index = TickIndex.from_lp(lp)
+    lwr, upr = multi_tick_setup.narrow
+    for tick in (lwr - 1, lwr, lwr + 1, lp.slot0.tick, upr):
+        for lte in (True, False):
+            assert index.next_initialized_tick(tick, lte) == lp.nextTick(tick, lte)[0]
+
+
+def test_next_initialized_tick_none_past_the_ends():
+    index = TickIndex([0, 60], [1.0, -1.0])
+    assert index.next_initialized_tick(-1, True) is None
+    assert index.next_initialized_tick(60, False) is None
+
+
+# ─── Quotes ─────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("amount_in", [1.0, 50.0, 400.0])
+def test_quote_matches_swap_selling_token0(multi_tick_setup, amount_in):
+    lp, eth = multi_tick_setup.lp, multi_tick_setup.eth
+    expected, after = _swapped(lp, eth, amount_in)
+    amount_out, sqrt_after = TickIndex.from_lp(lp).quote(lp, eth, amount_in)
+    assert amount_out == pytest.approx(expected, rel = 1e-9)
+    assert sqrt_after == pytest.approx(after.slot0.sqrtPriceX96 / 2 ** 96, rel = 1e-9)
+
+
+@pytest.mark.parametrize("amount_in", [100.0, 5_000.0, 40_000.0])
+def test_quote_matches_swap_selling_token1(multi_tick_setup, amount_in):
+    lp, dai = multi_tick_setup.lp, multi_tick_setup.dai
+    expected, after = _swapped(lp, dai, amount_in)
+    amount_out, sqrt_after = TickIndex.from_lp(lp).quote(lp, dai, amount_in)
+    assert amount_out == pytest.approx(expected, rel = 1e-9)
+    assert sqrt_after == pytest.approx(after.slot0.sqrtPriceX96 / 2 ** 96, rel = 1e-9)
+
+
+def test_large_quote_crosses_the_narrow_range(multi_tick_setup):
+    lp, eth = multi_tick_setup.lp, multi_tick_setup.eth
+    _out, sqrt_after = TickIndex.from_lp(lp).quote(lp, eth, 400.0)
+    lwr, _upr = multi_tick_setup.narrow
+    assert sqrt_after < 1.0001 ** (lwr / 2)
+
+
+def test_quote_past_all_liquidity_returns_everything():
+    index = TickIndex([-60, 60], [1_000.0, -1_000.0])
+    out, sqrt_after = index.swap(1e12, True, 1.0, fee = 0)
+    assert out == pytest.approx(1_000.0 * (1.0 - 1.0001 ** -30))
+    assert sqrt_after == pytest.approx(1.0001 ** -30)
+
+
+def test_swap_rejects_non_positive_amount():
+    with pytest.raises(ValueError):
+        TickIndex([-60, 60], [1.0, -1.0]).swap(0.0, True, 1.0)
+
+
+# ─── Primitive integration ──────────────────────────────────────────────────
+
+
+def test_calculate_slippage_walks_ticks(multi_tick_setup):
+    lp, eth = multi_tick_setup.lp, multi_tick_setup.eth
+    expected, after = _swapped(lp, eth, 400.0)
+    result = CalculateSlippage().apply(lp, eth, 400.0)
+    assert result.execution_price * 400.0 == pytest.approx(expected, rel = 1e-9)
+    new_spot = (after.slot0.sqrtPriceX96 / 2 ** 96) ** 2
+    assert result.price_impact_pct == pytest.approx(
+        (result.spot_price - new_spot) / result.spot_price, rel = 1e-6,
+    )
+
+
+def test_calculate_slippage_accepts_prebuilt_index(multi_tick_setup):
+    lp, dai = multi_tick_setup.lp, multi_tick_setup.dai
+    index = TickIndex.from_lp(lp)
+    assert CalculateSlippage().apply(lp, dai, 500.0, tick_index = index) == \
+        CalculateSlippage().apply(lp, dai, 500.0)
+
+
+def test_detect_mev_matches_real_swap(multi_tick_setup):
+    lp, eth = multi_tick_setup.lp, multi_tick_setup.eth
+    actual, _ = _swapped(lp, eth, 400.0)
+    result = DetectMEV().apply(lp, eth, 400.0, actual)
+    assert abs(result.extraction_bps) < 1e-4
+    assert not result.likely_frontrun
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_swap_batch_matches_swap(multi_tick_setup, zero_for_one):
+    lp = multi_tick_setup.lp
+    index = TickIndex.from_lp(lp)
+    sqrt_price = lp.slot0.sqrtPriceX96 / 2 ** 96
+    amounts = [0.5, 50.0, 5_000.0, 5e6]
+    outs, afters = index.swap_batch(amounts, zero_for_one, sqrt_price, lp.fee)
+    for amount, out, after in zip(amounts, outs, afters):
+        assert (out, after) == pytest.approx(
+            index.swap(amount, zero_for_one, sqrt_price, lp.fee), rel = 1e-12,
+        )
+
+
+def test_swap_batch_on_a_single_range(v3_setup):
+    # Two-tick table: small trades stay inside the only interval.
+    lp = v3_setup.lp
+    index = TickIndex.from_lp(lp)
+    sqrt_price = lp.slot0.sqrtPriceX96 / 2 ** 96
+    amounts = [1e-6, 1.0, 10.0]
+    outs, _afters = index.swap_batch(amounts, True, sqrt_price, lp.fee)
+    for amount, out in zip(amounts, outs):
+        assert out == pytest.approx(
+            index.swap(amount, True, sqrt_price, lp.fee)[0], rel = 1e-12,
+        )
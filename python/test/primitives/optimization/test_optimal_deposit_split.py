@@ -16,9 +16,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License
 
-import sys, os, unittest
+import sys, os, copy, unittest
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)).split('/python/')[0])
 
+import numpy as np
 import pytest
 
 from uniswappy.erc import ERC20
@@ -27,8 +28,9 @@ from uniswappy.utils.data import UniswapExchangeData
 from uniswappy.utils.tools.v3 import UniV3Utils
 from uniswappy.process.join import Join
 from uniswappy.process.deposit import SwapDeposit
+from uniswappy.process.swap import Swap
 
-from python.prod.utils.data import DepositSplitResult
+from python.prod.utils.data import DepositSplitResult, DepositSplitBatch
 from python.prod.primitives.optimization import OptimalDepositSplit
 
 
@@ -359,7 +361,8 @@ class TestOptimalDepositSplitValidation(unittest.TestCase):
     def _bind_setup(self, v2_setup):
         self.setup = v2_setup
 
-    def test_v3_raises(self):
+    def test_v3_without_range_raises(self):
+        # V3 deposits target a position, so the range is required.
         # Build a V3 pool inline (v3_setup fixture would also work
         # but we inline here to avoid mixed-fixture binding).
         eth = ERC20("ETH", "0x09")
@@ -379,6 +382,8 @@ class TestOptimalDepositSplitValidation(unittest.TestCase):
             OptimalDepositSplit().apply(lp_v3, eth, 10.0)
         msg = str(ctx.exception)
         self.assertIn("V3", msg)
+        with self.assertRaises(ValueError):
+            OptimalDepositSplit().apply(lp_v3, eth, 10.0, upr, lwr)
 
     def test_unknown_token_raises(self):
         # An ERC20 that isn't in the pool should raise with a clear
@@ -403,5 +408,187 @@ class TestOptimalDepositSplitValidation(unittest.TestCase):
         self.assertIn("amount_in", str(ctx.exception))
 
 
+# ─── V3: ranged positions ────────────────────────────────────────────────────
+
+def _v3_needs(lwr_tick, upr_tick, sqrt_price):
+    """Token0 / token1 per unit of liquidity for [lwr, upr) at sqrt_price."""
+    sa, sb = 1.0001 ** (lwr_tick / 2), 1.0001 ** (upr_tick / 2)
+    s = min(max(sqrt_price, sa), sb)
+    return 1.0 / s - 1.0 / sb, s - sa
+
+
+class TestOptimalDepositSplitV3(unittest.TestCase):
+
+    @pytest.fixture(autouse = True)
+    def _bind_setup(self, v3_setup):
+        self.setup = v3_setup
+        lp = v3_setup.lp
+        spacing = lp.tickSpacing
+        self.center = lp.slot0.tick - lp.slot0.tick % spacing
+
+    def _check_balanced(self, token, lwr, upr, amount_in):
+        # Swap for real on a copy, then check the leftover pair fills
+        # the range at the post-swap price with nothing to spare.
+        lp = self.setup.lp
+        result = OptimalDepositSplit().apply(lp, token, amount_in, lwr, upr)
+        after = copy.deepcopy(lp)
+        tkn = after.factory.token_from_exchange[after.name][token.token_name]
+        out = Swap().apply(after, tkn, USER, result.swap_amount_in)
+        self.assertAlmostEqual(out / result.swap_amount_out, 1.0, places = 9)
+
+        need0, need1 = _v3_needs(lwr, upr, after.slot0.sqrtPriceX96 / 2 ** 96)
+        if token.token_name == lp.token0:
+            need_in, need_out = need0, need1
+        else:
+            need_in, need_out = need1, need0
+        self.assertAlmostEqual(
+            result.deposit_amount_in / need_in
+            / (result.deposit_amount_out / need_out), 1.0, places = 9,
+        )
+        self.assertAlmostEqual(
+            result.expected_lp_tokens / (result.deposit_amount_in / need_in),
+            1.0, places = 9,
+        )
+        return result
+
+    def test_full_range_is_near_half(self):
+        s = self.setup
+        result = self._check_balanced(s.eth, s.lwr_tick, s.upr_tick, 10.0)
+        self.assertAlmostEqual(result.optimal_fraction, 0.5, delta = 0.01)
+
+    def test_narrow_range_token0_in(self):
+        c = self.center
+        self._check_balanced(self.setup.eth, c - 600, c + 600, 10.0)
+
+    def test_skewed_range_token1_in(self):
+        # Range mostly above the price holds mostly token0 (ETH), so a
+        # DAI deposit has to swap most of itself.
+        c = self.center
+        result = self._check_balanced(self.setup.dai, c - 120, c + 6000, 1_000.0)
+        self.assertGreater(result.optimal_fraction, 0.5)
+
+    def test_range_on_token_in_side_needs_no_swap(self):
+        # Above the price a position is all token0: deposit ETH as is.
+        c = self.center
+        result = OptimalDepositSplit().apply(
+            self.setup.lp, self.setup.eth, 10.0, c + 600, c + 1200,
+        )
+        self.assertEqual(result.optimal_fraction, 0.0)
+        self.assertEqual(result.swap_amount_out, 0.0)
+        self.assertEqual(result.slippage_pct, 0.0)
+
+    def test_range_on_token_out_side_swaps_everything(self):
+        c = self.center
+        result = OptimalDepositSplit().apply(
+            self.setup.lp, self.setup.eth, 10.0, c - 1200, c - 600,
+        )
+        self.assertAlmostEqual(result.optimal_fraction, 1.0, places = 9)
+        self.assertGreater(result.expected_lp_tokens, 0.0)
+
+    def test_does_not_mutate_pool(self):
+        lp = self.setup.lp
+        slot0 = (lp.slot0.sqrtPriceX96, lp.slot0.tick)
+        liquidity = lp.get_liquidity()
+        OptimalDepositSplit().apply(lp, self.setup.eth, 50.0,
+                                    self.center - 600, self.center + 600)
+        self.assertEqual((lp.slot0.sqrtPriceX96, lp.slot0.tick), slot0)
+        self.assertEqual(lp.get_liquidity(), liquidity)
+
+
+# ─── Balancer: proportional joins ────────────────────────────────────────────
+
+class TestOptimalDepositSplitBalancer(unittest.TestCase):
+
+    @pytest.fixture(autouse = True)
+    def _bind_setup(self, balancer_setup, weighted_balancer_setup):
+        self.setup = balancer_setup
+        self.weighted = weighted_balancer_setup(0.8, "ods")
+
+    def _check_balanced(self, setup, amount_in):
+        lp, tkn_in, tkn_out = setup.lp, setup.base_tkn, setup.opp_tkn
+        result = OptimalDepositSplit().apply(lp, tkn_in, amount_in)
+        quoted = lp.get_amount_out(result.swap_amount_in, tkn_in,
+                                   tkn_out)['tkn_out_amt']
+        self.assertAlmostEqual(result.swap_amount_out / quoted, 1.0, places = 9)
+
+        # The leftover pair is proportional to the post-swap balances.
+        b_in = lp.vault.get_token(tkn_in.token_name).token_total
+        b_out = lp.vault.get_token(tkn_out.token_name).token_total
+        share_in = result.deposit_amount_in / (b_in + result.swap_amount_in)
+        share_out = result.deposit_amount_out / (b_out - result.swap_amount_out)
+        self.assertAlmostEqual(share_in / share_out, 1.0, places = 9)
+        self.assertAlmostEqual(
+            result.expected_lp_tokens / (lp.pool_shares * share_in), 1.0,
+            places = 9,
+        )
+        return result
+
+    def test_50_50_is_near_half(self):
+        result = self._check_balanced(self.setup, 10.0)
+        self.assertAlmostEqual(result.optimal_fraction, 0.5, delta = 0.01)
+        self.assertGreater(result.slippage_pct, 0.0)
+
+    def test_weighted_pool_swaps_by_weight(self):
+        # An 80/20 pool is 80% base token by value, so a single-sided
+        # base deposit only needs to swap about 20% of itself.
+        result = self._check_balanced(self.weighted, 10.0)
+        self.assertAlmostEqual(result.optimal_fraction, 0.2, delta = 0.01)
+
+    def test_unknown_token_raises(self):
+        with self.assertRaises(ValueError):
+            OptimalDepositSplit().apply(self.setup.lp, ERC20("BTC", "0x77"), 1.0)
+
+
+# ─── Batch mode ──────────────────────────────────────────────────────────────
+
+class TestOptimalDepositSplitBatch(unittest.TestCase):
+
+    AMOUNTS = [0.5, 10.0, 150.0, 600.0]
+
+    @pytest.fixture(autouse = True)
+    def _bind_setup(self, v2_setup, v3_setup, balancer_setup):
+        self.v2 = v2_setup
+        self.v3 = v3_setup
+        self.balancer = balancer_setup
+
+    def _check_matches_scalar(self, lp, token, *ticks):
+        splitter = OptimalDepositSplit()
+        batch = splitter.apply_batch(lp, token, self.AMOUNTS, *ticks)
+        self.assertIsInstance(batch, DepositSplitBatch)
+        self.assertEqual(batch.token_in_name, token.token_name)
+        for i, amount in enumerate(self.AMOUNTS):
+            single = splitter.apply(lp, token, amount, *ticks)
+            for field in ("optimal_fraction", "swap_amount_out",
+                          "deposit_amount_in", "expected_lp_tokens",
+                          "slippage_pct"):
+                self.assertAlmostEqual(
+                    getattr(batch, field)[i], getattr(single, field),
+                    delta = 1e-9 * max(1.0, abs(getattr(single, field))),
+                )
+
+    def test_v2_matches_scalar(self):
+        self._check_matches_scalar(self.v2.lp, self.v2.dai)
+
+    def test_v3_matches_scalar(self):
+        lp = self.v3.lp
+        center = lp.slot0.tick - lp.slot0.tick % lp.tickSpacing
+        self._check_matches_scalar(lp, self.v3.eth, center - 600, center + 1800)
+
+    def test_balancer_matches_scalar(self):
+        self._check_matches_scalar(self.balancer.lp, self.balancer.base_tkn)
+
+    def test_slippage_grows_with_size(self):
+        batch = OptimalDepositSplit().apply_batch(
+            self.v2.lp, self.v2.eth, self.AMOUNTS,
+        )
+        self.assertTrue(np.all(np.diff(batch.slippage_pct) > 0))
+
+    def test_non_positive_amount_raises(self):
+        with self.assertRaises(ValueError):
+            OptimalDepositSplit().apply_batch(self.v2.lp, self.v2.eth, [1.0, 0.0])
+        with self.assertRaises(ValueError):
+            OptimalDepositSplit().apply_batch(self.v2.lp, self.v2.eth, [])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -19,9 +19,10 @@
 import sys, os, unittest
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)).split('/python/')[0])
 
+import numpy as np
 import pytest
 
-from python.prod.utils.data import PriceMoveScenario
+from python.prod.utils.data import PriceMoveScenario, PriceMoveScenarioBatch
 from python.prod.primitives.position import SimulatePriceMove
 
 
@@ -182,5 +183,80 @@ class TestSimulatePriceMoveV3(unittest.TestCase):
         self.assertLessEqual(result.il_at_new_price, 1e-9)
 
 
+# ─── Batch mode (V2 + V3) ────────────────────────────────────────────────────
+
+PCT_GRID = [-0.75, -0.30, -0.05, 0.0, 0.10, 0.50, 2.00]
+
+
+class TestSimulatePriceMoveBatchV2(unittest.TestCase):
+
+    @pytest.fixture(autouse = True)
+    def _bind_setup(self, v2_setup):
+        self.setup = v2_setup
+
+    def test_returns_batch_of_matching_shape(self):
+        result = SimulatePriceMove().apply_batch(
+            self.setup.lp, PCT_GRID, self.setup.lp_init_amt,
+        )
+        self.assertIsInstance(result, PriceMoveScenarioBatch)
+        for col in (result.new_price_ratio, result.new_value,
+                    result.il_at_new_price, result.value_change_pct):
+            self.assertEqual(col.shape, (len(PCT_GRID),))
+
+    def test_matches_scalar_apply(self):
+        prim = SimulatePriceMove()
+        batch = prim.apply_batch(self.setup.lp, PCT_GRID, self.setup.lp_init_amt)
+        for i, pct in enumerate(PCT_GRID):
+            r = prim.apply(self.setup.lp, pct, self.setup.lp_init_amt)
+            self.assertAlmostEqual(batch.new_price_ratio[i], r.new_price_ratio, places = 10)
+            self.assertAlmostEqual(batch.new_value[i], r.new_value, places = 6)
+            self.assertAlmostEqual(batch.il_at_new_price[i], r.il_at_new_price, places = 10)
+            self.assertAlmostEqual(batch.value_change_pct[i], r.value_change_pct, places = 10)
+
+    def test_position_size_array_broadcasts(self):
+        sizes = np.array([1.0, 10.0, 100.0])
+        batch = SimulatePriceMove().apply_batch(
+            self.setup.lp, [-0.30, -0.30, -0.30], sizes,
+        )
+        np.testing.assert_allclose(batch.new_value / sizes,
+                                   np.full(3, batch.new_value[0]), rtol = 1e-12)
+        np.testing.assert_allclose(batch.il_at_new_price,
+                                   np.full(3, batch.il_at_new_price[0]))
+
+    def test_does_not_mutate_lp(self):
+        x_before = self.setup.lp.get_reserve(self.setup.eth)
+        SimulatePriceMove().apply_batch(self.setup.lp, PCT_GRID, 1.0)
+        self.assertEqual(self.setup.lp.get_reserve(self.setup.eth), x_before)
+
+    def test_raises_if_any_price_change_at_minus_one(self):
+        with self.assertRaises(ValueError):
+            SimulatePriceMove().apply_batch(self.setup.lp, [0.1, -1.0], 1.0)
+
+    def test_raises_if_any_position_size_nonpositive(self):
+        with self.assertRaises(ValueError):
+            SimulatePriceMove().apply_batch(self.setup.lp, [0.1, 0.2], [1.0, 0.0])
+
+    def test_raises_on_unbroadcastable_shapes(self):
+        with self.assertRaises(ValueError):
+            SimulatePriceMove().apply_batch(self.setup.lp, [0.1, 0.2], [1.0, 2.0, 3.0])
+
+
+class TestSimulatePriceMoveBatchV3(unittest.TestCase):
+
+    @pytest.fixture(autouse = True)
+    def _bind_setup(self, v3_setup):
+        self.setup = v3_setup
+
+    def test_v3_matches_scalar_apply(self):
+        prim = SimulatePriceMove()
+        kw = dict(lwr_tick = self.setup.lwr_tick, upr_tick = self.setup.upr_tick)
+        batch = prim.apply_batch(self.setup.lp, PCT_GRID, self.setup.lp_init_amt, **kw)
+        for i, pct in enumerate(PCT_GRID):
+            r = prim.apply(self.setup.lp, pct, self.setup.lp_init_amt, **kw)
+            self.assertAlmostEqual(batch.new_value[i], r.new_value, places = 6)
+            self.assertAlmostEqual(batch.il_at_new_price[i], r.il_at_new_price, places = 8)
+            self.assertAlmostEqual(batch.value_change_pct[i], r.value_change_pct, places = 8)
+
+
 if __name__ == '__main__':
     unittest.main()
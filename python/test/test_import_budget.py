@@ -0,0 +1,90 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Import-time / memory budget for each public entry point.
+
+Measurement and budget live in python/benchmarks/ (bench_import_time.py
+and import_budget.json); this only runs the warm-time and peak-memory
+checks. The cold (recompile) check is left to
+`bench_import_time.py --check`, as it costs several seconds per entry
+point. Set DEFIPY_IMPORT_BUDGET to a different JSON file to loosen or
+tighten the limits for a given machine.
+
+The tracemalloc peak-memory check runs by default. Import time
+depends on machine load, so the warm-time check is marked `benchmark`
+and skipped by default. To run it:
+
+    DEFIPY_BENCHMARK=1 pytest -m benchmark
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+
+_BENCH_PATH = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__), "..", "benchmarks", "bench_import_time.py"
+    )
+)
+
+# benchmarks/ is a directory of scripts, not a package: load by path.
+_spec = importlib.util.spec_from_file_location("bench_import_time", _BENCH_PATH)
+bench = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench)
+
+_BENCHMARK_ENV_VAR = "DEFIPY_BENCHMARK"
+
+
+@pytest.fixture(scope = "module")
+def budget():
+    return bench.load_budget()
+
+
+def test_every_entry_point_has_a_budget(budget):
+    assert set(budget) == set(bench.ENTRY_POINTS)
+    for limits in budget.values():
+        assert set(limits) <= {"warm_ms", "cold_ms", "peak_mb"}
+
+
+@pytest.mark.parametrize("name", sorted(bench.ENTRY_POINTS))
+def test_entry_point_within_memory_budget(name, budget):
+    if not bench.available(name):
+        pytest.skip("{} not installed".format(bench.REQUIRES[name]))
+    result = {"peak_mb": bench.peak_mb(name)}
+    assert bench.over_budget(name, result, budget) == []
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", sorted(bench.ENTRY_POINTS))
+def test_entry_point_within_budget(name, budget):
+    if not os.environ.get(_BENCHMARK_ENV_VAR):
+        pytest.skip("Set {}=1 to run import-time benchmarks".format(
+            _BENCHMARK_ENV_VAR))
+    if not bench.available(name):
+        pytest.skip("{} not installed".format(bench.REQUIRES[name]))
+    result = bench.measure(name, repeat = 1, cold = False)
+    assert bench.over_budget(name, result, budget) == []
+
+
+def test_over_budget_reports_each_metric():
+    budget = {"x": {"warm_ms": 10, "cold_ms": 100, "peak_mb": 1}}
+    result = {"warm_ms": 12.0, "peak_mb": 0.5}      # no cold run
+    assert bench.over_budget("x", result, budget) == ["warm_ms: 12.0 > 10.0"]
+    assert bench.over_budget("unbudgeted", result, budget) == []
@@ -0,0 +1,114 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Lazy `import defipy` — the top-level namespace loads on first use.
+
+Import-cost assertions run `python -X importtime` in a fresh
+interpreter, so they see exactly what a CLI or MCP worker would.
+"""
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import defipy
+from defipy._lazy_index import INDEX
+
+
+# Heavy dependencies that a bare `import defipy` must not touch.
+DEFERRED = ("uniswappy", "balancerpy", "stableswappy", "web3",
+            "web3scout", "defipy.agents", "numpy", "pandas")
+
+
+def _python(code, eager = False, importtime = False):
+    env = dict(os.environ)
+    env.pop("DEFIPY_EAGER_IMPORT", None)
+    if eager:
+        env["DEFIPY_EAGER_IMPORT"] = "1"
+    args = [sys.executable] + (["-X", "importtime"] if importtime else [])
+    proc = subprocess.run(args + ["-c", code], env = env, capture_output = True,
+                          text = True, check = True)
+    return proc.stdout, proc.stderr
+
+
+def _imported(importtime_log):
+    """Module names listed by -X importtime, with their cumulative us."""
+    modules = {}
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative_us)
+    return modules
+
+
+def test_bare_import_defers_protocol_packages_and_agents():
+    _out, log = _python("import defipy", importtime = True)
+    modules = _imported(log)
+    assert "defipy" in modules
+    loaded = sorted(m for m in modules
+                    if any(m == d or m.startswith(d + ".") for d in DEFERRED))
+    assert loaded == []
+
+
+def test_eager_mode_still_loads_everything():
+    _out, log = _python("import defipy", eager = True, importtime = True)
+    modules = _imported(log)
+    assert {"uniswappy", "balancerpy", "stableswappy",
+            "web3scout"} <= set(modules)
+
+
+def test_index_is_up_to_date():
+    # Regenerate in a fresh interpreter: `python -m defipy._lazy`
+    # after changing EXPORTS or a re-exported module's public names.
+    out, _err = _python(
+        "import json; from defipy._lazy import build_index; "
+        "print(json.dumps(build_index()))"
+    )
+    assert json.loads(out) == INDEX
+
+
+def test_star_import_matches_eager_namespace():
+    code = ("from defipy import *; "
+            "print(sorted(n for n in dir() if not n.startswith('_')))")
+    lazy, _ = _python(code)
+    eager, _ = _python(code, eager = True)
+    assert lazy == eager
+
+
+@pytest.mark.parametrize("name", sorted(INDEX))
+def test_every_name_resolves_to_its_source(name):
+    source = importlib.import_module(INDEX[name])
+    assert getattr(defipy, name) is getattr(source, name)
+
+
+def test_resolved_names_are_cached():
+    defipy.UniswapFactory
+    assert "UniswapFactory" in vars(defipy)
+
+
+def test_subpackages_and_unknown_names():
+    assert defipy.twin is importlib.import_module("defipy.twin")
+    assert "SimulatePriceMove" in dir(defipy)
+    assert not hasattr(defipy, "NoSuchThing")
+    with pytest.raises(AttributeError):
+        defipy.no_such_module
@@ -0,0 +1,154 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import threading
+
+import pytest
+
+from defipy.primitives.execution import CalculateSlippage
+from defipy.tools import BatchResult, run_batch
+from defipy.twin import MockProvider, StateTwinBuilder
+
+
+def _slippage_calls(pool_id, amounts):
+    return [{"pool_id": pool_id, "token_in": "DAI", "amount_in": a}
+            for a in amounts]
+
+
+def test_rows_match_single_calls_in_call_order():
+    provider = MockProvider()
+    calls = (_slippage_calls("eth_dai_v2", [10.0, 1000.0])
+             + [{"pool_id": "eth_dai_balancer_50_50", "amount_in": 1.0}]
+             + _slippage_calls("eth_dai_v2", [50.0]))
+    table = run_batch("CalculateSlippage", calls, provider)
+
+    assert isinstance(table, BatchResult)
+    assert table.columns[0] == "pool_id" and table.columns[-1] == "error"
+    assert [row[0] for row in table.rows] == [c["pool_id"] for c in calls]
+    assert table.errors == 1
+
+    lp = StateTwinBuilder().build(provider.snapshot("eth_dai_v2"))
+    dai = lp.factory.token_from_exchange[lp.name]["DAI"]
+    records = table.records()
+    for i in (0, 1, 3):
+        expected = CalculateSlippage().apply(lp, dai, calls[i]["amount_in"])
+        assert records[i]["slippage_pct"] == expected.slippage_pct
+        assert records[i]["error"] is None
+
+
+def test_each_pool_twin_is_built_once():
+    provider = MockProvider()
+    builder = StateTwinBuilder()
+    built = []
+    lock = threading.Lock()
+
+    def twins(pool_id):
+        with lock:
+            built.append(pool_id)
+        return builder.build(provider.snapshot(pool_id))
+
+    calls = [{"pool_id": p, "recent_window": w}
+             for w in (5, 10, 20) for p in ("eth_dai_v2", "eth_dai_v3")]
+    table = run_batch("CheckPoolHealth", calls, twins)
+    assert sorted(built) == ["eth_dai_v2", "eth_dai_v3"]
+    assert table.errors == 0
+
+
+def test_writable_batches_get_a_twin_per_call():
+    provider = MockProvider()
+    builder = StateTwinBuilder()
+    built = []
+
+    def twins(pool_id):
+        built.append(pool_id)
+        return builder.build(provider.snapshot(pool_id))
+
+    calls = _slippage_calls("eth_dai_v2", [10.0, 20.0, 30.0])
+    run_batch("CalculateSlippage", calls, twins, read_only=False)
+    assert built == ["eth_dai_v2"] * 3
+
+
+def test_run_pool_hook_runs_each_pool_job():
+    seen = []
+
+    def run_pool(pool_id, job):
+        seen.append(pool_id)
+        if pool_id == "eth_dai_v3":
+            raise RuntimeError("worker lost")
+        return job()
+
+    calls = [{"pool_id": p, "recent_window": 5}
+             for p in ("eth_dai_v2", "eth_dai_v3", "eth_dai_v2")]
+    table = run_batch("CheckPoolHealth", calls, MockProvider(),
+                      max_workers=0, run_pool=run_pool)
+    assert seen == ["eth_dai_v2", "eth_dai_v3"]
+    errors = [r["error"] for r in table.records()]
+    assert errors == [None, "RuntimeError: worker lost", None]
+
+
+def test_inline_and_threaded_runs_agree():
+    calls = [{"pool_id": p, "price_change_pct": pct, "position_size_lp": 1.0}
+             for pct in (-0.5, 0.1) for p in ("eth_dai_v2", "eth_dai_v2")]
+    threaded = run_batch("SimulatePriceMove", calls, MockProvider())
+    inline = run_batch("SimulatePriceMove", calls, MockProvider(),
+                       max_workers=0)
+    assert threaded == inline
+
+
+def test_failures_are_recorded_per_row():
+    calls = [
+        {"pool_id": "no_such_recipe", "amount_in": 1.0},
+        {"pool_id": "eth_dai_v2", "token_in": "XYZ", "amount_in": 1.0},
+    ]
+    table = run_batch("CalculateSlippage", calls, MockProvider())
+    assert table.columns == ["pool_id", "error"]
+    assert table.rows[0][1].startswith("ValueError: MockProvider")
+    assert "'XYZ' not found" in table.rows[1][1]
+
+
+def test_nested_results_are_stored_as_dicts():
+    table = run_batch("AssessDepegRisk", [{
+        "pool_id": "usdc_dai_stableswap_A10", "lp_init_amt": 10.0,
+        "depeg_token": "USDC",
+    }], MockProvider())
+    scenarios = table.records()[0]["scenarios"]
+    assert scenarios and all(isinstance(s, dict) for s in scenarios)
+
+
+def test_to_pandas():
+    pd = pytest.importorskip("pandas")
+    table = run_batch("CheckPoolHealth", [{"pool_id": "eth_dai_v2"}],
+                      MockProvider())
+    df = table.to_pandas()
+    assert isinstance(df, pd.DataFrame)
+    assert list(df.columns) == table.columns and len(df) == 1
+
+
+@pytest.mark.parametrize("kwargs, exc", [
+    ({"tool_name": "NoSuchTool", "calls": []}, ValueError),
+    ({"tool_name": "CheckPoolHealth", "calls": [{}]}, ValueError),
+    ({"tool_name": "CheckPoolHealth", "calls": ["eth_dai_v2"]}, TypeError),
+    ({"tool_name": "CheckPoolHealth", "calls": [], "max_workers": -1},
+     ValueError),
+    ({"tool_name": "CheckPoolHealth", "calls": [], "twins": object()},
+     TypeError),
+])
+def test_rejects_bad_arguments(kwargs, exc):
+    kwargs.setdefault("twins", MockProvider())
+    with pytest.raises(exc):
+        run_batch(**kwargs)
@@ -30,11 +30,9 @@ The fake satisfies the surface used by:
     which calls w3.to_checksum_address, w3.eth.contract,
     contract.functions.symbol().call(),
     contract.functions.decimals().call()
-  - LiveProvider._snapshot_v2 directly:
-    pair.functions.token0().call(block_identifier=N),
-    pair.functions.token1().call(block_identifier=N),
-    pair.functions.getReserves().call(block_identifier=N),
-    pair.functions.totalSupply().call(block_identifier=N)
+  - LiveProvider's multicall paths (V2 / V3 / Balancer / Stableswap):
+    Multicall3.aggregate3(calls).call(block_identifier=N), with each
+    sub-call dispatched by selector against the registered specs
 
 Phase 2 (per STATE_TWIN_PHASE_2.md) will lift this into shared
 fixture machinery generalized over V2 and V3. For Phase 1 it stays
@@ -57,10 +55,15 @@ from typing import Optional
 @dataclass
 class CallRecord:
     """One observed contract function call. Tests inspect a list of
-    these to verify block consistency, call ordering, etc."""
+    these to verify block consistency, call ordering, etc.
+
+    `batched` marks a sub-call served inside an aggregate3 envelope —
+    it shares the envelope's round trip and isn't counted by
+    `FakeRpcClient.round_trips`."""
     address: str
     function: str
     block_identifier: object   # int, None, "latest", etc.
+    batched: bool = False
 
 
 # ─── Pool / token specs ────────────────────────────────────────────────────
@@ -74,6 +77,11 @@ class V2PoolSpec:
     returns on-chain), per the C2 contract — LiveProvider does the
     decimal scaling. The spec is what the chain looks like; LiveProvider
     is what we're testing.
+
+    `reserves_by_block` optionally gives the pair a history for
+    multicall reads: {block: (reserve0_raw, reserve1_raw)}, each entry
+    in force from its block until the next. Blocks before the first
+    entry read reserve{0,1}_raw.
     """
     address: str
     token0_address: str
@@ -81,6 +89,16 @@ class V2PoolSpec:
     reserve0_raw: int
     reserve1_raw: int
     total_supply_raw: int = 10_000 * 10**18
+    reserves_by_block: Optional[dict] = None
+
+    def reserves_at(self, block_identifier) -> tuple:
+        reserves = (self.reserve0_raw, self.reserve1_raw)
+        if self.reserves_by_block and isinstance(block_identifier, int):
+            for block in sorted(self.reserves_by_block):
+                if block > block_identifier:
+                    break
+                reserves = self.reserves_by_block[block]
+        return reserves
 
 
 @dataclass
@@ -102,6 +120,26 @@ class V3PoolSpec:
     liquidity: int        # active liquidity (uint128)
     fee: int = 3000       # 500 / 3000 / 10000
     tick_spacing: int = 60   # 10 / 60 / 200
+    # Initialized ticks, {tick: liquidityNet}, served through
+    # tickBitmap(int16) / ticks(int24) for the tick-walk read path.
+    ticks: Optional[dict] = None
+
+    def tick_bitmap(self, word: int) -> int:
+        bitmap = 0
+        for tick in (self.ticks or {}):
+            compressed = tick // self.tick_spacing
+            if compressed >> 8 == word:
+                bitmap |= 1 << (compressed % 256)
+        return bitmap
+
+    def tick_info(self, tick: int) -> tuple:
+        # (liquidityGross, liquidityNet, feeGrowthOutside0X128,
+        # feeGrowthOutside1X128, tickCumulativeOutside,
+        # secondsPerLiquidityOutsideX128, secondsOutside, initialized)
+        net = (self.ticks or {}).get(tick)
+        if net is None:
+            return (0, 0, 0, 0, 0, 0, 0, False)
+        return (abs(net), net, 0, 0, 0, 0, 0, True)
 
 
 @dataclass
@@ -465,6 +503,14 @@ def _ensure_dispatch():
         _selector("A()"): ("A", ["uint256"]),
         _selector("coins(uint256)"): ("coins", ["address"]),
         _selector("balances(uint256)"): ("balances", ["uint256"]),
+        # V3 tick walk: one-arg reads, dispatched per argument like the
+        # Curve index reads.
+        _selector("tickBitmap(int16)"): ("tickBitmap", ["uint256"]),
+        _selector("ticks(int24)"): (
+            "ticks",
+            ["uint128", "int128", "uint256", "uint256", "int56", "uint160",
+             "uint32", "bool"],
+        ),
     })
     _MULTICALL3_TIMESTAMP_SELECTOR = _selector("getCurrentBlockTimestamp()")
 
@@ -525,6 +571,7 @@ class _BoundAggregate3:
                     address = target,
                     function = "getCurrentBlockTimestamp",
                     block_identifier = block_identifier,
+                    batched = True,
                 ))
                 encoded = encode(["uint256"], [self._fake_w3._block_timestamp])
                 results.append((True, encoded))
@@ -547,6 +594,24 @@ class _BoundAggregate3:
             # call_data[4:] and return the i-th element. An out-of-range
             # index is a genuine revert ((False, b"")) — this is what
             # lets the allow_failure coin-count probe stop at N.
+            if fn_name in ("tickBitmap", "ticks"):
+                from eth_abi import decode as _decode
+                spec = self._fake_w3._pool_specs[target]
+                if fn_name == "tickBitmap":
+                    word = _decode(["int16"], bytes(call_data[4:]))[0]
+                    values = [spec.tick_bitmap(word)]
+                else:
+                    tick = _decode(["int24"], bytes(call_data[4:]))[0]
+                    values = list(spec.tick_info(tick))
+                self._recorder.append(CallRecord(
+                    address = target,
+                    function = fn_name,
+                    block_identifier = block_identifier,
+                    batched = True,
+                ))
+                results.append((True, encode(return_types, values)))
+                continue
+
             if fn_name in ("coins", "balances"):
                 from eth_abi import decode as _decode
                 index = _decode(["uint256"], bytes(call_data[4:]))[0]
@@ -558,15 +623,23 @@ class _BoundAggregate3:
                     address = target,
                     function = fn_name,
                     block_identifier = block_identifier,
+                    batched = True,
                 ))
                 results.append((True, encode(return_types, [value])))
                 continue
 
-            value = self._dispatch_to_spec(target, fn_name)
+            if allow_failure and not self._is_registered(target):
+                # No code at target: a real node returns success with
+                # empty returnData.
+                results.append((True, b""))
+                continue
+
+            value = self._dispatch_to_spec(target, fn_name, block_identifier)
             self._recorder.append(CallRecord(
                 address = target,
                 function = fn_name,
                 block_identifier = block_identifier,
+                batched = True,
             ))
 
             # ABI-encode per the function's return shape. Multi-return
@@ -582,7 +655,12 @@ class _BoundAggregate3:
             results.append((True, encoded))
         return results
 
-    def _dispatch_to_spec(self, target: str, fn_name: str):
+    def _is_registered(self, target: str) -> bool:
+        return (target in self._fake_w3._pool_specs
+                or target in self._fake_w3._token_specs)
+
+    def _dispatch_to_spec(self, target: str, fn_name: str,
+                          block_identifier = None):
         """Look up the canned value for `fn_name` against the spec
         registered at `target`. Mirror of the direct-call path so the
         same V2PoolSpec / V3PoolSpec / TokenSpec serves both."""
@@ -590,6 +668,8 @@ class _BoundAggregate3:
         if target in self._fake_w3._pool_specs:
             spec = self._fake_w3._pool_specs[target]
             if isinstance(spec, V2PoolSpec):
+                if fn_name == "getReserves":
+                    return spec.reserves_at(block_identifier) + (0,)
                 return _PairFunctions(
                     spec, [], target,
                 ).__getattribute__(fn_name)()._value_fn()
@@ -686,9 +766,11 @@ class _FakeEth:
     def __init__(self, fake_w3):
         self._fake_w3 = fake_w3
         self._chain_id_reads = 0
+        self._block_number_reads = 0
 
     @property
     def block_number(self) -> int:
+        self._block_number_reads += 1
         return self._fake_w3._latest_block
 
     @property
@@ -708,6 +790,24 @@ class _FakeEth:
         ))
         return _FakeBlock(self._fake_w3._block_timestamp)
 
+    def get_logs(self, filter_params):
+        # eth_getLogs over FakeWeb3._logs: address, inclusive block
+        # range, and a topic0 OR-list — the filter fetch_pool_logs sends.
+        self._fake_w3._call_log.append(CallRecord(
+            address = filter_params["address"],
+            function = "get_logs",
+            block_identifier = (filter_params["fromBlock"],
+                                filter_params["toBlock"]),
+        ))
+        topic0s = filter_params.get("topics", [None])[0]
+        return [
+            log for log in self._fake_w3._logs
+            if log["address"] == filter_params["address"]
+            and filter_params["fromBlock"] <= log["blockNumber"]
+                <= filter_params["toBlock"]
+            and (topic0s is None or log["topics"][0] in topic0s)
+        ]
+
     def contract(self, address=None, abi=None):
         # Address arrives in checksum form (LiveProvider normalizes
         # via to_checksum_address before reaching here). Look it up
@@ -764,8 +864,27 @@ class FakeWeb3:
         self._pool_specs: dict = {}
         self._token_specs: dict = {}
         self._call_log: list = []
+        self._logs: list = []
         self.eth = _FakeEth(self)
 
+    def add_log(self, address: str, signature: str, block_number: int,
+                log_index: int, data_types: list, data: list,
+                topics: tuple = (), tx_hash: bytes = None) -> None:
+        """Register a raw event log for eth_getLogs. `topics` are the
+        indexed args after topic0, as (abi_type, value) pairs."""
+        from eth_abi import encode
+        from eth_utils import keccak
+        self._logs.append({
+            "address": address,
+            "topics": [keccak(text = signature)] + [
+                encode([abi_type], [value]) for abi_type, value in topics
+            ],
+            "data": encode(data_types, data),
+            "blockNumber": block_number,
+            "logIndex": log_index,
+            "transactionHash": tx_hash,
+        })
+
     def to_checksum_address(self, address: str) -> str:
         # Phase 2 — V3 reads addresses back from eth_abi decode in
         # lowercase. Normalize here so callers pass-through to
@@ -824,6 +943,148 @@ class FakeRpcClient:
         """
         return list(self._w3._call_log)
 
+    @property
+    def round_trips(self) -> int:
+        """JSON-RPC requests a real node would have served so far.
+
+        Counts eth_blockNumber and eth_chainId reads plus every
+        unbatched CallRecord (direct eth_calls, aggregate3 envelopes,
+        get_block). Sub-calls inside an aggregate3 ride on their
+        envelope and don't count.
+        """
+        eth = self._w3.eth
+        return (
+            eth._block_number_reads
+            + eth._chain_id_reads
+            + sum(1 for rec in self._w3._call_log if not rec.batched)
+        )
+
+
+# ─── Async variant ─────────────────────────────────────────────────────────
+#
+# AsyncLiveProvider awaits `w3.eth.block_number`, `w3.eth.chain_id` and
+# `contract.functions.X(...).call(...)`. The async fakes wrap the sync
+# ones — same specs, same call_log — and make every request awaitable.
+# `latency` seconds of simulated network time per request lets tests
+# observe overlap; `max_in_flight` records the peak concurrency.
+
+
+class _AsyncFakeWeb3:
+    """web3.AsyncWeb3 stand-in over a FakeWeb3."""
+
+    def __init__(self, fake_w3: FakeWeb3, latency: float = 0.0):
+        self._sync = fake_w3
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.eth = _AsyncFakeEth(self)
+
+    def to_checksum_address(self, address: str) -> str:
+        return self._sync.to_checksum_address(address)
+
+    async def _request(self, value_fn):
+        import asyncio
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            return value_fn()
+        finally:
+            self.in_flight -= 1
+
+
+class _AsyncFakeEth:
+    """web3.eth (async) stand-in: awaitable properties, contracts whose
+    prepared calls are awaitable."""
+
+    def __init__(self, async_w3: _AsyncFakeWeb3):
+        self._async_w3 = async_w3
+
+    @property
+    def block_number(self):
+        return self._async_w3._request(
+            lambda: self._async_w3._sync.eth.block_number,
+        )
+
+    @property
+    def chain_id(self):
+        return self._async_w3._request(
+            lambda: self._async_w3._sync.eth.chain_id,
+        )
+
+    def contract(self, address=None, abi=None):
+        contract = self._async_w3._sync.eth.contract(address = address, abi = abi)
+        return _FakeContract(
+            contract.address, abi,
+            _AsyncFunctions(contract.functions, self._async_w3),
+        )
+
+
+class _AsyncFunctions:
+    """Wraps a sync `.functions` surface; each prepared call becomes
+    an _AsyncBound."""
+
+    def __init__(self, functions, async_w3: _AsyncFakeWeb3):
+        self._functions = functions
+        self._async_w3 = async_w3
+
+    def __getattr__(self, name):
+        fn = getattr(self._functions, name)
+        return lambda *args: _AsyncBound(fn(*args), self._async_w3)
+
+
+class _AsyncBound:
+    def __init__(self, bound, async_w3: _AsyncFakeWeb3):
+        self._bound = bound
+        self._async_w3 = async_w3
+
+    async def call(self, block_identifier=None):
+        return await self._async_w3._request(
+            lambda: self._bound.call(block_identifier = block_identifier),
+        )
+
+
+class AsyncFakeRpcClient:
+    """Test-only AsyncRpcClient stand-in.
+
+    Duck-types defipy.twin._rpc.AsyncRpcClient. `call_log` and
+    `round_trips` read the same records as FakeRpcClient.
+    """
+
+    def __init__(self, fake_w3: FakeWeb3, latency: float = 0.0):
+        self._sync_client = FakeRpcClient(fake_w3)
+        self._w3 = _AsyncFakeWeb3(fake_w3, latency)
+        self._chain_id_cache = None
+
+    def get_w3(self):
+        return self._w3
+
+    async def block_number(self) -> int:
+        return await self._w3.eth.block_number
+
+    async def chain_id(self) -> int:
+        if self._chain_id_cache is None:
+            self._chain_id_cache = await self._w3.eth.chain_id
+        return self._chain_id_cache
+
+    async def is_connected(self) -> bool:
+        return True
+
+    # ─── Test inspection ───────────────────────────────────────────────────
+
+    @property
+    def call_log(self) -> list:
+        return self._sync_client.call_log
+
+    @property
+    def round_trips(self) -> int:
+        return self._sync_client.round_trips
+
+    @property
+    def max_in_flight(self) -> int:
+        """Peak number of requests awaiting a reply at once."""
+        return self._w3.max_in_flight
+
 
 # ─── Builder API ───────────────────────────────────────────────────────────
 
@@ -845,10 +1106,11 @@ def build_fake_client(
 
     Parameters
     ----------
-    pool : V2PoolSpec | V3PoolSpec
+    pool : V2PoolSpec | V3PoolSpec | BalancerPoolSpec | CurvePoolSpec | list
         Pool metadata. V2: address, token addrs, raw reserves.
         V3: address, token addrs, sqrtPriceX96, liquidity, fee,
-        tickSpacing, tick.
+        tickSpacing, tick. A list registers several pools on one
+        client (LiveProvider.snapshot_many tests).
     tokens : list[TokenSpec]
         Token metadata (symbol, decimals) for token0 and token1.
         Must include specs for both addresses referenced by `pool`.
@@ -868,6 +1130,37 @@ def build_fake_client(
         chain_id = chain_id,
         block_timestamp = block_timestamp,
     )
+    pools = pool if isinstance(pool, (list, tuple)) else [pool]
+    for spec in pools:
+        _register_pool(fake, spec)
+    for token in tokens:
+        fake._token_specs[token.address] = token
+    # Sanity check: the pools' referenced token addrs must have specs.
+    referenced = set()
+    for spec in pools:
+        if isinstance(spec, CurvePoolSpec):
+            referenced |= set(spec.coin_addresses)
+        else:
+            referenced |= {spec.token0_address, spec.token1_address}
+    provided = {t.address for t in tokens}
+    missing = referenced - provided
+    if missing:
+        raise ValueError(
+            "build_fake_client: pool references token addresses "
+            "without TokenSpecs: {}".format(missing)
+        )
+    return FakeRpcClient(fake)
+
+
+def build_fake_async_client(*, latency: float = 0.0, **kwargs) -> AsyncFakeRpcClient:
+    """AsyncFakeRpcClient over the same fixtures as build_fake_client
+    (same keyword arguments), for `AsyncLiveProvider._with_client`.
+    `latency` is the simulated seconds per request."""
+    return AsyncFakeRpcClient(build_fake_client(**kwargs)._w3, latency)
+
+
+def _register_pool(fake, pool) -> None:
+    """Register one pool spec on a FakeWeb3 (see build_fake_client)."""
     if isinstance(pool, V2PoolSpec):
         fake._pool_specs[pool.address] = pool
     elif isinstance(pool, V3PoolSpec):
@@ -896,21 +1189,6 @@ def build_fake_client(
             "BalancerPoolSpec, or CurvePoolSpec; got {}"
             .format(type(pool).__name__)
         )
-    for token in tokens:
-        fake._token_specs[token.address] = token
-    # Sanity check: the pool's referenced token addrs must have specs.
-    if isinstance(pool, CurvePoolSpec):
-        referenced = set(pool.coin_addresses)
-    else:
-        referenced = {pool.token0_address, pool.token1_address}
-    provided = {t.address for t in tokens}
-    missing = referenced - provided
-    if missing:
-        raise ValueError(
-            "build_fake_client: pool references token addresses "
-            "without TokenSpecs: {}".format(missing)
-        )
-    return FakeRpcClient(fake)
 
 
 # ─── Canonical V2 pool fixture: WETH/USDC mainnet ──────────────────────────
@@ -27,3 +27,17 @@ from primitives.conftest import (  # noqa: F401
     balancer_setup,
     stableswap_setup,
 )
+
+
+import pytest
+
+from defipy.twin.token_cache import default_token_cache
+
+
+@pytest.fixture(autouse = True)
+def _cold_token_cache():
+    """Every twin test starts with an empty process-wide token metadata
+    cache, so call-log assertions don't depend on test order."""
+    default_token_cache().clear()
+    yield
+    default_token_cache().clear()
@@ -0,0 +1,250 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Mocked-RPC unit tests for AsyncLiveProvider.
+
+Runs against AsyncFakeRpcClient (the async wrapper over the same specs
+as FakeRpcClient). Parity is checked against the sync LiveProvider on a
+fresh client; coroutines are driven with asyncio.run so the suite needs
+no async test plugin."""
+
+import asyncio
+
+import pytest
+
+from defipy.twin import (
+    AsyncLiveProvider,
+    LiveProvider,
+    SnapshotCache,
+    StateTwinBuilder,
+)
+from defipy.twin.token_cache import default_token_cache
+
+from twin._fake_rpc import (
+    build_fake_client,
+    build_fake_async_client,
+    canonical_weth_usdc_v2_spec, canonical_weth_usdc_token_specs,
+    canonical_usdc_weth_v3_spec, canonical_usdc_weth_v3_token_specs,
+    canonical_bal_weth_balancer_spec, canonical_bal_weth_token_specs,
+    canonical_3pool_curve_spec, canonical_3pool_curve_token_specs,
+    WETH_USDC_V2_POOL, USDC_WETH_V3_POOL, BAL_WETH_BALANCER_POOL,
+    CURVE_3POOL,
+)
+
+
+POOL_IDS = [
+    "uniswap_v2:{}".format(WETH_USDC_V2_POOL),
+    "uniswap_v3:{}".format(USDC_WETH_V3_POOL),
+    "balancer:{}".format(BAL_WETH_BALANCER_POOL),
+    "stableswap:{}".format(CURVE_3POOL),
+]
+
+SPECS = [
+    (canonical_weth_usdc_v2_spec, canonical_weth_usdc_token_specs),
+    (canonical_usdc_weth_v3_spec, canonical_usdc_weth_v3_token_specs),
+    (canonical_bal_weth_balancer_spec, canonical_bal_weth_token_specs),
+    (canonical_3pool_curve_spec, canonical_3pool_curve_token_specs),
+]
+
+
+def _all_tokens():
+    by_addr = {}
+    for _pool, tokens in SPECS:
+        for t in tokens():
+            by_addr[t.address] = t
+    return list(by_addr.values())
+
+
+def _fixtures():
+    return dict(pool = [pool() for pool, _ in SPECS], tokens = _all_tokens())
+
+
+def _sync_snapshot(pool_id, **kwargs):
+    default_token_cache().clear()
+    client = build_fake_client(**_fixtures())
+    snap = LiveProvider._with_client(client).snapshot(pool_id, **kwargs)
+    default_token_cache().clear()
+    return snap
+
+
+# ─── Construction ──────────────────────────────────────────────────────────
+
+
+def test_max_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+        AsyncLiveProvider("http://x", max_concurrency = 0)
+
+
+def test_construction_does_not_connect():
+    provider = AsyncLiveProvider("http://x")
+    assert provider._cached_client is None
+
+
+# ─── snapshot() ────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("pool_id", POOL_IDS)
+def test_snapshot_matches_sync_provider(pool_id):
+    expected = _sync_snapshot(pool_id, block_number = 20_000_000)
+    client = build_fake_async_client(**_fixtures())
+    snap = asyncio.run(AsyncLiveProvider._with_client(client).snapshot(
+        pool_id, block_number = 20_000_000,
+    ))
+    assert snap == expected
+
+
+def test_snapshot_honors_v3_tick_overrides():
+    kwargs = dict(block_number = 20_000_000, lwr_tick = 200_040, upr_tick = 200_100)
+    expected = _sync_snapshot(POOL_IDS[1], **kwargs)
+    client = build_fake_async_client(**_fixtures())
+    snap = asyncio.run(
+        AsyncLiveProvider._with_client(client).snapshot(POOL_IDS[1], **kwargs)
+    )
+    assert (snap.lwr_tick, snap.upr_tick) == (200_040, 200_100)
+    assert snap == expected
+
+
+def test_snapshot_honors_n_coins_hint():
+    client = build_fake_async_client(**_fixtures())
+    snap = asyncio.run(AsyncLiveProvider._with_client(client).snapshot(
+        POOL_IDS[3], n_coins = 3,
+    ))
+    assert len(snap.token_names) == 3
+
+
+def test_snapshot_pins_every_read_to_resolved_block():
+    client = build_fake_async_client(**_fixtures(), latest_block = 18_000_000)
+    snap = asyncio.run(
+        AsyncLiveProvider._with_client(client).snapshot(POOL_IDS[0])
+    )
+    assert snap.block_number == 18_000_000
+    assert {rec.block_identifier for rec in client.call_log} == {18_000_000}
+
+
+def test_snapshot_round_trips_match_sync_path():
+    """Cold token cache, "latest": eth_blockNumber + eth_chainId + one
+    aggregate3 for the pool + one for token metadata."""
+    client = build_fake_async_client(**_fixtures())
+    asyncio.run(AsyncLiveProvider._with_client(client).snapshot(POOL_IDS[0]))
+    assert client.round_trips == 4
+
+
+def test_snapshot_bad_pool_id_raises_before_io():
+    client = build_fake_async_client(**_fixtures())
+    with pytest.raises(ValueError):
+        asyncio.run(
+            AsyncLiveProvider._with_client(client).snapshot("uniswap_v4:0xabc")
+        )
+    assert client.round_trips == 0
+
+
+def test_snapshot_read_error_propagates():
+    client = build_fake_async_client(**_fixtures())
+    with pytest.raises(RuntimeError) as excinfo:
+        asyncio.run(AsyncLiveProvider._with_client(client).snapshot(
+            "uniswap_v2:0x0000000000000000000000000000000000001001",
+        ))
+    assert str(excinfo.value).startswith("AsyncLiveProvider.snapshot: ")
+
+
+def test_snapshot_builds_a_twin():
+    client = build_fake_async_client(**_fixtures())
+    snap = asyncio.run(
+        AsyncLiveProvider._with_client(client).snapshot(POOL_IDS[0])
+    )
+    lp = StateTwinBuilder().build(snap)
+    assert lp.live_snapshot is True
+
+
+# ─── snapshot_many() ───────────────────────────────────────────────────────
+
+
+def test_snapshot_many_matches_sync_snapshot_many():
+    sync_client = build_fake_client(**_fixtures())
+    expected = LiveProvider._with_client(sync_client).snapshot_many(
+        POOL_IDS, block_number = 20_000_000,
+    )
+    default_token_cache().clear()
+    client = build_fake_async_client(**_fixtures())
+    snaps = asyncio.run(AsyncLiveProvider._with_client(client).snapshot_many(
+        POOL_IDS, block_number = 20_000_000,
+    ))
+    assert snaps == expected
+
+
+def test_snapshot_many_isolates_errors():
+    client = build_fake_async_client(**_fixtures())
+    snaps = asyncio.run(AsyncLiveProvider._with_client(client).snapshot_many(
+        [POOL_IDS[0], "not-a-pool-id", POOL_IDS[1]],
+    ))
+    assert isinstance(snaps[1], ValueError)
+    assert snaps[0].pool_id == WETH_USDC_V2_POOL
+    assert snaps[2].pool_id == USDC_WETH_V3_POOL
+
+
+def test_snapshot_many_uses_cache():
+    cache = SnapshotCache()
+    client = build_fake_async_client(**_fixtures())
+    provider = AsyncLiveProvider._with_client(client, cache = cache)
+    asyncio.run(provider.snapshot_many(POOL_IDS, block_number = 20_000_000))
+    before = client.round_trips
+    snaps = asyncio.run(provider.snapshot_many(POOL_IDS, block_number = 20_000_000))
+    assert client.round_trips == before
+    assert cache.hits == len(POOL_IDS)
+    assert not any(isinstance(s, Exception) for s in snaps)
+
+
+def test_snapshot_many_rejects_bad_batch_size():
+    client = build_fake_async_client(**_fixtures())
+    with pytest.raises(ValueError):
+        asyncio.run(AsyncLiveProvider._with_client(client).snapshot_many(
+            POOL_IDS, batch_size = 0,
+        ))
+
+
+# ─── Bounded concurrency ───────────────────────────────────────────────────
+
+
+def test_snapshot_many_chunks_run_concurrently():
+    client = build_fake_async_client(**_fixtures(), latency = 0.01)
+    provider = AsyncLiveProvider._with_client(client, max_concurrency = 8)
+    snaps = asyncio.run(provider.snapshot_many(POOL_IDS, batch_size = 4))
+    assert not any(isinstance(s, Exception) for s in snaps)
+    assert client.max_in_flight > 1
+
+
+def test_max_concurrency_bounds_in_flight_requests():
+    client = build_fake_async_client(**_fixtures(), latency = 0.01)
+    provider = AsyncLiveProvider._with_client(client, max_concurrency = 2)
+
+    async def sweep():
+        return await asyncio.gather(
+            provider.snapshot_many(POOL_IDS, batch_size = 4),
+            *(provider.snapshot(pool_id) for pool_id in POOL_IDS),
+        )
+
+    asyncio.run(sweep())
+    assert client.max_in_flight == 2
+
+
+def test_provider_survives_multiple_event_loops():
+    client = build_fake_async_client(**_fixtures(), latency = 0.001)
+    provider = AsyncLiveProvider._with_client(client, max_concurrency = 1)
+    for _ in range(2):
+        snaps = asyncio.run(provider.snapshot_many(POOL_IDS, batch_size = 4))
+        assert not any(isinstance(s, Exception) for s in snaps)
@@ -0,0 +1,66 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Token-name resolution shared by ScenarioEngine, run_batch and the
+MCP server (defipy.twin._dispatch)."""
+
+import pytest
+
+from defipy.twin import MockProvider, StateTwinBuilder
+from defipy.twin._dispatch import (
+    describe_error,
+    pool_token_names,
+    resolve_token,
+    resolve_tokens,
+)
+
+
+def _build(recipe):
+    return StateTwinBuilder().build(MockProvider().snapshot(recipe))
+
+
+@pytest.mark.parametrize("recipe, name", [
+    ("eth_dai_v2", "DAI"),
+    ("eth_dai_v3", "ETH"),
+    ("eth_dai_balancer_50_50", "ETH"),
+    ("usdc_dai_stableswap_A10", "USDC"),
+])
+def test_resolve_token_finds_factory_and_vault_tokens(recipe, name):
+    assert resolve_token(_build(recipe), name).token_name == name
+
+
+def test_resolve_token_unknown_lists_available_names():
+    lp = _build("eth_dai_v2")
+    with pytest.raises(ValueError) as excinfo:
+        resolve_token(lp, "NOPE")
+    assert "NOPE" in str(excinfo.value)
+    assert str(pool_token_names(lp)) in str(excinfo.value)
+
+
+def test_resolve_tokens_returns_a_resolved_copy():
+    lp = _build("usdc_dai_stableswap_A10")
+    params = {"depeg_token": "USDC", "token_in": lp.vault.get_token("DAI"),
+              "amount": 5}
+    kwargs = resolve_tokens(lp, params)
+    assert kwargs["depeg_token"].token_name == "USDC"
+    assert kwargs["token_in"] is params["token_in"]
+    assert params["depeg_token"] == "USDC"
+
+
+def test_describe_error():
+    assert describe_error(ValueError("bad")) == "ValueError: bad"
@@ -0,0 +1,436 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Unit tests for TwinEventUpdater, LiveProvider.pool_events and
+LiveProvider.follow.
+
+The reference for every incremental update is a twin freshly built
+from a snapshot of the state the events lead to: after applying the
+events, the updated twin must report the same reserves, price and
+liquidity."""
+
+import pytest
+
+from defipy.twin import (
+    LiveProvider,
+    MockProvider,
+    StateTwinBuilder,
+    TwinEventUpdater,
+)
+
+from twin._fake_rpc import (
+    build_fake_client,
+    canonical_weth_usdc_v2_spec, canonical_weth_usdc_token_specs,
+    canonical_usdc_weth_v3_spec, canonical_usdc_weth_v3_token_specs,
+    WETH_USDC_V2_POOL, USDC_WETH_V3_POOL,
+)
+
+
+V2_ID = "uniswap_v2:{}".format(WETH_USDC_V2_POOL)
+V3_ID = "uniswap_v3:{}".format(USDC_WETH_V3_POOL)
+START = 20_000_000
+
+SYNC = "Sync(uint112,uint112)"
+V2_SWAP = "Swap(address,uint256,uint256,uint256,uint256,address)"
+V2_MINT = "Mint(address,uint256,uint256)"
+V3_SWAP = "Swap(address,address,int256,int256,uint160,uint128,int24)"
+V3_MINT = "Mint(address,address,int24,int24,uint128,uint256,uint256)"
+
+USDC, WETH = 10**6, 10**18
+
+
+def _v2(reserves_by_block = None):
+    spec = canonical_weth_usdc_v2_spec()
+    spec.reserves_by_block = reserves_by_block
+    client = build_fake_client(
+        pool = spec, tokens = canonical_weth_usdc_token_specs(),
+    )
+    return LiveProvider._with_client(client), client
+
+
+def _v3():
+    client = build_fake_client(
+        pool = canonical_usdc_weth_v3_spec(),
+        tokens = canonical_usdc_weth_v3_token_specs(),
+    )
+    return LiveProvider._with_client(client), client
+
+
+def _event(name, block, log_index, tx = None, **args):
+    return {"event": name, "args": args, "blockNumber": block,
+            "logIndex": log_index, "transactionHash": tx}
+
+
+def _reserves(lp):
+    return (lp.convert_to_human(lp.reserve0), lp.convert_to_human(lp.reserve1))
+
+
+def _v2_twin(provider):
+    snap = provider.snapshot(V2_ID, block_number = START)
+    return StateTwinBuilder().build(snap), snap
+
+
+# ─── Uniswap V2 ────────────────────────────────────────────────────────────
+
+
+def test_v2_sync_matches_fresh_build():
+    new = (51_000_000 * USDC, 14_800 * WETH)
+    provider, _ = _v2({START + 1: new})
+    lp, _ = _v2_twin(provider)
+    TwinEventUpdater(lp, 6, 18).apply([
+        _event("Sync", START + 1, 0, reserve0 = new[0], reserve1 = new[1]),
+    ])
+    fresh = StateTwinBuilder().build(
+        provider.snapshot(V2_ID, block_number = START + 1)
+    )
+    assert _reserves(lp) == _reserves(fresh)
+    assert lp.reserve0 == fresh.reserve0 and lp.reserve1 == fresh.reserve1
+    tokens = lp.factory.token_from_exchange[lp.name]
+    assert tokens[lp.token0].token_total == lp.reserve0
+    assert lp.snapshot_block_number == START + 1
+
+
+def test_v2_swap_paired_with_sync_is_not_double_counted():
+    provider, _ = _v2()
+    lp, _ = _v2_twin(provider)
+    new = (50_100_000 * USDC, 14_970 * WETH)
+    TwinEventUpdater(lp, 6, 18).apply([
+        _event("Sync", START + 1, 0, tx = b"a", reserve0 = new[0], reserve1 = new[1]),
+        _event("Swap", START + 1, 1, tx = b"a", amount0In = 100_000 * USDC,
+               amount1In = 0, amount0Out = 0, amount1Out = 30 * WETH),
+    ])
+    assert _reserves(lp) == pytest.approx((50_100_000, 14_970))
+
+
+def test_v2_unpaired_swap_applies_deltas():
+    provider, _ = _v2()
+    lp, _ = _v2_twin(provider)
+    TwinEventUpdater(lp, 6, 18).apply([
+        _event("Swap", START + 1, 1, amount0In = 100_000 * USDC,
+               amount1In = 0, amount0Out = 0, amount1Out = 30 * WETH),
+    ])
+    assert _reserves(lp) == pytest.approx((50_100_000, 14_970))
+
+
+def test_v2_mint_and_burn_move_lp_supply_pro_rata():
+    provider, _ = _v2()
+    lp, snap = _v2_twin(provider)
+    updater = TwinEventUpdater(lp, 6, 18)
+    supply = lp.get_liquidity()
+    updater.apply([
+        _event("Sync", START + 1, 0, tx = b"m", reserve0 = 55_000_000 * USDC,
+               reserve1 = 16_500 * WETH),
+        _event("Mint", START + 1, 1, tx = b"m", amount0 = 5_000_000 * USDC,
+               amount1 = 1_500 * WETH),
+    ])
+    assert lp.get_liquidity() == pytest.approx(supply * 1.1)
+    updater.apply([
+        _event("Sync", START + 2, 0, tx = b"b", reserve0 = 50_000_000 * USDC,
+               reserve1 = 15_000 * WETH),
+        _event("Burn", START + 2, 1, tx = b"b", amount0 = 5_000_000 * USDC,
+               amount1 = 1_500 * WETH),
+    ])
+    assert lp.get_liquidity() == pytest.approx(supply)
+    assert lp.get_liquidity_from_provider("twin_user") == pytest.approx(supply)
+
+
+def test_v2_skips_events_already_in_the_twin():
+    provider, _ = _v2()
+    lp, _ = _v2_twin(provider)
+    updater = TwinEventUpdater(lp, 6, 18)
+    sync = lambda block, i, r0: _event(
+        "Sync", block, i, reserve0 = r0 * USDC, reserve1 = 15_000 * WETH,
+    )
+    # At the snapshot block: already reflected.
+    assert updater.apply([sync(START, 3, 1)]) == 0
+    assert updater.apply([sync(START + 1, 0, 2), sync(START + 1, 1, 3)],
+                         through_block = START + 1) == 2
+    # Overlapping range: nothing new.
+    assert updater.apply([sync(START + 1, 1, 4)]) == 0
+    assert lp.convert_to_human(lp.reserve0) == pytest.approx(3)
+    assert updater.events_applied == 2
+    assert updater.block_number == START + 1
+
+
+def test_v2_through_block_advances_with_no_events():
+    provider, _ = _v2()
+    lp, _ = _v2_twin(provider)
+    updater = TwinEventUpdater(lp, 6, 18)
+    assert updater.apply([], through_block = START + 10) == 0
+    assert updater.block_number == lp.snapshot_block_number == START + 10
+
+
+def test_v2_verify_and_resync():
+    new = (52_000_000 * USDC, 14_500 * WETH)
+    provider, _ = _v2({START + 1: new})
+    lp, _ = _v2_twin(provider)
+    updater = TwinEventUpdater(lp, 6, 18)
+    # The range held the reserve change but the Sync log was missed.
+    updater.apply([], through_block = START + 1)
+    snap = provider.snapshot(V2_ID, block_number = START + 1)
+    assert updater.verify(snap) is False
+    assert updater.last_drift > 0.01
+    assert _reserves(lp) == pytest.approx((52_000_000, 14_500))
+    assert updater.verify(snap) is True
+
+
+def test_verify_rejects_snapshot_at_another_block():
+    provider, _ = _v2()
+    lp, _ = _v2_twin(provider)
+    with pytest.raises(ValueError):
+        TwinEventUpdater(lp, 6, 18).verify(
+            provider.snapshot(V2_ID, block_number = START + 5)
+        )
+
+
+def test_rejects_unsupported_twin():
+    lp = StateTwinBuilder().build(MockProvider().snapshot("eth_dai_balancer_50_50"))
+    with pytest.raises(TypeError):
+        TwinEventUpdater(lp)
+
+
+# ─── Uniswap V3 ────────────────────────────────────────────────────────────
+
+
+def _v3_state(lp):
+    return (_reserves(lp), lp.slot0.sqrtPriceX96, lp.slot0.tick,
+            lp.total_supply)
+
+
+def test_v3_swap_matches_fresh_build():
+    provider, client = _v3()
+    lp = StateTwinBuilder().build(provider.snapshot(V3_ID, block_number = START))
+    spec = client.get_w3()._pool_specs[USDC_WETH_V3_POOL]
+    spec.sqrt_price_x96 = spec.sqrt_price_x96 * 101 // 100
+    spec.liquidity = spec.liquidity * 9 // 10
+    spec.tick += 199
+
+    TwinEventUpdater(lp, 6, 18).apply([_event(
+        "Swap", START + 1, 0, amount0 = 0, amount1 = 0,
+        sqrtPriceX96 = spec.sqrt_price_x96, liquidity = spec.liquidity,
+        tick = spec.tick,
+    )])
+    fresh = StateTwinBuilder().build(
+        provider.snapshot(V3_ID, block_number = START + 1)
+    )
+    assert _v3_state(lp) == _v3_state(fresh)
+    assert lp.get_price(lp.factory.token_from_exchange[lp.name][lp.token0]) \
+        == fresh.get_price(fresh.factory.token_from_exchange[fresh.name][fresh.token0])
+
+
+def test_v3_twin_still_swaps_after_update():
+    provider, client = _v3()
+    lp = StateTwinBuilder().build(provider.snapshot(V3_ID, block_number = START))
+    spec = client.get_w3()._pool_specs[USDC_WETH_V3_POOL]
+    TwinEventUpdater(lp, 6, 18).apply([_event(
+        "Swap", START + 1, 0, amount0 = 0, amount1 = 0,
+        sqrtPriceX96 = spec.sqrt_price_x96 * 102 // 100,
+        liquidity = spec.liquidity, tick = spec.tick + 396,
+    )])
+    from uniswappy.process.swap import Swap
+    usdc = lp.factory.token_from_exchange[lp.name][lp.token0]
+    assert Swap().apply(lp, usdc, "trader", 1_000.0) > 0
+
+
+def test_v3_mint_in_range_uses_seeded_raw_state():
+    provider, client = _v3()
+    spec = client.get_w3()._pool_specs[USDC_WETH_V3_POOL]
+    lp = StateTwinBuilder().build(provider.snapshot(V3_ID, block_number = START))
+    updater = TwinEventUpdater(lp, 6, 18, sqrt_price_x96 = spec.sqrt_price_x96,
+                               liquidity = spec.liquidity)
+    added = spec.liquidity // 4
+    updater.apply([
+        _event("Mint", START + 1, 0, tickLower = -887_220,
+               tickUpper = 887_220, amount = added,
+               amount0 = 1, amount1 = 1, sender = WETH_USDC_V2_POOL),
+        # Above the current tick: active liquidity unchanged.
+        _event("Mint", START + 1, 1, tickLower = 800_000,
+               tickUpper = 800_600, amount = added,
+               amount0 = 1, amount1 = 0, sender = WETH_USDC_V2_POOL),
+    ])
+    spec.liquidity += added
+    fresh = StateTwinBuilder().build(
+        provider.snapshot(V3_ID, block_number = START + 1)
+    )
+    assert _v3_state(lp) == _v3_state(fresh)
+    assert updater.stale is False
+
+
+def test_v3_mint_without_raw_state_marks_stale_until_resync():
+    provider, client = _v3()
+    lp = StateTwinBuilder().build(provider.snapshot(V3_ID, block_number = START))
+    updater = TwinEventUpdater(lp, 6, 18)
+    updater.apply([_event("Mint", START + 1, 0, tickLower = -887_220,
+                          tickUpper = 887_220, amount = 10**18, amount0 = 1,
+                          amount1 = 1, sender = WETH_USDC_V2_POOL)])
+    assert updater.stale is True
+    snap = provider.snapshot(V3_ID, block_number = START + 1)
+    assert updater.verify(snap) is False
+    assert updater.stale is True      # no raw state passed to resync
+    spec = client.get_w3()._pool_specs[USDC_WETH_V3_POOL]
+    updater.resync(snap, spec.sqrt_price_x96, spec.liquidity)
+    assert updater.stale is False
+    assert updater.verify(snap) is True
+
+
+# ─── LiveProvider.pool_events / follow ─────────────────────────────────────
+
+
+def _add_sync(client, block, log_index, r0, r1, tx = None):
+    client.get_w3().add_log(
+        WETH_USDC_V2_POOL, SYNC, block, log_index,
+        ["uint112", "uint112"], [r0, r1], tx_hash = tx,
+    )
+
+
+def test_pool_events_decodes_one_get_logs():
+    provider, client = _v2()
+    w3 = client.get_w3()
+    _add_sync(client, START + 2, 4, 1 * USDC, 2 * WETH, tx = b"\x01" * 32)
+    w3.add_log(WETH_USDC_V2_POOL, V2_SWAP, START + 2, 5,
+               ["uint256"] * 4, [USDC, 0, 0, WETH],
+               topics = (("address", WETH_USDC_V2_POOL),
+                         ("address", WETH_USDC_V2_POOL)))
+    _add_sync(client, START + 1, 9, 3 * USDC, 4 * WETH)
+    _add_sync(client, START + 50, 0, 5 * USDC, 6 * WETH)   # out of range
+    w3.add_log(WETH_USDC_V2_POOL, "Approval(address,address,uint256)",
+               START + 1, 0, ["uint256"], [1])
+
+    before = client.round_trips
+    events = provider.pool_events(V2_ID, START + 1, START + 10)
+    assert client.round_trips - before == 1
+    assert [(e["event"], e["blockNumber"]) for e in events] == [
+        ("Sync", START + 1), ("Sync", START + 2), ("Swap", START + 2),
+    ]
+    assert events[1]["args"] == {"reserve0": USDC, "reserve1": 2 * WETH}
+    assert events[2]["args"]["amount1Out"] == WETH
+
+
+def test_pool_events_decodes_v3_indexed_ticks():
+    provider, client = _v3()
+    client.get_w3().add_log(
+        USDC_WETH_V3_POOL, V3_MINT, START + 1, 0,
+        ["address", "uint128", "uint256", "uint256"],
+        [USDC_WETH_V3_POOL, 10**18, 5, 6],
+        topics = (("address", USDC_WETH_V3_POOL), ("int24", -600),
+                  ("int24", 1200)),
+    )
+    event, = provider.pool_events(V3_ID, START, START + 1)
+    assert event["event"] == "Mint"
+    assert (event["args"]["tickLower"], event["args"]["tickUpper"]) == (-600, 1200)
+    assert event["args"]["amount"] == 10**18
+
+
+@pytest.mark.parametrize("pool_id, blocks", [
+    ("balancer:0x5c6Ee304399DBdB9C8Ef030aB642B10820DB8F56", (1, 2)),
+    (V2_ID, (5, 4)),
+])
+def test_pool_events_rejects_bad_arguments(pool_id, blocks):
+    provider, _ = _v2()
+    with pytest.raises(ValueError):
+        provider.pool_events(pool_id, *blocks)
+
+
+def test_follow_advance_is_one_get_logs_per_call():
+    new = (50_500_000 * USDC, 14_850 * WETH)
+    provider, client = _v2({START + 3: new})
+    _add_sync(client, START + 3, 0, *new)
+    follower = provider.follow(V2_ID, block_number = START)
+
+    before = client.round_trips
+    assert follower.advance(START + 5) == 1
+    assert client.round_trips - before == 1
+    assert follower.block_number == START + 5
+    fresh = StateTwinBuilder().build(
+        provider.snapshot(V2_ID, block_number = START + 5)
+    )
+    assert _reserves(follower.lp) == _reserves(fresh)
+    assert follower.advance(START + 5) == 0
+
+
+def test_follow_advance_chunks_wide_ranges():
+    new = (50_500_000 * USDC, 14_850 * WETH)
+    provider, client = _v2({START + 7: new})
+    _add_sync(client, START + 7, 0, *new)
+    follower = provider.follow(V2_ID, block_number = START,
+                               log_block_range = 4)
+    calls = []
+    real = provider.pool_events
+    def recording(pool_id, from_block, to_block):
+        calls.append((from_block, to_block))
+        return real(pool_id, from_block, to_block)
+    provider.pool_events = recording
+
+    assert follower.advance(START + 10) == 1
+    assert calls == [(START + 1, START + 4), (START + 5, START + 8),
+                     (START + 9, START + 10)]
+    assert follower.block_number == START + 10
+    assert _reserves(follower.lp) == pytest.approx((50_500_000, 14_850))
+
+
+def test_follow_advance_resumes_after_failed_chunk():
+    provider, _ = _v2()
+    follower = provider.follow(V2_ID, block_number = START,
+                               log_block_range = 4)
+    real = provider.pool_events
+    def flaky(pool_id, from_block, to_block):
+        if from_block > START + 4:
+            raise ConnectionError("range too wide")
+        return real(pool_id, from_block, to_block)
+    provider.pool_events = flaky
+    with pytest.raises(ConnectionError):
+        follower.advance(START + 10)
+    assert follower.block_number == START + 4
+    provider.pool_events = real
+    follower.advance(START + 10)
+    assert follower.block_number == START + 10
+
+
+def test_follow_verify_every_resyncs_on_missed_logs():
+    new = (49_000_000 * USDC, 15_300 * WETH)
+    provider, client = _v2({START + 2: new})
+    follower = provider.follow(V2_ID, block_number = START, verify_every = 4)
+    follower.advance(START + 3)            # no logs, no verify yet
+    assert _reserves(follower.lp) == pytest.approx((50_000_000, 15_000))
+    follower.advance(START + 4)            # verify: drift → resync
+    assert follower.updater.last_drift > 0
+    assert _reserves(follower.lp) == pytest.approx((49_000_000, 15_300))
+
+
+def test_follow_v3_seeds_raw_state():
+    provider, client = _v3()
+    follower = provider.follow(V3_ID, block_number = START)
+    spec = client.get_w3()._pool_specs[USDC_WETH_V3_POOL]
+    assert follower.updater._v3_raw[:2] == [spec.sqrt_price_x96, spec.liquidity]
+
+
+def test_follow_rejects_bad_verify_every():
+    provider, _ = _v2()
+    with pytest.raises(ValueError):
+        provider.follow(V2_ID, verify_every = 0)
+    with pytest.raises(ValueError):
+        provider.follow(V2_ID, log_block_range = 0)
+
+
+def test_follow_rejects_tick_table_twins():
+    provider, client = _v3()
+    before = len(client.call_log)
+    with pytest.raises(ValueError) as excinfo:
+        provider.follow(V3_ID, tick_words = 2)
+    assert "tick_words" in str(excinfo.value)
+    assert len(client.call_log) == before
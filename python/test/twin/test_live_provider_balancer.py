@@ -172,21 +172,25 @@ def test_balancer_snapshot_populates_chain_context():
 def test_balancer_snapshot_two_round_trips():
     """The read is two Multicall3 batches: RT1 (pool no-arg reads +
     timestamp) and RT2 (vault getPoolTokens). poolId isn't known until
-    RT1 returns, so it can't fold into one batch."""
+    RT1 returns, so it can't fold into one batch. A cold token cache
+    adds one metadata batch; a warm one adds nothing."""
     client = build_fake_client(
         pool=canonical_bal_weth_balancer_spec(),
         tokens=canonical_bal_weth_token_specs(),
     )
-    LiveProvider._with_client(client).snapshot(_bal_pool_id())
-    aggregate3_calls = [
-        rec for rec in client.call_log if rec.function == "aggregate3"
-    ]
-    assert len(aggregate3_calls) == 2
+    provider = LiveProvider._with_client(client)
+    count = lambda: len(
+        [rec for rec in client.call_log if rec.function == "aggregate3"]
+    )
+    provider.snapshot(_bal_pool_id())
+    assert count() == 3
+    provider.snapshot(_bal_pool_id())
+    assert count() == 3 + 2
 
 
 def test_balancer_snapshot_reads_expected_functions():
     """RT1 reads getPoolId/getVault/getNormalizedWeights +
-    getCurrentBlockTimestamp; RT2 reads getPoolTokens; FetchToken pulls
+    getCurrentBlockTimestamp; RT2 reads getPoolTokens; a metadata batch pulls
     symbol/decimals per token."""
     client = build_fake_client(
         pool=canonical_bal_weth_balancer_spec(),
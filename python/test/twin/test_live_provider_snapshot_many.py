@@ -0,0 +1,242 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Mocked-RPC unit tests for LiveProvider.snapshot_many.
+
+One FakeRpcClient carries all four canonical pools. Parity is checked
+against `.snapshot()` on a fresh client per pool; round trips are
+counted from the call log's aggregate3 envelopes."""
+
+import pytest
+
+from defipy.twin import (
+    LiveProvider,
+    SnapshotCache,
+    V2PoolSnapshot, V3PoolSnapshot,
+    BalancerPoolSnapshot, StableswapPoolSnapshot,
+)
+from defipy.twin.token_cache import default_token_cache
+
+from twin._fake_rpc import (
+    TokenSpec,
+    build_fake_client,
+    canonical_weth_usdc_v2_spec, canonical_weth_usdc_token_specs,
+    canonical_usdc_weth_v3_spec, canonical_usdc_weth_v3_token_specs,
+    canonical_bal_weth_balancer_spec, canonical_bal_weth_token_specs,
+    canonical_3pool_curve_spec, canonical_3pool_curve_token_specs,
+    WETH_USDC_V2_POOL, USDC_WETH_V3_POOL, BAL_WETH_BALANCER_POOL,
+    CURVE_3POOL,
+)
+
+
+POOL_IDS = [
+    "uniswap_v2:{}".format(WETH_USDC_V2_POOL),
+    "uniswap_v3:{}".format(USDC_WETH_V3_POOL),
+    "balancer:{}".format(BAL_WETH_BALANCER_POOL),
+    "stableswap:{}".format(CURVE_3POOL),
+]
+
+SPECS = [
+    (canonical_weth_usdc_v2_spec, canonical_weth_usdc_token_specs),
+    (canonical_usdc_weth_v3_spec, canonical_usdc_weth_v3_token_specs),
+    (canonical_bal_weth_balancer_spec, canonical_bal_weth_token_specs),
+    (canonical_3pool_curve_spec, canonical_3pool_curve_token_specs),
+]
+
+
+def _all_tokens():
+    by_addr = {}
+    for _pool, tokens in SPECS:
+        for t in tokens():
+            by_addr[t.address] = t
+    return list(by_addr.values())
+
+
+def _mixed_client(**kwargs):
+    return build_fake_client(
+        pool = [pool() for pool, _ in SPECS],
+        tokens = _all_tokens(),
+        **kwargs,
+    )
+
+
+def _aggregate3_count(client):
+    return sum(1 for rec in client.call_log if rec.function == "aggregate3")
+
+
+# ─── Shape & parity ─────────────────────────────────────────────────────────
+
+
+def test_returns_snapshots_in_input_order():
+    provider = LiveProvider._with_client(_mixed_client())
+    snaps = provider.snapshot_many(POOL_IDS)
+    assert [type(s) for s in snaps] == [
+        V2PoolSnapshot, V3PoolSnapshot,
+        BalancerPoolSnapshot, StableswapPoolSnapshot,
+    ]
+    reversed_snaps = provider.snapshot_many(POOL_IDS[::-1])
+    assert reversed_snaps == snaps[::-1]
+
+
+@pytest.mark.parametrize("index", range(len(POOL_IDS)))
+def test_matches_single_pool_snapshot(index):
+    pool, tokens = SPECS[index]
+    single = LiveProvider._with_client(
+        build_fake_client(pool = pool(), tokens = tokens()),
+    ).snapshot(POOL_IDS[index], block_number = 19_000_000)
+    default_token_cache().clear()
+    batch = LiveProvider._with_client(_mixed_client()).snapshot_many(
+        POOL_IDS, block_number = 19_000_000,
+    )
+    assert batch[index] == single
+
+
+def test_resolves_latest_once_and_pins_every_read():
+    client = _mixed_client(latest_block = 20_500_000)
+    snaps = LiveProvider._with_client(client).snapshot_many(POOL_IDS)
+    assert {s.block_number for s in snaps} == {20_500_000}
+    assert {rec.block_identifier for rec in client.call_log} == {20_500_000}
+    assert {s.timestamp for s in snaps} == {1_710_000_000}
+
+
+# ─── Round trips ────────────────────────────────────────────────────────────
+
+
+def test_mixed_sweep_is_three_round_trips():
+    """Phase 1 (all pool getters + timestamp), phase 2 (Balancer vault
+    getPoolTokens), then one token-metadata batch."""
+    client = _mixed_client()
+    LiveProvider._with_client(client).snapshot_many(POOL_IDS)
+    assert _aggregate3_count(client) == 3
+
+
+def test_warm_token_cache_drops_metadata_batch():
+    client = _mixed_client()
+    provider = LiveProvider._with_client(client)
+    provider.snapshot_many(POOL_IDS)
+    before = _aggregate3_count(client)
+    provider.snapshot_many(POOL_IDS)
+    assert _aggregate3_count(client) - before == 2
+
+
+def test_batch_size_chunks_calls():
+    client = _mixed_client()
+    snaps = LiveProvider._with_client(client).snapshot_many(
+        POOL_IDS, batch_size = 8,
+    )
+    # Phase 1 is 1 + 4 + 6 + 3 + 17 = 31 sub-calls → 4 chunks; vault
+    # phase 1; 6 tokens × 2 metadata reads = 12 → 2 chunks.
+    assert _aggregate3_count(client) == 4 + 1 + 2
+    assert not any(isinstance(s, Exception) for s in snaps)
+
+
+def test_many_pools_cost_a_handful_of_round_trips():
+    pool_ids = POOL_IDS[:2] * 100
+    client = _mixed_client()
+    snaps = LiveProvider._with_client(client).snapshot_many(pool_ids)
+    assert len(snaps) == 200
+    # 200 pools × ~5 getters ≈ 1000 sub-calls → 4 batches, + tokens.
+    assert _aggregate3_count(client) <= 5
+
+
+def test_rejects_nonpositive_batch_size():
+    provider = LiveProvider._with_client(_mixed_client())
+    with pytest.raises(ValueError):
+        provider.snapshot_many(POOL_IDS, batch_size = 0)
+
+
+# ─── Error isolation ────────────────────────────────────────────────────────
+
+
+def test_malformed_pool_id_is_isolated():
+    provider = LiveProvider._with_client(_mixed_client())
+    out = provider.snapshot_many(["nonsense", POOL_IDS[0], "curve:0x1"])
+    assert isinstance(out[0], ValueError)
+    assert isinstance(out[1], V2PoolSnapshot)
+    assert isinstance(out[2], ValueError)
+
+
+def test_address_without_code_is_isolated():
+    provider = LiveProvider._with_client(_mixed_client())
+    empty = "uniswap_v3:0x000000000000000000000000000000000000dEaD"
+    out = provider.snapshot_many([POOL_IDS[0], empty, POOL_IDS[1]])
+    assert isinstance(out[1], RuntimeError)
+    assert "token0()" in str(out[1])
+    assert isinstance(out[0], V2PoolSnapshot)
+    assert isinstance(out[2], V3PoolSnapshot)
+
+
+def test_unsupported_pool_shape_is_isolated():
+    THIRD = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
+    spec = canonical_bal_weth_balancer_spec()
+    spec.extra_token_addresses = [THIRD]
+    spec.extra_balances_raw = [1_000 * 10**18]
+    client = build_fake_client(
+        pool = [spec, canonical_weth_usdc_v2_spec()],
+        tokens = canonical_bal_weth_token_specs()
+                 + [TokenSpec(address = THIRD, symbol = "DAI", decimals = 18)]
+                 + [t for t in canonical_weth_usdc_token_specs()
+                    if t.symbol == "USDC"],
+    )
+    out = LiveProvider._with_client(client).snapshot_many(
+        [POOL_IDS[2], POOL_IDS[0]],
+    )
+    assert isinstance(out[0], NotImplementedError)
+    assert isinstance(out[1], V2PoolSnapshot)
+
+
+def test_failed_batch_only_fails_its_pools(monkeypatch):
+    from defipy.twin import _rpc
+    real = _rpc.multicall_aggregate3_args
+    def flaky(w3, calls, block_number, allow_failure = False):
+        if any(c[1] == "getReserves()" for c in calls):
+            raise ConnectionError("body too large")
+        return real(w3, calls, block_number, allow_failure)
+    monkeypatch.setattr(_rpc, "multicall_aggregate3_args", flaky)
+    provider = LiveProvider._with_client(_mixed_client())
+    # batch_size=7: [timestamp + 6 V3 getters] | [4 V2 getters].
+    out = provider.snapshot_many([POOL_IDS[1], POOL_IDS[0]], batch_size = 7)
+    assert isinstance(out[0], V3PoolSnapshot)
+    assert isinstance(out[1], ConnectionError)
+
+
+# ─── Snapshot cache ─────────────────────────────────────────────────────────
+
+
+def test_uses_and_fills_snapshot_cache():
+    cache = SnapshotCache()
+    client = _mixed_client()
+    provider = LiveProvider._with_client(client, cache = cache)
+    first = provider.snapshot_many(POOL_IDS, block_number = 1)
+    assert cache.misses == 4 and len(cache) == 4
+    n = len(client.call_log)
+    assert provider.snapshot_many(POOL_IDS, block_number = 1) == first
+    assert len(client.call_log) == n
+    # Single-pool reads share the entries.
+    assert provider.snapshot(POOL_IDS[1], block_number = 1) == first[1]
+    assert len(client.call_log) == n
+
+
+def test_revert_errors_name_the_calling_method():
+    provider = LiveProvider._with_client(_mixed_client())
+    empty = "uniswap_v3:0x000000000000000000000000000000000000dEaD"
+    out, = provider.snapshot_many([empty])
+    assert str(out).startswith("LiveProvider.snapshot_many: ")
+    with pytest.raises(RuntimeError) as excinfo:
+        provider.snapshot(empty)
+    assert str(excinfo.value).startswith("LiveProvider.snapshot: ")
@@ -0,0 +1,218 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Mocked-RPC unit tests for LiveProvider.snapshot_range and the
+columnar snapshot series format (snapshot_series.py)."""
+
+import threading
+import time
+
+import pytest
+
+from defipy.twin import (
+    LiveProvider,
+    V2PoolSnapshot,
+    StableswapPoolSnapshot,
+    write_snapshot_series,
+    read_snapshot_series,
+)
+
+from twin._fake_rpc import (
+    build_fake_client,
+    canonical_weth_usdc_v2_spec, canonical_weth_usdc_token_specs,
+    canonical_usdc_weth_v3_spec, canonical_usdc_weth_v3_token_specs,
+    canonical_3pool_curve_spec, canonical_3pool_curve_token_specs,
+    WETH_USDC_V2_POOL, USDC_WETH_V3_POOL, CURVE_3POOL,
+)
+
+
+V2_ID = "uniswap_v2:{}".format(WETH_USDC_V2_POOL)
+START = 20_000_000
+
+
+def _v2_provider(reserves_by_block = None):
+    spec = canonical_weth_usdc_v2_spec()
+    spec.reserves_by_block = reserves_by_block
+    client = build_fake_client(
+        pool = spec, tokens = canonical_weth_usdc_token_specs(),
+    )
+    return LiveProvider._with_client(client), client
+
+
+# ─── Streaming ─────────────────────────────────────────────────────────────
+
+
+def test_snapshot_range_yields_in_block_order():
+    provider, _ = _v2_provider()
+    snaps = list(provider.snapshot_range(V2_ID, START, START + 9))
+    assert [s.block_number for s in snaps] == list(range(START, START + 10))
+    assert all(isinstance(s, V2PoolSnapshot) for s in snaps)
+
+
+def test_snapshot_range_end_is_inclusive_with_step():
+    provider, _ = _v2_provider()
+    snaps = list(provider.snapshot_range(V2_ID, START, START + 10, step = 5))
+    assert [s.block_number for s in snaps] == [START, START + 5, START + 10]
+
+
+def test_snapshot_range_is_lazy():
+    provider, client = _v2_provider()
+    gen = provider.snapshot_range(V2_ID, START, START + 100)
+    assert client.round_trips == 0
+    next(gen)
+    gen.close()
+    # The first block plus at most one window of reads ahead of it.
+    assert len([r for r in client.call_log
+                if r.function == "getReserves"]) <= 1 + 8
+
+
+def test_snapshot_range_warm_blocks_are_one_round_trip_each():
+    provider, client = _v2_provider()
+    gen = provider.snapshot_range(V2_ID, START, START + 20, window = 4)
+    next(gen)
+    before = client.round_trips
+    rest = list(gen)
+    assert len(rest) == 20
+    assert client.round_trips - before == 20
+
+
+def test_snapshot_range_window_bounds_concurrent_reads(monkeypatch):
+    provider, _ = _v2_provider()
+    lock = threading.Lock()
+    state = {"in_flight": 0, "max": 0}
+    read = LiveProvider.snapshot
+
+    def slow_snapshot(self, pool_id, **kwargs):
+        with lock:
+            state["in_flight"] += 1
+            state["max"] = max(state["max"], state["in_flight"])
+        time.sleep(0.005)
+        try:
+            return read(self, pool_id, **kwargs)
+        finally:
+            with lock:
+                state["in_flight"] -= 1
+
+    monkeypatch.setattr(LiveProvider, "snapshot", slow_snapshot)
+    snaps = list(provider.snapshot_range(V2_ID, START, START + 30, window = 3))
+    assert len(snaps) == 31
+    assert 1 < state["max"] <= 3
+
+
+def test_snapshot_range_skip_unchanged():
+    provider, client = _v2_provider(reserves_by_block = {
+        START + 3: (60_000_000 * 10**6, 14_000 * 10**18),
+        START + 7: (55_000_000 * 10**6, 14_500 * 10**18),
+    })
+    snaps = list(provider.snapshot_range(
+        V2_ID, START, START + 9, skip_unchanged = True,
+    ))
+    assert [s.block_number for s in snaps] == [START, START + 3, START + 7]
+    assert snaps[1].reserve0 != snaps[0].reserve0
+    # An output filter only — every block is still read.
+    reads = [rec for rec in client.call_log if rec.function == "getReserves"]
+    assert len(reads) == 10
+
+
+def test_snapshot_range_v3_passes_tick_kwargs():
+    client = build_fake_client(
+        pool = canonical_usdc_weth_v3_spec(),
+        tokens = canonical_usdc_weth_v3_token_specs(),
+    )
+    provider = LiveProvider._with_client(client)
+    snaps = list(provider.snapshot_range(
+        "uniswap_v3:{}".format(USDC_WETH_V3_POOL), START, START + 3,
+        lwr_tick = 200_040, upr_tick = 200_100,
+    ))
+    assert {(s.lwr_tick, s.upr_tick) for s in snaps} == {(200_040, 200_100)}
+
+
+def test_snapshot_range_read_error_propagates():
+    # No spec at the address: the fake raises on the first read.
+    provider, _ = _v2_provider()
+    with pytest.raises(Exception):
+        list(provider.snapshot_range(
+            "uniswap_v2:0x0000000000000000000000000000000000001001",
+            START, START + 3,
+        ))
+
+
+@pytest.mark.parametrize("args, kwargs", [
+    ((START, START - 1), {}),
+    ((-1, 5), {}),
+    ((START, START + 5), {"step": 0}),
+    ((START, START + 5), {"window": 0}),
+    ((START, START + 5), {"block_number": START}),
+])
+def test_snapshot_range_rejects_bad_arguments(args, kwargs):
+    provider, client = _v2_provider()
+    with pytest.raises(ValueError):
+        provider.snapshot_range(V2_ID, *args, **kwargs)
+    assert client.round_trips == 0
+
+
+# ─── Columnar series ───────────────────────────────────────────────────────
+
+
+def test_snapshot_range_writes_series_for_replay(tmp_path):
+    path = str(tmp_path / "weth_usdc.npz")
+    provider, _ = _v2_provider(reserves_by_block = {
+        START + 2: (51_000_000 * 10**6, 14_900 * 10**18),
+    })
+    snaps = list(provider.snapshot_range(V2_ID, START, START + 4, path = path))
+    assert read_snapshot_series(path) == snaps
+
+
+def test_snapshot_range_skips_write_when_abandoned(tmp_path):
+    path = tmp_path / "partial.npz"
+    provider, _ = _v2_provider()
+    gen = provider.snapshot_range(V2_ID, START, START + 4, path = str(path))
+    next(gen)
+    gen.close()
+    assert not path.exists()
+
+
+def test_series_round_trips_stableswap(tmp_path):
+    client = build_fake_client(
+        pool = canonical_3pool_curve_spec(),
+        tokens = canonical_3pool_curve_token_specs(),
+    )
+    provider = LiveProvider._with_client(client)
+    path = str(tmp_path / "3pool.npz")
+    snaps = list(provider.snapshot_range(
+        "stableswap:{}".format(CURVE_3POOL), START, START + 2, path = path,
+    ))
+    replay = read_snapshot_series(path)
+    assert all(isinstance(s, StableswapPoolSnapshot) for s in replay)
+    assert replay == snaps
+
+
+def test_write_series_rejects_empty_and_mixed(tmp_path):
+    provider, _ = _v2_provider()
+    v2 = provider.snapshot(V2_ID, block_number = START)
+    client = build_fake_client(
+        pool = canonical_3pool_curve_spec(),
+        tokens = canonical_3pool_curve_token_specs(),
+    )
+    curve = LiveProvider._with_client(client).snapshot(
+        "stableswap:{}".format(CURVE_3POOL), block_number = START,
+    )
+    with pytest.raises(ValueError):
+        write_snapshot_series(str(tmp_path / "a.npz"), [])
+    with pytest.raises(ValueError):
+        write_snapshot_series(str(tmp_path / "b.npz"), [v2, curve])
@@ -162,23 +162,27 @@ def test_stableswap_3coin_fields():
 
 
 def test_stableswap_n_coins_hint_skips_probe():
-    """Passing n_coins=3 takes the fast path — a single multicall (the
-    main read), no probe round trip."""
+    """Passing n_coins=3 takes the fast path — the main read plus one
+    token-metadata batch on a cold token cache, no probe round trip.
+    Warm, the snapshot is a single multicall."""
     client = build_fake_client(
         pool=canonical_3pool_curve_spec(),
         tokens=canonical_3pool_curve_token_specs(),
     )
-    LiveProvider._with_client(client).snapshot(_ss_pool_id(), n_coins=3)
-    aggregate3_calls = [
-        rec for rec in client.call_log if rec.function == "aggregate3"
-    ]
-    assert len(aggregate3_calls) == 1
+    provider = LiveProvider._with_client(client)
+    count = lambda: len(
+        [rec for rec in client.call_log if rec.function == "aggregate3"]
+    )
+    provider.snapshot(_ss_pool_id(), n_coins=3)
+    assert count() == 2
+    provider.snapshot(_ss_pool_id(), n_coins=3)
+    assert count() == 2 + 1
 
 
 def test_stableswap_probe_resolves_coin_count():
     """Without a hint, the probe resolves N=3 — proving coins(3) failed
-    (else N would over-count) — and adds one extra multicall (probe +
-    main = 2)."""
+    (else N would over-count). The probe rides in the main read, so a
+    cold snapshot is still two multicalls (main + token metadata)."""
     client = build_fake_client(
         pool=canonical_3pool_curve_spec(),
         tokens=canonical_3pool_curve_token_specs(),
@@ -51,6 +51,15 @@ from twin._fake_rpc import (
 )
 
 
+# Valid (digits-only, so checksum-stable) addresses for hand-built
+# specs: the V2 read path goes through Multicall3, which ABI-encodes
+# the token0()/token1() replies.
+_POOL = "0x0000000000000000000000000000000000001001"
+_T0 = "0x0000000000000000000000000000000000002001"
+_T1 = "0x0000000000000000000000000000000000002002"
+_MISSING = "0x0000000000000000000000000000000000002fff"
+
+
 def _provider_pool_id(address: str = WETH_USDC_V2_POOL) -> str:
     """Convenience: build the canonical 'uniswap_v2:<addr>' pool_id."""
     return "uniswap_v2:{}".format(address)
@@ -61,7 +70,8 @@ def _provider_pool_id(address: str = WETH_USDC_V2_POOL) -> str:
 
 # Test 1
 def test_snapshot_returns_v2_pool_snapshot():
-    """`provider.snapshot("uniswap_v2:0xPOOL")` returns a V2PoolSnapshot."""
+    """`provider.snapshot("uniswap_v2:<WETH/USDC pair>")` for the canonical
+    WETH/USDC spec returns a V2PoolSnapshot."""
     client = build_fake_client(
         pool=canonical_weth_usdc_v2_spec(),
         tokens=canonical_weth_usdc_token_specs(),
@@ -83,18 +93,18 @@ def test_snapshot_reserves_decimal_adjusted():
     produce nonsense output.
     """
     pool = V2PoolSpec(
-        address = "0xPOOL",
-        token0_address = "0xT0",
-        token1_address = "0xT1",
+        address = _POOL,
+        token0_address = _T0,
+        token1_address = _T1,
         reserve0_raw = 1000 * 10**18,        # 1000 ETH
         reserve1_raw = 100_000 * 10**18,     # 100k DAI
     )
     tokens = [
-        TokenSpec(address="0xT0", symbol="ETH", decimals=18),
-        TokenSpec(address="0xT1", symbol="DAI", decimals=18),
+        TokenSpec(address=_T0, symbol="ETH", decimals=18),
+        TokenSpec(address=_T1, symbol="DAI", decimals=18),
     ]
     client = build_fake_client(pool=pool, tokens=tokens)
-    snap = LiveProvider._with_client(client).snapshot("uniswap_v2:0xPOOL")
+    snap = LiveProvider._with_client(client).snapshot(_provider_pool_id(_POOL))
     assert snap.reserve0 == pytest.approx(1000.0)
     assert snap.reserve1 == pytest.approx(100_000.0)
 
@@ -155,21 +165,21 @@ def test_block_number_resolved_once():
     )
     LiveProvider._with_client(client).snapshot(_provider_pool_id())
 
-    # Every recorded contract call should pin to 18_500_000.
+    # Every recorded contract call should pin to 18_500_000 — the pair
+    # reads, the timestamp, and the token-metadata batch all ride
+    # Multicall3 at the resolved block.
     assert len(client.call_log) > 0, "Expected pool reads to be recorded."
     block_identifiers = {rec.block_identifier for rec in client.call_log}
-    # FetchToken's symbol/decimals reads don't pin (pass None as
-    # block_identifier). The pair-side reads MUST pin to the resolved
-    # block. Filter to pair calls and verify.
+    assert block_identifiers == {18_500_000}, (
+        "All reads must pin to the resolved block; got {}"
+        .format(block_identifiers)
+    )
     pair_call_blocks = {
         rec.block_identifier
         for rec in client.call_log
         if rec.address == WETH_USDC_V2_POOL
     }
-    assert pair_call_blocks == {18_500_000}, (
-        "Pair reads must all pin to the resolved block; got {}"
-        .format(pair_call_blocks)
-    )
+    assert pair_call_blocks == {18_500_000}
 
 
 # Test 7
@@ -234,19 +244,19 @@ def test_live_twin_matches_mock_twin_reserves():
     twin. Builder parity guarantees primitives behave identically."""
     # Build a fake matching MockProvider's eth_dai_v2 recipe.
     pool = V2PoolSpec(
-        address = "0xMOCKPARITY",
-        token0_address = "0xT_ETH",
-        token1_address = "0xT_DAI",
+        address = _POOL,
+        token0_address = _T0,
+        token1_address = _T1,
         reserve0_raw = 1000 * 10**18,
         reserve1_raw = 100_000 * 10**18,
     )
     tokens = [
-        TokenSpec(address="0xT_ETH", symbol="ETH", decimals=18),
-        TokenSpec(address="0xT_DAI", symbol="DAI", decimals=18),
+        TokenSpec(address=_T0, symbol="ETH", decimals=18),
+        TokenSpec(address=_T1, symbol="DAI", decimals=18),
     ]
     client = build_fake_client(pool=pool, tokens=tokens)
 
-    live_snap = LiveProvider._with_client(client).snapshot("uniswap_v2:0xMOCKPARITY")
+    live_snap = LiveProvider._with_client(client).snapshot(_provider_pool_id(_POOL))
     live_lp = StateTwinBuilder().build(live_snap)
 
     mock_snap = MockProvider().snapshot("eth_dai_v2")
@@ -268,20 +278,20 @@ def test_live_twin_matches_mock_twin_total_supply():
     supply from snapshot data on one path but not the other.
     """
     pool = V2PoolSpec(
-        address = "0xMOCKPARITY",
-        token0_address = "0xT_ETH",
-        token1_address = "0xT_DAI",
+        address = _POOL,
+        token0_address = _T0,
+        token1_address = _T1,
         reserve0_raw = 1000 * 10**18,
         reserve1_raw = 100_000 * 10**18,
     )
     tokens = [
-        TokenSpec(address="0xT_ETH", symbol="ETH", decimals=18),
-        TokenSpec(address="0xT_DAI", symbol="DAI", decimals=18),
+        TokenSpec(address=_T0, symbol="ETH", decimals=18),
+        TokenSpec(address=_T1, symbol="DAI", decimals=18),
     ]
     client = build_fake_client(pool=pool, tokens=tokens)
 
     live_lp = StateTwinBuilder().build(
-        LiveProvider._with_client(client).snapshot("uniswap_v2:0xMOCKPARITY")
+        LiveProvider._with_client(client).snapshot(_provider_pool_id(_POOL))
     )
     mock_lp = StateTwinBuilder().build(MockProvider().snapshot("eth_dai_v2"))
 
@@ -292,8 +302,8 @@ def test_live_twin_matches_mock_twin_total_supply():
 def test_live_twin_token_from_exchange_populated():
     """`lp.factory.token_from_exchange[lp.name]` returns a dict with
     both token symbols as keys. R6 from STATE_TWIN_PHASE_1.md — the
-    MCP server's _resolve_token() helper depends on this mapping for
-    V2 twins."""
+    shared token resolver (defipy.twin._dispatch.resolve_token) depends
+    on this mapping for V2 twins."""
     client = build_fake_client(
         pool=canonical_weth_usdc_v2_spec(),
         tokens=canonical_weth_usdc_token_specs(),
@@ -353,15 +363,15 @@ def test_snapshot_rpc_failure_propagates():
     # When LiveProvider tries to FetchToken on it, our FakeWeb3.eth.contract
     # raises KeyError naming the missing address.
     pool = V2PoolSpec(
-        address = "0xPOOL",
-        token0_address = "0xMISSING",
-        token1_address = "0xT1",
+        address = _POOL,
+        token0_address = _MISSING,
+        token1_address = _T1,
         reserve0_raw = 1000 * 10**18,
         reserve1_raw = 1000 * 10**18,
     )
     tokens = [
-        # Only T1; T0 (0xMISSING) deliberately omitted.
-        TokenSpec(address="0xT1", symbol="DAI", decimals=18),
+        # Only T1; T0 (_MISSING) deliberately omitted.
+        TokenSpec(address=_T1, symbol="DAI", decimals=18),
     ]
     # build_fake_client validates that all referenced token addrs have
     # specs, so we bypass it here.
@@ -372,13 +382,12 @@ def test_snapshot_rpc_failure_propagates():
         fake._token_specs[t.address] = t
     client = FakeRpcClient(fake)
 
-    # The failure originates in FetchToken's contract construction
-    # against 0xMISSING. FetchToken catches it and prints, returning
-    # None — which then surfaces as an AttributeError when LiveProvider
-    # accesses tkn0.token_name. Either way, an exception escapes
-    # LiveProvider.snapshot(); we just verify *something* propagates.
+    # The batched metadata read for _MISSING comes back empty, so
+    # LiveProvider falls back to FetchToken, whose contract
+    # construction raises KeyError naming the missing address. We just
+    # verify *something* escapes LiveProvider.snapshot().
     with pytest.raises(Exception):
-        LiveProvider._with_client(client).snapshot("uniswap_v2:0xPOOL")
+        LiveProvider._with_client(client).snapshot(_provider_pool_id(_POOL))
 
 
 # ─── Construction and config (2 tests) ─────────────────────────────────────
@@ -520,3 +529,59 @@ def test_v2_snapshot_populates_chain_context():
     assert snap.block_number == 20_000_000
     assert snap.timestamp == 1_715_000_000
     assert snap.chain_id == 1
+
+
+# ─── Round trips (Multicall3 batching) ─────────────────────────────────────
+
+
+def test_v2_cold_snapshot_round_trips():
+    """Cold token cache, "latest": eth_blockNumber + eth_chainId + one
+    aggregate3 for the pair reads and timestamp + one aggregate3 for
+    token metadata. No direct eth_calls, no eth_getBlockByNumber."""
+    client = build_fake_client(
+        pool=canonical_weth_usdc_v2_spec(),
+        tokens=canonical_weth_usdc_token_specs(),
+    )
+    LiveProvider._with_client(client).snapshot(_provider_pool_id())
+
+    unbatched = [rec.function for rec in client.call_log if not rec.batched]
+    assert unbatched == ["aggregate3", "aggregate3"]
+    assert client.round_trips == 4
+
+
+def test_v2_warm_snapshot_is_one_round_trip():
+    """With token metadata cached and the block pinned, a V2 snapshot
+    is a single aggregate3 — the same cost as a warm V3 snapshot."""
+    client = build_fake_client(
+        pool=canonical_weth_usdc_v2_spec(),
+        tokens=canonical_weth_usdc_token_specs(),
+    )
+    provider = LiveProvider._with_client(client)
+    provider.snapshot(_provider_pool_id(), block_number=20_000_000)
+
+    before = client.round_trips
+    snap = provider.snapshot(_provider_pool_id(), block_number=20_000_001)
+    assert client.round_trips - before == 1
+    assert snap.block_number == 20_000_001
+    assert snap.token0_name == "USDC"
+
+
+def test_v2_multicall_reads_timestamp_in_batch():
+    """The block timestamp comes from Multicall3's
+    getCurrentBlockTimestamp() inside the pair batch, pinned with the
+    pair reads — not from a separate get_block."""
+    client = build_fake_client(
+        pool=canonical_weth_usdc_v2_spec(),
+        tokens=canonical_weth_usdc_token_specs(),
+        block_timestamp=1_715_000_000,
+    )
+    snap = LiveProvider._with_client(client).snapshot(
+        _provider_pool_id(), block_number=20_000_000,
+    )
+    assert snap.timestamp == 1_715_000_000
+    functions = [rec.function for rec in client.call_log]
+    assert "get_block" not in functions
+    ts = [rec for rec in client.call_log
+          if rec.function == "getCurrentBlockTimestamp"]
+    assert len(ts) == 1
+    assert ts[0].batched and ts[0].block_identifier == 20_000_000
@@ -180,8 +180,8 @@ def test_v3_snapshot_reads_fee_and_tick_spacing():
 
 # Test 8
 def test_v3_snapshot_reads_token_addresses_and_metadata():
-    """token0/token1 reads happen via multicall; FetchToken pulls
-    symbols + decimals separately and lands in the snapshot."""
+    """token0/token1 reads happen via multicall; symbols + decimals
+    are read separately and land in the snapshot."""
     client = build_fake_client(
         pool=canonical_usdc_weth_v3_spec(),
         tokens=canonical_usdc_weth_v3_token_specs(),
@@ -192,8 +192,8 @@ def test_v3_snapshot_reads_token_addresses_and_metadata():
     fns = {rec.function for rec in client.call_log}
     assert "token0" in fns
     assert "token1" in fns
-    # FetchToken makes a direct symbol() / decimals() read against
-    # each token contract — separate from the multicall.
+    # Cold token cache — symbol() / decimals() are read for each
+    # token in a follow-up multicall batch.
     assert "symbol" in fns
     assert "decimals" in fns
 
@@ -241,17 +241,26 @@ def test_v3_active_tick_at_range_boundary_produces_single_sided():
 
 # Test 10
 def test_v3_snapshot_uses_multicall():
-    """Inspecting client.call_log shows ONE aggregate3 call against
-    the Multicall3 address — not 6+ separate calls against the pool."""
+    """Inspecting client.call_log shows ONE aggregate3 call for the
+    pool state — not 6+ separate calls against the pool — plus one
+    token-metadata batch on a cold token cache. A warm snapshot is
+    exactly one round trip."""
     client = build_fake_client(
         pool=canonical_usdc_weth_v3_spec(),
         tokens=canonical_usdc_weth_v3_token_specs(),
     )
-    LiveProvider._with_client(client).snapshot(_v3_pool_id())
+    provider = LiveProvider._with_client(client)
+    provider.snapshot(_v3_pool_id())
     aggregate3_calls = [
         rec for rec in client.call_log if rec.function == "aggregate3"
     ]
-    assert len(aggregate3_calls) == 1
+    assert len(aggregate3_calls) == 2
+
+    n = len(client.call_log)
+    provider.snapshot(_v3_pool_id())
+    warm = client.call_log[n:]
+    assert [rec.function for rec in warm].count("aggregate3") == 1
+    assert not {"symbol", "decimals"} & {rec.function for rec in warm}
 
 
 # Test 11
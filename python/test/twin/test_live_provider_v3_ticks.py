@@ -0,0 +1,281 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Mocked-RPC unit tests for the V3 tick bitmap walk
+(`LiveProvider.snapshot(..., tick_words=N)`) and tick-table twins.
+
+The fake pool answers tickBitmap(int16) / ticks(int24) from
+V3PoolSpec.ticks. Specs here pin sqrtPriceX96 to the tick so the
+walked liquidity profile lines up with the current price."""
+
+import asyncio
+import math
+
+import pytest
+
+from uniswappy.process.swap import Swap
+from uniswappy.utils.tools.v3 import TickMath
+
+from defipy.twin import (
+    AsyncLiveProvider,
+    LiveProvider,
+    SnapshotCache,
+    StateTwinBuilder,
+    V3PoolSnapshot,
+    read_snapshot_series,
+    write_snapshot_series,
+)
+
+from twin._fake_rpc import (
+    build_fake_client,
+    build_fake_async_client,
+    canonical_usdc_weth_v3_spec,
+    canonical_usdc_weth_v3_token_specs,
+    USDC_WETH_V3_POOL,
+)
+
+
+V3_ID = "uniswap_v3:{}".format(USDC_WETH_V3_POOL)
+TICK = 200_010
+L = 10 ** 22
+# Raw liquidityNet: 3L below 199_800..199_980, 2L to 200_100 (current
+# price), 3L to 200_400.
+TICKS = {199_800: 3 * L, 199_980: -L, 200_100: L, 200_400: -3 * L}
+# USDC (6) / WETH (18): raw ticks shift by -12 decades, liquidity
+# scales by 1e-12.
+SHIFT = -12 * math.log(10) / math.log(1.0001)
+
+
+def _spec(ticks = TICKS, tick = TICK, liquidity = 2 * L):
+    spec = canonical_usdc_weth_v3_spec(
+        sqrt_price_x96 = int(TickMath.getSqrtRatioAtTick(tick)),
+        tick = tick, liquidity = liquidity,
+    )
+    spec.ticks = dict(ticks)
+    return spec
+
+
+def _client(spec = None, **kwargs):
+    return build_fake_client(
+        pool = spec or _spec(), tokens = canonical_usdc_weth_v3_token_specs(),
+        **kwargs,
+    )
+
+
+def _human(tick):
+    return round((tick + SHIFT) / 60) * 60
+
+
+# ─── Snapshot fields ───────────────────────────────────────────────────────
+
+
+def test_tick_fields_default_to_none():
+    snap = LiveProvider._with_client(_client()).snapshot(V3_ID)
+    assert snap.tick_indices is None
+    assert snap.tick_liquidity_net is None
+
+
+def test_snapshot_rejects_half_a_tick_table():
+    with pytest.raises(ValueError):
+        V3PoolSnapshot(
+            pool_id = "p", token0_name = "A", token1_name = "B",
+            reserve0 = 1, reserve1 = 1, tick_indices = [0, 60],
+        )
+
+
+def test_snapshot_rejects_unsorted_ticks():
+    with pytest.raises(ValueError):
+        V3PoolSnapshot(
+            pool_id = "p", token0_name = "A", token1_name = "B",
+            reserve0 = 1, reserve1 = 1,
+            tick_indices = [60, 0], tick_liquidity_net = [1.0, -1.0],
+        )
+
+
+def test_negative_tick_words_raises_before_io():
+    client = _client()
+    with pytest.raises(ValueError):
+        LiveProvider._with_client(client).snapshot(V3_ID, tick_words = -1)
+    assert client.round_trips == 0
+
+
+# ─── Tick walk ─────────────────────────────────────────────────────────────
+
+
+def test_walk_returns_decimal_adjusted_tick_table():
+    snap = LiveProvider._with_client(_client()).snapshot(V3_ID, tick_words = 2)
+    assert snap.tick_indices == [_human(t) for t in sorted(TICKS)]
+    expected = [TICKS[t] * 1e-12 for t in sorted(TICKS)]
+    assert snap.tick_liquidity_net == pytest.approx(expected)
+    assert sum(snap.tick_liquidity_net) == pytest.approx(0.0, abs = 1e-3)
+
+
+def test_walk_costs_two_multicalls():
+    """Cold token cache: eth_blockNumber + eth_chainId + pool reads +
+    tickBitmap words + ticks() + token metadata."""
+    client = _client()
+    LiveProvider._with_client(client).snapshot(V3_ID, tick_words = 2)
+    assert client.round_trips == 6
+
+
+def test_walk_without_initialized_ticks_skips_ticks_read():
+    client = _client(_spec(ticks = {}))
+    snap = LiveProvider._with_client(client).snapshot(V3_ID, tick_words = 1)
+    # Active liquidity alone spans the whole window.
+    assert len(snap.tick_indices) == 2
+    assert snap.tick_liquidity_net == pytest.approx([2e10, -2e10])
+    assert client.round_trips == 5
+
+
+def test_walk_only_reads_requested_words():
+    # 256 spacings of 60 per word: TICK is in word 13, 245_760 opens
+    # word 16.
+    ticks = {**TICKS, 245_760: 5 * L, 261_120: -5 * L}
+    snap = LiveProvider._with_client(_client(_spec(ticks))).snapshot(
+        V3_ID, tick_words = 2,
+    )
+    assert _human(245_760) not in snap.tick_indices
+
+
+def test_liquidity_beyond_window_is_truncated():
+    # A position opening inside the window and closing outside it.
+    ticks = {**TICKS, 200_160: L, 260_040: -L}
+    snap = LiveProvider._with_client(_client(_spec(ticks))).snapshot(
+        V3_ID, tick_words = 1,
+    )
+    # The table still closes: liquidity drops to zero at the window edge.
+    assert sum(snap.tick_liquidity_net) == pytest.approx(0.0, abs = 1e-3)
+    assert snap.tick_indices[-1] < _human(260_040)
+
+
+def test_table_anchors_on_active_liquidity():
+    # A net outside the window (below it) that the walk never sees.
+    ticks = {**TICKS, 100_020: L}
+    snap = LiveProvider._with_client(
+        _client(_spec(ticks, liquidity = 3 * L)),
+    ).snapshot(V3_ID, tick_words = 1)
+    levels = []
+    level = 0.0
+    for net in snap.tick_liquidity_net:
+        level += net
+        levels.append(level)
+    active = [lvl for t, lvl in zip(snap.tick_indices, levels)
+              if t <= _human(TICK)][-1]
+    assert active == pytest.approx(3e10)
+
+
+def test_cache_keys_tick_words():
+    cache = SnapshotCache()
+    client = _client()
+    provider = LiveProvider._with_client(client, cache = cache)
+    plain = provider.snapshot(V3_ID, block_number = 19_500_000)
+    walked = provider.snapshot(V3_ID, block_number = 19_500_000, tick_words = 1)
+    assert plain.tick_indices is None
+    assert walked.tick_indices is not None
+    before = client.round_trips
+    assert provider.snapshot(
+        V3_ID, block_number = 19_500_000, tick_words = 1,
+    ) == walked
+    assert client.round_trips == before
+
+
+def test_async_walk_matches_sync():
+    expected = LiveProvider._with_client(_client()).snapshot(
+        V3_ID, block_number = 19_500_000, tick_words = 2,
+    )
+    client = build_fake_async_client(
+        pool = _spec(), tokens = canonical_usdc_weth_v3_token_specs(),
+    )
+    snap = asyncio.run(AsyncLiveProvider._with_client(client).snapshot(
+        V3_ID, block_number = 19_500_000, tick_words = 2,
+    ))
+    assert snap == expected
+
+
+# ─── Tick-table twins ──────────────────────────────────────────────────────
+
+
+def _twin():
+    snap = LiveProvider._with_client(_client()).snapshot(V3_ID, tick_words = 2)
+    return snap, StateTwinBuilder().build(snap)
+
+
+def test_twin_tick_table_matches_snapshot():
+    snap, lp = _twin()
+    assert sorted(lp.ticks) == snap.tick_indices
+    for tick, net in zip(snap.tick_indices, snap.tick_liquidity_net):
+        assert lp.convert_to_human(lp.ticks[tick].liquidityNet) == pytest.approx(net)
+
+
+def test_twin_active_liquidity_is_the_current_interval():
+    _snap, lp = _twin()
+    assert lp.get_liquidity() == pytest.approx(2e10)
+
+
+def test_twin_starts_at_the_pool_price_whatever_the_tick_range():
+    # A position range above the price leaves reserve1 at zero; the
+    # twin still initializes from the snapshot's sqrt_price.
+    snap = LiveProvider._with_client(_client()).snapshot(
+        V3_ID, tick_words = 2, lwr_tick = 210_000, upr_tick = 219_960,
+    )
+    assert snap.reserve1 == 0
+    lp = StateTwinBuilder().build(snap)
+    assert snap.sqrt_price == pytest.approx(1.0001 ** ((TICK + SHIFT) / 2))
+    assert abs(lp.slot0.tick - (TICK + SHIFT)) <= 1
+    assert lp.get_liquidity() == pytest.approx(2e10)
+
+
+def test_twin_without_sqrt_price_needs_both_reserves():
+    snap = V3PoolSnapshot(
+        pool_id = "p", token0_name = "A", token1_name = "B",
+        reserve0 = 1.0, reserve1 = 0.0, tick_indices = [-60, 60],
+        tick_liquidity_net = [1.0, -1.0],
+    )
+    with pytest.raises(ValueError):
+        StateTwinBuilder().build(snap)
+
+
+def test_twin_swap_crosses_ticks():
+    _snap, lp = _twin()
+    usdc = lp.factory.token_from_exchange[lp.name][lp.token0]
+    Swap().apply(lp, usdc, "trader", 1e9)
+    assert lp.slot0.tick < _human(199_980)
+    assert lp.convert_to_human(lp.liquidity) == pytest.approx(3e10)
+
+
+def test_forked_tick_table_twin_swaps_independently():
+    _snap, lp = _twin()
+    tick = lp.slot0.tick
+    (fork,) = StateTwinBuilder().fork(lp)
+    usdc = fork.factory.token_from_exchange[fork.name][fork.token0]
+    Swap().apply(fork, usdc, "trader", 1e9)
+    assert fork.slot0.tick < _human(199_980)
+    assert lp.slot0.tick == tick
+
+
+# ─── Series ────────────────────────────────────────────────────────────────
+
+
+def test_series_round_trips_ragged_tick_tables(tmp_path):
+    a = LiveProvider._with_client(_client()).snapshot(V3_ID, tick_words = 2)
+    b = LiveProvider._with_client(_client(_spec(ticks = {}))).snapshot(
+        V3_ID, tick_words = 2,
+    )
+    path = str(tmp_path / "v3.npz")
+    write_snapshot_series(path, [a, b, a])
+    assert read_snapshot_series(path) == [a, b, a]
@@ -0,0 +1,318 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""Unit tests for RpcEndpointPool and pool-backed RpcClients.
+
+Every test injects a fake transport — no network. The fake answers
+eth_blockNumber / eth_chainId per endpoint and can be scripted to fail,
+rate-limit, or lag."""
+
+import json
+
+import pytest
+
+from defipy.twin import LiveProvider, RpcEndpointPool
+from defipy.twin import _rpc
+
+
+A, B, C = "http://a.test", "http://b.test", "http://c.test"
+
+
+class _FakeTransport:
+    """Scripted transport. `failures[url]` is a list of per-request
+    outcomes consumed in order: an Exception instance is raised, a dict
+    is returned as the JSON body. Once exhausted the endpoint answers
+    normally."""
+
+    def __init__(self, block = 20_000_000, chain_id = 1):
+        self.block = block
+        self.chain_id = chain_id
+        self.failures = {}
+        self.calls = []
+
+    def __call__(self, url, body, timeout):
+        request = json.loads(body)
+        self.calls.append((url, request["method"]))
+        script = self.failures.get(url)
+        if script:
+            outcome = script.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return json.dumps(dict(outcome, id = request["id"])).encode()
+        result = {
+            "eth_blockNumber": hex(self.block),
+            "eth_chainId": hex(self.chain_id),
+            "web3_clientVersion": "fake/1.0",
+        }[request["method"]]
+        return json.dumps(
+            {"jsonrpc": "2.0", "id": request["id"], "result": result}
+        ).encode()
+
+    def urls_called(self):
+        return [url for url, _ in self.calls]
+
+
+class _HTTPError(Exception):
+    def __init__(self, status):
+        super().__init__("HTTP {}".format(status))
+        self.response = type("R", (), {"status_code": status})()
+
+
+def _body(method = "eth_blockNumber"):
+    return json.dumps(
+        {"jsonrpc": "2.0", "id": 1, "method": method, "params": []}
+    ).encode()
+
+
+def _pool(urls, transport, **kwargs):
+    kwargs.setdefault("backoff", 0.0)
+    pool = RpcEndpointPool(urls, transport = transport, seed = 7, **kwargs)
+    pool._sleep = lambda s: None
+    return pool
+
+
+# ─── Construction ──────────────────────────────────────────────────────────
+
+
+def test_requires_at_least_one_url():
+    with pytest.raises(ValueError):
+        RpcEndpointPool([])
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"max_retries": -1}, {"failure_threshold": 0}, {"cooldown": -1},
+    {"timeout": 0}, {"pool_size": 0},
+])
+def test_rejects_out_of_range_options(kwargs):
+    with pytest.raises(ValueError):
+        RpcEndpointPool([A], **kwargs)
+
+
+def test_single_url_string_is_accepted():
+    assert RpcEndpointPool(A).urls == [A]
+
+
+# ─── Failover and retry ────────────────────────────────────────────────────
+
+
+def test_transport_error_fails_over_to_other_endpoint():
+    transport = _FakeTransport()
+    transport.failures[A] = [ConnectionError("down")] * 10
+    pool = _pool([A, B], transport)
+    for _ in range(5):
+        raw = pool.request(_body())
+        assert json.loads(raw)["result"] == hex(20_000_000)
+
+
+def test_http_5xx_and_429_are_retried():
+    transport = _FakeTransport()
+    transport.failures[A] = [_HTTPError(503), _HTTPError(429)]
+    pool = _pool([A], transport, max_retries = 2)
+    assert json.loads(pool.request(_body()))["result"] == hex(20_000_000)
+    assert transport.urls_called() == [A, A, A]
+
+
+def test_http_4xx_is_not_retried():
+    transport = _FakeTransport()
+    transport.failures[A] = [_HTTPError(400)]
+    pool = _pool([A, B], transport)
+    with pytest.raises(_HTTPError):
+        pool.request(_body())
+    assert len(transport.calls) == 1
+
+
+def test_non_transport_error_is_raised_at_once():
+    transport = _FakeTransport()
+    transport.failures[A] = [TypeError("bad body")]
+    transport.failures[B] = [TypeError("bad body")]
+    pool = _pool([A, B], transport, failure_threshold = 1)
+    slept = []
+    pool._sleep = slept.append
+    with pytest.raises(TypeError):
+        pool.request(_body())
+    assert len(transport.calls) == 1 and slept == []
+    assert all(s["healthy"] and s["failures"] == 0 for s in pool.stats())
+
+
+def test_requests_transport_errors_are_transient():
+    requests = pytest.importorskip("requests")
+    from defipy.twin.rpc_pool import _is_transient
+    assert _is_transient(requests.exceptions.ConnectionError("reset"))
+    assert _is_transient(requests.exceptions.ReadTimeout("slow"))
+    assert not _is_transient(requests.exceptions.InvalidURL("nope"))
+    assert _is_transient(OSError("unreachable"))
+
+
+def test_rate_limit_body_is_retried_elsewhere():
+    transport = _FakeTransport()
+    limited = {"jsonrpc": "2.0",
+               "error": {"code": -32005, "message": "limit exceeded"}}
+    transport.failures[A] = [limited] * 10
+    transport.failures[B] = [limited] * 10
+    transport.failures[C] = []
+    pool = _pool([A, B, C], transport, max_retries = 2)
+    assert json.loads(pool.request(_body()))["result"] == hex(20_000_000)
+
+
+def test_revert_body_is_returned_not_retried():
+    transport = _FakeTransport()
+    revert = {"jsonrpc": "2.0",
+              "error": {"code": 3, "message": "execution reverted"}}
+    transport.failures[A] = [revert]
+    pool = _pool([A, B], transport)
+    raw = pool.request(_body())
+    assert json.loads(raw)["error"]["message"] == "execution reverted"
+    assert len(transport.calls) == 1
+
+
+def test_exhausted_retries_raise_last_error():
+    transport = _FakeTransport()
+    transport.failures[A] = [ConnectionError("a")] * 10
+    transport.failures[B] = [ConnectionError("b")] * 10
+    pool = _pool([A, B], transport, max_retries = 3)
+    with pytest.raises(ConnectionError):
+        pool.request(_body())
+    assert len(transport.calls) == 4
+
+
+def test_backoff_only_after_every_endpoint_failed():
+    transport = _FakeTransport()
+    transport.failures[A] = [ConnectionError("a")] * 10
+    transport.failures[B] = [ConnectionError("b")] * 10
+    pool = _pool([A, B], transport, max_retries = 4, backoff = 0.1,
+                 max_backoff = 0.15, failure_threshold = 100)
+    sleeps = []
+    pool._sleep = sleeps.append
+    with pytest.raises(ConnectionError):
+        pool.request(_body())
+    # 5 attempts over 2 endpoints → rounds after attempts 2 and 4.
+    assert sleeps == [0.1, 0.15]
+
+
+# ─── Health and cooldown ───────────────────────────────────────────────────
+
+
+def test_failing_endpoint_leaves_rotation_and_returns_after_health_check():
+    now = [0.0]
+    transport = _FakeTransport()
+    transport.failures[A] = [ConnectionError("down")] * 2
+    pool = _pool([A, B], transport, failure_threshold = 2, cooldown = 30.0)
+    pool._clock = lambda: now[0]
+
+    for _ in range(10):
+        pool.request(_body())
+    stats = {s["url"]: s for s in pool.stats()}
+    assert stats[A]["healthy"] is False
+    calls_before = len(transport.calls)
+    for _ in range(10):
+        pool.request(_body())
+    # A is out of rotation: every request went to B.
+    assert set(transport.urls_called()[calls_before:]) == {B}
+
+    now[0] = 31.0
+    pool.request(_body())
+    # The cooldown elapsed: A was health-checked and is back.
+    assert {s["url"]: s for s in pool.stats()}[A]["healthy"] is True
+
+
+def test_check_health_probes_every_endpoint():
+    transport = _FakeTransport()
+    transport.failures[B] = [ConnectionError("down")]
+    pool = _pool([A, B], transport)
+    assert pool.check_health() == [True, False]
+
+
+def test_all_endpoints_down_still_tries_last_resort():
+    now = [0.0]
+    transport = _FakeTransport()
+    transport.failures[A] = [ConnectionError("down")] * 2
+    pool = _pool([A], transport, failure_threshold = 1, cooldown = 60.0,
+                 max_retries = 0)
+    pool._clock = lambda: now[0]
+    with pytest.raises(ConnectionError):
+        pool.request(_body())
+    with pytest.raises(ConnectionError):
+        pool.request(_body())
+    assert json.loads(pool.request(_body()))["result"] == hex(20_000_000)
+
+
+# ─── Latency-weighted routing ──────────────────────────────────────────────
+
+
+def test_routing_prefers_lower_latency_endpoint():
+    now = [0.0]
+    latency = {A: 0.5, B: 0.01}
+    transport = _FakeTransport()
+
+    def timed(url, body, timeout):
+        now[0] += latency[url]
+        return transport(url, body, timeout)
+
+    pool = _pool([A, B], timed)
+    pool._clock = lambda: now[0]
+    for _ in range(200):
+        pool.request(_body())
+    stats = {s["url"]: s for s in pool.stats()}
+    assert stats[B]["requests"] > 5 * stats[A]["requests"]
+    assert stats[A]["latency_ms"] == pytest.approx(500.0)
+
+
+def test_concurrent_first_requests_share_one_session():
+    import threading
+    pool = RpcEndpointPool([A])
+    ep = pool._endpoints[0]
+    barrier = threading.Barrier(8)
+    sessions = []
+
+    def first_use():
+        barrier.wait()
+        sessions.append(pool._session(ep))
+
+    threads = [threading.Thread(target = first_use) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(s) for s in sessions}) == 1
+    assert sessions[0] is ep.session
+
+
+# ─── RpcClient / LiveProvider integration ──────────────────────────────────
+
+
+def test_make_client_with_pool_keeps_rpc_client_surface():
+    transport = _FakeTransport(block = 19_000_123, chain_id = 10)
+    transport.failures[A] = [ConnectionError("down")] * 10
+    pool = _pool([A, B], transport)
+    client = _rpc.make_client(pool)
+    assert isinstance(client, _rpc.RpcClient)
+    assert client.pool is pool
+    assert client.block_number() == 19_000_123
+    assert client.chain_id() == 10
+    assert client.is_connected() is True
+
+
+def test_single_url_client_has_no_pool():
+    client = _rpc.RpcClient(type("C", (), {"get_w3": lambda self: None})())
+    assert client.pool is None
+
+
+def test_live_provider_accepts_pool():
+    transport = _FakeTransport(block = 18_000_000)
+    provider = LiveProvider(_pool([A, B], transport))
+    assert provider._get_client().block_number() == 18_000_000
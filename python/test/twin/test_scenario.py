@@ -0,0 +1,154 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""ScenarioEngine — grid expansion, ordering, worker-side twins."""
+
+import pytest
+
+from defipy.twin import (
+    MockProvider,
+    ScenarioEngine,
+    ScenarioJob,
+    ScenarioReport,
+    StateTwinBuilder,
+)
+from defipy.primitives.position import SimulatePriceMove
+from defipy.primitives.execution import CalculateSlippage
+from defipy.primitives.pool_health import CheckPoolHealth
+
+
+PRICE_MOVES = [-0.5, -0.1, 0.1, 0.5]
+
+
+@pytest.fixture
+def jobs():
+    provider = MockProvider()
+    return [
+        ScenarioJob(provider.snapshot("eth_dai_v2"), SimulatePriceMove,
+                    {"price_change_pct": PRICE_MOVES,
+                     "position_size_lp": 10.0}),
+        ScenarioJob(provider.snapshot("eth_dai_v2"), CalculateSlippage,
+                    {"token_in": ["ETH", "DAI"], "amount_in": [1.0, 50.0]}),
+        ScenarioJob(provider.snapshot("eth_dai_v3"), CheckPoolHealth),
+    ]
+
+
+def _direct(job):
+    """Run a job's points in-process on a freshly built twin."""
+    lp = StateTwinBuilder().build(job.snapshot)
+    out = []
+    for params in job.points():
+        kwargs = dict(params)
+        if "token_in" in kwargs:
+            kwargs["token_in"] = lp.factory.token_from_exchange[lp.name][kwargs["token_in"]]
+        out.append(getattr(job.primitive(), job.method)(lp, **kwargs))
+    return out
+
+
+# ─── Grid expansion ─────────────────────────────────────────────────────────
+
+
+def test_dict_grid_is_a_cartesian_product(jobs):
+    points = jobs[1].points()
+    assert points == [
+        {"token_in": "ETH", "amount_in": 1.0},
+        {"token_in": "ETH", "amount_in": 50.0},
+        {"token_in": "DAI", "amount_in": 1.0},
+        {"token_in": "DAI", "amount_in": 50.0},
+    ]
+
+
+def test_scalars_are_held_fixed_and_empty_grid_is_one_call(jobs):
+    assert [p["position_size_lp"] for p in jobs[0].points()] == [10.0] * 4
+    assert jobs[2].points() == [{}]
+
+
+def test_list_grid_is_taken_as_is(jobs):
+    job = ScenarioJob(jobs[0].snapshot, SimulatePriceMove,
+                      [{"price_change_pct": 0.2, "position_size_lp": 1.0}])
+    assert job.points() == [{"price_change_pct": 0.2, "position_size_lp": 1.0}]
+
+
+# ─── Running ────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("processes, chunksize", [(0, None), (0, 1), (2, None), (2, 3)])
+def test_results_match_direct_calls_in_order(jobs, processes, chunksize):
+    with ScenarioEngine(processes = processes, chunksize = chunksize) as engine:
+        outcomes = engine.run(jobs).collect()
+
+    expected = [(i, params, result)
+                for i, job in enumerate(jobs)
+                for params, result in zip(job.points(), _direct(job))]
+    assert [(o.job_index, o.params, o.result) for o in outcomes] == expected
+    assert all(o.ok for o in outcomes)
+    assert [o.pool_id for o in outcomes[:4]] == ["eth_dai_v2"] * 4
+
+
+def test_errors_are_recorded_per_point(jobs):
+    job = ScenarioJob(jobs[1].snapshot, CalculateSlippage,
+                      {"token_in": ["ETH", "BTC"], "amount_in": 1.0})
+    outcomes = ScenarioEngine(processes = 0).run([job]).collect()
+    assert outcomes[0].ok
+    assert not outcomes[1].ok and outcomes[1].result is None
+    assert outcomes[1].error.startswith("ValueError")
+    assert "BTC" in outcomes[1].error
+
+
+def test_bad_method_fails_every_point_of_the_job(jobs):
+    job = ScenarioJob(jobs[2].snapshot, CheckPoolHealth,
+                      {"recent_window": [5, 10]}, method = "nope")
+    outcomes = ScenarioEngine(processes = 0).run([job]).collect()
+    assert [o.error.split(":")[0] for o in outcomes] == ["AttributeError"] * 2
+
+
+def test_report_and_progress(jobs):
+    seen = []
+    run = ScenarioEngine(processes = 0, chunksize = 2).run(
+        jobs, progress = lambda r: seen.append(r.done),
+    )
+    assert run.report.done == 0
+    run.collect()
+    assert isinstance(run.report, ScenarioReport)
+    assert (run.report.jobs, run.report.points, run.report.chunks) == (3, 9, 5)
+    assert run.report.done == 9 and run.report.errors == 0
+    assert seen == [2, 4, 6, 8, 9]
+    assert run.report.points_per_sec > 0
+    assert "9/9 points" in str(run.report)
+
+
+def test_pool_is_reused_across_runs_until_closed(jobs):
+    engine = ScenarioEngine(processes = 2)
+    engine.run(jobs).collect()
+    pool = engine._pool
+    engine.run(jobs).collect()
+    assert engine._pool is pool
+    engine.close()
+    assert engine._pool is None
+
+
+# ─── Validation ─────────────────────────────────────────────────────────────
+
+
+def test_rejects_bad_settings_and_jobs():
+    with pytest.raises(ValueError):
+        ScenarioEngine(processes = -1)
+    with pytest.raises(ValueError):
+        ScenarioEngine(chunksize = 0)
+    with pytest.raises(TypeError):
+        ScenarioEngine(processes = 0).run([("eth_dai_v2", CheckPoolHealth)])
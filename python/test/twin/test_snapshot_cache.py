@@ -0,0 +1,232 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""SnapshotCache + LiveProvider(cache=...) — mocked-RPC unit tests.
+
+Round-trip assertions read the FakeRpcClient call log: a cache hit
+must not issue a single contract call."""
+
+import pytest
+
+from defipy.twin import (
+    LiveProvider,
+    SnapshotCache,
+    V2PoolSnapshot,
+    V3PoolSnapshot,
+    StableswapPoolSnapshot,
+)
+
+from twin._fake_rpc import (
+    build_fake_client,
+    canonical_weth_usdc_v2_spec,
+    canonical_weth_usdc_token_specs,
+    canonical_usdc_weth_v3_spec,
+    canonical_usdc_weth_v3_token_specs,
+    WETH_USDC_V2_POOL,
+    USDC_WETH_V3_POOL,
+)
+
+
+V2_POOL_ID = "uniswap_v2:{}".format(WETH_USDC_V2_POOL)
+V3_POOL_ID = "uniswap_v3:{}".format(USDC_WETH_V3_POOL)
+
+
+def _v2_provider(cache, **kwargs):
+    client = build_fake_client(
+        pool = canonical_weth_usdc_v2_spec(),
+        tokens = canonical_weth_usdc_token_specs(),
+        **kwargs,
+    )
+    return LiveProvider._with_client(client, cache = cache), client
+
+
+def _snap(pool_id = "p", block = 1, reserve0 = 1.0):
+    return V2PoolSnapshot(
+        pool_id = pool_id, token0_name = "A", token1_name = "B",
+        reserve0 = reserve0, reserve1 = 2.0, block_number = block,
+    )
+
+
+# ─── LiveProvider integration ───────────────────────────────────────────────
+
+
+def test_no_cache_by_default():
+    provider, client = _v2_provider(None)
+    assert provider.cache is None
+    provider.snapshot(V2_POOL_ID, block_number = 19_000_000)
+    pair_reads = lambda: [
+        rec for rec in client.call_log if rec.address == WETH_USDC_V2_POOL
+    ]
+    n = len(pair_reads())
+    provider.snapshot(V2_POOL_ID, block_number = 19_000_000)
+    assert len(pair_reads()) == 2 * n
+
+
+def test_pinned_block_hit_issues_no_calls():
+    cache = SnapshotCache()
+    provider, client = _v2_provider(cache)
+    first = provider.snapshot(V2_POOL_ID, block_number = 19_000_000)
+    n = len(client.call_log)
+    second = provider.snapshot(V2_POOL_ID, block_number = 19_000_000)
+    assert len(client.call_log) == n
+    assert second == first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_latest_resolves_before_lookup():
+    cache = SnapshotCache()
+    provider, client = _v2_provider(cache, latest_block = 19_500_000)
+    first = provider.snapshot(V2_POOL_ID)
+    assert first.block_number == 19_500_000
+    # Explicit pin at the same block shares the entry.
+    provider.snapshot(V2_POOL_ID, block_number = 19_500_000)
+    assert cache.hits == 1
+    # Chain head moves → new key → fresh read.
+    client.get_w3()._latest_block = 19_500_001
+    moved = provider.snapshot(V2_POOL_ID)
+    assert moved.block_number == 19_500_001
+    assert cache.misses == 2
+
+
+def test_address_casing_shares_entry():
+    cache = SnapshotCache()
+    provider, _ = _v2_provider(cache)
+    provider.snapshot(V2_POOL_ID, block_number = 1)
+    provider.snapshot("uniswap_v2:{}".format(WETH_USDC_V2_POOL.lower()),
+                      block_number = 1)
+    assert cache.hits == 1
+
+
+def test_v3_tick_overrides_are_part_of_key():
+    cache = SnapshotCache()
+    client = build_fake_client(
+        pool = canonical_usdc_weth_v3_spec(),
+        tokens = canonical_usdc_weth_v3_token_specs(),
+    )
+    provider = LiveProvider._with_client(client, cache = cache)
+    full = provider.snapshot(V3_POOL_ID, block_number = 1)
+    ranged = provider.snapshot(V3_POOL_ID, block_number = 1,
+                               lwr_tick = -600, upr_tick = 600)
+    assert isinstance(ranged, V3PoolSnapshot)
+    assert (ranged.lwr_tick, ranged.upr_tick) == (-600, 600)
+    assert full.lwr_tick != ranged.lwr_tick
+    assert cache.misses == 2
+    provider.snapshot(V3_POOL_ID, block_number = 1,
+                      lwr_tick = -600, upr_tick = 600)
+    assert cache.hits == 1
+
+
+def test_mutating_returned_snapshot_does_not_poison_cache():
+    cache = SnapshotCache()
+    provider, _ = _v2_provider(cache)
+    snap = provider.snapshot(V2_POOL_ID, block_number = 1)
+    reserve0 = snap.reserve0
+    snap.reserve0 = -1.0
+    assert provider.snapshot(V2_POOL_ID, block_number = 1).reserve0 == reserve0
+
+
+# ─── SnapshotCache: memory tier ─────────────────────────────────────────────
+
+
+def test_lru_eviction_drops_least_recently_used():
+    cache = SnapshotCache(max_size = 2)
+    cache.put(("a",), _snap("a"))
+    cache.put(("b",), _snap("b"))
+    cache.get(("a",))                     # "b" is now LRU
+    cache.put(("c",), _snap("c"))
+    assert ("a",) in cache and ("c",) in cache
+    assert ("b",) not in cache
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+
+def test_ttl_expires_entries(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("defipy.twin.snapshot_cache.time.time", lambda: clock[0])
+    cache = SnapshotCache(ttl = 10)
+    cache.put(("k",), _snap())
+    clock[0] += 5
+    assert cache.get(("k",)) is not None
+    clock[0] += 6
+    assert cache.get(("k",)) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_stats_reports_counters():
+    cache = SnapshotCache(max_size = 8)
+    cache.get(("missing",))
+    cache.put(("k",), _snap())
+    cache.get(("k",))
+    assert cache.stats() == {
+        "hits": 1, "misses": 1, "evictions": 0, "size": 1, "max_size": 8,
+    }
+
+
+def test_clear_keeps_counters():
+    cache = SnapshotCache()
+    cache.put(("k",), _snap())
+    cache.get(("k",))
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 1
+
+
+@pytest.mark.parametrize("kwargs", [{"max_size": 0}, {"ttl": 0}, {"ttl": -1}])
+def test_rejects_bad_bounds(kwargs):
+    with pytest.raises(ValueError):
+        SnapshotCache(**kwargs)
+
+
+# ─── SnapshotCache: disk tier ───────────────────────────────────────────────
+
+
+def test_disk_tier_survives_new_cache_instance(tmp_path):
+    path = str(tmp_path / "snapshots.db")
+    cache = SnapshotCache(path = path)
+    cache.put((1, "uniswap_v2", "0xp", 5), _snap(block = 5, reserve0 = 42.0))
+    cache.close()
+
+    reopened = SnapshotCache(path = path)
+    snap = reopened.get((1, "uniswap_v2", "0xp", 5))
+    assert isinstance(snap, V2PoolSnapshot)
+    assert snap.reserve0 == 42.0 and snap.block_number == 5
+    assert snap.protocol == "uniswap_v2"
+    assert reopened.hits == 1
+    # Promoted into memory on the disk hit.
+    assert (1, "uniswap_v2", "0xp", 5) in reopened
+
+
+def test_disk_tier_round_trips_list_fields(tmp_path):
+    cache = SnapshotCache(path = str(tmp_path / "s.db"))
+    snap = StableswapPoolSnapshot(
+        pool_id = "p", token_names = ["USDC", "DAI"],
+        reserves = [1.0, 2.0], A = 100, block_number = 7,
+    )
+    cache.put(("s",), snap)
+    cache._entries.clear()                # force the disk path
+    assert cache.get(("s",)) == snap
+
+
+def test_disk_tier_respects_ttl(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("defipy.twin.snapshot_cache.time.time", lambda: clock[0])
+    cache = SnapshotCache(ttl = 10, path = str(tmp_path / "s.db"))
+    cache.put(("k",), _snap())
+    cache._entries.clear()
+    clock[0] += 11
+    assert cache.get(("k",)) is None
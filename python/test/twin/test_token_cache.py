@@ -0,0 +1,175 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""TokenMetadataCache + _rpc.fetch_tokens — mocked-RPC unit tests.
+
+The twin conftest clears the process-wide cache around every test."""
+
+import pytest
+
+from defipy.twin import LiveProvider
+from defipy.twin import _rpc
+from defipy.twin.token_cache import (
+    TokenMetadataCache,
+    default_token_cache,
+    set_default_token_cache,
+)
+
+from twin._fake_rpc import (
+    build_fake_client,
+    canonical_weth_usdc_v2_spec,
+    canonical_weth_usdc_token_specs,
+    canonical_usdc_weth_v3_spec,
+    canonical_usdc_weth_v3_token_specs,
+    WETH_USDC_V2_POOL,
+    USDC_WETH_V3_POOL,
+    USDC_ADDRESS, WETH_ADDRESS,
+)
+
+
+def _metadata_reads(client, start = 0):
+    return [
+        rec for rec in client.call_log[start:]
+        if rec.function in ("symbol", "decimals")
+    ]
+
+
+# ─── Cache object ───────────────────────────────────────────────────────────
+
+
+def test_get_put_is_case_insensitive_and_chain_scoped():
+    cache = TokenMetadataCache()
+    cache.put(1, USDC_ADDRESS, "USDC", 6)
+    assert cache.get(1, USDC_ADDRESS.lower()) == ("USDC", 6)
+    assert cache.get(10, USDC_ADDRESS) is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_persistent_cache_reloads(tmp_path):
+    path = str(tmp_path / "tokens.db")
+    cache = TokenMetadataCache(path = path)
+    cache.put(1, WETH_ADDRESS, "WETH", 18)
+    cache.close()
+    assert TokenMetadataCache(path = path).get(1, WETH_ADDRESS) == ("WETH", 18)
+
+
+def test_set_default_token_cache_swaps_process_cache(monkeypatch):
+    replacement = TokenMetadataCache()
+    monkeypatch.setattr("defipy.twin.token_cache._DEFAULT_CACHE",
+                        default_token_cache())
+    set_default_token_cache(replacement)
+    assert default_token_cache() is replacement
+
+
+def test_set_default_token_cache_rejects_other_types():
+    with pytest.raises(TypeError):
+        set_default_token_cache({})
+
+
+# ─── Symbol decoding ────────────────────────────────────────────────────────
+
+
+def test_decode_symbol_string_and_bytes32():
+    from eth_abi import encode
+    assert _rpc._decode_symbol(encode(["string"], ["USDC"])) == "USDC"
+    assert _rpc._decode_symbol(b"MKR".ljust(32, b"\x00")) == "MKR"
+    assert _rpc._decode_symbol(None) is None
+    assert _rpc._decode_symbol(b"\x01\x02") is None
+
+
+# ─── LiveProvider integration ───────────────────────────────────────────────
+
+
+def test_v3_warm_snapshot_is_one_round_trip():
+    client = build_fake_client(
+        pool = canonical_usdc_weth_v3_spec(),
+        tokens = canonical_usdc_weth_v3_token_specs(),
+    )
+    provider = LiveProvider._with_client(client)
+    cold = provider.snapshot("uniswap_v3:{}".format(USDC_WETH_V3_POOL))
+    # Cold: symbol + decimals per token, inside one pinned batch.
+    assert len(_metadata_reads(client)) == 4
+    assert {rec.block_identifier for rec in _metadata_reads(client)} == {
+        cold.block_number,
+    }
+    n = len(client.call_log)
+    warm = provider.snapshot("uniswap_v3:{}".format(USDC_WETH_V3_POOL))
+    assert _metadata_reads(client, n) == []
+    assert [r.function for r in client.call_log[n:]].count("aggregate3") == 1
+    assert (warm.token0_name, warm.token1_name) == ("USDC", "WETH")
+    assert warm.reserve0 == cold.reserve0
+
+
+def test_cache_is_shared_across_providers_and_protocols():
+    v3 = build_fake_client(
+        pool = canonical_usdc_weth_v3_spec(),
+        tokens = canonical_usdc_weth_v3_token_specs(),
+    )
+    LiveProvider._with_client(v3).snapshot(
+        "uniswap_v3:{}".format(USDC_WETH_V3_POOL),
+    )
+    # Same tokens, same chain, different provider and protocol.
+    v2 = build_fake_client(
+        pool = canonical_weth_usdc_v2_spec(),
+        tokens = canonical_weth_usdc_token_specs(),
+    )
+    snap = LiveProvider._with_client(v2).snapshot(
+        "uniswap_v2:{}".format(WETH_USDC_V2_POOL),
+    )
+    assert _metadata_reads(v2) == []
+    assert (snap.token0_name, snap.token1_name) == ("USDC", "WETH")
+
+
+def test_cache_entries_are_chain_scoped():
+    LiveProvider._with_client(build_fake_client(
+        pool = canonical_weth_usdc_v2_spec(),
+        tokens = canonical_weth_usdc_token_specs(),
+        chain_id = 1,
+    )).snapshot("uniswap_v2:{}".format(WETH_USDC_V2_POOL))
+    other = build_fake_client(
+        pool = canonical_weth_usdc_v2_spec(),
+        tokens = canonical_weth_usdc_token_specs(),
+        chain_id = 8453,
+    )
+    LiveProvider._with_client(other).snapshot(
+        "uniswap_v2:{}".format(WETH_USDC_V2_POOL),
+    )
+    assert len(_metadata_reads(other)) == 4
+
+
+def test_fetch_tokens_falls_back_when_batch_read_fails(monkeypatch):
+    client = build_fake_client(
+        pool = canonical_usdc_weth_v3_spec(),
+        tokens = canonical_usdc_weth_v3_token_specs(),
+    )
+    w3 = client.get_w3()
+    # Simulate a token whose symbol() reverts inside the batch.
+    real = _rpc.multicall_aggregate3_args
+    def failing_symbol(w3, calls, block_number, allow_failure = False):
+        out = real(w3, calls, block_number, allow_failure)
+        return [None if c[1] == "symbol()" else r for c, r in zip(calls, out)]
+    monkeypatch.setattr(_rpc, "multicall_aggregate3_args", failing_symbol)
+    fetched = []
+    monkeypatch.setattr(
+        _rpc, "fetch_token",
+        lambda w3, address, chain_id = None:
+            fetched.append(address) or _rpc._make_token(address, "X", 18),
+    )
+    tokens = _rpc.fetch_tokens(w3, [USDC_ADDRESS, WETH_ADDRESS], 1, 1)
+    assert fetched == [USDC_ADDRESS, WETH_ADDRESS]
+    assert [t.token_name for t in tokens] == ["X", "X"]
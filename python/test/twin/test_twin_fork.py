@@ -0,0 +1,274 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+"""StateTwinBuilder.fork — forks must be as independent as
+copy.deepcopy(lp): mutating a fork never moves the parent or a sibling,
+and mutating the parent never moves an existing fork."""
+
+import copy
+
+import pytest
+
+from uniswappy.process.swap import Swap as UniSwap
+from balancerpy.process.swap import Swap as BSwap
+from stableswappy.process.swap import Swap as SSwap
+
+from defipy.twin import MockProvider, StateTwinBuilder
+
+
+def _build(recipe):
+    snap = MockProvider().snapshot(recipe)
+    return StateTwinBuilder().build(snap)
+
+
+def _uni_tokens(lp):
+    tokens = lp.factory.token_from_exchange[lp.name]
+    return tokens[lp.token0], tokens[lp.token1]
+
+
+def _uni_state(lp):
+    tkn0, tkn1 = _uni_tokens(lp)
+    return (lp.get_reserve(tkn0), lp.get_reserve(tkn1),
+            lp.get_price(tkn0), lp.total_supply)
+
+
+def _vault_state(lp):
+    return tuple(lp.get_reserve(tkn) for tkn in lp.vault.tkns)
+
+
+# ─── Argument handling ──────────────────────────────────────────────────────
+
+
+def test_fork_returns_n_distinct_exchanges():
+    lp = _build("eth_dai_v2")
+    forks = StateTwinBuilder().fork(lp, 3)
+    assert len(forks) == 3
+    assert len({id(f) for f in forks} | {id(lp)}) == 4
+    assert all(type(f) is type(lp) for f in forks)
+
+
+def test_fork_default_is_single_fork():
+    lp = _build("eth_dai_v2")
+    assert len(StateTwinBuilder().fork(lp)) == 1
+
+
+def test_fork_rejects_nonpositive_n():
+    lp = _build("eth_dai_v2")
+    with pytest.raises(ValueError):
+        StateTwinBuilder().fork(lp, 0)
+
+
+def test_fork_rejects_unsupported_type():
+    with pytest.raises(TypeError) as excinfo:
+        StateTwinBuilder().fork(object())
+    assert "unsupported exchange type" in str(excinfo.value)
+
+
+def test_fork_carries_provenance():
+    lp = _build("eth_dai_v2")
+    (fork,) = StateTwinBuilder().fork(lp)
+    assert fork.live_snapshot is lp.live_snapshot
+    assert fork.snapshot_block_number == lp.snapshot_block_number
+
+
+# ─── Uniswap V2 ─────────────────────────────────────────────────────────────
+
+
+def test_v2_fork_matches_parent():
+    lp = _build("eth_dai_v2")
+    (fork,) = StateTwinBuilder().fork(lp)
+    assert _uni_state(fork) == _uni_state(lp)
+
+
+def test_v2_fork_swap_leaves_parent_and_sibling_untouched():
+    lp = _build("eth_dai_v2")
+    before = _uni_state(lp)
+    a, b = StateTwinBuilder().fork(lp, 2)
+    UniSwap().apply(a, _uni_tokens(a)[0], "trader", 10)
+    assert _uni_state(a) != before
+    assert _uni_state(lp) == before
+    assert _uni_state(b) == before
+
+
+def test_v2_parent_swap_leaves_fork_untouched():
+    lp = _build("eth_dai_v2")
+    (fork,) = StateTwinBuilder().fork(lp)
+    before = _uni_state(fork)
+    UniSwap().apply(lp, _uni_tokens(lp)[0], "trader", 10)
+    assert _uni_state(fork) == before
+
+
+def test_v2_fork_has_its_own_tokens():
+    lp = _build("eth_dai_v2")
+    (fork,) = StateTwinBuilder().fork(lp)
+    for parent_tkn, fork_tkn in zip(_uni_tokens(lp), _uni_tokens(fork)):
+        assert parent_tkn is not fork_tkn
+        assert parent_tkn.token_addr == fork_tkn.token_addr
+
+
+# ─── Uniswap V3 ─────────────────────────────────────────────────────────────
+
+
+def test_v3_fork_matches_parent():
+    lp = _build("eth_dai_v3")
+    (fork,) = StateTwinBuilder().fork(lp)
+    assert _uni_state(fork) == _uni_state(lp)
+    assert fork.slot0.tick == lp.slot0.tick
+    assert fork.get_liquidity() == lp.get_liquidity()
+
+
+def test_v3_fork_swap_leaves_parent_and_sibling_untouched():
+    lp = _build("eth_dai_v3")
+    before = _uni_state(lp)
+    tick_before = lp.slot0.tick
+    a, b = StateTwinBuilder().fork(lp, 2)
+    UniSwap().apply(a, _uni_tokens(a)[0], "trader", 50)
+    assert a.slot0.tick != tick_before
+    assert _uni_state(lp) == before and lp.slot0.tick == tick_before
+    assert _uni_state(b) == before and b.slot0.tick == tick_before
+
+
+def test_v3_parent_swap_leaves_fork_untouched():
+    lp = _build("eth_dai_v3")
+    (fork,) = StateTwinBuilder().fork(lp)
+    before = _uni_state(fork)
+    UniSwap().apply(lp, _uni_tokens(lp)[0], "trader", 50)
+    assert _uni_state(fork) == before
+
+
+def test_v3_position_entries_copied_on_access():
+    lp = _build("eth_dai_v3")
+    (fork,) = StateTwinBuilder().fork(lp)
+    key = next(iter(lp.positions))
+    shared = dict.__getitem__(lp.positions, key)
+    assert dict.__getitem__(fork.positions, key) is shared
+    fork.positions[key].liquidity += 1
+    assert shared.liquidity == lp.positions[key].liquidity
+    assert fork.positions[key].liquidity == shared.liquidity + 1
+
+
+def test_v3_position_setdefault_and_pop_copy_shared_entries():
+    lp = _build("eth_dai_v3")
+    a, b = StateTwinBuilder().fork(lp, 2)
+    key = next(iter(lp.positions))
+    before = lp.positions[key].liquidity
+    a.positions.setdefault(key, None).liquidity += 1
+    b.positions.pop(key).liquidity += 2
+    assert key not in b.positions
+    assert a.positions[key].liquidity == before + 1
+    assert lp.positions[key].liquidity == before
+    b.positions[key] = copy.copy(lp.positions[key])
+    assert b.positions[key].liquidity == before
+
+
+def test_v3_tick_entries_are_private_to_fork():
+    # uniswappy's Tick helpers require a plain dict tick table.
+    lp = _build("eth_dai_v3")
+    (fork,) = StateTwinBuilder().fork(lp)
+    assert type(fork.ticks) is dict
+    key = next(iter(lp.ticks))
+    fork.ticks[key].liquidityGross += 1
+    assert fork.ticks[key].liquidityGross == lp.ticks[key].liquidityGross + 1
+
+
+def test_v3_forked_twin_survives_deepcopy():
+    lp = _build("eth_dai_v3")
+    (fork,) = StateTwinBuilder().fork(lp)
+    clone = copy.deepcopy(fork)
+    assert _uni_state(clone) == _uni_state(fork)
+    UniSwap().apply(clone, _uni_tokens(clone)[0], "trader", 50)
+    assert _uni_state(fork) == _uni_state(lp)
+
+
+def test_fork_of_fork_is_independent():
+    lp = _build("eth_dai_v3")
+    (child,) = StateTwinBuilder().fork(lp)
+    (grandchild,) = StateTwinBuilder().fork(child)
+    before = _uni_state(lp)
+    UniSwap().apply(grandchild, _uni_tokens(grandchild)[0], "trader", 50)
+    assert _uni_state(child) == before
+    assert _uni_state(lp) == before
+
+
+def test_v3_fork_and_parent_can_mint_and_cross_ticks():
+    # Minting and crossing run uniswappy's Tick.update / Tick.cross,
+    # which only accept a plain dict tick table.
+    lp = _build("eth_dai_v3")
+    (fork,) = StateTwinBuilder().fork(lp)
+    for twin in (fork, lp):
+        spacing = twin.tickSpacing
+        lwr = (twin.slot0.tick // spacing - 1) * spacing
+        upr = lwr + 3 * spacing
+        twin.mint("0xlp", lwr, upr, 1000.0)
+        assert twin.ticks[lwr].liquidityGross > 0 and upr in twin.ticks
+        dai = _uni_tokens(twin)[1]
+        UniSwap().apply(twin, dai, "trader", 20000.0)
+        assert twin.slot0.tick >= upr
+    assert lp.ticks[lwr].liquidityGross == fork.ticks[lwr].liquidityGross
+
+
+# ─── Balancer ───────────────────────────────────────────────────────────────
+
+
+def test_balancer_fork_matches_parent():
+    lp = _build("eth_dai_balancer_50_50")
+    (fork,) = StateTwinBuilder().fork(lp)
+    assert _vault_state(fork) == _vault_state(lp)
+    assert fork.pool_shares == lp.pool_shares
+
+
+def test_balancer_fork_swap_leaves_parent_untouched():
+    lp = _build("eth_dai_balancer_50_50")
+    before = _vault_state(lp)
+    (fork,) = StateTwinBuilder().fork(lp)
+    eth, dai = fork.vault.tkns
+    BSwap().apply(fork, eth, dai, "trader", 10)
+    assert _vault_state(fork) != before
+    assert _vault_state(lp) == before
+    assert [t.token_total for t in lp.vault.tkns] != \
+           [t.token_total for t in fork.vault.tkns]
+
+
+def test_balancer_fork_has_its_own_tokens():
+    lp = _build("eth_dai_balancer_50_50")
+    (fork,) = StateTwinBuilder().fork(lp)
+    for name, tkn in fork.vault.tkn_dic.items():
+        assert tkn is not lp.vault.tkn_dic[name]
+        assert tkn is fork.factory.token_from_exchange[fork.name][name]
+
+
+# ─── Stableswap ─────────────────────────────────────────────────────────────
+
+
+def test_stableswap_fork_matches_parent():
+    lp = _build("usdc_dai_stableswap_A10")
+    (fork,) = StateTwinBuilder().fork(lp)
+    assert _vault_state(fork) == _vault_state(lp)
+    assert fork.math_pool.balances == lp.math_pool.balances
+
+
+def test_stableswap_fork_swap_leaves_parent_untouched():
+    lp = _build("usdc_dai_stableswap_A10")
+    before = _vault_state(lp)
+    balances_before = list(lp.math_pool.balances)
+    (fork,) = StateTwinBuilder().fork(lp)
+    usdc, dai = fork.vault.tkns
+    SSwap().apply(fork, usdc, dai, "trader", 1000)
+    assert _vault_state(fork) != before
+    assert _vault_state(lp) == before
+    assert lp.math_pool.balances == balances_before
@@ -39,6 +39,12 @@ from twin._fake_rpc import V2PoolSpec, TokenSpec, build_fake_client
 _R0, _R1 = 1000.0, 100_000.0
 _SQRT = math.sqrt(_R0 * _R1)   # 10000.0
 
+# Valid (digits-only, so checksum-stable) addresses: the V2 read path
+# goes through Multicall3, which ABI-encodes token0()/token1().
+_POOL = "0x0000000000000000000000000000000000001001"
+_T0 = "0x0000000000000000000000000000000000002001"
+_T1 = "0x0000000000000000000000000000000000002002"
+
 
 def _v2_snap(total_supply):
     return V2PoolSnapshot(
@@ -52,16 +58,16 @@ def _v2_snap(total_supply):
 
 def test_live_snapshot_carries_real_total_supply():
     pool = V2PoolSpec(
-        address="0xPOOL", token0_address="0xT0", token1_address="0xT1",
+        address=_POOL, token0_address=_T0, token1_address=_T1,
         reserve0_raw=1000 * 10**18, reserve1_raw=100_000 * 10**18,
         total_supply_raw=7_777 * 10**18,   # known, 18-dec, ≠ √(r0·r1)
     )
     tokens = [
-        TokenSpec(address="0xT0", symbol="ETH", decimals=18),
-        TokenSpec(address="0xT1", symbol="DAI", decimals=18),
+        TokenSpec(address=_T0, symbol="ETH", decimals=18),
+        TokenSpec(address=_T1, symbol="DAI", decimals=18),
     ]
     client = build_fake_client(pool=pool, tokens=tokens)
-    snap = LiveProvider._with_client(client).snapshot("uniswap_v2:0xPOOL")
+    snap = LiveProvider._with_client(client).snapshot("uniswap_v2:" + _POOL)
     assert snap.total_supply == pytest.approx(7_777.0)   # raw / 1e18
 
 
@@ -69,16 +75,16 @@ def test_live_snapshot_total_supply_uses_18_decimals_not_pool_token():
     # USDC is 6-dec; if the supply were (wrongly) adjusted by a pool token's
     # decimals it would be off by 1e12. LP tokens are always 18-dec.
     pool = V2PoolSpec(
-        address="0xPOOL", token0_address="0xT0", token1_address="0xT1",
+        address=_POOL, token0_address=_T0, token1_address=_T1,
         reserve0_raw=int(50_000_000 * 10**6), reserve1_raw=15_000 * 10**18,
         total_supply_raw=1_234 * 10**18,
     )
     tokens = [
-        TokenSpec(address="0xT0", symbol="USDC", decimals=6),
-        TokenSpec(address="0xT1", symbol="WETH", decimals=18),
+        TokenSpec(address=_T0, symbol="USDC", decimals=6),
+        TokenSpec(address=_T1, symbol="WETH", decimals=18),
     ]
     snap = LiveProvider._with_client(
-        build_fake_client(pool=pool, tokens=tokens)).snapshot("uniswap_v2:0xPOOL")
+        build_fake_client(pool=pool, tokens=tokens)).snapshot("uniswap_v2:" + _POOL)
     assert snap.total_supply == pytest.approx(1_234.0)
 
 
@@ -0,0 +1,129 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+import dataclasses
+import json
+import pickle
+
+import pytest
+
+from defipy.utils.data import (
+    compact_class,
+    to_compact,
+    from_compact,
+    ResultCollector,
+    PriceMoveScenario,
+    StableswapPositionAnalysis,
+    DepegRiskAssessment,
+    DepegScenario,
+)
+
+
+def _scenario(fee = None):
+    return PriceMoveScenario(
+        new_price_ratio = 1.2, new_value = 101.5, il_at_new_price = -0.004,
+        fee_projection = fee, value_change_pct = 0.015,
+    )
+
+
+def _depeg():
+    return DepegRiskAssessment(
+        depeg_token = "USDC", protocol_type = "stableswap", n_assets = 2,
+        current_peg_deviation = 0.001,
+        scenarios = [DepegScenario(0.05, 0.95, 99.0, 100.0, -0.01, -0.02),
+                     DepegScenario(0.2, 0.8, None, None, None, None)],
+    )
+
+
+# ─── Class shape ────────────────────────────────────────────────────────────
+
+
+def test_same_fields_and_no_instance_dict():
+    cls = compact_class(PriceMoveScenario)
+    assert cls.__name__ == "CompactPriceMoveScenario"
+    assert [(f.name, f.type) for f in dataclasses.fields(cls)] == \
+        [(f.name, f.type) for f in dataclasses.fields(PriceMoveScenario)]
+    assert not hasattr(to_compact(_scenario()), "__dict__")
+    assert cls.__compact_of__ is PriceMoveScenario
+
+
+def test_classes_are_cached_per_frozen_flag():
+    assert compact_class(PriceMoveScenario) is compact_class(PriceMoveScenario)
+    assert compact_class(PriceMoveScenario, frozen = True) is not \
+        compact_class(PriceMoveScenario)
+    assert compact_class(compact_class(PriceMoveScenario)) is \
+        compact_class(PriceMoveScenario)
+
+
+def test_defaults_and_default_factories_carry_over():
+    cls = compact_class(StableswapPositionAnalysis)
+    a, b = (cls(**{f.name: None for f in dataclasses.fields(cls)
+                   if f.default is dataclasses.MISSING
+                   and f.default_factory is dataclasses.MISSING})
+            for _ in range(2))
+    assert a.per_token_init == [] and a.per_token_init is not b.per_token_init
+
+
+def test_frozen_is_opt_in():
+    mutable = to_compact(_scenario())
+    mutable.new_value = 0.0
+    assert mutable.new_value == 0.0
+    with pytest.raises(AttributeError):
+        mutable.extra = 1.0
+    frozen = to_compact(_scenario(), frozen = True)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        frozen.new_value = 0.0
+    assert hash(frozen) == hash(to_compact(_scenario(), frozen = True))
+
+
+def test_rejects_non_dataclasses():
+    with pytest.raises(TypeError):
+        compact_class(dict)
+    with pytest.raises(TypeError):
+        to_compact({"new_value": 1.0})
+
+
+# ─── Compatibility ──────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("result", [_scenario(), _scenario(0.5), _depeg()])
+def test_asdict_and_json_match_the_original(result):
+    compact = to_compact(result)
+    assert dataclasses.asdict(compact) == dataclasses.asdict(result)
+    assert json.dumps(dataclasses.asdict(compact), default = str) == \
+        json.dumps(dataclasses.asdict(result), default = str)
+
+
+def test_nested_results_are_converted_and_restored():
+    compact = to_compact(_depeg())
+    assert all(type(s).__compact_of__ is DepegScenario for s in compact.scenarios)
+    assert from_compact(compact) == _depeg()
+    assert from_compact(_depeg()) == _depeg()
+
+
+def test_pickle_round_trip():
+    for frozen in (True, False):
+        compact = to_compact(_depeg(), frozen = frozen)
+        assert pickle.loads(pickle.dumps(compact)) == compact
+
+
+def test_result_collector_accepts_compact_results():
+    collector = ResultCollector(PriceMoveScenario)
+    collector.extend([_scenario(), to_compact(_scenario(0.5))])
+    assert collector[1] == _scenario(0.5)
+    assert collector.mask("fee_projection").tolist() == [True, False]
@@ -0,0 +1,155 @@
+# ─────────────────────────────────────────────────────────────────────────────
+# Apache 2.0 License (DeFiPy)
+# ─────────────────────────────────────────────────────────────────────────────
+# Copyright 2023–2026 Ian Moore
+# Email: defipy.devs@gmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from defipy.utils.data import (
+    ResultCollector,
+    PoolHealth,
+    PriceMoveScenario,
+    DepegRiskAssessment,
+)
+
+
+def _scenario(i):
+    return PriceMoveScenario(
+        new_price_ratio = 1.0 + 0.1 * i,
+        new_value = 100.0 + i,
+        il_at_new_price = -0.001 * i,
+        fee_projection = None if i % 3 else 0.5 * i,
+        value_change_pct = 0.01 * i,
+    )
+
+
+def _health(num_swaps):
+    return PoolHealth(
+        version = "V2", token0_name = "ETH", token1_name = "DAI",
+        spot_price = 100.0, reserve0 = 1_000.0, reserve1 = 100_000.0,
+        total_liquidity = 10_000.0, tvl_in_token0 = 2_000.0,
+        total_fee0 = 0.0, total_fee1 = 0.0, num_swaps = num_swaps,
+        fee_accrual_rate_recent = None, num_lps = 1,
+        top_lp_share_pct = 1.0, has_activity = bool(num_swaps),
+    )
+
+
+# ─── Column layout ──────────────────────────────────────────────────────────
+
+
+def test_dtypes_follow_annotations():
+    collector = ResultCollector(PoolHealth)
+    assert collector.column("spot_price").dtype == np.float64
+    assert collector.column("num_swaps").dtype == np.int64
+    assert collector.column("has_activity").dtype == np.bool_
+    assert collector.column("version").dtype == object
+    assert collector.mask("num_swaps") is not None
+    assert collector.mask("spot_price") is None
+
+
+def test_nested_fields_use_object_columns():
+    collector = ResultCollector(DepegRiskAssessment)
+    assert collector.column("scenarios").dtype == object
+    assert collector.mask("scenarios") is None
+    assert collector.column("n_assets").dtype == np.int64
+
+
+def test_rejects_non_dataclass_and_bad_capacity():
+    with pytest.raises(TypeError):
+        ResultCollector(dict)
+    with pytest.raises(TypeError):
+        ResultCollector(_scenario(0))
+    with pytest.raises(ValueError):
+        ResultCollector(PriceMoveScenario, capacity = 0)
+
+
+# ─── Accumulation ───────────────────────────────────────────────────────────
+
+
+def test_grows_geometrically_and_round_trips():
+    collector = ResultCollector(PriceMoveScenario, capacity = 2)
+    results = [_scenario(i) for i in range(9)]
+    collector.extend(results)
+    assert len(collector) == 9
+    assert collector.capacity == 16
+    assert [collector[i] for i in range(9)] == results
+    assert collector[-1] == results[-1]
+
+
+def test_masks_record_none():
+    collector = ResultCollector(PriceMoveScenario)
+    collector.extend(_scenario(i) for i in range(6))
+    assert collector.mask("fee_projection").tolist() == \
+        [False, True, True, False, True, True]
+    assert np.isnan(collector.column("fee_projection")[1])
+
+
+def test_rejects_other_types_and_bad_rows():
+    collector = ResultCollector(PriceMoveScenario)
+    with pytest.raises(TypeError):
+        collector.append(_health(3))
+    with pytest.raises(IndexError):
+        collector[0]
+    with pytest.raises(KeyError):
+        collector.column("nope")
+
+
+def test_clear_keeps_capacity():
+    collector = ResultCollector(PriceMoveScenario, capacity = 4)
+    collector.extend(_scenario(i) for i in range(5))
+    collector.clear()
+    assert len(collector) == 0 and collector.capacity == 8
+    collector.append(_scenario(1))
+    assert collector[0] == _scenario(1)
+
+
+# ─── Export ─────────────────────────────────────────────────────────────────
+
+
+def test_to_pandas_matches_asdict():
+    results = [_health(n) for n in (0, 4, None)]
+    collector = ResultCollector(PoolHealth)
+    collector.extend(results)
+    df = collector.to_pandas()
+    expected = pd.DataFrame([asdict(r) for r in results])
+    assert list(df.columns) == list(expected.columns)
+    assert df["num_swaps"].dtype == "Int64"
+    assert df["num_swaps"].isna().tolist() == [False, False, True]
+    assert df["num_swaps"].iloc[1] == 4
+    assert df["fee_accrual_rate_recent"].isna().all()
+    assert df["spot_price"].tolist() == expected["spot_price"].tolist()
+    assert df["version"].tolist() == ["V2"] * 3
+
+
+def test_to_pandas_shares_buffers():
+    collector = ResultCollector(PriceMoveScenario)
+    collector.extend(_scenario(i) for i in range(4))
+    df = collector.to_pandas()
+    assert np.shares_memory(df["new_value"].to_numpy(), collector.column("new_value"))
+
+
+def test_to_arrow_carries_nulls():
+    pa = pytest.importorskip("pyarrow")
+    collector = ResultCollector(PriceMoveScenario)
+    collector.extend(_scenario(i) for i in range(4))
+    table = collector.to_arrow()
+    assert isinstance(table, pa.Table)
+    assert table.column("fee_projection").null_count == 2
+    assert table.column("new_value").to_pylist() == [100.0, 101.0, 102.0, 103.0]